@@ -124,6 +124,19 @@ def _get_column_defs() -> list:
             min_width=110,
             cell_style=_VALUE_STYLE,
         ),
+        ag_grid.column_def(
+            field="hedge_notional",
+            header_name="Hedge Notional",
+            filter=AGFilters.text,
+            min_width=120,
+            cell_style=_VALUE_STYLE,
+        ),
+        ag_grid.column_def(
+            field="hedge_ratio",
+            header_name="Hedge Ratio",
+            filter=AGFilters.text,
+            min_width=100,
+        ),
         ag_grid.column_def(
             field="ccy_hedged_pnl",
             header_name="CCY Hedged PnL",
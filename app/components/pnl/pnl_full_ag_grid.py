@@ -57,6 +57,15 @@ _VALUE_STYLE = rx.Var(
 # COLUMN DEFINITIONS
 # =============================================================================
 
+_EXPLAIN_COLUMNS = [
+    ("pnl_delta", "Delta PnL"),
+    ("pnl_gamma", "Gamma PnL"),
+    ("pnl_vega", "Vega PnL"),
+    ("pnl_theta", "Theta PnL"),
+    ("pnl_fx", "FX PnL"),
+    ("pnl_residual", "Residual"),
+]
+
 
 def _get_column_defs() -> list:
     """Return column definitions for the PnL full grid.
@@ -155,6 +164,18 @@ def _get_column_defs() -> list:
             enable_row_group=True,
             agg_func="avg",
         ),
+        # 1D attribution: Greeks, FX translation and unexplained residual
+        *[
+            ag_grid.column_def(
+                field=field,
+                header_name=header,
+                filter=AGFilters.text,
+                min_width=100,
+                cell_style=_VALUE_STYLE,
+                agg_func="sum",
+            )
+            for field, header in _EXPLAIN_COLUMNS
+        ],
     ]
 
 
@@ -120,6 +120,66 @@ def _get_column_defs() -> list:
     ]
 
 
+def _get_aggregate_column_defs() -> list:
+    """Return column definitions for the per ticker/side/broker fill aggregates."""
+    return [
+        ag_grid.column_def(
+            field="ticker",
+            header_name="Ticker",
+            filter=AGFilters.text,
+            min_width=100,
+            pinned="left",
+        ),
+        ag_grid.column_def(
+            field="side",
+            header_name="Side",
+            filter="agSetColumnFilter",
+            min_width=80,
+        ),
+        ag_grid.column_def(
+            field="broker",
+            header_name="Broker",
+            filter="agSetColumnFilter",
+            min_width=90,
+        ),
+        ag_grid.column_def(
+            field="quantity",
+            header_name="Quantity",
+            filter=AGFilters.number,
+            min_width=100,
+        ),
+        ag_grid.column_def(
+            field="notional",
+            header_name="Notional",
+            filter=AGFilters.number,
+            min_width=120,
+        ),
+        ag_grid.column_def(
+            field="avg_price",
+            header_name="Avg Price",
+            filter=AGFilters.number,
+            min_width=100,
+        ),
+        ag_grid.column_def(
+            field="last_price",
+            header_name="Last Price",
+            filter=AGFilters.number,
+            min_width=100,
+        ),
+        ag_grid.column_def(
+            field="fill_count",
+            header_name="Fills",
+            filter=AGFilters.number,
+            min_width=70,
+        ),
+        ag_grid.column_def(
+            field="last_fill_time",
+            header_name="Last Fill",
+            min_width=90,
+        ),
+    ]
+
+
 # =============================================================================
 # POSITION DATE FILTER BAR
 # =============================================================================
@@ -158,6 +218,7 @@ def _position_date_bar() -> rx.Component:
 
 _STORAGE_KEY = "trade_summary_grid_state"
 _GRID_ID = "trade_summary_grid"
+_AGGREGATE_GRID_ID = "trade_aggregate_grid"
 
 
 def trade_summary_ag_grid() -> rx.Component:
@@ -171,6 +232,7 @@ def trade_summary_ag_grid() -> rx.Component:
     - Full grid state persistence (columns + filters + sort)
     - Status bar with row counts
     - Compact mode toggle
+    - Live fill aggregates per ticker/side/broker below the summary
     """
     from app.components.shared.ag_grid_config import (
         grid_state_script,
@@ -212,6 +274,20 @@ def trade_summary_ag_grid() -> rx.Component:
             row_id_key="id",
             enable_cell_flash=True,
             loading=PositionsState.is_loading_trade_summaries,
+            height="60%",
+        ),
+        # Live fill aggregates by ticker / side / broker
+        create_standard_grid(
+            grid_id=_AGGREGATE_GRID_ID,
+            row_data=PositionsState.filtered_trade_aggregates,
+            column_defs=_get_aggregate_column_defs(),
+            row_id_key="id",
+            enable_cell_flash=True,
+            default_excel_export_params=get_default_export_params("trade_aggregates"),
+            default_csv_export_params=get_default_csv_export_params("trade_aggregates"),
+            quick_filter_text=TradeSummaryGridState.search_text,
+            loading=PositionsState.is_loading_trade_summaries,
+            height="40%",
         ),
         width="100%",
         height="100%",
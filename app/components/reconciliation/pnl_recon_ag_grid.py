@@ -35,6 +35,16 @@ class PnlReconGridState(rx.State):
 # COLUMN DEFINITIONS
 # =============================================================================
 
+_EXPLAIN_COLUMNS = [
+    ("pnl_total", "PnL 1D"),
+    ("pnl_delta", "Delta PnL"),
+    ("pnl_gamma", "Gamma PnL"),
+    ("pnl_vega", "Vega PnL"),
+    ("pnl_theta", "Theta PnL"),
+    ("pnl_fx", "FX PnL"),
+    ("pnl_residual", "Residual"),
+]
+
 
 def _get_column_defs() -> list:
     return [
@@ -100,6 +110,16 @@ def _get_column_defs() -> list:
             filter=AGFilters.number,
             min_width=110,
         ),
+        # Day-over-day P&L attribution of the underlying
+        *[
+            ag_grid.column_def(
+                field=field,
+                header_name=header,
+                filter=AGFilters.text,
+                min_width=100,
+            )
+            for field, header in _EXPLAIN_COLUMNS
+        ],
     ]
 
 
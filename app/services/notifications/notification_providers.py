@@ -7,10 +7,10 @@ by app/services/__init__.py to ensure all providers are registered
 at startup.
 """
 
+from app.services.registry import services
 from pmt_core.services.notifications.notification_registry import NotificationRegistry
 from pmt_core.services.notifications.notification_providers import (
     get_pnl_notifications,
-    get_position_notifications,
     get_risk_notifications,
     get_market_data_notifications,
     get_fx_notifications,
@@ -20,7 +20,10 @@ from pmt_core.services.notifications.notification_providers import (
 
 # === Register all core providers ===
 NotificationRegistry.register("pnl", get_pnl_notifications)
-NotificationRegistry.register("positions", get_position_notifications)
+# Positions come from the live book's intraday diff (SOD vs current).
+NotificationRegistry.register(
+    "positions", lambda: services.positions.get_position_notifications()
+)
 NotificationRegistry.register("risk", get_risk_notifications)
 NotificationRegistry.register("market_data", get_market_data_notifications)
 NotificationRegistry.register("fx", get_fx_notifications)
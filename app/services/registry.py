@@ -28,13 +28,13 @@ class ServiceRegistry:
     def pnl(self):
         from pmt_core.services.pnl import PnLService
 
-        return PnLService()
+        return PnLService(fx=self.market_data.fx)
 
     @cached_property
     def positions(self):
         from pmt_core.services.positions import PositionService
 
-        return PositionService()
+        return PositionService(emsx=self.emsx, reference_data=self.reference_data)
 
     @cached_property
     def risk(self):
@@ -58,7 +58,15 @@ class ServiceRegistry:
     def market_data(self):
         from pmt_core.services.market_data import MarketDataService
 
-        return MarketDataService()
+        return MarketDataService(
+            reference_data=self.reference_data, vol_surfaces=self.vol_surfaces
+        )
+
+    @cached_property
+    def vol_surfaces(self):
+        from pmt_core.services.pricing import VolSurfaceService
+
+        return VolSurfaceService()
 
     @cached_property
     def emsx(self):
@@ -76,7 +84,7 @@ class ServiceRegistry:
     def reconciliation(self):
         from pmt_core.services.reconciliation import ReconciliationService
 
-        return ReconciliationService()
+        return ReconciliationService(pnl=self.pnl)
 
     @cached_property
     def user(self):
@@ -88,7 +96,13 @@ class ServiceRegistry:
     def instruments(self):
         from pmt_core.services.instruments import InstrumentsService
 
-        return InstrumentsService()
+        return InstrumentsService(reference_data=self.reference_data)
+
+    @cached_property
+    def reference_data(self):
+        from pmt_core.services.reference_data import ReferenceDataCache
+
+        return ReferenceDataCache()
 
     @cached_property
     def reverse_inquiry(self):
@@ -112,7 +126,7 @@ class ServiceRegistry:
     def performance_header(self):
         from pmt_core.services.performance import PerformanceService
 
-        return PerformanceService()
+        return PerformanceService(pnl=self.pnl)
 
     @cached_property
     def notifications(self):
@@ -3,7 +3,6 @@ import asyncio
 import reflex as rx
 from app.states.market_data.types import MarketDataItem
 import logging
-import random
 from app.services import services
 
 class MarketDataMixin(rx.State, mixin=True):
@@ -36,13 +35,34 @@ class MarketDataMixin(rx.State, mixin=True):
 
     @rx.event(background=True)
     async def start_market_data_auto_refresh(self):
-        """Background task for Market Data auto-refresh (2s interval)."""
-        while True:
-            async with self:
-                if not self.market_data_auto_refresh:
-                    break
-                self.simulate_market_data_update()
-            await asyncio.sleep(2)
+        """Background task for Market Data auto-refresh (2s interval).
+
+        Subscribes the grid's tickers to the market data feed and re-reads
+        the rows, which carry live last price / VWAP from the feed. The
+        session's subscriptions are released when auto-refresh stops, so
+        the feed shuts down once no session is watching.
+        """
+        from datetime import datetime
+
+        async with self:
+            consumer = self.router.session.client_token
+        try:
+            while True:
+                async with self:
+                    if not self.market_data_auto_refresh:
+                        break
+                    tickers = [row["ticker"] for row in self.market_data]
+                if tickers:
+                    await services.market_data.subscribe_to_tickers(tickers, consumer)
+                    rows = await services.market_data.get_market_data()
+                    async with self:
+                        self.market_data = rows
+                        self.market_data_last_updated = datetime.now().strftime(
+                            "%Y-%m-%d %H:%M:%S"
+                        )
+                await asyncio.sleep(2)
+        finally:
+            await services.market_data.release_consumer(consumer)
 
     def toggle_market_data_auto_refresh(self, value: bool):
         """Toggle auto-refresh state. Restarts background task if enabled."""
@@ -50,29 +70,6 @@ class MarketDataMixin(rx.State, mixin=True):
         if value:
             return type(self).start_market_data_auto_refresh
 
-    def simulate_market_data_update(self):
-        """Simulated delta update for demo - called by rx.moment interval."""
-        if not self.market_data_auto_refresh or len(self.market_data) < 1:
-            return
-
-        from datetime import datetime
-
-        # Update 1-5 random rows with price fluctuations
-        for _ in range(random.randint(1, min(5, len(self.market_data)))):
-            idx = random.randint(0, len(self.market_data) - 1)
-            row = self.market_data[idx]
-            # Simulate price/change updates
-            if "last_price" in row and row["last_price"]:
-                row["last_price"] = round(
-                    float(row["last_price"]) * random.uniform(0.99, 1.01), 2
-                )
-            if "change" in row:
-                row["change"] = round(random.uniform(-5, 5), 2)
-            if "volume" in row and row["volume"]:
-                row["volume"] = int(float(row["volume"]) * random.uniform(0.98, 1.02))
-
-        self.market_data_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
     def set_market_data_search(self, query: str):
         self.market_data_search = query
 
@@ -1,10 +1,10 @@
 import asyncio
 import logging
+import math
 from datetime import datetime
 
 import reflex as rx
 from app.states.pnl.types import PnLChangeItem
-from app.utils.simulation import simulate_financial_tick
 from app.utils.sort_utils import financial_sort_key
 from app.services import services
 
@@ -22,6 +22,8 @@ class PnLChangeMixin(rx.State, mixin=True):
     pnl_change_error: str = ""
     pnl_change_last_updated: str = "—"
     pnl_change_auto_refresh: bool = True
+    # Live book version this session last patched from.
+    pnl_change_version: int = 0
 
     # Filters
     pnl_change_search: str = ""
@@ -44,6 +46,7 @@ class PnLChangeMixin(rx.State, mixin=True):
         try:
             pos_date = self._ensure_pnl_change_date()
             self.pnl_change_list = await services.pnl.get_pnl_changes(pos_date)
+            self.pnl_change_version = 0
         except Exception as e:
             self.pnl_change_error = str(e)
             logger.exception(f"Error loading P&L change data: {e}")
@@ -52,9 +55,11 @@ class PnLChangeMixin(rx.State, mixin=True):
             self.pnl_change_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     async def set_pnl_change_position_date(self, value: str):
-        """Set position date and reload data."""
+        """Set position date and reload data; neighbouring dates load in the background."""
         self.pnl_change_position_date = value
         await self.load_pnl_change_data()
+        if value:
+            services.pnl.prefetch_adjacent_dates(value)
 
     async def force_refresh_pnl_change(self):
         """Force refresh PnL change data with loading overlay."""
@@ -66,6 +71,7 @@ class PnLChangeMixin(rx.State, mixin=True):
         try:
             pos_date = self._ensure_pnl_change_date()
             self.pnl_change_list = await services.pnl.get_pnl_changes(pos_date)
+            self.pnl_change_version = 0
             self.pnl_change_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         except Exception as e:
             logger.exception(f"Error refreshing PnL change: {e}")
@@ -79,7 +85,7 @@ class PnLChangeMixin(rx.State, mixin=True):
             async with self:
                 if not self.pnl_change_auto_refresh:
                     return
-                self.simulate_pnl_change_update()
+                await self.apply_pnl_change_ticks()
             await asyncio.sleep(2)
 
     def toggle_pnl_change_auto_refresh(self, value: bool):
@@ -88,15 +94,22 @@ class PnLChangeMixin(rx.State, mixin=True):
         if value:
             return type(self).start_pnl_change_auto_refresh
 
-    def simulate_pnl_change_update(self):
-        """Apply simulated tick using shared utility."""
+    async def apply_pnl_change_ticks(self):
+        """Patch only the ticker rows that changed since this session's last pass."""
         if not self.pnl_change_auto_refresh or not self.pnl_change_list:
             return
-        self.pnl_change_list = simulate_financial_tick(
-            rows=self.pnl_change_list,
-            value_fields=["pnl_chg_1d", "pnl_chg_1w", "pnl_chg_1m", "pnl_ytd"],
-            pct_fields=["pnl_chg_pct_1d", "pnl_chg_pct_1w", "pnl_chg_pct_1m"],
+        if self._ensure_pnl_change_date() != datetime.now().strftime("%Y-%m-%d"):
+            return  # Historical dates do not tick
+        tickers = [row["ticker"] for row in self.pnl_change_list]
+        last = services.market_data.get_snapshot().column(tickers).tolist()
+        prices = {t: p for t, p in zip(tickers, last) if not math.isnan(p)}
+        updates, self.pnl_change_version = await services.pnl.get_pnl_change_updates(
+            prices, since=self.pnl_change_version
         )
+        if not updates:
+            return
+        by_id = {row["id"]: row for row in updates}
+        self.pnl_change_list = [by_id.get(row["id"], row) for row in self.pnl_change_list]
         self.pnl_change_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def set_pnl_change_search(self, query: str):
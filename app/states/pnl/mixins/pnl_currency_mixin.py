@@ -4,7 +4,6 @@ from datetime import datetime
 import reflex as rx
 from app.states.pnl.types import PnLCurrencyItem
 import logging
-import random
 from app.services import services
 
 class PnLCurrencyMixin(rx.State, mixin=True):
@@ -18,6 +17,8 @@ class PnLCurrencyMixin(rx.State, mixin=True):
     pnl_currency_error: str = ""
     pnl_currency_last_updated: str = "—"
     pnl_currency_auto_refresh: bool = True
+    # Currency exposure version this session last patched from.
+    pnl_currency_version: int = 0
 
     # Filters
     pnl_currency_search: str = ""
@@ -38,6 +39,7 @@ class PnLCurrencyMixin(rx.State, mixin=True):
         try:
             pos_date = self._ensure_pnl_currency_date()
             self.pnl_currency_list = await services.pnl.get_pnl_by_currency(pos_date)
+            self.pnl_currency_version = 0
         except Exception as e:
             self.pnl_currency_error = str(e)
 
@@ -63,6 +65,7 @@ class PnLCurrencyMixin(rx.State, mixin=True):
         try:
             pos_date = self._ensure_pnl_currency_date()
             self.pnl_currency_list = await services.pnl.get_pnl_by_currency(pos_date)
+            self.pnl_currency_version = 0
             self.pnl_currency_last_updated = datetime.now().strftime(
                 "%Y-%m-%d %H:%M:%S"
             )
@@ -79,7 +82,7 @@ class PnLCurrencyMixin(rx.State, mixin=True):
             async with self:
                 if not self.pnl_currency_auto_refresh:
                     break
-                self.simulate_pnl_currency_update()
+                await self.apply_pnl_currency_ticks()
             await asyncio.sleep(2)
 
     def toggle_pnl_currency_auto_refresh(self, value: bool):
@@ -88,33 +91,18 @@ class PnLCurrencyMixin(rx.State, mixin=True):
         if value:
             return type(self).start_pnl_currency_auto_refresh
 
-    def simulate_pnl_currency_update(self):
-        """Simulated delta update for demo - random PnL fluctuations."""
+    async def apply_pnl_currency_ticks(self):
+        """Patch only the currency rows whose FX rate or positions moved."""
         if not self.pnl_currency_auto_refresh or len(self.pnl_currency_list) < 1:
             return
-
-        # Create a new list to trigger change detection
-        new_list = list(self.pnl_currency_list)
-
-        # Update 1-3 random rows
-        for _ in range(random.randint(1, min(3, len(new_list)))):
-            idx = random.randint(0, len(new_list) - 1)
-            old_row = new_list[idx]
-            # Create a new row dict (immutable update for AG Grid change detection)
-            new_row = dict(old_row)
-
-            # Simulate small FX rate changes
-            if "fx_rate" in new_row and new_row["fx_rate"]:
-                try:
-                    val = float(str(new_row["fx_rate"]).replace(",", ""))
-                    new_val = round(val * random.uniform(0.999, 1.001), 4)
-                    new_row["fx_rate"] = f"{new_val:.4f}"
-                except (ValueError, TypeError):
-                    pass
-
-            new_list[idx] = new_row
-
-        self.pnl_currency_list = new_list
+        pos_date = self._ensure_pnl_currency_date()
+        updates, self.pnl_currency_version = await services.pnl.get_pnl_currency_updates(
+            trade_date=pos_date, since=self.pnl_currency_version
+        )
+        if not updates:
+            return
+        by_id = {row["id"]: row for row in updates}
+        self.pnl_currency_list = [by_id.get(row["id"], row) for row in self.pnl_currency_list]
         self.pnl_currency_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def set_pnl_currency_search(self, query: str):
@@ -33,6 +33,12 @@ class PnLFullItem(TypedDict):
     pnl_chg_pct_1d: str
     pnl_chg_pct_1w: str
     pnl_chg_pct_1m: str
+    pnl_delta: str
+    pnl_gamma: str
+    pnl_vega: str
+    pnl_theta: str
+    pnl_fx: str
+    pnl_residual: str
 
 
 class PnLSummaryItem(TypedDict):
@@ -61,6 +67,8 @@ class PnLCurrencyItem(TypedDict):
     ccy_exposure: str
     usd_exposure: str
     pos_ccy_expo: str
+    hedge_notional: str
+    hedge_ratio: str
     ccy_hedged_pnl: str
     pos_ccy_pnl: str
     net_ccy: str
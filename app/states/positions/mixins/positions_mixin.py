@@ -60,7 +60,7 @@ class PositionsMixin(rx.State, mixin=True):
         await asyncio.sleep(0.3)
         try:
             pos_date = self._ensure_positions_date()
-            self.positions = await services.positions.get_positions(pos_date)
+            self.positions = await services.positions.get_positions(pos_date, refresh=True)
             self.positions_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         except Exception as e:
 
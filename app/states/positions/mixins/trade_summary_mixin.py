@@ -2,9 +2,8 @@ import asyncio
 from datetime import datetime
 
 import reflex as rx
-from app.states.positions.types import TradeSummaryItem
+from app.states.positions.types import TradeAggregateItem, TradeSummaryItem
 import logging
-import random
 from app.services import services
 
 class TradeSummaryMixin(rx.State, mixin=True):
@@ -22,6 +21,11 @@ class TradeSummaryMixin(rx.State, mixin=True):
 
     trade_summary_search: str = ""
 
+    # Live per ticker/side/broker fill aggregates
+    trade_aggregates: list[TradeAggregateItem] = []
+    # Aggregator version this session last patched from.
+    trade_aggregate_version: int = 0
+
     # Position date — defaults to today
     trade_summary_position_date: str = ""
 
@@ -40,6 +44,8 @@ class TradeSummaryMixin(rx.State, mixin=True):
             self.trade_summaries = await services.positions.get_trade_summary(
                 start_date=pos_date, end_date=pos_date
             )
+            self.trade_aggregates = await services.positions.get_trade_aggregates()
+            self.trade_aggregate_version = 0
         except Exception as e:
             self.trade_summary_error = str(e)
 
@@ -67,6 +73,8 @@ class TradeSummaryMixin(rx.State, mixin=True):
             self.trade_summaries = await services.positions.get_trade_summary(
                 start_date=pos_date, end_date=pos_date
             )
+            self.trade_aggregates = await services.positions.get_trade_aggregates()
+            self.trade_aggregate_version = 0
             self.trade_summary_last_updated = datetime.now().strftime(
                 "%Y-%m-%d %H:%M:%S"
             )
@@ -88,7 +96,7 @@ class TradeSummaryMixin(rx.State, mixin=True):
             async with self:
                 if not self.trade_summary_auto_refresh:
                     break
-                self.simulate_trade_summary_update()
+                await self.apply_trade_aggregate_updates()
             await asyncio.sleep(2)
 
     def toggle_trade_summary_auto_refresh(self, value: bool):
@@ -97,27 +105,20 @@ class TradeSummaryMixin(rx.State, mixin=True):
         if value:
             return type(self).start_trade_summary_auto_refresh
 
-    def simulate_trade_summary_update(self):
-        """Simulated update for demo - random fluctuations."""
-        if not self.trade_summary_auto_refresh or len(self.trade_summaries) < 1:
+    async def apply_trade_aggregate_updates(self):
+        """Patch only the aggregate rows that new fills touched."""
+        if not self.trade_summary_auto_refresh:
             return
-
-        # Immutable update for cell flash
-        new_list = list(self.trade_summaries)
-        for _ in range(random.randint(1, min(3, len(new_list)))):
-            idx = random.randint(0, len(new_list) - 1)
-            new_row = dict(new_list[idx])
-            # Simulate divisor changes
-            if "divisor" in new_row and new_row["divisor"]:
-                try:
-                    val = float(new_row["divisor"])
-                    new_row["divisor"] = str(
-                        round(val * random.uniform(0.99, 1.01), 4)
-                    )
-                except (ValueError, TypeError):
-                    pass
-            new_list[idx] = new_row
-        self.trade_summaries = new_list
+        updates, self.trade_aggregate_version = await services.positions.get_trade_aggregate_updates(
+            since=self.trade_aggregate_version
+        )
+        if not updates:
+            return
+        by_id = {row["id"]: row for row in updates}
+        known = {row["id"] for row in self.trade_aggregates}
+        self.trade_aggregates = [by_id.get(row["id"], row) for row in self.trade_aggregates] + [
+            row for row in updates if row["id"] not in known
+        ]
         self.trade_summary_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def set_trade_summary_search(self, query: str):
@@ -130,3 +131,11 @@ class TradeSummaryMixin(rx.State, mixin=True):
             query = self.trade_summary_search.lower()
             data = [item for item in data if query in item.get("ticker", "").lower()]
         return data
+
+    @rx.var(cache=True)
+    def filtered_trade_aggregates(self) -> list[TradeAggregateItem]:
+        data = self.trade_aggregates
+        if self.trade_summary_search:
+            query = self.trade_summary_search.lower()
+            data = [item for item in data if query in item.get("ticker", "").lower()]
+        return data
@@ -64,6 +64,19 @@ class BondPositionItem(TypedDict):
     account_id: str
 
 
+class TradeAggregateItem(TypedDict):
+    id: int
+    ticker: str
+    side: str
+    broker: str
+    quantity: str
+    notional: str
+    avg_price: str
+    last_price: str
+    fill_count: int
+    last_fill_time: str
+
+
 class TradeSummaryItem(TypedDict):
     id: int
     deal_num: str
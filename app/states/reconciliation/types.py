@@ -66,6 +66,13 @@ class PnLReconItem(TypedDict):
     warrant_sec_id: str
     bond_sec_id: str
     stock_position: str
+    pnl_total: str
+    pnl_delta: str
+    pnl_gamma: str
+    pnl_vega: str
+    pnl_theta: str
+    pnl_fx: str
+    pnl_residual: str
 
 
 class RiskInputReconItem(TypedDict):
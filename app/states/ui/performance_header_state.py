@@ -98,12 +98,13 @@ class PerformanceHeaderState(rx.State):
             # Load KPI metrics (from core via PerformanceHeaderService)
             self.kpi_metrics = await services.performance_header.get_kpi_metrics()
 
-            # Load top movers for all categories (from MarketDataService)
-            self.top_movers_ops = await services.market_data.get_top_movers("ops")
-            self.top_movers_ytd = await services.market_data.get_top_movers("ytd")
-            self.top_movers_delta = await services.market_data.get_top_movers("delta")
-            self.top_movers_price = await services.market_data.get_top_movers("price")
-            self.top_movers_volume = await services.market_data.get_top_movers("volume")
+            # Load top movers for all categories in one snapshot (from MarketDataService)
+            movers = await services.market_data.get_top_movers_snapshot()
+            self.top_movers_ops = movers["ops"]["top"]
+            self.top_movers_ytd = movers["ytd"]["top"]
+            self.top_movers_delta = movers["delta"]["top"]
+            self.top_movers_price = movers["price"]["top"]
+            self.top_movers_volume = movers["volume"]["top"]
 
             # Load portfolio holdings (from core via PerformanceHeaderService)
             self.portfolio_holdings = (
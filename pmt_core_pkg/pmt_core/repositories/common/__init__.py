@@ -2,6 +2,7 @@
 pmt_core.repositories.common - Common Repository Base Classes
 """
 
+from .connection_pool import ConnectionPool, close_pools, get_pool
 from .database_base import DatabaseRepository
 
-__all__ = ["DatabaseRepository"]
+__all__ = ["ConnectionPool", "DatabaseRepository", "close_pools", "get_pool"]
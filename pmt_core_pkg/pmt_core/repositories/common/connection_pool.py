@@ -0,0 +1,269 @@
+"""
+Connection Pool — bounded, thread-safe reuse of database connections.
+
+Opening a SQL Server connection costs a full login handshake, so
+connections are kept open and handed out again. The pool is bounded:
+when every connection is checked out, callers wait up to the checkout
+timeout and then get ``DatabaseConnectionError``. Checkout hands out the
+most recently used connection and first sweeps expired ones from the
+cold end, so idle connections are retired after ``idle_timeout`` and
+every connection after ``max_lifetime``; a connection idle for longer
+than ``health_check_after`` is pinged on checkout and replaced if dead.
+Every returned connection is rolled back, so no transaction carries over
+to its next user.
+
+Pools are shared per connection string through ``get_pool``, so every
+repository pointing at the same database draws from one pool.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+from pmt_core.exceptions import DatabaseConnectionError
+
+logger = logging.getLogger(__name__)
+
+
+def ping(connection: Any) -> bool:
+    """Default health check: a trivial round trip."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+    finally:
+        cursor.close()
+    return True
+
+
+@dataclass
+class _Pooled:
+    connection: Any
+    created_at: float
+    last_used: float
+
+
+class ConnectionPool:
+    """
+    Bounded pool of connections created by ``connect``.
+
+    Use ``with pool.connection() as conn:``; the connection is rolled back
+    and goes back to the pool afterwards, or is discarded if it can no
+    longer be rolled back. Work that must persist commits before the
+    block ends (or runs on an ``autocommit`` connection).
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int = 10,
+        checkout_timeout: float = 30.0,
+        max_lifetime: float = 1800.0,
+        idle_timeout: float = 300.0,
+        health_check: Optional[Callable[[Any], bool]] = ping,
+        health_check_after: float = 5.0,
+        server: Optional[str] = None,
+        database: Optional[str] = None,
+    ):
+        self._connect = connect
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self.health_check_after = health_check_after
+        self.server = server
+        self.database = database
+        self.name = f"{server}/{database}"
+        self._cond = threading.Condition()
+        self._idle: deque[_Pooled] = deque()
+        self._in_use: dict[int, _Pooled] = {}
+        self._opening = 0
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Open connections, idle or checked out."""
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {"size": self.size, "idle": len(self._idle), "in_use": len(self._in_use)}
+
+    # --- Checkout ---
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a connection, waiting up to ``timeout`` seconds
+        (``checkout_timeout`` by default) for one to become free.
+
+        Raises:
+            DatabaseConnectionError: If the pool stays exhausted for the whole
+                timeout, is closed, or a new connection cannot be opened.
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        self._sweep()
+        while True:
+            pooled = self._checkout(deadline)
+            if pooled is None:
+                return self._open()
+            if self._usable(pooled):
+                return pooled.connection
+            self._discard(pooled)
+
+    def _checkout(self, deadline: float) -> Optional[_Pooled]:
+        """An idle connection, or None once a slot to open a new one is reserved."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DatabaseConnectionError(
+                        "Connection pool is closed", self.server, self.database
+                    )
+                if self._idle:
+                    pooled = self._idle.pop()  # most recently used first
+                    self._in_use[id(pooled.connection)] = pooled
+                    return pooled
+                if self.size < self.max_size:
+                    self._opening += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DatabaseConnectionError(
+                        "Connection pool exhausted",
+                        self.server,
+                        self.database,
+                        details=f"{self.max_size} connections in use",
+                    )
+                self._cond.wait(remaining)
+
+    def _open(self) -> Any:
+        try:
+            connection = self._connect()
+        except Exception as e:
+            with self._cond:
+                self._opening -= 1
+                self._cond.notify()
+            raise DatabaseConnectionError(
+                server=self.server, database=self.database, details=str(e)
+            ) from e
+        now = time.monotonic()
+        with self._cond:
+            self._opening -= 1
+            self._in_use[id(connection)] = _Pooled(connection, now, now)
+        logger.debug(f"Opened pooled connection ({self.name})")
+        return connection
+
+    def _expired(self, pooled: _Pooled, now: float) -> bool:
+        return (
+            now - pooled.created_at > self.max_lifetime
+            or now - pooled.last_used > self.idle_timeout
+        )
+
+    def _sweep(self) -> None:
+        """Close expired idle connections, starting from the least recently used."""
+        now = time.monotonic()
+        expired = []
+        with self._cond:
+            while self._idle and self._expired(self._idle[0], now):
+                expired.append(self._idle.popleft())
+            if expired:
+                self._cond.notify(len(expired))
+        for pooled in expired:
+            self._close(pooled.connection)
+        if expired:
+            logger.debug(f"Retired {len(expired)} expired pooled connections ({self.name})")
+
+    def _usable(self, pooled: _Pooled) -> bool:
+        now = time.monotonic()
+        if self._expired(pooled, now):
+            return False
+        if self.health_check is not None and now - pooled.last_used > self.health_check_after:
+            try:
+                return bool(self.health_check(pooled.connection))
+            except Exception as e:
+                logger.warning(f"Pooled connection failed health check ({self.name}): {e}")
+                return False
+        return True
+
+    # --- Return ---
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """
+        Return a connection; ``discard`` closes it instead of reusing it.
+
+        The connection is rolled back first, so no open transaction (or
+        locks it holds) reaches the next user; one that cannot be rolled
+        back is closed.
+        """
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception as e:
+                logger.warning(f"Pooled connection failed rollback ({self.name}): {e}")
+                discard = True
+        with self._cond:
+            pooled = self._in_use.pop(id(connection), None)
+            if pooled is None:
+                return
+            if not (discard or self._closed):
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+                self._cond.notify()
+                return
+            self._cond.notify()
+        self._close(pooled.connection)
+
+    def _discard(self, pooled: _Pooled) -> None:
+        self.release(pooled.connection, discard=True)
+
+    @staticmethod
+    def _close(connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Context manager that checks a connection out and back in."""
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones close when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._cond.notify_all()
+        for pooled in idle:
+            self._close(pooled.connection)
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key: str, factory: Callable[[], ConnectionPool]) -> ConnectionPool:
+    """The shared pool for ``key`` (e.g. a connection string), created on first use."""
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = _pools[key] = factory()
+        return pool
+
+
+def close_pools() -> None:
+    """Close every shared pool (application shutdown, tests)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -1,5 +1,9 @@
 import os
+import asyncio
 import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 from contextlib import contextmanager
 
@@ -20,8 +24,62 @@ except ImportError:
         "python-dotenv not installed. Environment variables must be set manually."
     )
 
+from pmt_core.exceptions import DataExtractionError
+
+from .connection_pool import ConnectionPool, get_pool
+
 logger = logging.getLogger(__name__)
 
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_query_executor() -> ThreadPoolExecutor:
+    """
+    Dedicated worker threads for blocking database calls.
+
+    Sized by DB_QUERY_WORKERS (default DB_POOL_SIZE) so a burst of slow
+    queries queues here instead of starving the loop's default executor.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = int(os.getenv("DB_QUERY_WORKERS", os.getenv("DB_POOL_SIZE", "10")))
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-query")
+        return _executor
+
+
+class _QueryHandle:
+    """Cursor of an in-flight query, so another thread can cancel it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cursor = None
+        self.cancelled = False
+
+    def attach(self, cursor) -> bool:
+        """
+        Register the cursor about to execute.
+
+        Returns:
+            False if the query was already cancelled (timed out or its task
+            was cancelled); the caller must not execute it.
+        """
+        with self._lock:
+            if self.cancelled:
+                return False
+            self.cursor = cursor
+            return True
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            if self.cursor is not None:
+                try:
+                    self.cursor.cancel()
+                except Exception as e:
+                    logger.debug(f"Cursor cancel failed: {e}")
+
 
 class DatabaseRepository:
     """
@@ -37,6 +95,13 @@ class DatabaseRepository:
         self.driver = os.getenv("DB_DRIVER", "ODBC Driver 17 for SQL Server")
         self.connection_timeout = int(os.getenv("DB_CONNECTION_TIMEOUT", "30"))
 
+        # Connection pool (shared by every repository on the same database)
+        self.pool_size = int(os.getenv("DB_POOL_SIZE", "10"))
+        self.pool_timeout = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.pool_max_lifetime = float(os.getenv("DB_POOL_MAX_LIFETIME", "1800"))
+        self.pool_idle_timeout = float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300"))
+        self.query_timeout = float(os.getenv("DB_QUERY_TIMEOUT", "60"))
+
         # Mock Data Mode toggle
         # Services can set this to True to force mock data return
         self.mock_mode = os.getenv("USE_MOCK_DATA", "True").lower() == "true"
@@ -63,9 +128,36 @@ class DatabaseRepository:
                 f"Connection Timeout={self.connection_timeout};"
             )
 
+    def get_pool(self) -> ConnectionPool:
+        """Shared connection pool for this repository's connection string."""
+        conn_str = self.get_connection_string()
+        return get_pool(
+            conn_str,
+            lambda: ConnectionPool(
+                # Each statement commits on its own; nothing is left pending
+                # on a connection when it goes back to the pool.
+                lambda: pyodbc.connect(conn_str, autocommit=True),
+                max_size=self.pool_size,
+                checkout_timeout=self.pool_timeout,
+                max_lifetime=self.pool_max_lifetime,
+                idle_timeout=self.pool_idle_timeout,
+                server=self.server,
+                database=self.database,
+            ),
+        )
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
+        """
+        Context manager for database connections.
+
+        Connections are checked out of the shared pool and returned to it
+        on exit rather than closed.
+
+        Raises:
+            DatabaseConnectionError: If the pool is exhausted or the server
+                cannot be reached.
+        """
         if self.mock_mode:
             logger.info("Mock mode enabled: yielding None connection.")
             yield None
@@ -74,54 +166,102 @@ class DatabaseRepository:
         if not PYODBC_AVAILABLE:
             raise ImportError("pyodbc is not installed. Run: pip install pyodbc")
 
-        connection = None
         try:
-            conn_str = self.get_connection_string()
-            connection = pyodbc.connect(conn_str)
-            yield connection
+            with self.get_pool().connection() as connection:
+                yield connection
         except Exception as e:
             logger.error(f"Database connection error: {e}")
             raise
-        finally:
-            if connection:
-                connection.close()
+
+    def _fetch_all(
+        self, sql: str, params: Optional[tuple], handle: _QueryHandle, timeout: float
+    ) -> list[dict[str, Any]]:
+        """Blocking execute + fetch; runs on a query executor thread."""
+        with self.get_connection() as conn:
+            if not conn:
+                return []
+            # Server-side backstop in case the client-side cancel is lost
+            conn.timeout = math.ceil(timeout)
+            cursor = conn.cursor()
+            try:
+                if not handle.attach(cursor):
+                    # Timed out while waiting for a worker or a connection;
+                    # nobody is waiting for the result any more.
+                    return []
+                if params:
+                    cursor.execute(sql, params)
+                else:
+                    cursor.execute(sql)
+                if cursor.description is None:
+                    return []
+                columns = [column[0] for column in cursor.description]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+
+    async def _run_query(
+        self, sql: str, params: Optional[tuple], timeout: Optional[float]
+    ) -> list[dict[str, Any]]:
+        """
+        Run ``sql`` off the event loop with a timeout.
+
+        On timeout or task cancellation the in-flight cursor is cancelled so
+        the worker thread and its pooled connection are freed promptly.
+        """
+        timeout = self.query_timeout if timeout is None else timeout
+        handle = _QueryHandle()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            get_query_executor(), self._fetch_all, sql, params, handle, timeout
+        )
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            handle.cancel()
+            raise DataExtractionError(
+                f"Query timed out after {timeout:g}s",
+                source=self.database,
+                query=sql,
+            )
+        except asyncio.CancelledError:
+            handle.cancel()
+            raise
 
     async def execute_query(
-        self, query: str, params: Optional[tuple] = None
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        timeout: Optional[float] = None,
     ) -> list[dict[str, Any]]:
         """
         Execute a SELECT query and return results as list of dictionaries.
         This method should be used by subclasses when fetching real data.
+
+        The query runs on the dedicated query executor, so the event loop
+        stays free. ``timeout`` defaults to DB_QUERY_TIMEOUT seconds.
+
+        Raises:
+            DataExtractionError: If the query exceeds its timeout.
         """
         if self.mock_mode:
             logger.warning("execute_query called in mock mode. Returning empty list.")
             return []
 
-        # Implementation for real DB execution (simplistic version)
-        with self.get_connection() as conn:
-            if not conn:
-                return []
-            cursor = conn.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-
-            columns = [column[0] for column in cursor.description]
-            results = []
-            for row in cursor.fetchall():
-                results.append(dict(zip(columns, row)))
-            return results
+        return await self._run_query(query, params, timeout)
 
     async def execute_stored_proc(
-        self, proc_name: str, params: Optional[list] = None
+        self,
+        proc_name: str,
+        params: Optional[list] = None,
+        timeout: Optional[float] = None,
     ) -> list[dict[str, Any]]:
-        """Execute a stored procedure."""
+        """Execute a stored procedure; same threading and timeout as execute_query."""
         if self.mock_mode:
             logger.warning(
                 "execute_stored_proc called in mock mode. Returning empty list."
             )
             return []
 
-        # TODO: Implement stored proc execution
-        return []
+        placeholders = ", ".join("?" for _ in params or ())
+        sql = f"{{CALL {proc_name} ({placeholders})}}" if params else f"{{CALL {proc_name}}}"
+        return await self._run_query(sql, tuple(params) if params else None, timeout)
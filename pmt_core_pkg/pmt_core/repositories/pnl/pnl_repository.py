@@ -1,52 +1,213 @@
 from typing import Any, List, Optional
 from pmt_core.repositories.common import DatabaseRepository
-from pmt_core.models import PnLRecord
 import logging
-import random
+import zlib
 from datetime import datetime
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Mock book: (book, underlying, ticker, currency, last price, quantity, ADV 3m).
+_MOCK_POSITIONS = [
+    ("JP-EQ", "Toyota Motor", "7203.T", "JPY", 2_876.5, 120_000, 4_567_890),
+    ("JP-EQ", "Sony Group", "6758.T", "JPY", 14_234.0, 25_000, 2_123_456),
+    ("JP-EQ", "Nintendo", "7974.T", "JPY", 8_567.0, 30_000, 3_234_567),
+    ("JP-EQ", "SoftBank Group", "9984.T", "JPY", 9_123.0, -40_000, 5_678_901),
+    ("JP-EQ", "Keyence", "6861.T", "JPY", 65_430.0, 5_000, 412_345),
+    ("JP-EQ", "Fast Retailing", "9983.T", "JPY", 41_250.0, 6_000, 612_345),
+    ("JP-EQ", "Tokyo Electron", "8035.T", "JPY", 24_880.0, 12_000, 2_345_678),
+    ("JP-EQ", "Shin-Etsu Chemical", "4063.T", "JPY", 6_012.0, 35_000, 3_456_789),
+    ("JP-EQ", "Hitachi", "6501.T", "JPY", 3_745.0, 60_000, 8_765_432),
+    ("JP-EQ", "Mitsubishi UFJ", "8306.T", "JPY", 1_612.5, -150_000, 45_678_901),
+    ("JP-EQ", "Recruit Holdings", "6098.T", "JPY", 9_870.0, 20_000, 2_987_654),
+    ("JP-EQ", "Daikin Industries", "6367.T", "JPY", 18_450.0, 8_000, 876_543),
+    ("JP-EQ", "KDDI", "9433.T", "JPY", 4_789.0, 45_000, 4_321_098),
+    ("JP-EQ", "Fanuc", "6954.T", "JPY", 4_123.0, 40_000, 2_109_876),
+    ("JP-EQ", "Murata Manufacturing", "6981.T", "JPY", 2_845.0, 70_000, 5_432_109),
+    ("US-TECH", "Apple Inc.", "AAPL", "USD", 182.5, 50_000, 54_000_000),
+    ("US-TECH", "Microsoft Corp.", "MSFT", "USD", 415.2, 20_000, 22_000_000),
+    ("US-TECH", "Alphabet Inc.", "GOOGL", "USD", 171.3, 30_000, 25_000_000),
+    ("US-TECH", "Amazon.com Inc.", "AMZN", "USD", 186.4, 25_000, 40_000_000),
+    ("US-TECH", "Tesla Inc.", "TSLA", "USD", 248.9, -15_000, 98_000_000),
+    ("US-TECH", "NVIDIA Corp.", "NVDA", "USD", 121.4, 60_000, 250_000_000),
+    ("US-TECH", "Meta Platforms Inc.", "META", "USD", 505.8, 10_000, 15_000_000),
+    ("EMEA", "ASML Holdings", "ASML.AS", "EUR", 678.9, 8_000, 1_123_456),
+    ("EMEA", "HSBC Holdings", "HSBA.L", "GBP", 745.6, 200_000, 7_890_123),
+    ("ASIA", "Tencent Holdings", "0700.HK", "HKD", 388.2, 40_000, 18_000_000),
+    ("GLOBAL", "Sony Group", "6758.T", "JPY", 14_234.0, 10_000, 2_123_456),
+    ("GLOBAL", "Apple Inc.", "AAPL", "USD", 182.5, -20_000, 54_000_000),
+]
+
+# Share of each currency's position exposure hedged with FX forwards.
+_MOCK_HEDGE_RATIOS = {"JPY": 0.8, "EUR": 0.5, "GBP": 1.0}
+
+# First business day of the mock P&L history.
+_MOCK_HISTORY_EPOCH = np.datetime64("2022-01-03")
+
+# Daily vol of the mock drift between today's FX close and a past date's.
+_MOCK_FX_DRIFT = 0.004
+
+
+def _mock_fx_close(trade_date: str, currencies: np.ndarray, fx_closes) -> np.ndarray:
+    """
+    Units of currency per 1 USD at ``trade_date``'s close.
+
+    Today's close is the FX matrix quote; past dates drift from it by a
+    deterministic per-date amount, so each date carries its own rates.
+    """
+    rates = np.asarray(fx_closes.usd_rate(currencies), dtype=float)
+    days_back = np.busday_count(
+        np.datetime64(trade_date, "D"), np.datetime64(datetime.now().strftime("%Y-%m-%d"))
+    )
+    if days_back <= 0:
+        return rates
+    rng = np.random.default_rng(zlib.crc32(f"fx:{trade_date}".encode()))
+    names, codes = np.unique(currencies, return_inverse=True)
+    drift = rng.normal(0.0, _MOCK_FX_DRIFT * np.sqrt(days_back), len(names))
+    drift[names == "USD"] = 0.0
+    return rates * np.exp(drift[codes])
+
+
+def _mock_pnl_inputs(trade_date: str, fx_closes) -> dict[str, np.ndarray]:
+    """Deterministic price/FX paths per trade date, read off at each reference close."""
+    books, underlyings, tickers, currencies, last, quantity, adv = map(
+        np.array, zip(*_MOCK_POSITIONS)
+    )
+    today = np.datetime64(trade_date, "D")
+    days = np.arange(today.astype("datetime64[Y]") - 45, today + 1)
+    bdays = days[np.is_busday(days) | (days == today)]
+    n = len(bdays)
+
+    refs = {
+        "t_1": n - 2,
+        "1w": n - 6,
+        "1m": n - 22,
+    }
+
+    rng = np.random.default_rng(zlib.crc32(trade_date.encode()))
+    # One path per underlying so positions in several books share prices.
+    names, codes = np.unique(tickers, return_inverse=True)
+    steps = rng.normal(0.0003, 0.018, (len(names), n - 1))
+    log_path = np.concatenate([np.zeros((len(names), 1)), np.cumsum(steps, axis=1)], axis=1)
+    # Anchor the path so the latest close equals the mock last price.
+    relative = np.exp(log_path - log_path[:, -1:])[codes]
+
+    ccys = ["USD", "EUR", "GBP", "JPY", "HKD"]
+    fx_steps = rng.normal(0.0, 0.004, (len(ccys), n - 1))
+    fx_steps[ccys.index("USD")] = 0.0
+    fx_log = np.concatenate([np.zeros((len(ccys), 1)), np.cumsum(fx_steps, axis=1)], axis=1)
+    fx_rel = np.exp(fx_log - fx_log[:, -1:])[[ccys.index(c) for c in currencies]]
+    fx_last = _mock_fx_close(trade_date, currencies, fx_closes)
+
+    columns: dict[str, np.ndarray] = {
+        "position_id": np.array([f"POS{i:05d}" for i in range(len(books))]),
+        "ticker": tickers,
+        "underlying": underlyings,
+        "currency": currencies,
+        "book": books,
+        "quantity": quantity.astype(float),
+        "price": last.astype(float),
+        "fx": fx_last,
+        "last_volume": np.round(adv * rng.uniform(0.6, 1.5, len(adv))),
+        "adv_3m": adv.astype(float),
+    }
+    for ref, idx in refs.items():
+        columns[f"price_{ref}"] = np.round(last * relative[:, idx], 2)
+        columns[f"fx_{ref}"] = fx_last * fx_rel[:, idx]
+    return columns
+
 
 class PnLRepository(DatabaseRepository):
     """
     Repository for accessing PnL data.
     """
 
-    async def get_pnl_changes(
+    def __init__(self, fx_closes=None):
+        """
+        Args:
+            fx_closes: FxRateMatrix holding today's FX closes, the anchor of
+                the mock FX columns. Defaults to the mock quotes.
+        """
+        super().__init__()
+        if fx_closes is None:
+            # Deferred: pmt_core.services imports this module.
+            from pmt_core.services.market_data.fx_engine import FxRateMatrix
+
+            fx_closes = FxRateMatrix()
+        self.fx_closes = fx_closes
+
+    async def get_pnl_inputs(
         self, trade_date: Optional[str] = None
-    ) -> List[PnLRecord]:
-        """Get P&L changes."""
+    ) -> dict[str, np.ndarray]:
+        """
+        Get positions with current and reference prices/FX as aligned columns.
+
+        Reference columns (``price_<ref>`` / ``fx_<ref>``) hold the closes for
+        t_1, 1w and 1m; FX is units of currency per 1 USD.
+        """
         if self.mock_mode:
-            logger.info("Returning mock P&L changes")
-            date_str = trade_date or datetime.now().strftime("%Y-%m-%d")
-            tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "NVDA", "META"]
+            logger.info("Returning mock P&L inputs")
+            return _mock_pnl_inputs(
+                trade_date or datetime.now().strftime("%Y-%m-%d"), self.fx_closes
+            )
+        return {}
 
-            return [
-                PnLRecord(
-                    id=i,
-                    trade_date=date_str,
-                    underlying=f"{ticker} US Equity",
-                    ticker=ticker,
-                    currency="USD",
-                    pnl_ytd=f"${random.uniform(-50000, 150000):,.2f}",
-                    pnl_mtd=f"${random.uniform(-10000, 30000):,.2f}",
-                    pnl_wtd=f"${random.uniform(-5000, 15000):,.2f}",
-                    pnl_dtd=f"${random.uniform(-2000, 5000):,.2f}",
-                    pnl_chg_1d=f"${random.uniform(-5000, 5000):,.2f}",
-                    pnl_chg_1w=f"${random.uniform(-15000, 15000):,.2f}",
-                    pnl_chg_1m=f"${random.uniform(-50000, 50000):,.2f}",
-                    pnl_chg_pct_1d=f"{random.uniform(-3, 3):.2f}%",
-                    pnl_chg_pct_1w=f"{random.uniform(-8, 8):.2f}%",
-                    pnl_chg_pct_1m=f"{random.uniform(-15, 15):.2f}%",
-                    price=f"{random.uniform(100, 500):.2f}",
-                    price_t_1=f"{random.uniform(100, 500):.2f}",
-                    price_change=f"{random.uniform(-10, 10):.2f}",
-                    fx_rate="1.0000",
-                )
-                for i, ticker in enumerate(tickers)
-            ]
-        return []
+    async def get_pnl_inputs_range(
+        self, trade_dates: List[str]
+    ) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Get ``get_pnl_inputs`` columns for several trade dates in one round trip.
+
+        Returns ``{trade_date: columns}``; dates with no positions are omitted.
+        """
+        if self.mock_mode:
+            logger.info(f"Returning mock P&L inputs for {len(trade_dates)} dates")
+            return {d: _mock_pnl_inputs(d, self.fx_closes) for d in trade_dates}
+        return {}
+
+    async def get_risk_snapshots(
+        self, trade_date: Optional[str] = None
+    ) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Get the T and T-1 close risk snapshots for the book in one call.
+
+        Returns ``{"t": columns, "t_1": columns}`` with per-position spot,
+        vol, FX, local value and Greeks (delta, gamma, vega per vol point,
+        theta per calendar day).
+        """
+        if self.mock_mode:
+            logger.info("Returning mock risk snapshots")
+            return _mock_risk_snapshots(
+                trade_date or datetime.now().strftime("%Y-%m-%d"), self.fx_closes
+            )
+        return {}
+
+    async def get_fx_hedges(
+        self, trade_date: Optional[str] = None
+    ) -> dict[str, np.ndarray]:
+        """
+        Get open FX hedges as columns: hedge_id, book, currency and signed
+        notional in units of the currency (negative = short the currency).
+        """
+        if self.mock_mode:
+            logger.info("Returning mock FX hedges")
+            return _mock_fx_hedges()
+        return {}
+
+    async def get_pnl_history(
+        self, start_date: str, end_date: str
+    ) -> dict[str, np.ndarray]:
+        """
+        Get daily P&L per position over [start_date, end_date].
+
+        Returns ``{"dates", "position_id", "pnl"}`` with ``pnl`` shaped
+        (dates × positions), USD.
+        """
+        if self.mock_mode:
+            logger.info(f"Returning mock P&L history {start_date} to {end_date}")
+            return _mock_pnl_history(start_date, end_date, self.fx_closes)
+        return {}
 
     async def get_pnl_recon(self) -> List[dict[str, Any]]:
         """Get P&L reconciliation data."""
@@ -70,3 +231,66 @@ class PnLRepository(DatabaseRepository):
                 for i in range(8)
             ]
         return []
+
+
+def _mock_fx_hedges() -> dict[str, np.ndarray]:
+    """Forwards covering a fixed share of each book's non-USD exposure."""
+    exposure: dict[tuple[str, str], float] = {}
+    for book, _, _, ccy, last, quantity, _ in _MOCK_POSITIONS:
+        if ccy in _MOCK_HEDGE_RATIOS:
+            exposure[(book, ccy)] = exposure.get((book, ccy), 0.0) + last * quantity
+    keys = sorted(exposure)
+    return {
+        "hedge_id": np.array([f"FXH{i:04d}" for i in range(len(keys))]),
+        "book": np.array([book for book, _ in keys]),
+        "currency": np.array([ccy for _, ccy in keys]),
+        "notional": np.array(
+            [round(-_MOCK_HEDGE_RATIOS[ccy] * exposure[(book, ccy)], -3) for book, ccy in keys]
+        ),
+    }
+
+
+def _mock_pnl_history(start_date: str, end_date: str, fx_closes) -> dict[str, np.ndarray]:
+    """Daily P&L (about 1% of USD market value per day) from a fixed-seed history."""
+    days = np.arange(_MOCK_HISTORY_EPOCH, np.datetime64(end_date, "D") + 1)
+    days = days[np.is_busday(days)]
+    # One draw over the whole history keeps overlapping ranges consistent.
+    rng = np.random.default_rng(zlib.crc32(b"pnl-history"))
+    _, _, _, currencies, last, quantity, _ = zip(*_MOCK_POSITIONS)
+    usd_value = np.abs(np.array(quantity) * np.array(last)) / fx_closes.usd_rate(currencies)
+    pnl = np.round(rng.normal(0.0003, 0.01, (len(days), len(usd_value))) * usd_value, 2)
+    keep = days >= np.datetime64(start_date, "D")
+    return {
+        "dates": days[keep],
+        "position_id": np.array([f"POS{i:05d}" for i in range(len(usd_value))]),
+        "pnl": pnl[keep],
+    }
+
+
+def _mock_risk_snapshots(trade_date: str, fx_closes) -> dict[str, dict[str, np.ndarray]]:
+    """Cash equity risk at the two closes, consistent with the mock P&L inputs."""
+    inputs = _mock_pnl_inputs(trade_date, fx_closes)
+    rng = np.random.default_rng(zlib.crc32(f"risk:{trade_date}".encode()))
+    n = len(inputs["position_id"])
+    labels = {k: inputs[k] for k in ("position_id", "ticker", "underlying", "currency", "book")}
+    vol_t_1 = rng.uniform(0.18, 0.45, n)
+    zeros = np.zeros(n)
+
+    def close(spot: np.ndarray, fx: np.ndarray, vol: np.ndarray) -> dict[str, np.ndarray]:
+        quantity = inputs["quantity"]
+        return {
+            **labels,
+            "spot": spot,
+            "vol": vol,
+            "fx": fx,
+            "value": quantity * spot,
+            "delta": quantity.copy(),
+            "gamma": zeros,
+            "vega": zeros,
+            "theta": zeros,
+        }
+
+    return {
+        "t": close(inputs["price"], inputs["fx"], vol_t_1 + rng.normal(0.0, 0.005, n)),
+        "t_1": close(inputs["price_t_1"], inputs["fx_t_1"], vol_t_1),
+    }
@@ -2,6 +2,9 @@ from typing import Any, List, Optional
 from pmt_core.repositories.common import DatabaseRepository
 from pmt_core.models import PositionRecord, InstrumentType
 import logging
+import zlib
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -12,86 +15,42 @@ class PositionRepository(DatabaseRepository):
     Returns pmt_core models.
     """
 
+    def __init__(self, reference_data=None):
+        """
+        Args:
+            reference_data: ReferenceDataCache supplying ticker, company and
+                currency for instruments. Defaults to a private cache.
+        """
+        super().__init__()
+        if reference_data is None:
+            # Deferred: pmt_core.services imports this module.
+            from pmt_core.services.reference_data import ReferenceDataCache
+
+            reference_data = ReferenceDataCache()
+        self.reference_data = reference_data
+
     async def get_positions(
         self, position_date: Optional[str] = None
     ) -> List[PositionRecord]:
         """Get all positions."""
         if self.mock_mode:
             logger.info("Returning mock positions")
-            # Using basic dicts that match PositionRecord structure, relying on TypedDict
-            # In a real scenario, we would map SQL rows to PositionRecord
-            positions = []
-            
-            # Generate 10 Equity positions
-            for i in range(10):
-                positions.append(
-                    PositionRecord(
-                        id=i,
-                        trade_date=position_date or "2026-01-17",
-                        deal_num=f"DEAL{i:03d}",
-                        detail_id=f"D{i:03d}",
-                        underlying=f"TKR{i} US Equity",
-                        ticker=f"TKR{i}",
-                        company_name=f"Company {i}",
-                        sec_id=f"SEC{i:06d}",
-                        sec_type="Equity",
-                        subtype=None,
-                        currency="USD",
-                        account_id="ACC001",
-                        pos_loc="NY",
-                        notional=f"${(i + 1) * 50000:,.2f}",
-                        position=f"{(i + 1) * 1000}",
-                        market_value=f"${(i + 1) * 52500:,.2f}",
-                    )
-                )
-            
-            # Generate 5 Warrant positions
-            for i in range(5):
-                positions.append(
-                    PositionRecord(
-                        id=100 + i,
-                        trade_date=position_date or "2026-01-17",
-                        deal_num=f"WDEAL{i:03d}",
-                        detail_id=f"WD{i:03d}",
-                        underlying=f"WRT{i} US Warrant",
-                        ticker=f"WRT{i}",
-                        company_name=f"Warrant Co {i}",
-                        sec_id=f"WSEC{i:06d}",
-                        sec_type="Warrant",
-                        subtype="Call",
-                        currency="USD",
-                        account_id="ACC002",
-                        pos_loc="NY",
-                        notional=f"${(i + 1) * 25000:,.2f}",
-                        position=f"{(i + 1) * 500}",
-                        market_value=f"${(i + 1) * 26250:,.2f}",
-                    )
-                )
-            
-            # Generate 5 Bond positions
-            for i in range(5):
-                positions.append(
-                    PositionRecord(
-                        id=200 + i,
-                        trade_date=position_date or "2026-01-17",
-                        deal_num=f"BDEAL{i:03d}",
-                        detail_id=f"BD{i:03d}",
-                        underlying=f"BND{i} US Bond",
-                        ticker=f"BND{i}",
-                        company_name=f"Bond Issuer {i}",
-                        sec_id=f"BSEC{i:06d}",
-                        sec_type="Bond",
-                        subtype="Corporate",
-                        currency="USD",
-                        account_id="ACC003",
-                        pos_loc="LN",
-                        notional=f"${(i + 1) * 100000:,.2f}",
-                        position=f"{(i + 1) * 100}",
-                        market_value=f"${(i + 1) * 101500:,.2f}",
-                    )
-                )
-            
-            return positions
+            return _mock_positions(position_date or "2026-01-17", self.reference_data)
+        return []
+
+    async def get_position_history(
+        self, start_date: str, end_date: str
+    ) -> List[dict[str, Any]]:
+        """
+        Get daily position changes over [start_date, end_date].
+
+        Returns one entry per business day, ascending:
+        ``{"date", "upserts": [PositionRecord], "removed": [(deal_num, detail_id)]}``.
+        The first entry carries the full book as of ``start_date``.
+        """
+        if self.mock_mode:
+            logger.info(f"Returning mock position history {start_date} to {end_date}")
+            return _mock_position_history(start_date, end_date, self.reference_data)
         return []
 
     async def get_instrument_data(self) -> List[dict[str, Any]]:
@@ -158,24 +117,15 @@ class PositionRepository(DatabaseRepository):
         if self.mock_mode:
             logger.info("Returning mock ticker data")
             tickers = ["AAPL", "MSFT", "TSLA", "NVDA", "GOOGL", "META", "AMZN", "AMD"]
-            sectors = [
-                "Technology",
-                "Technology",
-                "Automotive",
-                "Technology",
-                "Technology",
-                "Technology",
-                "Consumer",
-                "Technology",
-            ]
+            refs = [self.reference_data.get(t) for t in tickers]
             return [
                 {
                     "id": i + 1,
-                    "ticker": tickers[i],
-                    "currency": "USD",
+                    "ticker": ref.ticker,
+                    "currency": ref.currency,
                     "fx_rate": "1.0000",
-                    "sector": sectors[i],
-                    "company": f"{tickers[i]} Inc.",
+                    "sector": ref.sector,
+                    "company": ref.company,
                     "po_lead_manager": [
                         "Goldman Sachs",
                         "Morgan Stanley",
@@ -187,7 +137,7 @@ class PositionRepository(DatabaseRepository):
                     "chg_1d_pct": f"{(-1.5 + i * 0.5):.2f}%",
                     "dtl": f"{30 + i * 5}",
                 }
-                for i in range(len(tickers))
+                for i, ref in enumerate(refs)
             ]
         return []
 
@@ -213,3 +163,142 @@ class PositionRepository(DatabaseRepository):
                 },
             ]
         return []
+
+
+def _instrument_fields(reference_data, identifier: str) -> dict[str, Any]:
+    """Instrument columns of a position row, from the canonical reference record."""
+    ref = reference_data.get(identifier)
+    return {
+        "underlying": ref.bbg_code,
+        "ticker": ref.ticker,
+        "company_name": ref.company,
+        "sec_type": ref.sec_type,
+        "currency": ref.currency,
+    }
+
+
+def _mock_positions(position_date: str, reference_data) -> List[PositionRecord]:
+    """Mock book: 10 equities, 5 warrants and 5 bonds."""
+    # Using basic dicts that match PositionRecord structure, relying on TypedDict
+    # In a real scenario, we would map SQL rows to PositionRecord
+    positions = []
+
+    # Generate 10 Equity positions
+    for i in range(10):
+        positions.append(
+            PositionRecord(
+                id=i,
+                trade_date=position_date,
+                deal_num=f"DEAL{i:03d}",
+                detail_id=f"D{i:03d}",
+                **_instrument_fields(reference_data, f"TKR{i} US Equity"),
+                sec_id=f"SEC{i:06d}",
+                subtype=None,
+                account_id="ACC001",
+                pos_loc="NY",
+                notional=f"${(i + 1) * 50000:,.2f}",
+                position=f"{(i + 1) * 1000}",
+                market_value=f"${(i + 1) * 52500:,.2f}",
+            )
+        )
+
+    # Generate 5 Warrant positions
+    for i in range(5):
+        positions.append(
+            PositionRecord(
+                id=100 + i,
+                trade_date=position_date,
+                deal_num=f"WDEAL{i:03d}",
+                detail_id=f"WD{i:03d}",
+                **_instrument_fields(reference_data, f"WRT{i} US Warrant"),
+                sec_id=f"WSEC{i:06d}",
+                subtype="Call",
+                account_id="ACC002",
+                pos_loc="NY",
+                notional=f"${(i + 1) * 25000:,.2f}",
+                position=f"{(i + 1) * 500}",
+                market_value=f"${(i + 1) * 26250:,.2f}",
+            )
+        )
+
+    # Generate 5 Bond positions
+    for i in range(5):
+        positions.append(
+            PositionRecord(
+                id=200 + i,
+                trade_date=position_date,
+                deal_num=f"BDEAL{i:03d}",
+                detail_id=f"BD{i:03d}",
+                **_instrument_fields(reference_data, f"BND{i} US Bond"),
+                sec_id=f"BSEC{i:06d}",
+                subtype="Corporate",
+                account_id="ACC003",
+                pos_loc="LN",
+                notional=f"${(i + 1) * 100000:,.2f}",
+                position=f"{(i + 1) * 100}",
+                market_value=f"${(i + 1) * 101500:,.2f}",
+            )
+        )
+
+    return positions
+
+
+def _mock_position_history(
+    start_date: str, end_date: str, reference_data
+) -> List[dict[str, Any]]:
+    """
+    Business-day position changes: a few fills a day resize positions, and
+    every tenth day one new equity is opened and the oldest one closed.
+    """
+    days = np.arange(np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1)
+    days = [str(d) for d in days[np.is_busday(days)]]
+    if not days:
+        return []
+    book = {
+        (p["deal_num"], p["detail_id"]): p
+        for p in _mock_positions(days[0], reference_data)
+    }
+    history = [{"date": days[0], "upserts": list(book.values()), "removed": []}]
+    opened = 0
+    for n, day in enumerate(days[1:], start=1):
+        rng = np.random.default_rng(zlib.crc32(day.encode()))
+        keys = list(book)
+        upserts, removed = [], []
+        for i in rng.choice(len(keys), size=3, replace=False):
+            row = book[keys[i]]
+            held = float(row["position"])
+            new_held = max(1.0, round(held * rng.uniform(0.9, 1.1)))
+            scale = new_held / held
+            row = PositionRecord(
+                **{
+                    **row,
+                    "trade_date": day,
+                    "position": f"{int(new_held)}",
+                    "notional": f"${float(row['notional'][1:].replace(',', '')) * scale:,.2f}",
+                    "market_value": (
+                        f"${float(row['market_value'][1:].replace(',', '')) * scale:,.2f}"
+                    ),
+                }
+            )
+            book[keys[i]] = row
+            upserts.append(row)
+        if n % 10 == 0:
+            opened += 1
+            row = PositionRecord(
+                **{
+                    **_mock_positions(day, reference_data)[0],
+                    "id": 1000 + opened,
+                    "deal_num": f"NDEAL{opened:03d}",
+                    "detail_id": f"ND{opened:03d}",
+                    "ticker": f"NEW{opened}",
+                    "underlying": f"NEW{opened} US Equity",
+                }
+            )
+            book[(row["deal_num"], row["detail_id"])] = row
+            upserts.append(row)
+            closed = next(k for k in book if k[0].startswith(("DEAL", "NDEAL")))
+            del book[closed]
+            removed.append(closed)
+            upserts = [u for u in upserts if (u["deal_num"], u["detail_id"]) != closed]
+        history.append({"date": day, "upserts": upserts, "removed": removed})
+    return history
@@ -21,7 +21,15 @@ from typing import Any, List, Optional, Protocol, runtime_checkable
 class PnLRepositoryProtocol(Protocol):
     """Protocol for PnL data access."""
 
-    async def get_pnl_changes(self, trade_date: Optional[str] = None) -> List[Any]: ...
+    async def get_pnl_inputs(self, trade_date: Optional[str] = None) -> dict[str, Any]: ...
+
+    async def get_pnl_inputs_range(self, trade_dates: List[str]) -> dict[str, Any]: ...
+
+    async def get_risk_snapshots(self, trade_date: Optional[str] = None) -> dict[str, Any]: ...
+
+    async def get_fx_hedges(self, trade_date: Optional[str] = None) -> dict[str, Any]: ...
+
+    async def get_pnl_history(self, start_date: str, end_date: str) -> dict[str, Any]: ...
 
     async def get_pnl_recon(self) -> List[dict[str, Any]]: ...
 
@@ -35,6 +43,8 @@ class PositionRepositoryProtocol(Protocol):
 
     async def get_positions(self, position_date: Optional[str] = None) -> List[Any]: ...
 
+    async def get_position_history(self, start_date: str, end_date: str) -> List[Any]: ...
+
     async def get_instrument_data(self) -> List[dict[str, Any]]: ...
 
     async def get_instrument_terms(self) -> List[dict[str, Any]]: ...
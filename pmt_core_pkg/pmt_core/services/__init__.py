@@ -16,6 +16,7 @@ from pmt_core.services.operations import OperationsService
 from pmt_core.services.instruments import InstrumentsService
 from pmt_core.services.reconciliation import ReconciliationService
 from pmt_core.services.market_data import MarketDataService
+from pmt_core.services.reference_data import ReferenceDataCache
 from pmt_core.services.risk import RiskService
 from pmt_core.services.portfolio_tools import PortfolioToolsService
 from pmt_core.services.emsx import EMSXService
@@ -35,6 +36,7 @@ __all__ = [
     "InstrumentsService",
     "ReconciliationService",
     "MarketDataService",
+    "ReferenceDataCache",
     "RiskService",
     "PortfolioToolsService",
     "EMSXService",
@@ -7,11 +7,15 @@ TODO: Replace mock data with actual Bloomberg/database integration.
 
 import logging
 import random
+from collections import deque
 from typing import Any, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Most recent mock fills kept for polling.
+_MOCK_FILL_BUFFER = 1_000
+
 
 class EMSXService:
     """
@@ -21,6 +25,39 @@ class EMSXService:
     Real implementation would delegate to Bloomberg connector or repository.
     """
 
+    def __init__(self):
+        self._fills: deque[dict[str, Any]] = deque(maxlen=_MOCK_FILL_BUFFER)
+        self._fill_sequence = 0
+
+    async def get_emsx_fills(self, after_sequence: int = 0) -> list[dict[str, Any]]:
+        """
+        Get fills with a sequence number above ``after_sequence``.
+
+        TODO: Implement using the Bloomberg EMSX fill subscription.
+        """
+        logger.warning("Using mock EMSX fill data.")
+        # Each poll "executes" a few more mock fills.
+        tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA"]
+        prices = {"AAPL": 189.5, "MSFT": 402.1, "GOOGL": 171.3, "AMZN": 186.4, "TSLA": 248.9}
+        for _ in range(random.randint(1, 5) if self._fills else 40):
+            ticker = random.choice(tickers)
+            self._fill_sequence += 1
+            sequence = self._fill_sequence
+            self._fills.append(
+                {
+                    "fill_id": f"FILL{sequence:06d}",
+                    "sequence": sequence,
+                    "order_id": random.randint(0, 9),
+                    "ticker": ticker,
+                    "side": random.choice(["Buy", "Sell"]),
+                    "broker": random.choice(["GS", "MS", "JPM", "BAML", "CS"]),
+                    "quantity": random.randint(1, 50) * 100,
+                    "price": round(prices[ticker] * random.uniform(0.995, 1.005), 2),
+                    "time": datetime.now().strftime("%H:%M:%S"),
+                }
+            )
+        return [f for f in self._fills if f["sequence"] > after_sequence]
+
     async def get_emsx_orders(
         self, status_filter: Optional[str] = None
     ) -> list[dict[str, Any]]:
@@ -7,7 +7,9 @@ TODO: Replace mock data with actual database/repository calls.
 """
 
 import logging
-from typing import Any
+from typing import Any, Optional
+
+from pmt_core.services.reference_data import ReferenceDataCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,9 @@ class InstrumentsService:
     Real implementation would delegate to a repository layer.
     """
 
+    def __init__(self, reference_data: Optional[ReferenceDataCache] = None):
+        self.reference_data = reference_data or ReferenceDataCache()
+
     async def get_stock_screener(self) -> list[dict[str, Any]]:
         """Get stock screener data. TODO: Replace with DB query."""
         logger.info("Returning mock stock screener data")
@@ -177,27 +182,23 @@ class InstrumentsService:
         ]
 
     async def get_ticker_data(self) -> list[dict[str, Any]]:
-        """Get ticker data for instruments. TODO: Replace with DB query."""
+        """
+        Get ticker data for instruments.
+
+        Static fields come from the reference data cache.
+        TODO: Replace market fields with DB query.
+        """
         logger.info("Returning mock ticker data")
         tickers = ["AAPL", "MSFT", "TSLA", "NVDA", "GOOGL", "META", "AMZN", "AMD"]
-        sectors = [
-            "Technology",
-            "Technology",
-            "Automotive",
-            "Technology",
-            "Technology",
-            "Technology",
-            "Consumer",
-            "Technology",
-        ]
+        refs = [self.reference_data.get(t) for t in tickers]
         return [
             {
                 "id": i + 1,
                 "ticker": tickers[i],
-                "currency": "USD",
+                "currency": refs[i].currency,
                 "fx_rate": "1.0000",
-                "sector": sectors[i],
-                "company": f"{tickers[i]} Inc.",
+                "sector": refs[i].sector,
+                "company": refs[i].company,
                 "po_lead_manager": [
                     "Goldman Sachs",
                     "Morgan Stanley",
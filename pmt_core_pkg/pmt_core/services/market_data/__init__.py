@@ -1,3 +1,40 @@
 from pmt_core.services.market_data.market_data_service import MarketDataService
+from pmt_core.services.market_data.history_store import HistoricalPriceStore
+from pmt_core.services.market_data.bar_aggregator import BarAggregator
+from pmt_core.services.market_data.exchange_calendar import ExchangeCalendar
+from pmt_core.services.market_data.fx_engine import FxRateMatrix
+from pmt_core.services.market_data.market_feed import (
+    MarketDataFeed,
+    QuoteUpdate,
+    SimulatedFeed,
+)
+from pmt_core.services.market_data.market_snapshot import (
+    MarketSnapshot,
+    MarketSnapshotStore,
+    VersionedCache,
+)
+from pmt_core.services.market_data.market_sessions import MarketSessionIndex
+from pmt_core.services.market_data.history_columns import HistoryColumns, HistoryRows
+from pmt_core.services.market_data.top_movers import TopMoversEngine, IndexedHeap
+from pmt_core.services.market_data.yahoo_fetcher import YahooFinanceFetcher, TokenBucket
 
-__all__ = ["MarketDataService"]
+__all__ = [
+    "MarketDataService",
+    "HistoricalPriceStore",
+    "HistoryColumns",
+    "HistoryRows",
+    "BarAggregator",
+    "TopMoversEngine",
+    "IndexedHeap",
+    "ExchangeCalendar",
+    "FxRateMatrix",
+    "MarketSessionIndex",
+    "MarketSnapshot",
+    "MarketSnapshotStore",
+    "VersionedCache",
+    "MarketDataFeed",
+    "QuoteUpdate",
+    "SimulatedFeed",
+    "YahooFinanceFetcher",
+    "TokenBucket",
+]
@@ -0,0 +1,251 @@
+"""
+Bar Aggregator — streaming intraday OHLCV bars and session VWAP.
+
+Each tick updates the open bar for every configured interval and the
+ticker's running session VWAP in O(1); nothing is recomputed over
+history. When a tick falls into a new bucket the previous bar is
+completed and queued; ``persist`` appends queued bars to the
+HistoricalPriceStore under their interval partition (e.g.
+``<root>/5m/AAPL/2026.bin``) and is meant to run off the event loop.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+
+from pmt_core.services.market_data.history_store import BAR_DTYPE, HistoricalPriceStore
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_SECONDS = {"1m": 60, "5m": 300, "1h": 3600}
+
+_SECONDS_PER_DAY = 86400
+
+
+@dataclass(slots=True)
+class Bar:
+    """Open OHLCV bar; ``pv`` accumulates price × size for the bar VWAP."""
+
+    start: int  # epoch seconds, bucket-aligned
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    pv: float
+
+    @property
+    def vwap(self) -> float:
+        return self.pv / self.volume if self.volume else self.close
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start": self.start,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+            "vwap": self.vwap,
+        }
+
+
+@dataclass(slots=True)
+class _Session:
+    """Running per-ticker session totals."""
+
+    day: int  # epoch day of the session
+    pv: float = 0.0
+    volume: float = 0.0
+    last_price: float = 0.0
+    last_size: float = 0.0
+
+
+class BarAggregator:
+    """
+    Maintains running bars per (ticker, interval) and session VWAP per ticker.
+
+    Thread-safe; ``on_tick`` may be called from a feed thread while
+    readers take snapshots.
+    """
+
+    def __init__(
+        self,
+        intervals: tuple[str, ...] = ("1m", "5m", "1h"),
+        history_store: Optional[HistoricalPriceStore] = None,
+        on_bar: Optional[Callable[[str, str, Bar], None]] = None,
+    ):
+        """
+        Args:
+            intervals: Interval keys from INTERVAL_SECONDS.
+            history_store: Destination for completed bars written by
+                ``persist`` (None = not persisted).
+            on_bar: Optional callback invoked for every completed bar.
+        """
+        unknown = set(intervals) - set(INTERVAL_SECONDS)
+        if unknown:
+            raise ValueError(f"Unsupported bar intervals: {sorted(unknown)}")
+        self.intervals = tuple((name, INTERVAL_SECONDS[name]) for name in intervals)
+        self.history_store = history_store
+        self.on_bar = on_bar
+        self._bars: dict[tuple[str, str], Bar] = {}
+        self._sessions: dict[str, _Session] = {}
+        self._pending: list[tuple[str, str, Bar]] = []
+        self._lock = threading.Lock()
+        # Serializes writers so bars reach the store in completion order.
+        self._persist_lock = threading.Lock()
+
+    def on_tick(
+        self,
+        ticker: str,
+        price: float,
+        size: float,
+        ts: Optional[float] = None,
+    ) -> list[tuple[str, str, Bar]]:
+        """
+        Apply one trade tick.
+
+        Args:
+            ticker: Instrument identifier.
+            price: Trade price.
+            size: Trade size (shares).
+            ts: Epoch seconds; defaults to now.
+
+        Returns:
+            Bars completed by this tick as (ticker, interval, bar).
+        """
+        ts = time.time() if ts is None else ts
+        second = int(ts)
+        completed: list[tuple[str, str, Bar]] = []
+
+        with self._lock:
+            for name, seconds in self.intervals:
+                bucket = second - second % seconds
+                key = (ticker, name)
+                bar = self._bars.get(key)
+                if bar is None or bucket > bar.start:
+                    if bar is not None:
+                        completed.append((ticker, name, bar))
+                    self._bars[key] = Bar(
+                        bucket, price, price, price, price, size, price * size
+                    )
+                elif bucket == bar.start:
+                    if price > bar.high:
+                        bar.high = price
+                    elif price < bar.low:
+                        bar.low = price
+                    bar.close = price
+                    bar.volume += size
+                    bar.pv += price * size
+                # Late ticks for an already-completed bucket are dropped.
+
+            day = second // _SECONDS_PER_DAY
+            session = self._sessions.get(ticker)
+            if session is None or session.day != day:
+                session = self._sessions[ticker] = _Session(day)
+            session.pv += price * size
+            session.volume += size
+            session.last_price = price
+            session.last_size = size
+            if completed and self.history_store is not None:
+                self._pending.extend(completed)
+
+        if completed:
+            self._emit(completed)
+        return completed
+
+    def flush(self, now: Optional[float] = None) -> list[tuple[str, str, Bar]]:
+        """Complete every open bar whose bucket has ended by ``now``."""
+        now = time.time() if now is None else now
+        with self._lock:
+            completed = [
+                (ticker, name, bar)
+                for (ticker, name), bar in self._bars.items()
+                if bar.start + INTERVAL_SECONDS[name] <= now
+            ]
+            for ticker, name, _ in completed:
+                del self._bars[(ticker, name)]
+            if completed and self.history_store is not None:
+                self._pending.extend(completed)
+        if completed:
+            self._emit(completed)
+        return completed
+
+    @property
+    def has_pending(self) -> bool:
+        """True when completed bars are waiting to be persisted."""
+        return bool(self._pending)
+
+    def persist(self) -> int:
+        """
+        Append queued completed bars to the history store.
+
+        Blocking disk I/O: async callers run it via ``asyncio.to_thread``.
+
+        Returns:
+            Number of bars written.
+        """
+        with self._persist_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            written = 0
+            for ticker, name, bar in pending:
+                record = np.empty(1, dtype=BAR_DTYPE)
+                record["ts"] = np.datetime64(bar.start, "s")
+                record["open"] = bar.open
+                record["high"] = bar.high
+                record["low"] = bar.low
+                record["close"] = bar.close
+                record["volume"] = bar.volume
+                record["vwap"] = bar.vwap
+                try:
+                    written += self.history_store.append(ticker, record, frequency=name)
+                except OSError as e:
+                    logger.error(f"Failed to persist {name} bar for {ticker}: {e}")
+            return written
+
+    def _emit(self, completed: list[tuple[str, str, Bar]]) -> None:
+        if self.on_bar is not None:
+            for ticker, name, bar in completed:
+                self.on_bar(ticker, name, bar)
+
+    # --- Reads ---
+
+    def current_bar(self, ticker: str, interval: str = "1m") -> Optional[dict[str, Any]]:
+        """Return the open bar for (ticker, interval), if any."""
+        with self._lock:
+            bar = self._bars.get((ticker, interval))
+            return bar.to_dict() if bar else None
+
+    def vwap(self, ticker: str) -> Optional[float]:
+        """Session VWAP for a ticker, or None before its first tick."""
+        with self._lock:
+            session = self._sessions.get(ticker)
+            if session is None or not session.volume:
+                return None
+            return session.pv / session.volume
+
+    def snapshot(
+        self, tickers: Optional[Iterable[str]] = None
+    ) -> dict[str, dict[str, float]]:
+        """Per-ticker live fields for the market data grid (all tickers by default)."""
+        with self._lock:
+            if tickers is None:
+                sessions = self._sessions.items()
+            else:
+                sessions = [
+                    (t, self._sessions[t]) for t in tickers if t in self._sessions
+                ]
+            return {
+                ticker: {
+                    "last_price": s.last_price,
+                    "last_size": s.last_size,
+                    "session_volume": s.volume,
+                    "vwap": s.pv / s.volume if s.volume else s.last_price,
+                }
+                for ticker, s in sessions
+            }
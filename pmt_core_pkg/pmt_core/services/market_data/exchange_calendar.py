@@ -0,0 +1,263 @@
+"""
+Exchange Calendar — precomputed trading-day index per market.
+
+Each market's trading days (weekdays minus its holidays) are materialized
+once as a sorted ``datetime64[D]`` array. Every question after that —
+is this a trading day, what is T+n, how many sessions lie between two
+dates — is a ``searchsorted`` over that index, vectorized across arrays of
+dates, so reset, settlement and value-date columns for thousands of rows
+cost one NumPy call rather than a Python loop per row.
+
+Dates outside the years the holiday table covers fall back to weekday-only
+sessions: the index grows by whole years on demand and a warning is logged
+once per calendar.
+"""
+
+import logging
+import threading
+from datetime import date, datetime
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Calendar grid column -> exchange.
+MARKETS = {
+    "usa": "NYSE",
+    "hkg": "HKEX",
+    "jpn": "TSE",
+    "aus": "ASX",
+    "nzl": "NZX",
+    "kor": "KRX",
+    "chn": "SSE",
+    "twn": "TWSE",
+    "ind": "NSE",
+}
+
+# Exchange holidays falling on weekdays.
+# TODO: Load from the reference data holiday table; covers 2026 only.
+# Outside the years covered every weekday is treated as a session.
+MOCK_HOLIDAYS = {
+    "usa": [
+        "2026-01-01", "2026-01-19", "2026-02-16", "2026-04-03", "2026-05-25",
+        "2026-06-19", "2026-07-03", "2026-09-07", "2026-11-26", "2026-12-25",
+    ],
+    "hkg": [
+        "2026-01-01", "2026-02-17", "2026-02-18", "2026-02-19", "2026-04-03",
+        "2026-04-06", "2026-04-07", "2026-05-01", "2026-05-25", "2026-06-19",
+        "2026-07-01", "2026-10-01", "2026-10-19", "2026-12-25",
+    ],
+    "jpn": [
+        "2026-01-01", "2026-01-02", "2026-01-12", "2026-02-11", "2026-02-23",
+        "2026-03-20", "2026-04-29", "2026-05-04", "2026-05-05", "2026-05-06",
+        "2026-07-20", "2026-08-11", "2026-09-21", "2026-09-22", "2026-09-23",
+        "2026-10-12", "2026-11-03", "2026-11-23", "2026-12-31",
+    ],
+    "aus": [
+        "2026-01-01", "2026-01-26", "2026-04-03", "2026-04-06", "2026-06-08",
+        "2026-12-25", "2026-12-28",
+    ],
+    "nzl": [
+        "2026-01-01", "2026-01-02", "2026-01-19", "2026-02-06", "2026-04-03",
+        "2026-04-06", "2026-04-27", "2026-06-01", "2026-07-10", "2026-10-26",
+        "2026-12-25", "2026-12-28",
+    ],
+    "kor": [
+        "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02",
+        "2026-05-01", "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17",
+        "2026-09-24", "2026-09-25", "2026-10-05", "2026-10-09", "2026-12-25",
+        "2026-12-31",
+    ],
+    "chn": [
+        "2026-01-01", "2026-01-02", "2026-02-16", "2026-02-17", "2026-02-18",
+        "2026-02-19", "2026-02-20", "2026-02-23", "2026-04-06", "2026-05-01",
+        "2026-05-04", "2026-05-05", "2026-06-19", "2026-09-25", "2026-10-01",
+        "2026-10-02", "2026-10-05", "2026-10-06", "2026-10-07",
+    ],
+    "twn": [
+        "2026-01-01", "2026-02-12", "2026-02-13", "2026-02-16", "2026-02-17",
+        "2026-02-18", "2026-02-19", "2026-02-20", "2026-02-27", "2026-04-03",
+        "2026-04-06", "2026-05-01", "2026-06-19", "2026-09-25", "2026-10-09",
+        "2026-12-25",
+    ],
+    "ind": [
+        "2026-01-26", "2026-03-03", "2026-03-26", "2026-03-31", "2026-04-03",
+        "2026-04-14", "2026-05-01", "2026-05-28", "2026-06-26", "2026-09-14",
+        "2026-10-02", "2026-10-20", "2026-11-10", "2026-11-24", "2026-12-25",
+    ],
+}
+
+DateArg = Union[str, date, datetime, np.datetime64, Iterable, np.ndarray]
+
+
+def as_days(dates: DateArg) -> np.ndarray:
+    """Coerce a date, date string or array of them to ``datetime64[D]``."""
+    if isinstance(dates, datetime):
+        dates = dates.date()
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+class ExchangeCalendar:
+    """
+    Per-market trading-day index with vectorized business-day math.
+
+    All query methods accept a scalar or an array of dates and return a
+    result of the same shape.
+    """
+
+    def __init__(
+        self,
+        holidays: Optional[dict[str, Iterable[str]]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ):
+        """
+        Args:
+            holidays: Market -> holiday dates. Defaults to MOCK_HOLIDAYS.
+            start: First date initially covered by the index. Defaults to
+                January 1st of the first year in the holiday table.
+            end: Last date initially covered by the index. Defaults to
+                December 31st of the last year in the holiday table.
+        """
+        holidays = MOCK_HOLIDAYS if holidays is None else holidays
+        first, last = self._holiday_range(holidays)
+        self._covered = (first, last)
+        self._warned = False
+        self._lock = threading.Lock()
+        self.start = first if start is None else np.datetime64(start, "D")
+        self.end = last if end is None else np.datetime64(end, "D")
+        if self.start < first or self.end > last:
+            self._warn_uncovered()
+        all_days = np.arange(self.start, self.end + 1, dtype="datetime64[D]")
+        weekdays = np.is_busday(all_days)
+
+        self._days: dict[str, np.ndarray] = {}
+        for market in MARKETS.keys() | holidays.keys():
+            closed = np.isin(all_days, as_days(list(holidays.get(market, []))))
+            self._days[market] = all_days[weekdays & ~closed]
+
+    @property
+    def markets(self) -> list[str]:
+        return list(self._days)
+
+    def trading_days(
+        self,
+        market: str = "usa",
+        start: Optional[DateArg] = None,
+        end: Optional[DateArg] = None,
+    ) -> np.ndarray:
+        """Trading days in ``[start, end]`` as a view onto the index."""
+        start = None if start is None else self._checked(start)
+        end = None if end is None else self._checked(end)
+        days = self._index(market)
+        lo = 0 if start is None else np.searchsorted(days, start, "left")
+        hi = len(days) if end is None else np.searchsorted(days, end, "right")
+        return days[lo:hi]
+
+    def is_trading_day(self, dates: DateArg, market: str = "usa"):
+        """True where ``dates`` is a trading day for ``market``."""
+        dates = self._checked(dates)
+        days = self._index(market)
+        pos = np.searchsorted(days, dates).clip(max=len(days) - 1)
+        return days[pos] == dates
+
+    def add_business_days(
+        self,
+        dates: DateArg,
+        n: Union[int, np.ndarray],
+        market: str = "usa",
+        roll: str = "following",
+    ):
+        """
+        Shift dates by ``n`` trading days (negative = backwards).
+
+        Non-trading start dates are first rolled to the next (``following``)
+        or previous (``preceding``) trading day, matching ``np.busday_offset``.
+        """
+        steps = np.asarray(n)
+        # Weekdays are 5/7 of calendar days; the margin covers holidays too.
+        reach = int(np.abs(steps).max(initial=0)) * 2 + 14
+        dates = self._checked(dates, reach)
+        days = self._index(market)
+        if roll == "following":
+            pos = np.searchsorted(days, dates, "left")
+        elif roll == "preceding":
+            pos = np.searchsorted(days, dates, "right") - 1
+        else:
+            raise ValueError(f"Unsupported roll convention: {roll}")
+        target = pos + steps
+        if np.any((target < 0) | (target >= len(days))):
+            raise ValueError(f"Business-day offset leaves the {market} calendar range")
+        return days[target]
+
+    def business_days_between(self, start: DateArg, end: DateArg, market: str = "usa"):
+        """Trading days in ``[start, end)``; negative when ``end < start``."""
+        start, end = self._checked(start), self._checked(end)
+        days = self._index(market)
+        return np.searchsorted(days, end) - np.searchsorted(days, start)
+
+    def previous_trading_day(self, dates: DateArg, market: str = "usa"):
+        """Last trading day strictly before each date."""
+        return self.add_business_days(dates, -1, market, roll="following")
+
+    # --- Internals ---
+
+    @staticmethod
+    def _holiday_range(
+        holidays: dict[str, Iterable[str]],
+    ) -> tuple[np.datetime64, np.datetime64]:
+        """First and last day of the calendar years the holiday table spans."""
+        dates = as_days([d for days in holidays.values() for d in days])
+        if not dates.size:
+            raise ValueError("Holiday table is empty; pass start and end explicitly")
+        years = dates.astype("datetime64[Y]")
+        return (
+            years.min().astype("datetime64[D]"),
+            (years.max() + 1).astype("datetime64[D]") - 1,
+        )
+
+    def _index(self, market: str) -> np.ndarray:
+        try:
+            return self._days[market]
+        except KeyError:
+            raise ValueError(f"Unknown market: {market}") from None
+
+    def _checked(self, dates: DateArg, margin: int = 0) -> np.ndarray:
+        """Coerce ``dates`` and grow the index to cover them (± ``margin`` days)."""
+        dates = as_days(dates)
+        if dates.size:
+            lo, hi = dates.min() - margin, dates.max() + margin
+            if lo < self.start or hi > self.end:
+                self._extend(lo, hi)
+        return dates
+
+    def _extend(self, lo: np.datetime64, hi: np.datetime64) -> None:
+        """Add weekday-only sessions out to the whole years around ``lo``/``hi``."""
+        with self._lock:
+            start = min(self.start, lo.astype("datetime64[Y]").astype("datetime64[D]"))
+            end = max(
+                self.end, (hi.astype("datetime64[Y]") + 1).astype("datetime64[D]") - 1
+            )
+            if start == self.start and end == self.end:
+                return
+            self._warn_uncovered()
+            before = np.arange(start, self.start, dtype="datetime64[D]")
+            after = np.arange(self.end + 1, end + 1, dtype="datetime64[D]")
+            before = before[np.is_busday(before)]
+            after = after[np.is_busday(after)]
+            # Swap the index in before widening the range readers check.
+            self._days = {
+                market: np.concatenate([before, days, after])
+                for market, days in self._days.items()
+            }
+            self.start, self.end = start, end
+
+    def _warn_uncovered(self) -> None:
+        if not self._warned:
+            self._warned = True
+            first, last = self._covered
+            logger.warning(
+                f"Holiday table covers {first} to {last} only; "
+                f"treating weekdays outside it as trading days"
+            )
@@ -0,0 +1,167 @@
+"""
+FX Rate Matrix — dense cross-rate table built from USD quotes.
+
+Only one quote per currency is held (units of currency per 1 USD). All
+crosses are derived by triangulation through USD in a single outer
+division, so ``matrix[i, j]`` converts one unit of currency ``i`` into
+currency ``j``. Conversions over arrays index the matrix directly; no
+per-row pair lookup or string parsing happens.
+"""
+
+import threading
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+# Units of currency per 1 USD.
+# TODO: Replace with Bloomberg / DB quotes.
+MOCK_USD_QUOTES = {
+    "USD": 1.0,
+    "EUR": 0.9234,
+    "GBP": 0.7923,
+    "JPY": 149.85,
+    "HKD": 7.8145,
+    "CNY": 7.1950,
+    "AUD": 1.5230,
+    "NZD": 1.6410,
+    "CAD": 1.3580,
+    "CHF": 0.8810,
+    "SGD": 1.3420,
+    "KRW": 1332.50,
+    "TWD": 31.480,
+    "INR": 83.120,
+}
+
+MOCK_USD_QUOTES_T_1 = {
+    **MOCK_USD_QUOTES,
+    "EUR": 0.9189,
+    "GBP": 0.7891,
+    "JPY": 149.23,
+    "HKD": 7.8102,
+}
+
+CurrencyArg = Union[str, Sequence[str], np.ndarray]
+
+
+class FxRateMatrix:
+    """
+    Currency × currency rate matrix for the current and prior close.
+
+    Thread-safe: updates build a new matrix and swap it in, so readers
+    never see a half-updated table.
+    """
+
+    def __init__(
+        self,
+        usd_quotes: Optional[dict[str, float]] = None,
+        prior_usd_quotes: Optional[dict[str, float]] = None,
+    ):
+        """
+        Args:
+            usd_quotes: Units of currency per 1 USD. Defaults to MOCK_USD_QUOTES.
+            prior_usd_quotes: Prior-close quotes. Defaults to MOCK_USD_QUOTES_T_1.
+        """
+        usd_quotes = dict(usd_quotes or MOCK_USD_QUOTES)
+        prior_usd_quotes = dict(prior_usd_quotes or MOCK_USD_QUOTES_T_1)
+        usd_quotes.setdefault("USD", 1.0)
+
+        self._lock = threading.Lock()
+        self.currencies: list[str] = sorted(set(usd_quotes) | set(prior_usd_quotes))
+        self._index = {c: i for i, c in enumerate(self.currencies)}
+        self._per_usd = self._vector(usd_quotes)
+        self._prior_per_usd = self._vector({**usd_quotes, **prior_usd_quotes})
+        self.version = 0
+        self.matrix = self._triangulate(self._per_usd)
+        self.prior_matrix = self._triangulate(self._prior_per_usd)
+
+    def _vector(self, quotes: dict[str, float]) -> np.ndarray:
+        vec = np.full(len(self.currencies), np.nan)
+        for ccy, rate in quotes.items():
+            vec[self._index[ccy]] = rate
+        return vec
+
+    @staticmethod
+    def _triangulate(per_usd: np.ndarray) -> np.ndarray:
+        """matrix[i, j] = per_usd[j] / per_usd[i] — every cross in one step."""
+        return per_usd[np.newaxis, :] / per_usd[:, np.newaxis]
+
+    # --- Updates ---
+
+    def update(self, usd_quotes: dict[str, float]) -> None:
+        """Apply new USD quotes and rebuild all crosses."""
+        with self._lock:
+            new_ccys = [c for c in usd_quotes if c not in self._index]
+            if new_ccys:
+                self.currencies = self.currencies + new_ccys
+                self._index = {c: i for i, c in enumerate(self.currencies)}
+                pad = np.full(len(new_ccys), np.nan)
+                self._per_usd = np.concatenate([self._per_usd, pad])
+                self._prior_per_usd = np.concatenate([self._prior_per_usd, pad])
+            per_usd = self._per_usd.copy()
+            for ccy, rate in usd_quotes.items():
+                per_usd[self._index[ccy]] = rate
+            self._per_usd = per_usd
+            self.matrix = self._triangulate(per_usd)
+            if new_ccys:
+                prior = self._prior_per_usd
+                missing = np.isnan(prior)
+                prior[missing] = per_usd[missing]
+                self.prior_matrix = self._triangulate(prior)
+            self.version += 1
+
+    def roll(self) -> None:
+        """End of day: current quotes become the prior close."""
+        with self._lock:
+            self._prior_per_usd = self._per_usd.copy()
+            self.prior_matrix = self.matrix
+            self.version += 1
+
+    # --- Lookups ---
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._index
+
+    def indices(self, codes: CurrencyArg) -> Union[int, np.ndarray]:
+        """Map currency code(s) to matrix indices; only unique codes hit the dict."""
+        if isinstance(codes, str):
+            return self._index[codes]
+        unique, inverse = np.unique(np.asarray(codes, dtype=str), return_inverse=True)
+        try:
+            lookup = np.array([self._index[c] for c in unique], dtype=np.intp)
+        except KeyError as e:
+            raise KeyError(f"Unknown currency: {e.args[0]}") from None
+        return lookup[inverse]
+
+    def rate(self, from_ccy: CurrencyArg, to_ccy: CurrencyArg, prior: bool = False):
+        """Rate(s) converting ``from_ccy`` into ``to_ccy`` (scalar or array)."""
+        matrix = self.prior_matrix if prior else self.matrix
+        return matrix[self.indices(from_ccy), self.indices(to_ccy)]
+
+    def usd_rate(self, ccy: CurrencyArg, prior: bool = False):
+        """Units of ``ccy`` per 1 USD — the repo's ``fx_rate`` convention."""
+        return self.rate("USD", ccy, prior)
+
+    def convert(
+        self,
+        amounts,
+        from_ccy: CurrencyArg,
+        to_ccy: CurrencyArg,
+        prior: bool = False,
+    ) -> np.ndarray:
+        """
+        Convert amounts between currencies.
+
+        Args:
+            amounts: Scalar or array of amounts.
+            from_ccy: Source currency, or one code per amount.
+            to_ccy: Target currency, or one code per amount.
+            prior: Use prior-close rates.
+
+        Returns:
+            Converted amounts as a float array.
+        """
+        return np.asarray(amounts, dtype=float) * self.rate(from_ccy, to_ccy, prior)
+
+    def pair_rate(self, pair: str, prior: bool = False) -> float:
+        """Market-convention quote for a 6-letter pair, e.g. 'EURUSD' -> USD per EUR."""
+        return float(self.rate(pair[:3], pair[3:6], prior))
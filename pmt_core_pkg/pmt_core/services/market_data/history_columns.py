@@ -0,0 +1,137 @@
+"""
+History Columns — columnar OHLCV access without per-row Python.
+
+``HistoryColumns`` exposes a ticker's bars as parallel NumPy arrays that
+are views onto the store (or a converted DataFrame). Row dicts, which the
+grids need, are produced by ``HistoryRows`` only for the slice that is
+actually requested, using vectorized formatting per column.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from pmt_core.services.market_data.history_store import BAR_DTYPE, bars_from_frame
+
+RowBuilder = Callable[["HistoryColumns"], list[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class HistoryColumns:
+    """Parallel OHLCV arrays for one ticker, oldest first unless reversed."""
+
+    ticker: str
+    dates: np.ndarray  # datetime64[s]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    vwap: np.ndarray
+
+    @classmethod
+    def from_bars(cls, ticker: str, bars: np.ndarray) -> "HistoryColumns":
+        """Wrap a BAR_DTYPE array; field access is a view, nothing is copied."""
+        return cls(
+            ticker=ticker,
+            dates=bars["ts"],
+            open=bars["open"],
+            high=bars["high"],
+            low=bars["low"],
+            close=bars["close"],
+            volume=bars["volume"],
+            vwap=bars["vwap"],
+        )
+
+    @classmethod
+    def from_frame(cls, ticker: str, frame) -> "HistoryColumns":
+        """Convert a yfinance-style DataFrame column-wise."""
+        return cls.from_bars(ticker, bars_from_frame(frame))
+
+    @classmethod
+    def empty(cls, ticker: str) -> "HistoryColumns":
+        return cls.from_bars(ticker, np.empty(0, dtype=BAR_DTYPE))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, key: slice) -> "HistoryColumns":
+        """Slice every column (views for basic slices)."""
+        if not isinstance(key, slice):
+            raise TypeError("HistoryColumns only supports slicing")
+        return HistoryColumns(
+            ticker=self.ticker,
+            dates=self.dates[key],
+            open=self.open[key],
+            high=self.high[key],
+            low=self.low[key],
+            close=self.close[key],
+            volume=self.volume[key],
+            vwap=self.vwap[key],
+        )
+
+    def reversed(self) -> "HistoryColumns":
+        """Newest-first view."""
+        return self[::-1]
+
+    def date_strings(self) -> np.ndarray:
+        """ISO dates (YYYY-MM-DD) for every bar."""
+        return np.datetime_as_string(self.dates, unit="D")
+
+    def pct_change(self) -> np.ndarray:
+        """Close-to-close percentage change; the first bar is 0."""
+        prev = np.concatenate(([np.nan], self.close[:-1]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.nan_to_num((self.close / prev - 1.0) * 100.0)
+
+    def rows(self, builder: Optional[RowBuilder] = None) -> "HistoryRows":
+        """Lazy row-dict view; dicts are built only for indexed slices."""
+        return HistoryRows(self, builder or price_rows)
+
+
+class HistoryRows(Sequence):
+    """
+    Read-only sequence of row dicts over a HistoryColumns.
+
+    Indexing or slicing materializes only the requested rows, so a grid
+    page of 100 rows over a multi-year history costs 100 dicts.
+    """
+
+    def __init__(self, columns: HistoryColumns, builder: RowBuilder):
+        self._columns = columns
+        self._builder = builder
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._builder(self._columns[key])
+        index = range(len(self))[key]
+        return self._builder(self._columns[index : index + 1])[0]
+
+    def materialize(self) -> list[dict[str, Any]]:
+        """Build every row (one vectorized pass per column)."""
+        return self[:]
+
+
+def price_rows(columns: HistoryColumns) -> list[dict[str, Any]]:
+    """Rows in the ``fetch_stock_history`` shape: ``{"date", "price"}``."""
+    dates = columns.date_strings().tolist()
+    prices = np.round(columns.close, 2).tolist()
+    return [{"date": d, "price": p} for d, p in zip(dates, prices)]
+
+
+def ohlcv_rows(columns: HistoryColumns) -> list[dict[str, Any]]:
+    """Rows with full OHLCV fields, rounded for charting."""
+    fields = {
+        "date": columns.date_strings().tolist(),
+        "open": np.round(columns.open, 2).tolist(),
+        "high": np.round(columns.high, 2).tolist(),
+        "low": np.round(columns.low, 2).tolist(),
+        "close": np.round(columns.close, 2).tolist(),
+        "volume": np.nan_to_num(columns.volume).astype(np.int64).tolist(),
+    }
+    return [dict(zip(fields, values)) for values in zip(*fields.values())]
@@ -0,0 +1,336 @@
+"""
+Historical Price Store — on-disk columnar OHLCV storage.
+
+Bars are persisted as fixed-width NumPy records, one file per
+frequency/ticker/year partition:
+
+    <root>/<frequency>/<TICKER>/<YEAR>.bin
+
+Partitions are append-only: new bars are written to the end of the file
+and reads go through ``np.memmap``, so a single-partition read is a
+zero-copy view into the page cache. Cold starts and VaR history loads
+therefore cost disk reads instead of network round-trips.
+"""
+
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BAR_DTYPE = np.dtype(
+    [
+        ("ts", "datetime64[s]"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("volume", "f8"),
+        ("vwap", "f8"),
+    ]
+)
+
+DEFAULT_STORE_PATH = "./data/market_data"
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+# One writer lock per store root, shared by every store instance pointing at it.
+_root_locks: dict[Path, threading.Lock] = {}
+_root_locks_guard = threading.Lock()
+
+
+def _lock_for(root: Path) -> threading.Lock:
+    with _root_locks_guard:
+        return _root_locks.setdefault(root.resolve(), threading.Lock())
+
+
+def _as_datetime64(value) -> Optional[np.datetime64]:
+    """Coerce a date string / datetime / datetime64 to datetime64[s]."""
+    if value is None or value == "":
+        return None
+    return np.datetime64(value, "s")
+
+
+def bars_from_frame(frame) -> np.ndarray:
+    """
+    Convert a yfinance-style OHLCV DataFrame into a BAR_DTYPE array.
+
+    The conversion is column-wise; no per-row Python is executed.
+
+    Args:
+        frame: DataFrame indexed by timestamp with Open/High/Low/Close/Volume columns.
+
+    Returns:
+        Structured array sorted by timestamp.
+    """
+    bars = np.empty(len(frame), dtype=BAR_DTYPE)
+    if not len(frame):
+        return bars
+
+    index = frame.index
+    if getattr(index, "tz", None) is not None:
+        # Daily bars are keyed by exchange-local session date.
+        index = index.tz_localize(None)
+    bars["ts"] = index.values.astype("datetime64[s]")
+    for field, column in (
+        ("open", "Open"),
+        ("high", "High"),
+        ("low", "Low"),
+        ("close", "Close"),
+        ("volume", "Volume"),
+    ):
+        if column in frame:
+            bars[field] = frame[column].to_numpy(dtype="f8", na_value=np.nan)
+        else:
+            bars[field] = np.nan
+    # Yahoo does not publish VWAP; it is only populated for aggregated intraday bars.
+    bars["vwap"] = np.nan
+    return np.sort(bars, order="ts")
+
+
+class HistoricalPriceStore:
+    """
+    Persistent, partitioned OHLCV store backed by memory-mapped files.
+
+    Thread-safe for concurrent readers and writers within one process.
+    """
+
+    def __init__(self, root: Optional[str | Path] = None):
+        """
+        Args:
+            root: Store directory. Defaults to the MARKET_DATA_STORE_PATH
+                  environment variable, then ./data/market_data.
+        """
+        self.root = Path(root or os.getenv("MARKET_DATA_STORE_PATH", DEFAULT_STORE_PATH))
+        self._lock = _lock_for(self.root)
+
+    # --- Paths ---
+
+    @staticmethod
+    def _safe_name(ticker: str) -> str:
+        return _UNSAFE_CHARS.sub("_", ticker.strip()).upper()
+
+    def _ticker_dir(self, ticker: str, frequency: str) -> Path:
+        return self.root / frequency / self._safe_name(ticker)
+
+    def _partition_path(self, ticker: str, year: int, frequency: str) -> Path:
+        return self._ticker_dir(ticker, frequency) / f"{year}.bin"
+
+    def _partition_years(self, ticker: str, frequency: str) -> list[int]:
+        ticker_dir = self._ticker_dir(ticker, frequency)
+        if not ticker_dir.is_dir():
+            return []
+        return sorted(int(p.stem) for p in ticker_dir.glob("*.bin") if p.stem.isdigit())
+
+    @staticmethod
+    def _map_partition(path: Path) -> np.ndarray:
+        size = path.stat().st_size // BAR_DTYPE.itemsize
+        if size == 0:
+            return np.empty(0, dtype=BAR_DTYPE)
+        return np.memmap(path, dtype=BAR_DTYPE, mode="r", shape=(size,))
+
+    # --- Writes ---
+
+    def append(self, ticker: str, bars: np.ndarray, frequency: str = "1d") -> int:
+        """
+        Append bars for a ticker.
+
+        Bars at or before the last stored timestamp are dropped, which keeps
+        every partition sorted and makes repeated daily updates idempotent.
+
+        Args:
+            ticker: Instrument identifier.
+            bars: BAR_DTYPE array (any order).
+            frequency: Bar frequency partition ('1d', '1m', '5m', '1h').
+
+        Returns:
+            Number of bars written.
+        """
+        if len(bars) == 0:
+            return 0
+        bars = np.sort(np.asarray(bars, dtype=BAR_DTYPE), order="ts")
+
+        with self._lock:
+            last_ts = self._last_timestamp_locked(ticker, frequency)
+            if last_ts is not None:
+                bars = bars[bars["ts"] > last_ts]
+            if len(bars) == 0:
+                return 0
+            # Drop duplicate timestamps within the batch, keeping the last bar.
+            keep = np.append(bars["ts"][1:] != bars["ts"][:-1], True)
+            bars = bars[keep]
+
+            years = bars["ts"].astype("datetime64[Y]").astype(int) + 1970
+            boundaries = np.flatnonzero(np.diff(years)) + 1
+            starts = np.concatenate(([0], boundaries))
+            for chunk, year in zip(np.split(bars, boundaries), years[starts]):
+                path = self._partition_path(ticker, int(year), frequency)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "ab") as fh:
+                    fh.write(chunk.tobytes())
+
+        logger.debug(f"Appended {len(bars)} {frequency} bars for {ticker}")
+        return len(bars)
+
+    def merge(self, ticker: str, bars: np.ndarray, frequency: str = "1d") -> int:
+        """
+        Merge bars that may predate the stored range (backfill).
+
+        Only the year partitions touched by ``bars`` are rewritten; incoming
+        bars win on duplicate timestamps. Each partition is replaced
+        atomically so concurrent memmap readers keep a consistent view.
+
+        Returns:
+            Number of bars in the rewritten partitions.
+        """
+        if len(bars) == 0:
+            return 0
+        bars = np.asarray(bars, dtype=BAR_DTYPE)
+        years = bars["ts"].astype("datetime64[Y]").astype(int) + 1970
+
+        written = 0
+        with self._lock:
+            for year in np.unique(years):
+                path = self._partition_path(ticker, int(year), frequency)
+                incoming = bars[years == year]
+                if path.exists():
+                    existing = np.array(self._map_partition(path))
+                    existing = existing[~np.isin(existing["ts"], incoming["ts"])]
+                    incoming = np.concatenate([existing, incoming])
+                incoming = np.sort(incoming, order="ts", kind="stable")
+                keep = np.append(incoming["ts"][1:] != incoming["ts"][:-1], True)
+                incoming = incoming[keep]
+
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as fh:
+                    fh.write(incoming.tobytes())
+                os.replace(tmp_path, path)
+                written += len(incoming)
+
+        logger.debug(f"Merged {len(bars)} {frequency} bars for {ticker}")
+        return written
+
+    # --- Reads ---
+
+    def _edge_timestamp(
+        self, ticker: str, frequency: str, last: bool
+    ) -> Optional[np.datetime64]:
+        years = self._partition_years(ticker, frequency)
+        for year in reversed(years) if last else years:
+            data = self._map_partition(self._partition_path(ticker, year, frequency))
+            if len(data):
+                return data["ts"][-1] if last else data["ts"][0]
+        return None
+
+    def _last_timestamp_locked(
+        self, ticker: str, frequency: str
+    ) -> Optional[np.datetime64]:
+        return self._edge_timestamp(ticker, frequency, last=True)
+
+    def first_timestamp(
+        self, ticker: str, frequency: str = "1d"
+    ) -> Optional[np.datetime64]:
+        """Return the oldest stored timestamp for a ticker, or None."""
+        return self._edge_timestamp(ticker, frequency, last=False)
+
+    def last_timestamp(
+        self, ticker: str, frequency: str = "1d"
+    ) -> Optional[np.datetime64]:
+        """Return the most recent stored timestamp for a ticker, or None."""
+        with self._lock:
+            return self._last_timestamp_locked(ticker, frequency)
+
+    def read(
+        self,
+        ticker: str,
+        start=None,
+        end=None,
+        frequency: str = "1d",
+    ) -> np.ndarray:
+        """
+        Read bars for a ticker within [start, end].
+
+        When the range falls within one year partition the result is a
+        read-only view onto the memory map (no copy).
+
+        Args:
+            ticker: Instrument identifier.
+            start: Inclusive start (date string, datetime or datetime64), optional.
+            end: Inclusive end, optional. Date-only values cover the whole day.
+            frequency: Bar frequency partition.
+
+        Returns:
+            BAR_DTYPE array sorted by timestamp.
+        """
+        start_ts = _as_datetime64(start)
+        end_ts = _as_datetime64(end)
+        if end_ts is not None and isinstance(end, str) and len(end) == 10:
+            end_ts = end_ts + np.timedelta64(86399, "s")
+
+        years = self._partition_years(ticker, frequency)
+        if start_ts is not None:
+            start_year = start_ts.astype("datetime64[Y]").astype(int) + 1970
+            years = [y for y in years if y >= start_year]
+        if end_ts is not None:
+            end_year = end_ts.astype("datetime64[Y]").astype(int) + 1970
+            years = [y for y in years if y <= end_year]
+
+        chunks = []
+        for year in years:
+            data = self._map_partition(self._partition_path(ticker, year, frequency))
+            lo = 0 if start_ts is None else np.searchsorted(data["ts"], start_ts, "left")
+            hi = len(data) if end_ts is None else np.searchsorted(data["ts"], end_ts, "right")
+            if hi > lo:
+                chunks.append(data[lo:hi])
+
+        if not chunks:
+            return np.empty(0, dtype=BAR_DTYPE)
+        if len(chunks) == 1:
+            return chunks[0]
+        return np.concatenate(chunks)
+
+    def tickers(self, frequency: str = "1d") -> list[str]:
+        """List tickers with at least one stored partition."""
+        freq_dir = self.root / frequency
+        if not freq_dir.is_dir():
+            return []
+        return sorted(p.name for p in freq_dir.iterdir() if p.is_dir())
+
+    def read_close_matrix(
+        self,
+        tickers: list[str],
+        start=None,
+        end=None,
+        frequency: str = "1d",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Build an aligned close-price matrix for several tickers.
+
+        Args:
+            tickers: Column order of the matrix.
+            start: Inclusive start, optional.
+            end: Inclusive end, optional.
+            frequency: Bar frequency partition.
+
+        Returns:
+            (timestamps, closes) where closes has shape (len(timestamps), len(tickers))
+            and missing observations are NaN.
+        """
+        series = [self.read(t, start, end, frequency) for t in tickers]
+        non_empty = [s["ts"] for s in series if len(s)]
+        if not non_empty:
+            return np.empty(0, dtype="datetime64[s]"), np.empty((0, len(tickers)))
+
+        timestamps = np.unique(np.concatenate(non_empty))
+        closes = np.full((len(timestamps), len(tickers)), np.nan)
+        for col, bars in enumerate(series):
+            if len(bars):
+                rows = np.searchsorted(timestamps, bars["ts"])
+                closes[rows, col] = bars["close"]
+        return timestamps, closes
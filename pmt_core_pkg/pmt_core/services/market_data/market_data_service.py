@@ -4,21 +4,121 @@ Market Data Service — core business logic for market data.
 Provides mock data for market data grids, FX rates, top movers,
 trading calendar, market hours, ticker data, and historical data.
 Also includes Yahoo Finance integration for real-time data fetching.
+Daily history is persisted in a local HistoricalPriceStore.
 TODO: Replace mock data with actual database/repository calls.
 """
 
 import asyncio
 import logging
+import os
 import threading
+import time
 from typing import Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import yfinance as yf
 from cachetools import TTLCache
 from cachetools.keys import hashkey
 
+from pmt_core.services.market_data.history_store import (
+    BAR_DTYPE,
+    HistoricalPriceStore,
+)
+from pmt_core.services.market_data.bar_aggregator import BarAggregator
+from pmt_core.services.market_data.exchange_calendar import MARKETS, ExchangeCalendar
+from pmt_core.services.market_data.fx_engine import FxRateMatrix
+from pmt_core.services.market_data.market_feed import (
+    MarketDataFeed,
+    QuoteUpdate,
+    SimulatedFeed,
+)
+from pmt_core.services.market_data.market_snapshot import (
+    MarketSnapshot,
+    MarketSnapshotStore,
+)
+from pmt_core.services.market_data.market_sessions import (
+    EXCHANGE_SESSIONS,
+    MarketSessionIndex,
+)
+from pmt_core.services.market_data.history_columns import (
+    HistoryColumns,
+    HistoryRows,
+    ohlcv_rows,
+)
+from pmt_core.services.market_data.top_movers import (
+    MOVER_CATEGORIES,
+    TopMoversEngine,
+)
+from pmt_core.services.market_data.yahoo_fetcher import YahooFinanceFetcher
+from pmt_core.services.pricing.vol_surface import VolSurfaceService
+from pmt_core.services.reference_data import ReferenceDataCache
+
 logger = logging.getLogger(__name__)
 
+# Seed movers: category -> (ticker, name, value, change %).
+# TODO: Replace with P&L / risk feeds once those publish into the engine.
+_MOCK_MOVERS = {
+    "ops": [
+        ("NVDA", "NVIDIA", 2_400_000, 12.0),
+        ("AAPL", "Apple", 1_800_000, 5.0),
+        ("TSLA", "Tesla", -1_200_000, -8.0),
+        ("META", "Meta", 950_000, 3.0),
+    ],
+    "ytd": [
+        ("NVDA", "NVIDIA", 45_000_000, 180.0),
+        ("META", "Meta", 28_000_000, 120.0),
+        ("AAPL", "Apple", 15_000_000, 45.0),
+        ("MSFT", "Microsoft", 12_000_000, 35.0),
+    ],
+    "delta": [
+        ("TSLA", "Tesla", 15_000, 8.0),
+        ("GOOGL", "Google", -12_000, -5.0),
+        ("AMZN", "Amazon", 8_000, 3.0),
+        ("NFLX", "Netflix", -5_000, -2.0),
+    ],
+    "price": [
+        ("SMCI", "Super Micro", 985.2, 25.0),
+        ("ARM", "ARM Holdings", 142.5, 18.0),
+        ("SNOW", "Snowflake", 160.1, -15.0),
+        ("PLTR", "Palantir", 24.5, 2.1),
+    ],
+    "volume": [
+        ("TSLA", "Tesla", 98_000_000, 15.0),
+        ("AAPL", "Apple", 54_000_000, -5.0),
+        ("AMD", "AMD", 45_000_000, 25.0),
+        ("F", "Ford", 32_000_000, 2.0),
+    ],
+}
+
+# Store partition for mock daily bars. Kept apart from "1d" so mock rows
+# never satisfy (or block) a real Yahoo history sync.
+_MOCK_FREQUENCY = "mock_1d"
+
+# Mock-mode simulator pace: a few prints per ticker per second animates the
+# grids without flooding the event loop (load tests build their own feed).
+_MOCK_FEED_TICK_RATE = 50
+
+# Tenor (years) of the implied vol shown in the market data grid.
+_ATM_VOL_TENOR = 30 / 365
+
+_DAY_NAMES = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday",
+)
+
+# Calendar-day lookback for yfinance period strings.
+_PERIOD_DAYS = {
+    "5d": 5,
+    "1mo": 31,
+    "3mo": 92,
+    "6mo": 183,
+    "1y": 366,
+    "2y": 731,
+    "5y": 1827,
+    "10y": 3653,
+}
+
 
 class MarketDataService:
     """
@@ -32,11 +132,55 @@ class MarketDataService:
     _historical_cache: TTLCache = TTLCache(maxsize=256, ttl=3600)
     _historical_cache_lock = threading.Lock()
 
-    async def get_market_data(self) -> list[dict[str, Any]]:
-        """Get market data for dashboard. TODO: Replace with DB query."""
+    def __init__(
+        self,
+        history_store: Optional[HistoricalPriceStore] = None,
+        fetcher: Optional[YahooFinanceFetcher] = None,
+        fx: Optional[FxRateMatrix] = None,
+        calendar: Optional[ExchangeCalendar] = None,
+        sessions: Optional[MarketSessionIndex] = None,
+        feed: Optional[MarketDataFeed] = None,
+        reference_data: Optional[ReferenceDataCache] = None,
+        vol_surfaces: Optional[VolSurfaceService] = None,
+    ):
+        self.history_store = history_store or HistoricalPriceStore()
+        self.fetcher = fetcher or YahooFinanceFetcher(history_store=self.history_store)
+        self.bar_aggregator = BarAggregator(history_store=self.history_store)
+        self.snapshots = MarketSnapshotStore()
+        self.top_movers = TopMoversEngine()
+        self.fx = fx or FxRateMatrix()
+        self.calendar = calendar or ExchangeCalendar()
+        self.sessions = sessions or MarketSessionIndex(self.calendar)
+        if feed is None and os.getenv("USE_MOCK_DATA", "True").lower() == "true":
+            # Tickers with no known price are not simulated, so a made-up
+            # start price never reaches P&L.
+            feed = SimulatedFeed(tick_rate=_MOCK_FEED_TICK_RATE, default_price=None)
+        # TODO: Bloomberg B-PIPE feed outside mock mode; None = no live quotes.
+        self.feed = feed
+        self.reference_data = reference_data or ReferenceDataCache()
+        self.vol_surfaces = vol_surfaces or VolSurfaceService()
+        self._subscriptions: set[str] = set()
+        self._consumers: dict[str, set[str]] = {}
+        self._feed_task: Optional[asyncio.Task] = None
+        self._prev_close: dict[str, float] = {}
+        self._seed_top_movers()
+
+    async def get_market_data(
+        self, version: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Get market data for dashboard. TODO: Replace with DB query.
+
+        Args:
+            version: Market snapshot version to read live fields from
+                (None = latest). Pin the same version across pages to get
+                prices that tie out.
+        """
         logger.info("Returning mock market data")
+        snapshot = self.snapshots.get(version)
         tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "NVDA"]
-        return [
+        market_status = "Open" if self.sessions.is_open("NYSE") else "Closed"
+        rows = [
             {
                 "id": i + 1,
                 "ticker": t,
@@ -48,59 +192,48 @@ class MarketDataService:
                 "ask": "182.55",
                 "chg_1d_pct": "+0.5%",
                 "implied_vol_pct": "25.0%",
-                "market_status": "Open",
+                "market_status": market_status,
                 "created_by": "system",
             }
             for i, t in enumerate(tickers)
         ]
+        return await self._apply_implied_vols(self._apply_live_fields(rows, snapshot))
 
     async def get_fx_data(self) -> list[dict[str, Any]]:
-        """Get FX data for dashboard. TODO: Replace with DB query."""
-        logger.info("Returning mock FX data")
+        """Get FX data for dashboard, priced from the FX rate matrix."""
+        logger.info("Returning FX data from rate matrix")
         pairs = ["EURUSD", "GBPUSD", "USDJPY", "USDCNY", "AUDUSD"]
         return [
             {
                 "id": i + 1,
-                "ticker": p,
-                "last_price": "1.1000",
-                "bid": "1.0995",
-                "ask": "1.1005",
-                "created_by": "system",
-                "created_time": datetime.now().isoformat(),
+                **quote,
                 "updated_by": "system",
                 "update": "",
             }
-            for i, p in enumerate(pairs)
+            for i, quote in enumerate(self._fx_quotes(pairs))
         ]
 
     async def get_fx_rates(self, currency_pairs: list[str]) -> list[dict[str, Any]]:
         """
         Fetch FX rates for currency pairs.
 
+        Crosses are triangulated through USD by the FX rate matrix.
+
         Args:
             currency_pairs: List of currency pairs (e.g., ['EURUSD', 'GBPUSD'])
 
         Returns:
             List of FX rate data
 
-        TODO: Implement using Bloomberg or database.
-        """
-        logger.warning("Using mock FX data. Implement real integration!")
-
-        mock_data = []
-        for pair in currency_pairs:
-            mock_data.append(
-                {
-                    "ticker": pair,
-                    "last_price": "1.1000",
-                    "bid": "1.0995",
-                    "ask": "1.1005",
-                    "created_by": "system",
-                    "created_time": datetime.now().isoformat(),
-                }
-            )
+        TODO: Feed the matrix from Bloomberg or database quotes.
+        """
+        return self._fx_quotes(currency_pairs)
 
-        return mock_data
+    def convert_currency(
+        self, amounts, from_ccy, to_ccy, prior: bool = False
+    ) -> np.ndarray:
+        """Convert amounts (scalar or array) between currencies via the FX matrix."""
+        return self.fx.convert(amounts, from_ccy, to_ccy, prior)
 
     async def get_top_movers(self, category: str = "ops") -> list[dict[str, Any]]:
         """
@@ -112,161 +245,52 @@ class MarketDataService:
         Returns:
             List of top mover dictionaries
         """
-        logger.info(f"Returning mock top movers data for category: {category}")
-
-        movers_data = {
-            "ops": [
-                {
-                    "ticker": "NVDA",
-                    "name": "NVIDIA",
-                    "value": "+$2.4M",
-                    "change": "+12%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "AAPL",
-                    "name": "Apple",
-                    "value": "+$1.8M",
-                    "change": "+5%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "TSLA",
-                    "name": "Tesla",
-                    "value": "-$1.2M",
-                    "change": "-8%",
-                    "is_positive": False,
-                },
-                {
-                    "ticker": "META",
-                    "name": "Meta",
-                    "value": "+$950K",
-                    "change": "+3%",
-                    "is_positive": True,
-                },
-            ],
-            "ytd": [
-                {
-                    "ticker": "NVDA",
-                    "name": "NVIDIA",
-                    "value": "+$45M",
-                    "change": "+180%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "META",
-                    "name": "Meta",
-                    "value": "+$28M",
-                    "change": "+120%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "AAPL",
-                    "name": "Apple",
-                    "value": "+$15M",
-                    "change": "+45%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "MSFT",
-                    "name": "Microsoft",
-                    "value": "+$12M",
-                    "change": "+35%",
-                    "is_positive": True,
-                },
-            ],
-            "delta": [
-                {
-                    "ticker": "TSLA",
-                    "name": "Tesla",
-                    "value": "+15K",
-                    "change": "+8%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "GOOGL",
-                    "name": "Google",
-                    "value": "-12K",
-                    "change": "-5%",
-                    "is_positive": False,
-                },
-                {
-                    "ticker": "AMZN",
-                    "name": "Amazon",
-                    "value": "+8K",
-                    "change": "+3%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "NFLX",
-                    "name": "Netflix",
-                    "value": "-5K",
-                    "change": "-2%",
-                    "is_positive": False,
-                },
-            ],
-            "price": [
-                {
-                    "ticker": "SMCI",
-                    "name": "Super Micro",
-                    "value": "$985.2",
-                    "change": "+25%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "ARM",
-                    "name": "ARM Holdings",
-                    "value": "$142.5",
-                    "change": "+18%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "SNOW",
-                    "name": "Snowflake",
-                    "value": "$160.1",
-                    "change": "-15%",
-                    "is_positive": False,
-                },
-                {
-                    "ticker": "PLTR",
-                    "name": "Palantir",
-                    "value": "$24.5",
-                    "change": "+2.1%",
-                    "is_positive": True,
-                },
-            ],
-            "volume": [
-                {
-                    "ticker": "TSLA",
-                    "name": "Tesla",
-                    "value": "98M",
-                    "change": "+15%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "AAPL",
-                    "name": "Apple",
-                    "value": "54M",
-                    "change": "-5%",
-                    "is_positive": False,
-                },
-                {
-                    "ticker": "AMD",
-                    "name": "AMD",
-                    "value": "45M",
-                    "change": "+25%",
-                    "is_positive": True,
-                },
-                {
-                    "ticker": "F",
-                    "name": "Ford",
-                    "value": "32M",
-                    "change": "+2%",
-                    "is_positive": True,
-                },
-            ],
+        if category not in MOVER_CATEGORIES:
+            category = "ops"
+        return [
+            self._format_mover(category, m) for m in self.top_movers.top(category)
+        ]
+
+    async def get_top_movers_snapshot(
+        self, k: Optional[int] = None
+    ) -> dict[str, dict[str, list[dict[str, Any]]]]:
+        """
+        Get top and bottom movers for every category in one call.
+
+        Args:
+            k: Movers per side (defaults to the engine's K)
+
+        Returns:
+            {category: {"top": [...], "bottom": [...]}} with display-formatted movers
+        """
+        snapshot = self.top_movers.snapshot(k)
+        return {
+            category: {
+                side: [self._format_mover(category, m) for m in movers]
+                for side, movers in sides.items()
+            }
+            for category, sides in snapshot.items()
         }
-        return movers_data.get(category, movers_data["ops"])
+
+    def get_snapshot(self, version: Optional[int] = None) -> MarketSnapshot:
+        """
+        Immutable market snapshot (None = latest).
+
+        Hold the returned object, or pass its ``version`` to other reads, to
+        price a whole computation off one consistent set of quotes. Versions
+        stay readable for ``snapshots.retention`` seconds; wrap longer
+        computations in ``snapshots.pin(version)``.
+
+        Raises:
+            KeyError: If ``version`` has been evicted and is not pinned.
+        """
+        return self.snapshots.get(version)
+
+    def update_mover(
+        self, category: str, ticker: str, value: float, change: float = 0.0
+    ) -> None:
+        """Publish a P&L / risk / volume update into the top movers engine, O(log n)."""
+        self.top_movers.update(category, ticker, value, change)
 
     async def get_trading_calendar(
         self,
@@ -286,81 +310,74 @@ class MarketDataService:
             f"Querying trading calendar — start_date={start_date}, end_date={end_date}"
         )
 
-        base_date = datetime.now()
+        today = np.datetime64(datetime.now().date(), "D")
         num_days = 60  # 2 months of calendar data
 
-        # Day-of-week names
-        day_names = [
-            "Monday", "Tuesday", "Wednesday", "Thursday",
-            "Friday", "Saturday", "Sunday",
-        ]
+        # Newest first, filtered at "query" level.
+        dates = today - np.arange(num_days)
+        if start_date:
+            dates = dates[dates >= np.datetime64(start_date, "D")]
+        if end_date:
+            dates = dates[dates <= np.datetime64(end_date, "D")]
+
+        # 1970-01-01 was a Thursday; shift so Monday is 0.
+        weekday = (dates.astype(np.int64) + 3) % 7
+        day_names = np.array(_DAY_NAMES)[weekday].tolist()
+        statuses = {
+            market: np.where(
+                self.calendar.is_trading_day(dates, market), "Open", "Closed"
+            ).tolist()
+            for market in MARKETS
+        }
 
-        result = []
-        row_id = 0
-        for day in range(num_days):
-            trade_dt = base_date - timedelta(days=day)
-            trade_date = trade_dt.strftime("%Y-%m-%d")
-            weekday = trade_dt.weekday()  # 0=Mon … 6=Sun
-
-            # Apply date range filter at "query" level
-            if start_date and trade_date < start_date:
-                continue
-            if end_date and trade_date > end_date:
-                continue
-
-            is_weekend = weekday >= 5
-            # Simulate per-market open/closed (weekends always closed)
-            status_open = "Open"
-            status_closed = "Closed"
-
-            row_id += 1
-            result.append(
-                {
-                    "id": row_id,
-                    "trade_date": trade_date,
-                    "day_of_week": day_names[weekday],
-                    "usa": status_closed if is_weekend else status_open,
-                    "hkg": status_closed if is_weekend else status_open,
-                    "jpn": status_closed if is_weekend else status_open,
-                    "aus": status_closed if is_weekend else status_open,
-                    "nzl": status_closed if is_weekend else status_open,
-                    "kor": status_closed if is_weekend else status_open,
-                    "chn": status_closed if is_weekend else status_open,
-                    "twn": status_closed if is_weekend else status_open,
-                    "ind": status_closed if is_weekend else status_open,
-                }
-            )
+        result = [
+            {
+                "id": i + 1,
+                "trade_date": trade_date,
+                "day_of_week": day_names[i],
+                **{market: statuses[market][i] for market in MARKETS},
+            }
+            for i, trade_date in enumerate(np.datetime_as_string(dates).tolist())
+        ]
 
         logger.info(f"Trading calendar — {len(result)} rows")
         return result
 
     async def get_market_hours(self) -> list[dict[str, Any]]:
-        """Get market hours for dashboard. TODO: Replace with DB query."""
-        logger.info("Returning mock market hours data")
-        return [
-            {
-                "id": 1,
-                "market": "NYSE",
-                "ticker": "SPY",
-                "session": "Regular",
-                "local_time": "09:30-16:00",
-                "session_period": "Morning",
-                "is_open": "Yes",
-                "timezone": "EST",
-            },
-        ]
+        """Get market hours for dashboard, with open flags from the session index."""
+        logger.info("Returning market hours from session index")
+        now = time.time()
+        rows = []
+        for market, (tz_name, ticker, sessions) in EXCHANGE_SESSIONS.items():
+            live_period = self.sessions.current_period(market, now)
+            timezone = datetime.fromtimestamp(now, ZoneInfo(tz_name)).tzname()
+            for period, open_at, close_at in sessions:
+                rows.append(
+                    {
+                        "id": len(rows) + 1,
+                        "market": market,
+                        "ticker": ticker,
+                        "session": "Regular",
+                        "local_time": f"{open_at}-{close_at}",
+                        "session_period": period,
+                        "is_open": "Yes" if period == live_period else "No",
+                        "timezone": timezone,
+                    }
+                )
+        return rows
 
     async def get_ticker_data(self) -> list[dict[str, Any]]:
         """Get reference ticker data for dashboard. TODO: Replace with DB query."""
         logger.info("Returning mock ticker data")
+        ref = self.reference_data.get("AAPL")
         return [
             {
                 "id": 1,
-                "ticker": "AAPL",
-                "currency": "USD",
-                "fx_rate": "1.00",
-                "sector": "Technology",
-                "company": "Apple Inc.",
+                "ticker": ref.ticker,
+                "currency": ref.currency,
+                "fx_rate": f"{self.fx.usd_rate(ref.currency):.2f}",
+                "sector": ref.sector,
+                "company": ref.company,
                 "po_lead_manager": "GS",
                 "fmat_cap": "2.95T",
                 "smkt_cap": "2.95T",
@@ -384,7 +401,7 @@ class MarketDataService:
             List of dictionaries with market data
         """
         logger.info(f"Returning mock realtime market data for {tickers}")
-        return [
+        rows = [
             {
                 "id": hash(t),
                 "ticker": t,
@@ -401,6 +418,8 @@ class MarketDataService:
             }
             for t in tickers
         ]
+        snapshot = self.snapshots.current()
+        return await self._apply_implied_vols(self._apply_live_fields(rows, snapshot))
 
     @staticmethod
     def _historical_cache_key(
@@ -421,7 +440,8 @@ class MarketDataService:
         """
         Fetch historical market data, filtered by tickers and date range.
 
-        Results are cached via cachetools TTLCache (256 entries, 1h TTL).
+        Rows are read from the local HistoricalPriceStore and the assembled
+        result is cached via cachetools TTLCache (256 entries, 1h TTL).
 
         Args:
             tickers: List of ticker symbols (optional — all tickers if empty/None)
@@ -438,7 +458,6 @@ class MarketDataService:
                 logger.debug(f"Historical data cache HIT for {key}")
                 return self._historical_cache[key]
 
-        # --- Mock data generation (simulates DB query) ---
         logger.info(
             f"Querying historical data — tickers={tickers}, "
             f"start_date={start_date}, end_date={end_date}"
@@ -446,38 +465,20 @@ class MarketDataService:
 
         all_tickers = ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"]
         query_tickers = tickers if tickers else all_tickers
-
-        base_date = datetime.now()
-        num_days = 30
+        created_time = datetime.now().isoformat()
 
         result = []
-        row_id = 0
         for i, tkr in enumerate(query_tickers):
             orig_idx = all_tickers.index(tkr) if tkr in all_tickers else i
-            for day in range(num_days):
-                trade_date = (base_date - timedelta(days=day)).strftime("%Y-%m-%d")
-
-                if start_date and trade_date < start_date:
-                    continue
-                if end_date and trade_date > end_date:
-                    continue
-
-                row_id += 1
-                result.append(
-                    {
-                        "id": row_id,
-                        "trade_date": trade_date,
-                        "ticker": tkr,
-                        "vwap_price": f"{150 + orig_idx * 50 + day:.2f}",
-                        "last_price": f"{151 + orig_idx * 50 + day:.2f}",
-                        "last_volume": f"{(orig_idx + 1) * 1000000:,}",
-                        "chg_1d_pct": f"{(-1 + orig_idx * 0.5):.2f}%",
-                        "created_by": "system",
-                        "created_time": datetime.now().isoformat(),
-                        "updated_by": "system",
-                        "update": "Active",
-                    }
-                )
+            await asyncio.to_thread(self._seed_mock_history, tkr, orig_idx)
+            columns = HistoryColumns.from_bars(
+                tkr,
+                self.history_store.read(tkr, start_date, end_date, _MOCK_FREQUENCY),
+            )
+            # Newest first, matching the grid's default ordering.
+            result.extend(
+                self._historical_grid_rows(columns, len(result) + 1, created_time)
+            )
 
         with self._historical_cache_lock:
             self._historical_cache[key] = result
@@ -499,9 +500,10 @@ class MarketDataService:
             Dictionary with stock data including price, volume, market cap, etc.
         """
         try:
-            ticker = yf.Ticker(symbol)
-            info = await asyncio.to_thread(lambda: ticker.info)
-            return self._extract_stock_info(symbol, info)
+            infos = await asyncio.to_thread(self.fetcher.fetch_infos, [symbol])
+            if symbol not in infos:
+                return {}
+            return self._extract_stock_info(symbol, infos[symbol])
         except Exception as e:
             logger.exception(f"Error fetching data for {symbol}: {e}")
             return {}
@@ -510,6 +512,8 @@ class MarketDataService:
         """
         Fetch real-time data for multiple stocks using Yahoo Finance.
 
+        Requests run concurrently through the rate-limited YahooFinanceFetcher.
+
         Args:
             symbols: List of stock ticker symbols
 
@@ -524,28 +528,22 @@ class MarketDataService:
             return {}
 
         try:
-
-            def _fetch():
-                tickers_obj = yf.Tickers(" ".join(valid_symbols))
-                results = {}
-                for symbol in valid_symbols:
-                    try:
-                        ticker = tickers_obj.tickers.get(symbol)
-                        if ticker:
-                            info = ticker.info
-                            results[symbol] = self._extract_stock_info(symbol, info)
-                    except Exception as e:
-                        logger.exception(f"Failed to fetch {symbol} in batch: {e}")
-                return results
-
-            return await asyncio.to_thread(_fetch)
+            infos = await asyncio.to_thread(self.fetcher.fetch_infos, valid_symbols)
+            return {
+                symbol: self._extract_stock_info(symbol, infos[symbol])
+                for symbol in valid_symbols
+                if symbol in infos
+            }
         except Exception as e:
             logger.exception(f"Batch fetch error: {e}")
             return {}
 
     async def fetch_stock_history(self, symbol: str, period: str = "1mo") -> list[dict]:
         """
-        Fetch historical price data for a symbol using Yahoo Finance.
+        Fetch historical price data for a symbol.
+
+        Served from the local HistoricalPriceStore; Yahoo Finance is only
+        queried for the part of the period that is not yet on disk.
 
         Args:
             symbol: Stock ticker symbol
@@ -557,23 +555,103 @@ class MarketDataService:
         try:
 
             def _fetch_history():
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period=period)
-                data = []
-                for date, row in hist.iterrows():
-                    data.append(
-                        {
-                            "date": date.strftime("%Y-%m-%d"),
-                            "price": round(row["Close"], 2),
-                        }
-                    )
-                return data
+                start = self._period_start(period)
+                self._sync_histories([symbol], period, start)
+                bars = self.history_store.read(symbol, start=start)
+                return HistoryColumns.from_bars(symbol, bars).rows().materialize()
 
             return await asyncio.to_thread(_fetch_history)
         except Exception as e:
             logger.exception(f"Error fetching history for {symbol}: {e}")
             return []
 
+    async def get_history_columns(
+        self,
+        symbol: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> HistoryColumns:
+        """
+        Columnar history (dates + OHLCV arrays) straight from the local store.
+
+        No rows are materialized; use ``get_history_rows`` or
+        ``HistoryColumns.rows()`` to build dicts for a displayed slice.
+
+        Args:
+            symbol: Stock ticker symbol
+            start_date: Start date inclusive (YYYY-MM-DD, optional)
+            end_date: End date inclusive (YYYY-MM-DD, optional)
+        """
+        bars = await asyncio.to_thread(
+            self.history_store.read, symbol, start_date, end_date
+        )
+        return HistoryColumns.from_bars(symbol, bars)
+
+    async def get_history_rows(
+        self,
+        symbol: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> HistoryRows:
+        """Lazy OHLCV row view; slice it to build only the rows on screen."""
+        columns = await self.get_history_columns(symbol, start_date, end_date)
+        return columns.rows(ohlcv_rows)
+
+    async def refresh_histories(
+        self, symbols: list[str], period: str = "1mo"
+    ) -> None:
+        """
+        Bring the local history store up to date for a whole watchlist.
+
+        Stale symbols are fetched with bulk downloads rather than one
+        request per symbol.
+        """
+        valid_symbols = [s for s in symbols if s]
+        if not valid_symbols:
+            return
+        try:
+            await asyncio.to_thread(
+                self._sync_histories,
+                valid_symbols,
+                period,
+                self._period_start(period),
+            )
+        except Exception as e:
+            logger.exception(f"Error refreshing histories: {e}")
+
+    async def get_return_matrix(
+        self,
+        tickers: list[str],
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Build a daily log-return matrix from the local history store.
+
+        Intended for VaR and correlation code; no network access.
+
+        Args:
+            tickers: Column order of the matrix
+            start_date: Start date inclusive (YYYY-MM-DD, optional)
+            end_date: End date inclusive (YYYY-MM-DD, optional)
+
+        Returns:
+            (dates, returns) with returns shaped (len(dates), len(tickers)).
+            Missing observations are NaN.
+        """
+
+        def _build():
+            dates, closes = self.history_store.read_close_matrix(
+                tickers, start_date, end_date
+            )
+            if len(dates) < 2:
+                return dates[:0], np.empty((0, len(tickers)))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns = np.diff(np.log(closes), axis=0)
+            return dates[1:], returns
+
+        return await asyncio.to_thread(_build)
+
     async def fetch_stock_news(self, symbol: str) -> list[dict]:
         """
         Fetch news for a symbol using Yahoo Finance.
@@ -610,16 +688,352 @@ class MarketDataService:
             logger.exception(f"Error fetching news for {symbol}: {e}")
             return []
 
-    async def subscribe_to_tickers(self, tickers: list[str]) -> bool:
+    def on_tick(
+        self, ticker: str, price: float, size: float, ts: Optional[float] = None
+    ) -> None:
         """
-        Subscribe to real-time updates for tickers.
-        TODO: Implement Bloomberg subscription logic.
+        Feed a trade tick into the intraday bar aggregator.
+
+        Updates running 1m/5m/1h bars and session VWAP in O(1); completed
+        bars are queued and persisted by the feed loop or the next bar read.
         """
-        logger.info(f"Mock subscription to tickers: {tickers}")
+        self.bar_aggregator.on_tick(ticker, price, size, ts)
+        self._publish_live({ticker: (price, np.nan, np.nan)}, ts)
+        prev_close = self._prev_close.get(ticker)
+        if prev_close:
+            self.top_movers.update(
+                "price", ticker, price, (price / prev_close - 1.0) * 100.0
+            )
+
+    async def get_intraday_bars(
+        self,
+        ticker: str,
+        interval: str = "1m",
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get intraday OHLCV bars: completed bars from the store plus the open bar.
+
+        Args:
+            ticker: Ticker symbol
+            interval: Bar interval ('1m', '5m', '1h')
+            start: Inclusive start timestamp (ISO format, optional)
+            end: Inclusive end timestamp (ISO format, optional)
+
+        Returns:
+            List of bars with ISO 'time' and OHLCV/VWAP fields, oldest first
+        """
+        if self.bar_aggregator.has_pending:
+            await asyncio.to_thread(self.bar_aggregator.persist)
+        bars = await asyncio.to_thread(
+            self.history_store.read, ticker, start, end, interval
+        )
+        times = np.datetime_as_string(bars["ts"], unit="s").tolist()
+        fields = {
+            "time": times,
+            "open": bars["open"].tolist(),
+            "high": bars["high"].tolist(),
+            "low": bars["low"].tolist(),
+            "close": bars["close"].tolist(),
+            "volume": bars["volume"].tolist(),
+            "vwap": bars["vwap"].tolist(),
+        }
+        result = [dict(zip(fields, values)) for values in zip(*fields.values())]
+
+        current = self.bar_aggregator.current_bar(ticker, interval)
+        if current is not None:
+            current_time = str(np.datetime64(current.pop("start"), "s"))
+            if (not times or current_time > times[-1]) and (
+                end is None or current_time <= end
+            ):
+                result.append({"time": current_time, **current})
+        return result
+
+    async def subscribe_to_tickers(self, tickers: list[str], consumer: str = "") -> bool:
+        """
+        Subscribe ``consumer`` (e.g. a client session) to real-time updates.
+
+        The feed carries the union of every consumer's tickers; only tickers
+        new to that union are sent to it, and the feed consumer is started
+        on first use.
+
+        Returns:
+            False when no live feed is configured.
+        """
+        self._consumers.setdefault(consumer, set()).update(tickers)
+        await self._sync_subscriptions()
+        if self.feed is None:
+            return False
+        self.start_feed()
         return True
 
+    async def unsubscribe_from_tickers(self, tickers: list[str], consumer: str = "") -> None:
+        """Drop ``consumer``'s interest in tickers; the feed stops when nobody is left."""
+        held = self._consumers.get(consumer)
+        if held is not None:
+            held.difference_update(tickers)
+            if not held:
+                del self._consumers[consumer]
+        await self._sync_subscriptions()
+
+    async def release_consumer(self, consumer: str) -> None:
+        """Drop every subscription held by ``consumer``."""
+        self._consumers.pop(consumer, None)
+        await self._sync_subscriptions()
+
+    async def _sync_subscriptions(self) -> None:
+        """Send the diff between the consumers' union and the feed's ticker set."""
+        wanted = set().union(*self._consumers.values())
+        added = sorted(wanted - self._subscriptions)
+        removed = sorted(self._subscriptions - wanted)
+        self._subscriptions = wanted
+        if self.feed is not None:
+            if added:
+                if isinstance(self.feed, SimulatedFeed):
+                    prices = await asyncio.to_thread(self._last_prices, added)
+                    self.feed.seed_prices(prices)
+                await self.feed.subscribe(added)
+                logger.info(f"Subscribed to {len(added)} tickers: {added}")
+            if removed:
+                await self.feed.unsubscribe(removed)
+                logger.info(f"Unsubscribed from {len(removed)} tickers: {removed}")
+        if not wanted and self._feed_task is not None:
+            await self.stop_feed()
+
+    def _last_prices(self, tickers: list[str]) -> dict[str, float]:
+        """Latest known price per ticker: live snapshot, else the last stored close."""
+        snapshot = self.snapshots.current()
+        prices = {}
+        for ticker in tickers:
+            last = snapshot.get(ticker)
+            if np.isnan(last):
+                for frequency in ("1d", _MOCK_FREQUENCY):
+                    ts = self.history_store.last_timestamp(ticker, frequency)
+                    if ts is not None:
+                        bars = self.history_store.read(ticker, ts, frequency=frequency)
+                        last = float(bars["close"][-1])
+                        break
+            if not np.isnan(last):
+                prices[ticker] = last
+        return prices
+
+    def start_feed(self) -> None:
+        """Start consuming the feed on the running event loop (idempotent)."""
+        if self.feed is None:
+            return
+        if self._feed_task is None or self._feed_task.done():
+            self._feed_task = asyncio.get_running_loop().create_task(self.run_feed())
+
+    async def stop_feed(self) -> None:
+        """Stop the feed consumer, persist finished bars and close the feed."""
+        task, self._feed_task = self._feed_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        # Bars whose bucket has ended would otherwise wait for a tick that
+        # may never come; bars still open stay in memory for a restart.
+        self.bar_aggregator.flush()
+        if self.bar_aggregator.has_pending:
+            await asyncio.to_thread(self.bar_aggregator.persist)
+        if self.feed is not None:
+            await self.feed.close()
+
+    async def run_feed(self, max_batches: Optional[int] = None) -> int:
+        """
+        Consume the feed, applying every quote to bars and movers.
+
+        Reconnects with exponential backoff when the feed drops and
+        re-subscribes the current ticker set.
+
+        Args:
+            max_batches: Stop after this many batches (None = run until stopped).
+
+        Returns:
+            Number of ticks applied.
+        """
+        if self.feed is None:
+            return 0
+        ticks = 0
+        batches = 0
+        backoff = 0.5
+        while True:
+            try:
+                await self.feed.connect()
+                if self._subscriptions:
+                    await self.feed.subscribe(list(self._subscriptions))
+                async for batch in self.feed.stream():
+                    self.on_quotes(batch)
+                    if self.bar_aggregator.has_pending:
+                        await asyncio.to_thread(self.bar_aggregator.persist)
+                    ticks += len(batch)
+                    batches += 1
+                    backoff = 0.5
+                    if max_batches is not None and batches >= max_batches:
+                        return ticks
+                return ticks
+            except ConnectionError as e:
+                logger.warning(f"Market data feed dropped ({e}); reconnecting in {backoff}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def on_quotes(self, batch: list[QuoteUpdate]) -> None:
+        """Apply a batch of feed quotes; movers and the snapshot see the last print per ticker."""
+        if not batch:
+            return
+        last: dict[str, tuple[float, float, float]] = {}
+        for quote in batch:
+            self.bar_aggregator.on_tick(quote.ticker, quote.price, quote.size, quote.ts)
+            last[quote.ticker] = (quote.price, quote.bid, quote.ask)
+        # One snapshot version per batch.
+        self._publish_live(last, batch[-1].ts)
+        for ticker, (price, _, _) in last.items():
+            prev_close = self._prev_close.get(ticker)
+            if prev_close:
+                self.top_movers.update(
+                    "price", ticker, price, (price / prev_close - 1.0) * 100.0
+                )
+
     # === Helper Methods ===
 
+    def _fx_quotes(
+        self, pairs: list[str], half_spread_bps: float = 5.0
+    ) -> list[dict[str, Any]]:
+        """
+        Quote rows for currency pairs, computed in one vectorized pass.
+
+        Malformed pairs and pairs with a currency the matrix does not
+        quote are skipped (and logged); the rest are still returned.
+        """
+        valid = [
+            p for p in pairs if len(p) == 6 and p[:3] in self.fx and p[3:] in self.fx
+        ]
+        if len(valid) < len(pairs):
+            skipped = [p for p in pairs if p not in valid]
+            logger.warning(f"Skipping unknown FX pairs: {skipped}")
+        if not valid:
+            return []
+        mids = self.fx.rate([p[:3] for p in valid], [p[3:] for p in valid])
+        half_spread = mids * half_spread_bps / 10000.0
+        created_time = datetime.now().isoformat()
+        return [
+            {
+                "ticker": pair,
+                "last_price": f"{mid:.4f}",
+                "bid": f"{bid:.4f}",
+                "ask": f"{ask:.4f}",
+                "created_by": "system",
+                "created_time": created_time,
+            }
+            for pair, mid, bid, ask in zip(
+                valid,
+                mids.tolist(),
+                (mids - half_spread).tolist(),
+                (mids + half_spread).tolist(),
+            )
+        ]
+
+    def _seed_top_movers(self) -> None:
+        """Load mock movers into the engine (simulates the initial P&L load)."""
+        for category, movers in _MOCK_MOVERS.items():
+            for ticker, name, value, change in movers:
+                self.top_movers.update(category, ticker, value, change, name=name)
+                if category == "price":
+                    self._prev_close[ticker] = value / (1.0 + change / 100.0)
+
+    @staticmethod
+    def _compact_number(value: float) -> str:
+        """Compact magnitude, e.g. 2400000 -> '2.4M', 950000 -> '950K'."""
+        for divisor, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K")):
+            if value >= divisor:
+                return f"{value / divisor:.3g}{suffix}"
+        return f"{value:.3g}"
+
+    def _format_mover(self, category: str, mover: dict[str, Any]) -> dict[str, Any]:
+        """Format a raw engine mover into the TopMover display shape."""
+        value, change = mover["value"], mover["change"]
+        sign = "-" if value < 0 else "+"
+        if category in ("ops", "ytd"):
+            value_str = f"{sign}${self._compact_number(abs(value))}"
+        elif category == "delta":
+            value_str = f"{sign}{self._compact_number(abs(value))}"
+        elif category == "price":
+            value_str = f"${value:,.1f}"
+        else:
+            value_str = self._compact_number(value)
+        rank = change if category in ("price", "volume") else value
+        return {
+            "ticker": mover["ticker"],
+            "name": mover["name"],
+            "value": value_str,
+            "change": f"{change:+.3g}%",
+            "is_positive": rank >= 0,
+        }
+
+    def _apply_live_fields(
+        self, rows: list[dict[str, Any]], snapshot: MarketSnapshot
+    ) -> list[dict[str, Any]]:
+        """Overlay live last/VWAP/volume/quotes from one market snapshot onto grid rows."""
+        if not len(snapshot):
+            return rows
+        for row in rows:
+            fields = snapshot.row(row["ticker"])
+            if fields:
+                row["last_price"] = f"{fields['last']:.2f}"
+                row["vwap_price"] = f"{fields['vwap']:.2f}"
+                row["last_volume"] = self._format_volume(fields["volume"])
+                if not np.isnan(fields["bid"]):
+                    row["bid"] = f"{fields['bid']:.2f}"
+                    row["ask"] = f"{fields['ask']:.2f}"
+        return rows
+
+    async def _apply_implied_vols(
+        self, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Fill 30-day ATM implied vol from each ticker's surface.
+
+        Surfaces still valid at the row's spot come from the cache; the rest
+        are fitted in one batch off the event loop.
+        """
+        spots = {row["ticker"]: float(row["last_price"]) for row in rows}
+        surfaces = {}
+        stale = {}
+        for ticker, spot in spots.items():
+            surface = self.vol_surfaces.cached(ticker, spot)
+            if surface is None:
+                stale[ticker] = spot
+            else:
+                surfaces[ticker] = surface
+        if stale:
+            surfaces.update(await asyncio.to_thread(self.vol_surfaces.get_surfaces, stale))
+        for row in rows:
+            vol = surfaces[row["ticker"]].atm_vol(_ATM_VOL_TENOR)
+            row["implied_vol_pct"] = f"{vol * 100:.1f}%"
+        return rows
+
+    def _publish_live(
+        self, quotes: dict[str, tuple[float, float, float]], ts: Optional[float]
+    ) -> None:
+        """Publish one snapshot version from last quotes plus session VWAP/volume."""
+        live = self.bar_aggregator.snapshot(quotes)
+        updates = {}
+        for ticker, (last, bid, ask) in quotes.items():
+            fields = live[ticker]
+            update = {
+                "last": last,
+                "vwap": fields["vwap"],
+                "volume": fields["session_volume"],
+            }
+            if not np.isnan(bid):
+                update["bid"] = bid
+                update["ask"] = ask
+            updates[ticker] = update
+        self.snapshots.publish(updates, ts)
+
     def _extract_stock_info(self, symbol: str, info: dict) -> dict:
         """Helper to extract relevant fields from yfinance info dict."""
         current_price = (
@@ -675,6 +1089,96 @@ class MarketDataService:
         else:
             return f"{value}"
 
+    @staticmethod
+    def _period_start(period: str) -> Optional[np.datetime64]:
+        """Translate a yfinance period string to a start date (None = all)."""
+        today = np.datetime64(datetime.now().date(), "D")
+        if period == "ytd":
+            return today.astype("datetime64[Y]").astype("datetime64[D]")
+        if period in _PERIOD_DAYS:
+            return today - _PERIOD_DAYS[period]
+        return None
+
+    def _sync_histories(
+        self, symbols: list[str], period: str, start: Optional[np.datetime64]
+    ) -> None:
+        """Bring the store up to date for ``symbols`` over ``period`` (blocking)."""
+        # The latest complete session is the previous business day.
+        latest_session = self.calendar.previous_trading_day(datetime.now())
+
+        backfill: list[str] = []
+        incremental: list[str] = []
+        since: Optional[np.datetime64] = None
+        for symbol in symbols:
+            first = self.history_store.first_timestamp(symbol)
+            last = self.history_store.last_timestamp(symbol)
+            # Periods rarely start on a trading day; allow a week of slack.
+            covers_start = first is not None and (
+                start is None or first.astype("datetime64[D]") <= start + 7
+            )
+            if not covers_start:
+                backfill.append(symbol)
+            elif last.astype("datetime64[D]") < latest_session:
+                incremental.append(symbol)
+                next_day = last.astype("datetime64[D]") + 1
+                since = next_day if since is None else min(since, next_day)
+
+        if backfill:
+            self.fetcher.download_history(backfill, period=period, through=latest_session)
+        if incremental:
+            self.fetcher.download_history(
+                incremental, start=str(since), through=latest_session
+            )
+
+    @staticmethod
+    def _historical_grid_rows(
+        columns: HistoryColumns, first_id: int, created_time: str
+    ) -> list[dict[str, Any]]:
+        """Format one ticker's columns as newest-first historical grid rows."""
+        chg_pct = columns.pct_change()[::-1]
+        columns = columns.reversed()
+        n = len(columns)
+        fields = {
+            "id": range(first_id, first_id + n),
+            "trade_date": columns.date_strings().tolist(),
+            "vwap_price": np.char.mod("%.2f", columns.vwap).tolist(),
+            "last_price": np.char.mod("%.2f", columns.close).tolist(),
+            "last_volume": [f"{v:,}" for v in columns.volume.astype(np.int64).tolist()],
+            "chg_1d_pct": np.char.add(np.char.mod("%.2f", chg_pct), "%").tolist(),
+        }
+        static = {
+            "ticker": columns.ticker,
+            "created_by": "system",
+            "created_time": created_time,
+            "updated_by": "system",
+            "update": "Active",
+        }
+        return [
+            {**dict(zip(fields, values)), **static} for values in zip(*fields.values())
+        ]
+
+    def _seed_mock_history(self, ticker: str, orig_idx: int, num_days: int = 30) -> None:
+        """Persist mock daily bars not yet in the store (simulates a DB load)."""
+        today = np.datetime64(datetime.now().date(), "D")
+        last = self.history_store.last_timestamp(ticker, _MOCK_FREQUENCY)
+        days_ago = np.arange(num_days - 1, -1, -1)
+        dates = today - days_ago
+        if last is not None:
+            new = dates > last.astype("datetime64[D]")
+            dates, days_ago = dates[new], days_ago[new]
+        if not len(dates):
+            return
+
+        bars = np.empty(len(dates), dtype=BAR_DTYPE)
+        bars["ts"] = dates.astype("datetime64[s]")
+        bars["close"] = 151 + orig_idx * 50 + days_ago
+        bars["open"] = bars["close"] - 1
+        bars["high"] = bars["close"] + 1
+        bars["low"] = bars["close"] - 2
+        bars["vwap"] = 150 + orig_idx * 50 + days_ago
+        bars["volume"] = (orig_idx + 1) * 1000000
+        self.history_store.append(ticker, bars, _MOCK_FREQUENCY)
+
     def _calculate_daily_change(self, current: float, previous: float) -> float:
         """Calculate daily percentage change."""
         if not previous:
@@ -0,0 +1,207 @@
+"""
+Market Data Feed — streaming quote adapter interface and a local simulator.
+
+``MarketDataFeed`` is the seam between MarketDataService and a real-time
+source (Bloomberg B-PIPE later). A feed is connected once, receives
+subscription diffs, and yields batches of ``QuoteUpdate`` from an async
+iterator; batching keeps per-update overhead off the event loop at high
+tick rates.
+
+``SimulatedFeed`` generates geometric Brownian motion quotes for the
+subscribed universe, vectorized per batch, so the whole pipeline (bar
+aggregation, movers, grids) can be load-tested at production rates
+without a vendor connection.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional, Protocol, runtime_checkable
+
+import numpy as np
+
+# Seconds in a trading year (252 sessions x 6.5 hours), for GBM time steps.
+_TRADING_SECONDS_PER_YEAR = 252 * 6.5 * 3600
+
+
+@dataclass(slots=True)
+class QuoteUpdate:
+    """One trade print with the prevailing top of book."""
+
+    ticker: str
+    price: float
+    size: float
+    bid: float
+    ask: float
+    ts: float  # epoch seconds
+
+
+class FeedDisconnectedError(ConnectionError):
+    """Raised from ``stream()`` when the feed drops; the consumer reconnects."""
+
+
+@runtime_checkable
+class MarketDataFeed(Protocol):
+    """Protocol for streaming market data sources."""
+
+    async def connect(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def subscribe(self, tickers: Iterable[str]) -> None: ...
+
+    async def unsubscribe(self, tickers: Iterable[str]) -> None: ...
+
+    def stream(self) -> AsyncIterator[list[QuoteUpdate]]: ...
+
+
+class SimulatedFeed:
+    """
+    GBM quote generator implementing MarketDataFeed.
+
+    Each batch draws ``tick_rate * batch_interval`` ticks spread over the
+    subscribed tickers and advances every ticker's log-price along its own
+    path, so consecutive prints for one ticker form a proper random walk.
+    """
+
+    def __init__(
+        self,
+        tick_rate: Optional[float] = 10_000,
+        batch_interval: float = 0.05,
+        sigma: float = 0.30,
+        mu: float = 0.0,
+        half_spread_bps: float = 5.0,
+        initial_prices: Optional[dict[str, float]] = None,
+        default_price: Optional[float] = 100.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            tick_rate: Ticks per second across all tickers (None = unpaced,
+                as fast as the consumer reads).
+            batch_interval: Seconds of ticks per yielded batch.
+            sigma: Annualized volatility.
+            mu: Annualized drift.
+            half_spread_bps: Half bid/ask spread in basis points.
+            initial_prices: Starting prices per ticker.
+            default_price: Starting price for tickers not in initial_prices
+                (None = such tickers are not simulated at all).
+            seed: RNG seed for reproducible runs.
+        """
+        self.tick_rate = tick_rate
+        self.batch_interval = batch_interval
+        self.sigma = sigma
+        self.mu = mu
+        self.half_spread_bps = half_spread_bps
+        self.default_price = default_price
+        self._initial_prices = dict(initial_prices or {})
+        self._rng = np.random.default_rng(seed)
+        self._tickers: list[str] = []
+        self._log_prices = np.empty(0)
+        self._connected = False
+
+    @property
+    def subscriptions(self) -> list[str]:
+        return list(self._tickers)
+
+    async def connect(self) -> None:
+        self._connected = True
+
+    async def close(self) -> None:
+        self._connected = False
+
+    def seed_prices(self, prices: dict[str, float]) -> None:
+        """Starting prices for tickers subscribed later (live paths are kept)."""
+        live = set(self._tickers)
+        self._initial_prices.update({t: p for t, p in prices.items() if t not in live})
+
+    async def subscribe(self, tickers: Iterable[str]) -> None:
+        new = [
+            t
+            for t in dict.fromkeys(tickers)
+            if t not in self._tickers
+            and (t in self._initial_prices or self.default_price is not None)
+        ]
+        if not new:
+            return
+        start = [self._initial_prices.get(t, self.default_price) for t in new]
+        self._tickers.extend(new)
+        self._log_prices = np.concatenate([self._log_prices, np.log(start)])
+
+    async def unsubscribe(self, tickers: Iterable[str]) -> None:
+        drop = set(tickers)
+        keep: list[int] = []
+        for i, ticker in enumerate(self._tickers):
+            if ticker in drop:
+                # Remember the last price so a resubscribe continues the path.
+                self._initial_prices[ticker] = float(np.exp(self._log_prices[i]))
+            else:
+                keep.append(i)
+        self._tickers = [self._tickers[i] for i in keep]
+        self._log_prices = self._log_prices[keep]
+
+    async def stream(self) -> AsyncIterator[list[QuoteUpdate]]:
+        if not self._connected:
+            raise FeedDisconnectedError("Simulated feed is not connected")
+        batch_size = max(1, int((self.tick_rate or 10_000) * self.batch_interval))
+        next_due = time.monotonic()
+        while self._connected:
+            if self.tick_rate:
+                next_due += self.batch_interval
+                delay = next_due - time.monotonic()
+                # Fall behind rather than burst if the consumer is slow.
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    next_due = time.monotonic()
+                    await asyncio.sleep(0)
+            else:
+                await asyncio.sleep(0)
+            if self._tickers:
+                yield self.generate(batch_size)
+
+    def generate(self, n: int, now: Optional[float] = None) -> list[QuoteUpdate]:
+        """Draw ``n`` ticks over the subscribed tickers (vectorized GBM)."""
+        num_tickers = len(self._tickers)
+        if not num_tickers:
+            return []
+        now = time.time() if now is None else now
+        rng = self._rng
+
+        idx = rng.integers(0, num_tickers, n)
+        # Each print of a ticker advances its path by the average time between
+        # that ticker's prints at the configured rate.
+        dt = num_tickers / ((self.tick_rate or n) * _TRADING_SECONDS_PER_YEAR)
+        steps = (self.mu - 0.5 * self.sigma**2) * dt + self.sigma * np.sqrt(
+            dt
+        ) * rng.standard_normal(n)
+
+        # Cumulative return per ticker in arrival order: sort by ticker
+        # (stable keeps arrival order), cumsum, subtract each group's base.
+        order = np.argsort(idx, kind="stable")
+        sorted_idx = idx[order]
+        sorted_steps = steps[order]
+        cum = np.cumsum(sorted_steps)
+        group_start = np.flatnonzero(np.r_[True, sorted_idx[1:] != sorted_idx[:-1]])
+        counts = np.diff(np.r_[group_start, n])
+        base = np.repeat(cum[group_start] - sorted_steps[group_start], counts)
+        log_path = np.empty(n)
+        log_path[order] = self._log_prices[sorted_idx] + cum - base
+        group_end = group_start + counts - 1
+        self._log_prices[sorted_idx[group_end]] = log_path[order[group_end]]
+
+        prices = np.round(np.exp(log_path), 4)
+        half = prices * self.half_spread_bps / 10_000.0
+        sizes = rng.integers(1, 10, n) * 100
+        stamps = now + np.arange(n) * (self.batch_interval / n)
+        tickers = self._tickers
+        return [
+            QuoteUpdate(tickers[i], p, s, p - h, p + h, t)
+            for i, p, s, h, t in zip(
+                idx.tolist(),
+                prices.tolist(),
+                sizes.tolist(),
+                half.tolist(),
+                stamps.tolist(),
+            )
+        ]
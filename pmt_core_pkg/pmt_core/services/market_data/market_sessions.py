@@ -0,0 +1,188 @@
+"""
+Market Sessions — precomputed UTC session index per exchange.
+
+Trading sessions for the next N trading days are expanded once into
+sorted arrays of UTC open/close instants (epoch seconds), with the DST
+offset of each local date resolved at build time. "Is this market open",
+"which markets are open" and "how long until the next open" are then a
+``searchsorted`` against those arrays; no timezone conversion happens
+per row or per tick.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, time as dtime
+from typing import Optional, Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from pmt_core.services.market_data.exchange_calendar import MARKETS, ExchangeCalendar
+
+logger = logging.getLogger(__name__)
+
+# Exchange -> (timezone, benchmark ticker, [(session period, local open, local close)]).
+# TODO: Load from reference data.
+EXCHANGE_SESSIONS = {
+    "NYSE": ("America/New_York", "SPY", [("Full Day", "09:30", "16:00")]),
+    "HKEX": (
+        "Asia/Hong_Kong",
+        "2800.HK",
+        [("Morning", "09:30", "12:00"), ("Afternoon", "13:00", "16:00")],
+    ),
+    "TSE": (
+        "Asia/Tokyo",
+        "1306.T",
+        [("Morning", "09:00", "11:30"), ("Afternoon", "12:30", "15:30")],
+    ),
+    "ASX": ("Australia/Sydney", "STW.AX", [("Full Day", "10:00", "16:00")]),
+    "NZX": ("Pacific/Auckland", "FNZ.NZ", [("Full Day", "10:00", "16:45")]),
+    "KRX": ("Asia/Seoul", "069500.KS", [("Full Day", "09:00", "15:30")]),
+    "SSE": (
+        "Asia/Shanghai",
+        "510300.SS",
+        [("Morning", "09:30", "11:30"), ("Afternoon", "13:00", "15:00")],
+    ),
+    "TWSE": ("Asia/Taipei", "0050.TW", [("Full Day", "09:00", "13:30")]),
+    "NSE": ("Asia/Kolkata", "NIFTYBEES.NS", [("Full Day", "09:15", "15:30")]),
+}
+
+_EXCHANGE_MARKET = {exchange: market for market, exchange in MARKETS.items()}
+
+TimeArg = Union[float, np.ndarray, None]
+
+_SECONDS_PER_DAY = 86400
+
+
+class _SessionTable:
+    """Sorted UTC open/close arrays for one exchange."""
+
+    __slots__ = ("opens", "closes", "periods")
+
+    def __init__(self, opens: np.ndarray, closes: np.ndarray, periods: np.ndarray):
+        self.opens = opens
+        self.closes = closes
+        self.periods = periods
+
+    def locate(self, ts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Index of the latest session opened at or before ``ts``, and whether it is live."""
+        idx = np.searchsorted(self.opens, ts, side="right") - 1
+        if not len(self.opens):
+            return idx, np.zeros(idx.shape, dtype=bool)
+        live = (idx >= 0) & (ts < self.closes[idx.clip(min=0)])
+        return idx, live
+
+
+class MarketSessionIndex:
+    """
+    UTC session open/close index for every exchange.
+
+    The index initially covers ``horizon_days`` calendar days from the build
+    time. Queries outside the covered window (or within half a horizon of
+    its end) widen it once, so a long-running process rolls forward on its
+    own.
+    """
+
+    def __init__(
+        self,
+        calendar: Optional[ExchangeCalendar] = None,
+        horizon_days: int = 30,
+        now: Optional[float] = None,
+    ):
+        """
+        Args:
+            calendar: Trading-day calendar. Defaults to a new ExchangeCalendar.
+            horizon_days: Calendar days of sessions to precompute.
+            now: Build time as epoch seconds; defaults to now.
+        """
+        self.calendar = calendar or ExchangeCalendar()
+        self.horizon_days = horizon_days
+        self._lock = threading.Lock()
+        now = time.time() if now is None else now
+        self._build(now, now + horizon_days * _SECONDS_PER_DAY)
+
+    @property
+    def exchanges(self) -> list[str]:
+        return list(EXCHANGE_SESSIONS)
+
+    def _build(self, start_ts: float, end_ts: float) -> None:
+        # Widen by a day each side so sessions straddling UTC midnight are included.
+        start = np.datetime64(int(start_ts), "s").astype("datetime64[D]") - 1
+        end = np.datetime64(int(end_ts), "s").astype("datetime64[D]") + 1
+        # Past the holiday table the calendar falls back to weekday sessions.
+        tables: dict[str, _SessionTable] = {}
+        for exchange, (tz_name, _, sessions) in EXCHANGE_SESSIONS.items():
+            tz = ZoneInfo(tz_name)
+            days = self.calendar.trading_days(_EXCHANGE_MARKET[exchange], start, end)
+            opens, closes, periods = [], [], []
+            for day in days.tolist():
+                for i, (_, open_at, close_at) in enumerate(sessions):
+                    opens.append(_utc_epoch(day, open_at, tz))
+                    closes.append(_utc_epoch(day, close_at, tz))
+                    periods.append(i)
+            tables[exchange] = _SessionTable(
+                np.array(opens, dtype=np.int64),
+                np.array(closes, dtype=np.int64),
+                np.array(periods, dtype=np.int8),
+            )
+        self._tables = tables
+        self._start, self._end = start_ts, end_ts
+
+    def _table(self, exchange: str, ts: np.ndarray) -> _SessionTable:
+        if ts.size:
+            lo, hi = float(ts.min()), float(ts.max())
+            margin = self.horizon_days * _SECONDS_PER_DAY / 2
+            if lo < self._start or hi + margin > self._end:
+                with self._lock:
+                    if lo < self._start or hi + margin > self._end:
+                        self._build(min(lo, self._start), max(hi + 2 * margin, self._end))
+        try:
+            return self._tables[exchange]
+        except KeyError:
+            raise ValueError(f"Unknown exchange: {exchange}") from None
+
+    # --- Queries ---
+
+    def is_open(self, exchange: str, ts: TimeArg = None):
+        """True where ``exchange`` is in a session at ``ts`` (epoch seconds)."""
+        ts = _as_ts(ts)
+        return self._table(exchange, ts).locate(ts)[1]
+
+    def open_exchanges(self, ts: Optional[float] = None) -> list[str]:
+        """Exchanges in a session at ``ts``."""
+        ts = _as_ts(ts)
+        return [e for e in EXCHANGE_SESSIONS if self._table(e, ts).locate(ts)[1]]
+
+    def current_period(self, exchange: str, ts: Optional[float] = None) -> Optional[str]:
+        """Session period name (e.g. 'Morning') live at ``ts``, or None."""
+        ts = _as_ts(ts)
+        table = self._table(exchange, ts)
+        idx, live = table.locate(ts)
+        if not live:
+            return None
+        return EXCHANGE_SESSIONS[exchange][2][table.periods[idx]][0]
+
+    def next_open(self, exchange: str, ts: TimeArg = None):
+        """Epoch seconds of the first session open strictly after ``ts``."""
+        ts = _as_ts(ts)
+        table = self._table(exchange, ts)
+        idx = np.searchsorted(table.opens, ts, side="right")
+        if np.any(idx >= len(table.opens)):
+            raise ValueError(f"No {exchange} session within the index horizon")
+        return table.opens[idx]
+
+    def seconds_until_open(self, exchange: str, ts: TimeArg = None):
+        """Seconds until ``exchange`` next opens; 0 while it is open."""
+        ts = _as_ts(ts)
+        live = self.is_open(exchange, ts)
+        return np.where(live, 0, self.next_open(exchange, ts) - ts)
+
+
+def _utc_epoch(day, local: str, tz: ZoneInfo) -> int:
+    hour, minute = map(int, local.split(":"))
+    return int(datetime.combine(day, dtime(hour, minute), tzinfo=tz).timestamp())
+
+
+def _as_ts(ts: TimeArg) -> np.ndarray:
+    return np.asarray(time.time() if ts is None else ts, dtype=np.int64)
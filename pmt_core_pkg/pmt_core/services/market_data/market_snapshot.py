@@ -0,0 +1,257 @@
+"""
+Market Snapshots — versioned, immutable views of live market data.
+
+Every publish copies the field arrays it writes (copy-on-write), applies
+the updates and swaps in a new ``MarketSnapshot`` with the next version
+number. A snapshot never changes after publication, so a consumer that
+pins one (or its version) for a whole computation sees one consistent set
+of prices, and the PnL, risk and positions pages tie out when they use the
+same version. Past versions stay readable for a retention window measured
+in time, not publishes, and ``pin()`` holds a version for as long as a
+computation needs it. Derived results can be cached per version with
+``VersionedCache``; a new version invalidates them exactly.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Iterable, Iterator, Mapping, Optional
+
+import numpy as np
+
+SNAPSHOT_FIELDS = ("last", "bid", "ask", "vwap", "volume")
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Immutable market state at one version."""
+
+    version: int
+    ts: float
+    tickers: tuple[str, ...]
+    index: Mapping[str, int] = field(repr=False)
+    fields: Mapping[str, np.ndarray] = field(repr=False)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.index
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def get(self, ticker: str, name: str = "last") -> float:
+        """One field for one ticker (NaN if unknown)."""
+        i = self.index.get(ticker)
+        return float(self.fields[name][i]) if i is not None else float("nan")
+
+    def column(self, tickers: Iterable[str], name: str = "last") -> np.ndarray:
+        """One field for many tickers, NaN where unknown."""
+        values = self.fields[name]
+        idx = np.array([self.index.get(t, -1) for t in tickers], dtype=np.intp)
+        out = np.full(len(idx), np.nan)
+        known = idx >= 0
+        out[known] = values[idx[known]]
+        return out
+
+    def row(self, ticker: str) -> Optional[dict[str, float]]:
+        """All fields for one ticker, or None."""
+        i = self.index.get(ticker)
+        if i is None:
+            return None
+        return {name: float(values[i]) for name, values in self.fields.items()}
+
+
+def _empty_snapshot() -> MarketSnapshot:
+    return MarketSnapshot(
+        version=0,
+        ts=0.0,
+        tickers=(),
+        index=MappingProxyType({}),
+        fields=MappingProxyType(
+            {name: _frozen(np.empty(0)) for name in SNAPSHOT_FIELDS}
+        ),
+    )
+
+
+def _frozen(values: np.ndarray) -> np.ndarray:
+    values.flags.writeable = False
+    return values
+
+
+class MarketSnapshotStore:
+    """
+    Publishes copy-on-write snapshots and retains recent ones by age.
+
+    Readers never lock: ``current()`` returns an immutable object.
+    """
+
+    def __init__(self, retention: float = 60.0, min_history: int = 64):
+        """
+        Args:
+            retention: Seconds a superseded version stays readable through
+                ``get(version)``.
+            min_history: Versions always retained, however old.
+        """
+        self.retention = retention
+        self.min_history = min_history
+        self._lock = threading.Lock()
+        self._current = _empty_snapshot()
+        # version -> (monotonic publish time, snapshot), oldest first.
+        self._history: dict[int, tuple[float, MarketSnapshot]] = {
+            0: (time.monotonic(), self._current)
+        }
+        # version -> (snapshot, pin count); held past retention until unpinned.
+        self._pinned: dict[int, tuple[MarketSnapshot, int]] = {}
+
+    @property
+    def version(self) -> int:
+        return self._current.version
+
+    def current(self) -> MarketSnapshot:
+        """The latest snapshot — hold on to it to pin a consistent view."""
+        return self._current
+
+    def get(self, version: Optional[int] = None) -> MarketSnapshot:
+        """
+        Snapshot at ``version`` (None = latest).
+
+        Raises:
+            KeyError: If the version was never published, or is older than
+                the retention window and not pinned.
+        """
+        current = self._current
+        if version is None or version == current.version:
+            return current
+        entry = self._history.get(version)
+        if entry is not None:
+            return entry[1]
+        pinned = self._pinned.get(version)
+        if pinned is not None:
+            return pinned[0]
+        raise KeyError(f"Market snapshot version {version} is not available")
+
+    @contextmanager
+    def pin(self, version: Optional[int] = None) -> Iterator[MarketSnapshot]:
+        """
+        Keep ``version`` (None = latest) readable by version for the block.
+
+        Use when a computation hands the version number to several readers
+        and may outlive the retention window.
+        """
+        with self._lock:
+            snapshot = self.get(version)
+            held, count = self._pinned.get(snapshot.version, (snapshot, 0))
+            self._pinned[snapshot.version] = (held, count + 1)
+        try:
+            yield snapshot
+        finally:
+            with self._lock:
+                held, count = self._pinned[snapshot.version]
+                if count > 1:
+                    self._pinned[snapshot.version] = (held, count - 1)
+                else:
+                    del self._pinned[snapshot.version]
+
+    def publish(
+        self,
+        updates: Mapping[str, Mapping[str, float]],
+        ts: Optional[float] = None,
+    ) -> MarketSnapshot:
+        """
+        Apply per-ticker field updates as one new version.
+
+        Args:
+            updates: ticker -> {field: value}; missing fields keep prior values.
+            ts: Publication time (epoch seconds); defaults to now.
+
+        Returns:
+            The newly published snapshot.
+        """
+        if not updates:
+            return self._current
+        with self._lock:
+            base = self._current
+            new_tickers = [t for t in updates if t not in base.index]
+            written = {name for values in updates.values() for name in values}
+            if new_tickers:
+                tickers = base.tickers + tuple(new_tickers)
+                index = dict(base.index)
+                for offset, ticker in enumerate(new_tickers, start=len(base.tickers)):
+                    index[ticker] = offset
+                index = MappingProxyType(index)
+                pad = np.full(len(new_tickers), np.nan)
+                fields = {
+                    name: np.concatenate([values, pad])
+                    for name, values in base.fields.items()
+                }
+            else:
+                # Unchanged index and unwritten fields are shared with the base.
+                tickers, index = base.tickers, base.index
+                fields = dict(base.fields)
+                for name in written:
+                    fields[name] = fields[name].copy()
+            for ticker, values in updates.items():
+                i = index[ticker]
+                for name, value in values.items():
+                    fields[name][i] = value
+            snapshot = MarketSnapshot(
+                version=base.version + 1,
+                ts=time.time() if ts is None else ts,
+                tickers=tickers,
+                index=index,
+                fields=MappingProxyType(
+                    {name: _frozen(values) for name, values in fields.items()}
+                ),
+            )
+            self._current = snapshot
+            now = time.monotonic()
+            self._history[snapshot.version] = (now, snapshot)
+            self._evict(now)
+        return snapshot
+
+    def _evict(self, now: float) -> None:
+        """Drop versions past the retention window, oldest first (lock held)."""
+        cutoff = now - self.retention
+        while len(self._history) > self.min_history:
+            oldest = next(iter(self._history))
+            if self._history[oldest][0] >= cutoff:
+                break
+            del self._history[oldest]
+
+
+class VersionedCache:
+    """
+    Cache for values derived from a snapshot, keyed by (version, key).
+
+    Entries for versions older than the newest ``keep_versions`` are dropped
+    as soon as a newer version is seen, so invalidation is exact and costs
+    nothing on the read path.
+    """
+
+    def __init__(self, keep_versions: int = 2):
+        self.keep_versions = keep_versions
+        self._entries: dict[int, dict[Hashable, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self, version: int, key: Hashable, compute: Callable[[], Any]
+    ) -> Any:
+        """Return the cached value for (version, key), computing it once."""
+        with self._lock:
+            bucket = self._entries.get(version)
+            if bucket is not None and key in bucket:
+                return bucket[key]
+        value = compute()
+        with self._lock:
+            bucket = self._entries.setdefault(version, {})
+            bucket[key] = value
+            # Keep only the newest versions.
+            while len(self._entries) > self.keep_versions:
+                oldest = min(self._entries)
+                del self._entries[oldest]
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,192 @@
+"""
+Top Movers Engine — incremental top-K / bottom-K per category.
+
+Each category keeps two indexed binary heaps (max and min) keyed by
+ticker, so a value update is a decrease/increase-key in O(log n) and the
+K best entries are read by walking the heap frontier in O(K log K).
+No full sort of the universe happens on refresh.
+"""
+
+import heapq
+import threading
+from typing import Any, Hashable, Optional
+
+MOVER_CATEGORIES = ("ops", "ytd", "delta", "price", "volume")
+
+# Categories ranked by percentage change rather than absolute value.
+_RANK_BY_CHANGE = {"price", "volume"}
+
+
+class IndexedHeap:
+    """
+    Binary min-heap with a key → position index.
+
+    Supports ``set`` (insert, decrease-key or increase-key) and ``remove``
+    in O(log n), and ``smallest(k)`` in O(k log k).
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[float, Hashable]] = []
+        self._pos: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pos
+
+    def set(self, key: Hashable, priority: float) -> None:
+        """Insert ``key`` or move it to ``priority``."""
+        idx = self._pos.get(key)
+        if idx is None:
+            self._heap.append((priority, key))
+            self._pos[key] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return
+        old = self._heap[idx][0]
+        self._heap[idx] = (priority, key)
+        if priority < old:
+            self._sift_up(idx)
+        elif priority > old:
+            self._sift_down(idx)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove ``key`` if present."""
+        idx = self._pos.pop(key, None)
+        if idx is None:
+            return
+        last = self._heap.pop()
+        if idx < len(self._heap):
+            self._heap[idx] = last
+            self._pos[last[1]] = idx
+            self._sift_down(idx)
+            self._sift_up(idx)
+
+    def smallest(self, k: int) -> list[tuple[float, Hashable]]:
+        """Return the ``k`` smallest (priority, key) pairs in order."""
+        result: list[tuple[float, Hashable]] = []
+        if not self._heap or k <= 0:
+            return result
+        heap = self._heap
+        frontier = [(heap[0][0], 0)]
+        while frontier and len(result) < k:
+            _, idx = heapq.heappop(frontier)
+            result.append(heap[idx])
+            for child in (2 * idx + 1, 2 * idx + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child][0], child))
+        return result
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._pos[heap[i][1]] = i
+        self._pos[heap[j][1]] = j
+
+    def _sift_up(self, idx: int) -> None:
+        heap = self._heap
+        while idx > 0:
+            parent = (idx - 1) // 2
+            if heap[idx][0] >= heap[parent][0]:
+                break
+            self._swap(idx, parent)
+            idx = parent
+
+    def _sift_down(self, idx: int) -> None:
+        heap = self._heap
+        n = len(heap)
+        while True:
+            smallest = idx
+            for child in (2 * idx + 1, 2 * idx + 2):
+                if child < n and heap[child][0] < heap[smallest][0]:
+                    smallest = child
+            if smallest == idx:
+                return
+            self._swap(idx, smallest)
+            idx = smallest
+
+
+class TopMoversEngine:
+    """
+    Maintains top-K and bottom-K movers for every category incrementally.
+
+    ``ops``, ``ytd`` and ``delta`` rank by value (P&L / delta); ``price``
+    and ``volume`` rank by percentage change.
+    """
+
+    def __init__(self, k: int = 4, categories: tuple[str, ...] = MOVER_CATEGORIES):
+        self.k = k
+        self.categories = categories
+        self._names: dict[str, str] = {}
+        self._entries: dict[str, dict[str, tuple[float, float]]] = {
+            c: {} for c in categories
+        }
+        self._max: dict[str, IndexedHeap] = {c: IndexedHeap() for c in categories}
+        self._min: dict[str, IndexedHeap] = {c: IndexedHeap() for c in categories}
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        category: str,
+        ticker: str,
+        value: float,
+        change: float = 0.0,
+        name: Optional[str] = None,
+    ) -> None:
+        """Set a ticker's value/change in a category, O(log n)."""
+        if category not in self._entries:
+            raise ValueError(f"Unknown top movers category: {category}")
+        rank = change if category in _RANK_BY_CHANGE else value
+        with self._lock:
+            if name:
+                self._names[ticker] = name
+            self._entries[category][ticker] = (value, change)
+            self._max[category].set(ticker, -rank)
+            self._min[category].set(ticker, rank)
+
+    def get(self, category: str, ticker: str) -> Optional[tuple[float, float]]:
+        """Current (value, change) for a ticker, or None."""
+        with self._lock:
+            return self._entries[category].get(ticker)
+
+    def remove(self, ticker: str) -> None:
+        """Drop a ticker from every category."""
+        with self._lock:
+            for category in self.categories:
+                self._entries[category].pop(ticker, None)
+                self._max[category].remove(ticker)
+                self._min[category].remove(ticker)
+
+    def _movers(self, category: str, heap: IndexedHeap, k: int) -> list[dict[str, Any]]:
+        entries = self._entries[category]
+        return [
+            {
+                "ticker": ticker,
+                "name": self._names.get(ticker, ticker),
+                "value": entries[ticker][0],
+                "change": entries[ticker][1],
+            }
+            for _, ticker in heap.smallest(k)
+        ]
+
+    def top(self, category: str, k: Optional[int] = None) -> list[dict[str, Any]]:
+        """Highest-ranked K movers in a category."""
+        with self._lock:
+            return self._movers(category, self._max[category], k or self.k)
+
+    def bottom(self, category: str, k: Optional[int] = None) -> list[dict[str, Any]]:
+        """Lowest-ranked K movers in a category."""
+        with self._lock:
+            return self._movers(category, self._min[category], k or self.k)
+
+    def snapshot(self, k: Optional[int] = None) -> dict[str, dict[str, list[dict[str, Any]]]]:
+        """Top and bottom K for every category under one lock."""
+        k = k or self.k
+        with self._lock:
+            return {
+                category: {
+                    "top": self._movers(category, self._max[category], k),
+                    "bottom": self._movers(category, self._min[category], k),
+                }
+                for category in self.categories
+            }
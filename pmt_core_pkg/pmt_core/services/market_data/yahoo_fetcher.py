@@ -0,0 +1,259 @@
+"""
+Yahoo Finance Fetcher — batched, rate-limited market data retrieval.
+
+Quote/info requests fan out over a bounded thread pool, every request
+passes through a shared token bucket, and transient failures are retried
+with exponential backoff. History for many symbols is pulled with one
+bulk download per chunk and persisted to the HistoricalPriceStore.
+
+The network calls are injectable (``info_loader`` / ``history_loader``)
+so the fetcher can be exercised against a local stub server.
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+from cachetools import TTLCache
+
+from pmt_core.services.market_data.history_store import (
+    HistoricalPriceStore,
+    bars_from_frame,
+)
+
+logger = logging.getLogger(__name__)
+
+InfoLoader = Callable[[str], dict]
+HistoryLoader = Callable[[list[str], Optional[str], Optional[str]], pd.DataFrame]
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens replenished per second.
+            capacity: Maximum burst size. Defaults to ``rate``.
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Block until ``tokens`` are available.
+
+        Returns:
+            True once acquired, False if ``timeout`` elapsed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+def _yf_info(symbol: str) -> dict:
+    import yfinance as yf
+
+    return yf.Ticker(symbol).info
+
+
+def _yf_download(
+    symbols: list[str], period: Optional[str], start: Optional[str]
+) -> pd.DataFrame:
+    import yfinance as yf
+
+    kwargs: dict[str, Any] = {"start": start} if start else {"period": period or "1mo"}
+    return yf.download(
+        " ".join(symbols),
+        group_by="ticker",
+        auto_adjust=False,
+        progress=False,
+        threads=False,
+        **kwargs,
+    )
+
+
+def split_download(frame: Optional[pd.DataFrame], symbols: list[str]) -> dict[str, pd.DataFrame]:
+    """Split a (possibly multi-indexed) bulk download into one frame per symbol."""
+    if frame is None or frame.empty:
+        return {}
+    if isinstance(frame.columns, pd.MultiIndex):
+        present = set(frame.columns.get_level_values(0))
+        return {s: frame[s].dropna(how="all") for s in symbols if s in present}
+    return {symbols[0]: frame.dropna(how="all")} if len(symbols) == 1 else {}
+
+
+class YahooFinanceFetcher:
+    """
+    Bounded-concurrency Yahoo Finance client.
+
+    A 200-name watchlist refresh costs ``ceil(200 / chunk_size)`` bulk history
+    downloads plus 200 info calls spread over ``max_workers`` threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        rate_per_sec: float = 10.0,
+        burst: Optional[float] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        chunk_size: int = 100,
+        info_ttl: float = 60.0,
+        history_store: Optional[HistoricalPriceStore] = None,
+        info_loader: Optional[InfoLoader] = None,
+        history_loader: Optional[HistoryLoader] = None,
+    ):
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.chunk_size = chunk_size
+        self.limiter = TokenBucket(rate_per_sec, burst)
+        self.history_store = history_store or HistoricalPriceStore()
+        self._info_loader = info_loader or _yf_info
+        self._history_loader = history_loader or _yf_download
+        self._info_cache: TTLCache = TTLCache(maxsize=4096, ttl=info_ttl)
+        self._info_cache_lock = threading.Lock()
+
+    def _call(self, fn: Callable, *args) -> Any:
+        """Rate-limit and retry a single upstream call."""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                return fn(*args)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+                delay *= random.uniform(0.5, 1.0)  # jitter
+                logger.warning(
+                    f"Yahoo call failed ({e}); retry {attempt + 1}/{self.max_retries} "
+                    f"in {delay:.2f}s"
+                )
+                time.sleep(delay)
+
+    def fetch_infos(self, symbols: list[str]) -> dict[str, dict]:
+        """
+        Fetch ``.info`` for many symbols concurrently (blocking).
+
+        Symbols that still fail after retries are logged and omitted.
+        """
+        results: dict[str, dict] = {}
+        pending = []
+        with self._info_cache_lock:
+            for symbol in dict.fromkeys(symbols):
+                if symbol in self._info_cache:
+                    results[symbol] = self._info_cache[symbol]
+                else:
+                    pending.append(symbol)
+        if not pending:
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            thread_name_prefix="yahoo-info",
+        ) as pool:
+            futures = {
+                pool.submit(self._call, self._info_loader, symbol): symbol
+                for symbol in pending
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    info = future.result()
+                except Exception as e:
+                    logger.exception(f"Failed to fetch info for {symbol}: {e}")
+                    continue
+                results[symbol] = info
+                with self._info_cache_lock:
+                    self._info_cache[symbol] = info
+        return results
+
+    def download_history(
+        self,
+        symbols: list[str],
+        period: Optional[str] = "1mo",
+        start: Optional[str] = None,
+        through=None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Bulk-download daily history and persist it to the store (blocking).
+
+        Args:
+            symbols: Symbols to download, split into ``chunk_size`` batches.
+            period: yfinance period string, used when ``start`` is not given.
+            start: Inclusive start date (YYYY-MM-DD) for incremental updates.
+            through: Last completed session date; later bars are dropped.
+                Defaults to yesterday. Yahoo returns a partial bar for a
+                session still trading, and the append-only store would
+                never correct it.
+
+        Returns:
+            Mapping of symbol to the downloaded (completed) BAR_DTYPE array.
+        """
+        if through is None:
+            through = np.datetime64(date.today(), "D") - 1
+        cutoff = np.datetime64(through, "D") + 1
+        symbols = list(dict.fromkeys(s for s in symbols if s))
+        chunks = [
+            symbols[i : i + self.chunk_size]
+            for i in range(0, len(symbols), self.chunk_size)
+        ]
+        results: dict[str, np.ndarray] = {}
+        if not chunks:
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks)),
+            thread_name_prefix="yahoo-history",
+        ) as pool:
+            futures = {
+                pool.submit(self._call, self._history_loader, chunk, period, start): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    frames = split_download(future.result(), chunk)
+                except Exception as e:
+                    logger.exception(f"Bulk history download failed for {chunk}: {e}")
+                    continue
+                for symbol, frame in frames.items():
+                    bars = bars_from_frame(frame)
+                    bars = bars[bars["ts"] < cutoff]
+                    self.persist(symbol, bars)
+                    results[symbol] = bars
+        return results
+
+    def persist(self, symbol: str, bars: np.ndarray) -> None:
+        """Append new bars, or merge when the batch reaches back into stored history."""
+        if not len(bars):
+            return
+        last = self.history_store.last_timestamp(symbol)
+        if last is None or bars["ts"][0] > last:
+            self.history_store.append(symbol, bars)
+        else:
+            self.history_store.merge(symbol, bars)
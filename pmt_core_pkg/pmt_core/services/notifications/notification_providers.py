@@ -1,5 +1,8 @@
 """
-Core Notification Providers — mock notification data for all domains.
+Core Notification Providers — notification data for all domains.
+
+Mock data throughout, except positions: ``position_diff_notifications``
+derives them from the live book's intraday diff (see PositionService).
 
 Uses generic icon/color keys that are mapped to framework-specific
 values (Lucide icons, Tailwind classes) in the app layer.
@@ -33,40 +36,54 @@ def get_pnl_notifications() -> list[dict]:
 
 
 # === Position Notifications ===
-def get_position_notifications() -> list[dict]:
-    """Mock position-related notifications."""
-    return [
-        {
-            "id": "pos-001",
-            "category": NotificationCategory.PORTFOLIO,
-            "title": "Position Update",
-            "message": "TKR0 position size updated after partial fill",
-            "time_ago": "45 mins ago",
-            "is_read": False,
-            "icon": "layers",
-            "color": "text-purple-500",
-            "module": "Positions",
-            "subtab": "Positions",
-            "row_id": "TKR0",
-            "grid_id": "positions_grid",
-            "ticker": "TKR0",
-        },
-        {
-            "id": "pos-002",
-            "category": NotificationCategory.PORTFOLIO,
-            "title": "New Position",
-            "message": "TKR5 added to portfolio",
-            "time_ago": "2 hours ago",
-            "is_read": True,
-            "icon": "plus-circle",
-            "color": "text-teal-500",
-            "module": "Positions",
-            "subtab": "Positions",
-            "row_id": "TKR5",
-            "grid_id": "positions_grid",
-            "ticker": "TKR5",
-        },
-    ]
+def position_diff_notifications(diff) -> list[dict]:
+    """
+    Position notifications derived from a ``PositionDiff`` (e.g. SOD vs
+    current): one per added position and one per position whose size changed.
+    """
+    notifications = []
+    for position in diff.added:
+        ticker = position["ticker"]
+        notifications.append(
+            {
+                "id": f"pos-add-{position['deal_num']}-{position['detail_id']}",
+                "category": NotificationCategory.PORTFOLIO,
+                "title": "New Position",
+                "message": f"{ticker} added to portfolio",
+                "time_ago": "Just now",
+                "is_read": False,
+                "icon": "plus-circle",
+                "color": "text-teal-500",
+                "module": "Positions",
+                "subtab": "Positions",
+                "row_id": ticker,
+                "grid_id": "positions_grid",
+                "ticker": ticker,
+            }
+        )
+    for change in diff.changed:
+        size = change.fields.get("position")
+        if size is None:
+            continue
+        ticker = change.after["ticker"]
+        notifications.append(
+            {
+                "id": f"pos-upd-{change.key[0]}-{change.key[1]}",
+                "category": NotificationCategory.PORTFOLIO,
+                "title": "Position Update",
+                "message": f"{ticker} position size updated: {size.old} -> {size.new}",
+                "time_ago": "Just now",
+                "is_read": False,
+                "icon": "layers",
+                "color": "text-purple-500",
+                "module": "Positions",
+                "subtab": "Positions",
+                "row_id": ticker,
+                "grid_id": "positions_grid",
+                "ticker": ticker,
+            }
+        )
+    return notifications
 
 
 # === Risk Notifications ===
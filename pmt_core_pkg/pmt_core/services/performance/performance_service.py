@@ -2,13 +2,20 @@
 Core Performance Service for Portfolio Management Tool.
 
 Provides KPI metrics and portfolio holdings data.
-KPI values are computed dynamically from the holdings data,
-and sparkline trends are generated to reflect performance direction.
+KPI values are computed from the PnL book and the daily PnL history,
+and their sparklines plot the history itself.
 TODO: Replace mock holdings with repository calls.
 """
 
 import logging
 import random
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from pmt_core.services.pnl import PnLService
+from pmt_core.services.pnl.pnl_history import period_start
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +52,25 @@ def _generate_sparkline(is_positive: bool, num_points: int = 6) -> str:
     return " ".join(points)
 
 
+def _series_sparkline(values: np.ndarray, num_points: int = 24) -> str:
+    """
+    SVG polyline points for a real series, scaled into the "0 0 50 24" viewBox.
+
+    Long series are resampled to ``num_points``; higher values plot at
+    lower Y, as in ``_generate_sparkline``.
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        values = np.repeat(values if len(values) else np.zeros(1), 2)
+    if len(values) > num_points:
+        values = values[np.linspace(0, len(values) - 1, num_points).round().astype(int)]
+    low, high = values.min(), values.max()
+    span = high - low
+    y = np.full(len(values), 12.0) if span == 0 else 22 - (values - low) / span * 20
+    x = np.linspace(0, 50, len(values))
+    return " ".join(f"{round(xi)},{round(yi)}" for xi, yi in zip(x, y))
+
+
 def _format_large_number(value: float) -> str:
     """Format a large number with appropriate suffix (B, M, K)."""
     abs_val = abs(value)
@@ -63,45 +89,58 @@ def _format_large_number(value: float) -> str:
 class PerformanceService:
     """Core service for performance header data (KPIs, holdings)."""
 
+    def __init__(self, pnl: Optional[PnLService] = None):
+        self.pnl = pnl or PnLService()
+
     async def get_kpi_metrics(self) -> list[dict]:
         """
         Get KPI metrics for the header cards.
 
-        Computes values dynamically from the holdings data and generates
-        sparkline trends that reflect whether each metric is positive or negative.
+        NAV and exposure come from the live PnL book; Daily P&L and YTD
+        Return are ``PnLService.get_period_pnl`` roll-ups of the P&L history
+        store (YTD Return over gross value at the prior close), and their
+        sparklines plot the cumulative daily P&L over the period.
 
         Returns:
             List of KPI metrics with sparkline-compatible trend data.
         """
-        logger.info("Computing KPI metrics from holdings data")
+        logger.info("Computing KPI metrics from the PnL book and history")
 
-        # Fetch the current holdings to derive KPI values
-        holdings = await self.get_portfolio_holdings()
+        today = datetime.now().strftime("%Y-%m-%d")
+        result = await self.pnl.compute_pnl(today)
+        history = await self.pnl.get_pnl_history()
+        position_ids = result.inputs.position_id.tolist()
+        live_pnl = float(result.pnl["t_1"].sum())
 
         # --- Compute Total NAV ---
-        total_nav = sum(h["shares"] * h["current_price"] for h in holdings)
+        market_value = result.market_value
+        total_nav = float(market_value.sum())
         nav_positive = total_nav > 0
 
-        # --- Compute Daily P&L ---
-        daily_pnl = sum(
-            h["shares"] * h["current_price"] * (h["daily_change_pct"] / 100)
-            for h in holdings
-        )
+        # --- Compute Daily P&L and YTD Return from history ---
+        last = history.last_date
+        open_day = last is None or last < np.datetime64(today, "D")
+        periods = await self.pnl.get_period_pnl(today, ("dtd", "ytd"))
+        daily_pnl = float(periods["dtd"].sum())
+        ytd_pnl = float(periods["ytd"].sum())
         pnl_positive = daily_pnl >= 0
 
-        # --- Compute YTD Return ---
-        total_cost = sum(h["shares"] * h["avg_cost"] for h in holdings)
-        ytd_return_pct = ((total_nav - total_cost) / total_cost * 100) if total_cost else 0.0
+        ytd_base = float(np.abs(result.base["t_1"]).sum())
+        ytd_return_pct = (ytd_pnl / ytd_base * 100) if ytd_base else 0.0
         ytd_positive = ytd_return_pct >= 0
 
-        # --- Compute Net Exposure ---
-        # Net exposure = (long - short) / total, using daily_change as proxy for direction
-        long_value = sum(
-            h["shares"] * h["current_price"]
-            for h in holdings
-            if h["daily_change_pct"] >= 0
+        month_start = period_start(np.datetime64(today, "D"), "mtd")
+        _, month_daily = history.daily_totals(month_start, today, position_ids)
+        _, year_daily = history.daily_totals(
+            period_start(np.datetime64(today, "D"), "ytd"), today, position_ids
         )
-        net_exposure_pct = (long_value / total_nav * 100) if total_nav else 0.0
+        if open_day:
+            month_daily = np.append(month_daily, live_pnl)
+            year_daily = np.append(year_daily, live_pnl)
+
+        # --- Compute Net Exposure ---
+        gross = float(np.abs(market_value).sum())
+        net_exposure_pct = (total_nav / gross * 100) if gross else 0.0
         exposure_positive = net_exposure_pct >= 50  # Above 50% is considered positive
 
         return [
@@ -109,19 +148,19 @@ class PerformanceService:
                 "label": "Total NAV",
                 "value": _format_large_number(total_nav),
                 "is_positive": nav_positive,
-                "trend_data": _generate_sparkline(nav_positive),
+                "trend_data": _series_sparkline(total_nav - ytd_pnl + np.cumsum(year_daily)),
             },
             {
                 "label": "Daily P&L",
                 "value": _format_large_number(daily_pnl),
                 "is_positive": pnl_positive,
-                "trend_data": _generate_sparkline(pnl_positive),
+                "trend_data": _series_sparkline(np.cumsum(month_daily)),
             },
             {
                 "label": "YTD Return",
                 "value": f"{'+' if ytd_positive else ''}{ytd_return_pct:.1f}%",
                 "is_positive": ytd_positive,
-                "trend_data": _generate_sparkline(ytd_positive),
+                "trend_data": _series_sparkline(np.cumsum(year_daily)),
             },
             {
                 "label": "Net Exposure",
@@ -2,6 +2,24 @@
 pmt_core.services.pnl - PnL Services
 """
 
+from .currency_exposure import CurrencyExposure, FxHedges
+from .intraday_pnl import IntradayPnL, PnLDelta
+from .pnl_engine import PnLInputs, PnLResult, compute_pnl
+from .pnl_explain import PnLExplain, RiskSnapshot, explain_pnl
+from .pnl_history import PnLHistoryStore
 from .pnl_service import PnLService
 
-__all__ = ["PnLService"]
+__all__ = [
+    "PnLService",
+    "PnLInputs",
+    "PnLResult",
+    "compute_pnl",
+    "IntradayPnL",
+    "PnLDelta",
+    "PnLExplain",
+    "RiskSnapshot",
+    "explain_pnl",
+    "PnLHistoryStore",
+    "CurrencyExposure",
+    "FxHedges",
+]
@@ -0,0 +1,165 @@
+"""
+Currency Exposure — position FX exposure netted against hedges per currency.
+
+Positions are summed into one local-currency exposure per currency and FX
+hedges (forwards, notional in units of the currency, negative = short the
+currency) into another; their sum is the net exposure. In USD, with fx
+the units of currency per 1 USD,
+
+    unhedged PnL = position exposure / fx_t − position value at T-1 close
+    hedge PnL    = hedge notional × (1 / fx_t − 1 / fx_t-1)
+
+and the hedged PnL is their sum. Everything is held as per-currency
+arrays, so an FX tick recomputes only the entries of the currencies whose
+rate moved, and a price tick only those of the currencies it touched.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+import numpy as np
+
+from pmt_core.services.market_data.fx_engine import FxRateMatrix
+from pmt_core.services.pnl.pnl_engine import GroupedPnL
+
+
+@dataclass
+class FxHedges:
+    """FX hedge trades; ``notional`` is signed, in units of ``currency``."""
+
+    hedge_id: np.ndarray
+    book: np.ndarray
+    currency: np.ndarray
+    notional: np.ndarray
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "FxHedges":
+        return cls(
+            **{
+                k: np.asarray(columns.get(k, ()), dtype=object)
+                for k in ("hedge_id", "book", "currency")
+            },
+            notional=np.asarray(columns.get("notional", ()), dtype=float),
+        )
+
+    def __len__(self) -> int:
+        return len(self.hedge_id)
+
+
+class CurrencyExposure:
+    """
+    Net exposure and hedged/unhedged PnL per currency.
+
+    Built from the per-currency view of a PnL compute pass. ``refresh``
+    and ``update_positions`` recompute in place and stamp the touched
+    currencies with a new version; ``changed_since`` lists the currencies
+    each consumer has not seen yet.
+    """
+
+    def __init__(
+        self, view: GroupedPnL, hedges: FxHedges, fx: FxRateMatrix, version: int = 0
+    ):
+        """
+        Args:
+            view: Per-currency PnL totals.
+            hedges: Open FX hedges.
+            fx: Current and T-1 FX rates.
+            version: Version to count on from, e.g. that of the exposure this
+                one replaces, so consumer cursors stay valid across rebuilds.
+        """
+        self.currencies = np.union1d(view.keys.astype(str), hedges.currency.astype(str))
+        n = len(self.currencies)
+        rows = self._indices(view.keys)
+
+        self.position_exposure = np.zeros(n)
+        self.position_exposure[rows] = view.market_value_local
+        # USD value of the positions at the T-1 close (fixed for the day).
+        self._position_base = np.zeros(n)
+        self._position_base[rows] = view.market_value - view.pnl["t_1"]
+        self.hedge_exposure = np.bincount(
+            self._indices(hedges.currency), weights=hedges.notional, minlength=n
+        )
+
+        self.fx_prior = fx.usd_rate(self.currencies, prior=True)
+        self.fx = np.full(n, np.nan)
+        self.unhedged_pnl = np.zeros(n)
+        self.hedge_pnl = np.zeros(n)
+        self.version = version
+        # Version at which each currency was last recomputed.
+        self._versions = np.zeros(n, dtype=np.int64)
+        self._lock = threading.Lock()
+        self.refresh(fx)
+
+    def __len__(self) -> int:
+        return len(self.currencies)
+
+    def _indices(self, currencies: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self.currencies, np.asarray(currencies).astype(str))
+
+    # --- Derived columns ---
+
+    @property
+    def net_exposure(self) -> np.ndarray:
+        """Positions plus hedges, local currency."""
+        return self.position_exposure + self.hedge_exposure
+
+    @property
+    def hedged_pnl(self) -> np.ndarray:
+        return self.unhedged_pnl + self.hedge_pnl
+
+    @property
+    def hedge_ratio(self) -> np.ndarray:
+        """Share of the position exposure offset by hedges (1.0 = fully hedged)."""
+        pos = self.position_exposure
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Adding 0.0 turns -0.0 (unhedged long) into 0.0.
+            return np.where(pos != 0, -self.hedge_exposure / pos, 0.0) + 0.0
+
+    @property
+    def net_fx_pnl(self) -> np.ndarray:
+        """FX move since T-1 on the net (post-hedge) exposure, USD."""
+        return self.net_exposure * (1.0 / self.fx - 1.0 / self.fx_prior)
+
+    # --- Updates ---
+
+    def refresh(self, fx: FxRateMatrix) -> np.ndarray:
+        """Recompute the currencies whose rate moved; returns their indices."""
+        rates = fx.usd_rate(self.currencies)
+        with self._lock:
+            moved = np.flatnonzero(rates != self.fx)  # NaN on first pass
+            self._recompute(moved, rates[moved])
+        return moved
+
+    def update_positions(self, view: GroupedPnL, codes: np.ndarray) -> np.ndarray:
+        """
+        Pick up price ticks from a per-currency view.
+
+        Args:
+            view: Per-currency PnL totals (e.g. the live book's running totals).
+            codes: Group codes of ``view`` that changed.
+        """
+        rows = self._indices(view.keys[codes])
+        with self._lock:
+            self.position_exposure[rows] = view.market_value_local[codes]
+            self._recompute(rows, self.fx[rows])
+        return rows
+
+    def _recompute(self, rows: np.ndarray, rates: np.ndarray) -> None:
+        self.fx[rows] = rates
+        inv = 1.0 / rates
+        self.unhedged_pnl[rows] = self.position_exposure[rows] * inv - self._position_base[rows]
+        self.hedge_pnl[rows] = self.hedge_exposure[rows] * (inv - 1.0 / self.fx_prior[rows])
+        if len(rows):
+            self.version += 1
+            self._versions[rows] = self.version
+
+    def changed_since(self, version: int) -> tuple[np.ndarray, int]:
+        """
+        Currencies recomputed after ``version``.
+
+        Returns:
+            (indices, current version) — pass the version back on the next call.
+        """
+        with self._lock:
+            return np.flatnonzero(self._versions > version), self.version
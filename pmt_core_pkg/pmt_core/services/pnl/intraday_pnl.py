@@ -0,0 +1,156 @@
+"""
+Intraday PnL — incremental updates of a computed book on price ticks.
+
+Reference closes are fixed for the day, so a price move changes every
+period PnL of a position by the same amount as its market value. A tick
+therefore touches only the positions in the ticked tickers: their
+market value delta is applied to the per-position arrays and scattered
+into the running per-group totals with ``np.add.at``, in O(changed rows).
+Each update returns a ``PnLDelta`` naming the changed positions and
+groups, and stamps the touched groups with a new book version, so every
+consumer can ask for the groups changed since the version it last saw
+without draining a shared change set.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+import numpy as np
+
+from pmt_core.services.pnl.pnl_engine import GroupedPnL, PnLResult
+
+# Groupings whose totals are kept current tick by tick.
+TRACKED_GROUPS = ("ticker", "underlying", "currency", "book")
+
+
+@dataclass(frozen=True)
+class PnLDelta:
+    """Positions and groups changed by one batch of ticks."""
+
+    rows: np.ndarray  # changed position indices
+    pnl_change: np.ndarray  # USD change in every period PnL, per changed row
+    groups: dict[str, np.ndarray] = field(default_factory=dict)  # touched group codes
+    version: int = 0  # book version after the update
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def empty(cls) -> "PnLDelta":
+        rows = np.empty(0, dtype=np.intp)
+        return cls(rows, np.empty(0), {by: rows for by in TRACKED_GROUPS})
+
+
+class IntradayPnL:
+    """
+    Live PnL book for one trade date, updated in place from price ticks.
+
+    The wrapped ``PnLResult`` is mutated, so any view aggregated from it
+    afterwards reflects the ticks; ``totals(by)`` reads the running group
+    sums without re-aggregating, and ``changed_since(by, version)`` lists
+    the groups each consumer has not seen yet.
+    """
+
+    def __init__(self, result: PnLResult, trade_date: str):
+        self.result = result
+        self.trade_date = trade_date
+        self._totals = {by: result.aggregate(by) for by in TRACKED_GROUPS}
+        keys, codes = result.groups("ticker")
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(keys) + 1))
+        self._rows_by_ticker = {
+            ticker: order[bounds[i] : bounds[i + 1]] for i, ticker in enumerate(keys.tolist())
+        }
+        self.version = 0
+        # Book version at which each group last changed.
+        self._group_versions = {
+            by: np.zeros(len(view.keys), dtype=np.int64) for by, view in self._totals.items()
+        }
+        self._lock = threading.Lock()
+
+    def totals(self, by: str) -> GroupedPnL:
+        """Running totals for one of ``TRACKED_GROUPS``."""
+        return self._totals[by]
+
+    def changed_since(self, by: str, version: int) -> tuple[np.ndarray, int]:
+        """
+        Group codes of ``by`` changed after ``version``.
+
+        Returns:
+            (codes, current version) — pass the version back on the next call.
+        """
+        with self._lock:
+            codes = np.flatnonzero(self._group_versions[by] > version)
+            return codes, self.version
+
+    def apply_prices(self, prices: Mapping[str, float]) -> PnLDelta:
+        """
+        Reprice the positions in the ticked tickers.
+
+        Args:
+            prices: ticker -> new price (local currency). Unknown tickers and
+                unchanged prices are ignored.
+
+        Returns:
+            The changed positions and the group codes whose totals moved.
+        """
+        parts = [
+            (self._rows_by_ticker[ticker], price)
+            for ticker, price in prices.items()
+            if ticker in self._rows_by_ticker
+        ]
+        if not parts:
+            return PnLDelta.empty()
+        rows = np.concatenate([r for r, _ in parts])
+        new_price = np.concatenate([np.full(len(r), p, dtype=float) for r, p in parts])
+
+        result = self.result
+        inputs = result.inputs
+        with self._lock:
+            moved = new_price != inputs.price[rows]
+            rows, new_price = rows[moved], new_price[moved]
+            if not len(rows):
+                return PnLDelta.empty()
+            mv_local = inputs.notional[rows] * new_price
+            mv = mv_local / inputs.fx[rows]
+            d_mv = mv - result.market_value[rows]
+            d_mv_local = mv_local - result.market_value_local[rows]
+
+            inputs.price[rows] = new_price
+            result.market_value[rows] = mv
+            result.market_value_local[rows] = mv_local
+            for ref in result.pnl:
+                result.pnl[ref][rows] += d_mv
+                result.pnl_local[ref][rows] += d_mv_local
+
+            self.version += 1
+            touched = {}
+            for by, view in self._totals.items():
+                codes = result.groups(by)[1][rows]
+                np.add.at(view.market_value, codes, d_mv)
+                np.add.at(view.market_value_local, codes, d_mv_local)
+                for ref in view.pnl:
+                    np.add.at(view.pnl[ref], codes, d_mv)
+                    np.add.at(view.pnl_local[ref], codes, d_mv_local)
+                touched[by] = np.unique(codes)
+                self._group_versions[by][touched[by]] = self.version
+            return PnLDelta(rows, d_mv, touched, self.version)
+
+    def records(self, delta: PnLDelta) -> list[dict[str, Any]]:
+        """Row-delta set: the new state of every changed position."""
+        result = self.result
+        inputs = result.inputs
+        rows = delta.rows
+        columns = {
+            "position_id": inputs.position_id[rows].tolist(),
+            "ticker": inputs.ticker[rows].tolist(),
+            "book": inputs.book[rows].tolist(),
+            "currency": inputs.currency[rows].tolist(),
+            "price": inputs.price[rows].tolist(),
+            "market_value": result.market_value[rows].tolist(),
+            "pnl_change": delta.pnl_change.tolist(),
+            **{f"pnl_{ref}": values[rows].tolist() for ref, values in result.pnl.items()},
+        }
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
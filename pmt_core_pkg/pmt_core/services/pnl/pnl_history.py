@@ -0,0 +1,185 @@
+"""
+PnL History Store — append-only daily PnL with prefix sums.
+
+Daily PnL is held as a dense (days × positions) matrix alongside its
+running prefix sums, where row ``k`` of the prefix matrix is the total of
+the first ``k`` days. Any period total (DTD, WTD, MTD, YTD or a custom
+range) for every position is then two row lookups and one subtraction,
+independent of how many years of history are loaded. Days are appended
+in date order only; a position first seen later simply has zero history
+before that.
+"""
+
+import threading
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+PERIODS = ("dtd", "wtd", "mtd", "ytd")
+
+
+def period_start(asof: np.datetime64, period: str) -> np.datetime64:
+    """First calendar day of the DTD/WTD/MTD/YTD period containing ``asof``."""
+    asof = np.datetime64(asof, "D")
+    if period == "dtd":
+        return asof
+    if period == "wtd":
+        # 1970-01-01 was a Thursday; Monday is weekday 0.
+        return asof - (asof.astype(np.int64) + 3) % 7
+    if period == "mtd":
+        return asof.astype("datetime64[M]").astype("datetime64[D]")
+    if period == "ytd":
+        return asof.astype("datetime64[Y]").astype("datetime64[D]")
+    raise ValueError(f"Unknown PnL period: {period}")
+
+
+class PnLHistoryStore:
+    """
+    Columnar daily PnL keyed by (date, position).
+
+    Storage grows by doubling in both dimensions, so appends are amortized
+    O(positions) and reads never scan history.
+    """
+
+    def __init__(self, capacity_days: int = 256, capacity_positions: int = 64):
+        self._lock = threading.Lock()
+        self._dates = np.empty(capacity_days, dtype="datetime64[D]")
+        self._daily = np.zeros((capacity_days, capacity_positions))
+        self._cum = np.zeros((capacity_days + 1, capacity_positions))
+        self._n_days = 0
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._n_days
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self._dates[: self._n_days]
+
+    @property
+    def position_ids(self) -> list[str]:
+        return list(self._positions)
+
+    @property
+    def last_date(self) -> Optional[np.datetime64]:
+        return self._dates[self._n_days - 1] if self._n_days else None
+
+    # --- Writes ---
+
+    def append(self, date, position_ids: Sequence[str], pnl: Sequence[float]) -> None:
+        """
+        Append one day of PnL.
+
+        Raises:
+            ValueError: If ``date`` is not after the last stored date.
+        """
+        self.extend([date], position_ids, np.asarray(pnl, dtype=float)[None, :])
+
+    def extend(
+        self, dates: Iterable, position_ids: Sequence[str], pnl: np.ndarray
+    ) -> None:
+        """
+        Append several days at once (e.g. a bulk load).
+
+        Args:
+            dates: Ascending dates, all after the last stored date.
+            position_ids: Column labels of ``pnl``.
+            pnl: (len(dates), len(position_ids)) daily PnL.
+        """
+        dates = np.asarray(list(dates), dtype="datetime64[D]")
+        pnl = np.asarray(pnl, dtype=float).reshape(len(dates), len(position_ids))
+        if not len(dates):
+            return
+        with self._lock:
+            last = self.last_date
+            if np.any(np.diff(dates) <= np.timedelta64(0, "D")) or (
+                last is not None and dates[0] <= last
+            ):
+                raise ValueError("PnL history is append-only: dates must be ascending and new")
+            cols = self._columns(position_ids)
+            start, end = self._n_days, self._n_days + len(dates)
+            self._reserve_days(end)
+
+            self._dates[start:end] = dates
+            self._daily[start:end] = 0.0
+            self._daily[start:end, cols] = pnl
+            self._cum[start + 1 : end + 1] = self._cum[start] + np.cumsum(
+                self._daily[start:end], axis=0
+            )
+            self._n_days = end
+
+    def _columns(self, position_ids: Sequence[str]) -> np.ndarray:
+        """Column index per position, registering unseen positions."""
+        for position_id in position_ids:
+            if position_id not in self._positions:
+                self._positions[position_id] = len(self._positions)
+        needed = len(self._positions)
+        capacity = self._daily.shape[1]
+        if needed > capacity:
+            grow = max(needed, capacity * 2) - capacity
+            self._daily = np.pad(self._daily, ((0, 0), (0, grow)))
+            self._cum = np.pad(self._cum, ((0, 0), (0, grow)))
+        return np.array([self._positions[p] for p in position_ids], dtype=np.intp)
+
+    def _reserve_days(self, needed: int) -> None:
+        capacity = len(self._dates)
+        if needed <= capacity:
+            return
+        grow = max(needed, capacity * 2) - capacity
+        self._dates = np.concatenate([self._dates, np.empty(grow, dtype="datetime64[D]")])
+        self._daily = np.pad(self._daily, ((0, grow), (0, 0)))
+        self._cum = np.pad(self._cum, ((0, grow), (0, 0)))
+
+    # --- Reads ---
+
+    def _select(self, position_ids: Optional[Sequence[str]]) -> np.ndarray:
+        if position_ids is None:
+            return np.arange(len(self._positions))
+        return np.array([self._positions.get(p, -1) for p in position_ids], dtype=np.intp)
+
+    def range_pnl(
+        self, start, end, position_ids: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """
+        Total PnL over [start, end] (inclusive) per position.
+
+        Args:
+            start, end: Calendar dates; either may fall on a non-trading day.
+            position_ids: Positions to return (None = all, in ``position_ids``
+                order). Unknown positions get 0.
+        """
+        dates = self.dates
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+        cols = self._select(position_ids)
+        known = cols >= 0
+        out = np.zeros(len(cols))
+        if hi > lo:
+            out[known] = self._cum[hi, cols[known]] - self._cum[lo, cols[known]]
+        return out
+
+    def period_pnl(
+        self,
+        asof,
+        position_ids: Optional[Sequence[str]] = None,
+        periods: Sequence[str] = PERIODS,
+    ) -> dict[str, np.ndarray]:
+        """DTD/WTD/MTD/YTD PnL as of ``asof`` per position."""
+        asof = np.datetime64(asof, "D")
+        return {
+            period: self.range_pnl(period_start(asof, period), asof, position_ids)
+            for period in periods
+        }
+
+    def daily_totals(
+        self, start=None, end=None, position_ids: Optional[Sequence[str]] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(dates, summed daily PnL) over [start, end], e.g. for sparklines."""
+        dates = self.dates
+        lo = 0 if start is None else np.searchsorted(dates, np.datetime64(start, "D"))
+        hi = len(dates) if end is None else np.searchsorted(
+            dates, np.datetime64(end, "D"), side="right"
+        )
+        cols = self._select(position_ids)
+        cols = cols[cols >= 0]
+        return dates[lo:hi], self._daily[lo:hi][:, cols].sum(axis=1)
@@ -1,11 +1,77 @@
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Mapping, Optional, Sequence, Dict, Any
 from pmt_core.repositories.pnl import PnLRepository
 from pmt_core.repositories.protocols import PnLRepositoryProtocol
 from pmt_core.models import PnLRecord
+from pmt_core.services.market_data.fx_engine import FxRateMatrix
+from pmt_core.services.pnl.currency_exposure import CurrencyExposure, FxHedges
+from pmt_core.services.pnl.intraday_pnl import TRACKED_GROUPS, IntradayPnL, PnLDelta
+from pmt_core.services.pnl.pnl_explain import (
+    EXPLAIN_COMPONENTS,
+    RiskSnapshot,
+    explain_pnl,
+)
+from pmt_core.services.pnl.pnl_engine import (
+    GroupedPnL,
+    PnLInputs,
+    PnLResult,
+    compute_pnl,
+)
+from pmt_core.services.pnl.pnl_history import PERIODS, PnLHistoryStore
+import asyncio
 import logging
+import threading
+from datetime import datetime
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
 
 logger = logging.getLogger(__name__)
 
+_CCY_SYMBOLS = {"USD": "$", "JPY": "¥", "EUR": "€", "GBP": "£", "HKD": "HK$"}
+
+# Share of 3-month ADV assumed tradable per day for days-to-liquidate.
+_ADV_PARTICIPATION = 0.2
+
+# Seconds a compute pass is reused across PnL views.
+_RESULT_TTL = 30
+
+# Compute passes kept for closed (past) trade dates.
+_CLOSED_CACHE_SIZE = 32
+
+# Business days either side of a viewed date loaded ahead of time.
+_PREFETCH_WINDOW = 2
+
+# Trade dates whose currency exposure engine is kept live.
+_EXPOSURE_CACHE_SIZE = 8
+
+# First date loaded into the P&L history store.
+_HISTORY_START = "2022-01-01"
+
+
+def _format_money(value: float, ccy: str) -> str:
+    """Full amount with currency symbol, e.g. ¥12,345,000,000."""
+    sign = "-" if round(value) < 0 else ""
+    return f"{sign}{_CCY_SYMBOLS.get(ccy, ccy + ' ')}{abs(value):,.0f}"
+
+
+def _format_compact(value: float, ccy: str) -> str:
+    """Compact amount with currency symbol, e.g. $1.57M or €345.7K."""
+    sign = "-" if value < 0 else ""
+    symbol = _CCY_SYMBOLS.get(ccy, ccy + " ")
+    abs_val = abs(value)
+    for divisor, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if abs_val >= divisor:
+            scaled = abs_val / divisor
+            return f"{sign}{symbol}{scaled:.{2 if scaled < 10 else 1}f}{suffix}"
+    return f"{sign}{symbol}{abs_val:,.0f}"
+
+
+def _iter_rows(columns: Dict[str, list]) -> Iterator[Dict[str, Any]]:
+    """Zip parallel column lists into per-row dicts."""
+    names = list(columns)
+    for values in zip(*columns.values()):
+        yield dict(zip(names, values))
+
 
 class PnLService:
     """
@@ -13,185 +79,557 @@ class PnLService:
     Delegates data fetching to PnLRepository.
     """
 
-    def __init__(self, repository: Optional[PnLRepositoryProtocol] = None):
+    def __init__(
+        self,
+        repository: Optional[PnLRepositoryProtocol] = None,
+        fx: Optional[FxRateMatrix] = None,
+    ):
         self.repository = repository or PnLRepository()
+        self.fx = fx or FxRateMatrix()
+        self._results: TTLCache = TTLCache(maxsize=16, ttl=_RESULT_TTL)
+        self._closed_results: LRUCache = LRUCache(maxsize=_CLOSED_CACHE_SIZE)
+        self._prefetch_tasks: set[asyncio.Task] = set()
+        # trade_date -> (compute pass, exposure built from it).
+        self._exposures: LRUCache = LRUCache(maxsize=_EXPOSURE_CACHE_SIZE)
+        self._lock = threading.Lock()
+        self._intraday: Optional[IntradayPnL] = None
+        self.history = PnLHistoryStore()
+        self._history_end: Optional[str] = None
+        self._history_load_lock = asyncio.Lock()
+
+    @staticmethod
+    def _apply_fx_columns(
+        rows: List[Dict[str, Any]], rates: np.ndarray, prior: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """Fill fx_rate / fx_rate_t_1 / fx_rate_change from the pass's FX in one pass."""
+        if not rows:
+            return rows
+        change = (rates / prior - 1.0) * 100.0
+        for row, rate, rate_t_1, chg in zip(
+            rows, rates.tolist(), prior.tolist(), change.tolist()
+        ):
+            row["fx_rate"] = f"{rate:.4f}"
+            row["fx_rate_t_1"] = f"{rate_t_1:.4f}"
+            row["fx_rate_change"] = f"{chg:+.2f}%" if chg else "0.00%"
+        return rows
+
+    def _fx_for(self, trade_date: str, result: PnLResult) -> FxRateMatrix:
+        """Live FX matrix for today; a matrix of the date's own closes otherwise."""
+        if trade_date >= datetime.now().strftime("%Y-%m-%d"):
+            return self.fx
+        inputs = result.inputs
+        currencies = inputs.currency.tolist()
+        return FxRateMatrix(
+            dict(zip(currencies, inputs.fx.tolist())),
+            dict(zip(currencies, inputs.ref_fx["t_1"].tolist())),
+        )
+
+    async def compute_pnl(self, trade_date: Optional[str] = None) -> PnLResult:
+        """
+        One PnL compute pass for a trade date, shared by every PnL view.
+
+        Positions and reference closes come from the repository in one call.
+        Today's current and T-1 FX come from the shared FX matrix; past
+        dates use the FX closes stored for that date. The result is
+        cached briefly per date so the Change, Summary, Currency and Full
+        pages reuse the same pass.
+        """
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        result = self._cached_result(trade_date)
+        if result is not None:
+            return result
+        columns = await self.repository.get_pnl_inputs(trade_date)
+        return self._store_result(trade_date, columns)
+
+    async def compute_pnl_range(self, trade_dates: List[str]) -> Dict[str, PnLResult]:
+        """
+        Compute passes for several trade dates.
+
+        Dates not already cached are loaded in one repository round trip.
+        """
+        results = {d: self._cached_result(d) for d in dict.fromkeys(trade_dates)}
+        missing = [d for d, result in results.items() if result is None]
+        if missing:
+            loaded = await self.repository.get_pnl_inputs_range(missing)
+            for trade_date, columns in loaded.items():
+                results[trade_date] = self._store_result(trade_date, columns)
+        return {d: result for d, result in results.items() if result is not None}
+
+    def _cached_result(self, trade_date: str) -> Optional[PnLResult]:
+        """Live book, else a cached pass (closed dates are kept longer)."""
+        live = self._intraday
+        if live is not None and live.trade_date == trade_date:
+            return live.result
+        with self._lock:
+            result = self._results.get(trade_date)
+            if result is None:
+                result = self._closed_results.get(trade_date)
+        return result
+
+    def _store_result(self, trade_date: str, columns: Mapping[str, Any]) -> PnLResult:
+        inputs = PnLInputs.from_columns(columns)
+        closed = trade_date < datetime.now().strftime("%Y-%m-%d")
+        if not closed:
+            # Today marks to the live FX matrix; past dates keep their own closes.
+            currencies = inputs.currency.tolist()
+            inputs.fx = self.fx.usd_rate(currencies)
+            inputs.ref_fx["t_1"] = self.fx.usd_rate(currencies, prior=True)
+        result = compute_pnl(inputs)
+        # Past dates no longer move, so they live in the bounded LRU cache
+        # rather than expiring with the short TTL.
+        with self._lock:
+            (self._closed_results if closed else self._results)[trade_date] = result
+        logger.info(f"Computed P&L for {len(result)} positions on {trade_date}")
+        return result
+
+    def prefetch_adjacent_dates(self, trade_date: str, window: int = _PREFETCH_WINDOW) -> None:
+        """
+        Load the business days around ``trade_date`` in the background.
+
+        Up to ``window`` business days either side (never past today) that
+        are not cached yet are fetched in one batch, so flipping the date
+        picker between T, T-1 and T-2 is served from cache.
+        """
+        today = np.datetime64(datetime.now().strftime("%Y-%m-%d"), "D")
+        offsets = [o for o in range(-window, window + 1) if o]
+        days = np.busday_offset(np.datetime64(trade_date, "D"), offsets, roll="backward")
+        dates = [str(d) for d in days if d <= today]
+        missing = [d for d in dates if self._cached_result(d) is None]
+        if not missing:
+            return
+        task = asyncio.get_running_loop().create_task(self._prefetch(missing))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _prefetch(self, trade_dates: List[str]) -> None:
+        try:
+            await self.compute_pnl_range(trade_dates)
+            logger.info(f"Prefetched P&L for {', '.join(trade_dates)}")
+        except Exception as e:
+            logger.warning(f"P&L prefetch failed for {trade_dates}: {e}")
 
     async def get_pnl_changes(
         self, trade_date: Optional[str] = None
     ) -> List[PnLRecord]:
-        """Get P&L changes."""
-        return await self.repository.get_pnl_changes(trade_date)
+        """Get P&L changes per ticker."""
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        result = await self.compute_pnl(trade_date)
+        view = self._view(result, "ticker")
+        periods = await self._grouped_periods(trade_date, result, view)
+        return self._change_records(
+            trade_date, result, view, periods, np.arange(len(view))
+        )
+
+    async def get_pnl_changes_range(
+        self, trade_dates: List[str]
+    ) -> Dict[str, List[PnLRecord]]:
+        """Get P&L changes per ticker for several dates (one repository call)."""
+        results = await self.compute_pnl_range(trade_dates)
+        changes = {}
+        for trade_date, result in results.items():
+            view = self._view(result, "ticker")
+            periods = await self._grouped_periods(trade_date, result, view)
+            changes[trade_date] = self._change_records(
+                trade_date, result, view, periods, np.arange(len(view))
+            )
+        return changes
+
+    async def start_intraday(self, trade_date: Optional[str] = None) -> IntradayPnL:
+        """
+        Live book for a trade date (today by default).
+
+        Once started, ticks update it in place and every PnL view for that
+        date reads the live state instead of recomputing.
+        """
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        live = self._intraday
+        if live is None or live.trade_date != trade_date:
+            live = IntradayPnL(await self.compute_pnl(trade_date), trade_date)
+            self._intraday = live
+            logger.info(f"Started intraday P&L for {trade_date}")
+        return live
+
+    def on_price_ticks(self, prices: Mapping[str, float]) -> PnLDelta:
+        """Apply ticker -> price ticks to the live book (no-op before start_intraday)."""
+        live = self._intraday
+        if live is None:
+            return PnLDelta.empty()
+        return self._apply_prices(live, prices)
+
+    def _apply_prices(self, live: IntradayPnL, prices: Mapping[str, float]) -> PnLDelta:
+        """Tick the live book and carry the moved currencies into the exposure view."""
+        delta = live.apply_prices(prices)
+        cached = self._exposures.get(live.trade_date)
+        if len(delta) and cached is not None and cached[0] is live.result:
+            cached[1].update_positions(live.totals("currency"), delta.groups["currency"])
+        return delta
+
+    async def get_pnl_change_updates(
+        self, prices: Mapping[str, float], since: int = 0
+    ) -> tuple[List[PnLRecord], int]:
+        """
+        Apply ticks to the live book and return the ticker rows changed since
+        the caller's last read.
+
+        Row ids match ``get_pnl_changes`` so grids can patch rows in place.
+        Each consumer keeps its own cursor, so a tick applied by one session
+        is still reported to every other session.
+
+        Args:
+            prices: ticker -> latest price.
+            since: Book version returned by this consumer's previous call
+                (0 = every row changed since the live book started).
+
+        Returns:
+            (changed rows, version to pass as ``since`` next time).
+        """
+        live = await self.start_intraday()
+        self._apply_prices(live, prices)
+        codes, version = live.changed_since("ticker", since)
+        if not len(codes):
+            return [], version
+        view = live.totals("ticker")
+        periods = await self._grouped_periods(live.trade_date, live.result, view)
+        records = self._change_records(live.trade_date, live.result, view, periods, codes)
+        return records, version
+
+    def _view(self, result: PnLResult, by: str) -> GroupedPnL:
+        """Running totals for the live book, else a fresh grouped reduction."""
+        live = self._intraday
+        if live is not None and live.result is result and by in TRACKED_GROUPS:
+            return live.totals(by)
+        return result.aggregate(by)
+
+    def _change_records(
+        self,
+        trade_date: str,
+        result: PnLResult,
+        view: GroupedPnL,
+        periods: Mapping[str, np.ndarray],
+        groups: np.ndarray,
+    ) -> List[PnLRecord]:
+        """PnL change rows for the given ticker group codes."""
+        inputs = result.inputs
+        first = view.first_row[groups]
+        price = inputs.price[first]
+        price_t_1 = inputs.ref_price["t_1"][first]
+        columns = {
+            "id": groups.tolist(),
+            "ticker": view.keys[groups].tolist(),
+            "underlying": inputs.underlying[first].tolist(),
+            "currency": inputs.currency[first].tolist(),
+            "pnl_ytd": periods["ytd"][groups].tolist(),
+            "pnl_mtd": periods["mtd"][groups].tolist(),
+            "pnl_wtd": periods["wtd"][groups].tolist(),
+            "pnl_dtd": view.pnl["t_1"][groups].tolist(),
+            "pnl_chg_1w": view.pnl["1w"][groups].tolist(),
+            "pnl_chg_1m": view.pnl["1m"][groups].tolist(),
+            "pct_1d": view.pct("t_1")[groups].tolist(),
+            "pct_1w": view.pct("1w")[groups].tolist(),
+            "pct_1m": view.pct("1m")[groups].tolist(),
+            "price": price.tolist(),
+            "price_t_1": price_t_1.tolist(),
+            "price_change": (price - price_t_1).tolist(),
+            "fx": inputs.fx[first].tolist(),
+        }
+        return [
+            PnLRecord(
+                id=row["id"],
+                trade_date=trade_date,
+                underlying=row["underlying"],
+                ticker=row["ticker"],
+                currency=row["currency"],
+                pnl_ytd=_format_money(row["pnl_ytd"], "USD"),
+                pnl_mtd=_format_money(row["pnl_mtd"], "USD"),
+                pnl_wtd=_format_money(row["pnl_wtd"], "USD"),
+                pnl_dtd=_format_money(row["pnl_dtd"], "USD"),
+                pnl_chg_1d=_format_money(row["pnl_dtd"], "USD"),
+                pnl_chg_1w=_format_money(row["pnl_chg_1w"], "USD"),
+                pnl_chg_1m=_format_money(row["pnl_chg_1m"], "USD"),
+                pnl_chg_pct_1d=f"{row['pct_1d']:.2f}%",
+                pnl_chg_pct_1w=f"{row['pct_1w']:.2f}%",
+                pnl_chg_pct_1m=f"{row['pct_1m']:.2f}%",
+                price=f"{row['price']:.2f}",
+                price_t_1=f"{row['price_t_1']:.2f}",
+                price_change=f"{row['price_change']:.2f}",
+                fx_rate=f"{row['fx']:.4f}",
+            )
+            for row in _iter_rows(columns)
+        ]
 
     async def get_pnl_summary(
         self, trade_date: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get P&L summary as dicts. TODO: Replace with DB query."""
-        logger.info("Returning mock PnL summary data")
-        return [
-            {
-                "trade_date": "2026-01-31",
-                "underlying": "Toyota Motor",
-                "currency": "JPY",
-                "price": "2,876.50",
-                "price_t_1": "2,845.00",
-                "price_change": "+1.11%",
-                "fx_rate": "149.8500",
-                "fx_rate_t_1": "149.2300",
-                "fx_rate_change": "+0.42%",
-                "dtl": "0",
-                "last_volume": "5,234,567",
-                "adv_3m": "4,567,890",
-            },
-            {
-                "trade_date": "2026-01-31",
-                "underlying": "Sony Group",
-                "currency": "JPY",
-                "price": "14,234.00",
-                "price_t_1": "14,123.00",
-                "price_change": "+0.79%",
-                "fx_rate": "149.8500",
-                "fx_rate_t_1": "149.2300",
-                "fx_rate_change": "+0.42%",
-                "dtl": "2",
-                "last_volume": "2,345,678",
-                "adv_3m": "2,123,456",
-            },
-            {
-                "trade_date": "2026-01-31",
-                "underlying": "Nintendo",
-                "currency": "JPY",
-                "price": "8,567.00",
-                "price_t_1": "8,456.00",
-                "price_change": "+1.31%",
-                "fx_rate": "149.8500",
-                "fx_rate_t_1": "149.2300",
-                "fx_rate_change": "+0.42%",
-                "dtl": "0",
-                "last_volume": "3,456,789",
-                "adv_3m": "3,234,567",
-            },
-            {
-                "trade_date": "2026-01-31",
-                "underlying": "SoftBank Group",
-                "currency": "JPY",
-                "price": "9,123.00",
-                "price_t_1": "9,345.00",
-                "price_change": "-2.37%",
-                "fx_rate": "149.8500",
-                "fx_rate_t_1": "149.2300",
-                "fx_rate_change": "+0.42%",
-                "dtl": "5",
-                "last_volume": "6,789,012",
-                "adv_3m": "5,678,901",
-            },
-            {
-                "trade_date": "2026-01-31",
-                "underlying": "ASML Holdings",
-                "currency": "EUR",
-                "price": "678.90",
-                "price_t_1": "672.50",
-                "price_change": "+0.95%",
-                "fx_rate": "0.9234",
-                "fx_rate_t_1": "0.9189",
-                "fx_rate_change": "+0.49%",
-                "dtl": "1",
-                "last_volume": "1,234,567",
-                "adv_3m": "1,123,456",
-            },
+        """
+        Get P&L summary per underlying: prices, FX and liquidity.
+
+        Days to liquidate assume 20% participation in the 3-month ADV.
+        """
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        result = await self.compute_pnl(trade_date)
+        inputs = result.inputs
+        keys, codes = result.groups("underlying")
+        first = self._view(result, "underlying").first_row
+        net_quantity = np.bincount(codes, weights=inputs.quantity, minlength=len(keys))
+        price = inputs.price[first]
+        price_t_1 = inputs.ref_price["t_1"][first]
+        adv = inputs.attributes["adv_3m"][first].astype(float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.where(price_t_1 > 0, (price / price_t_1 - 1.0) * 100.0, 0.0)
+            dtl = np.where(adv > 0, np.ceil(np.abs(net_quantity) / (_ADV_PARTICIPATION * adv)), 0)
+        columns = {
+            "underlying": keys.tolist(),
+            "currency": inputs.currency[first].tolist(),
+            "price": price.tolist(),
+            "price_t_1": price_t_1.tolist(),
+            "price_change": change.tolist(),
+            "dtl": dtl.astype(np.int64).tolist(),
+            "last_volume": inputs.attributes["last_volume"][first].astype(np.int64).tolist(),
+            "adv_3m": adv.astype(np.int64).tolist(),
+        }
+        rows = [
             {
-                "trade_date": "2026-01-31",
-                "underlying": "HSBC Holdings",
-                "currency": "GBP",
-                "price": "745.60",
-                "price_t_1": "742.30",
-                "price_change": "+0.44%",
-                "fx_rate": "0.7923",
-                "fx_rate_t_1": "0.7891",
-                "fx_rate_change": "+0.41%",
-                "dtl": "3",
-                "last_volume": "8,901,234",
-                "adv_3m": "7,890,123",
-            },
+                "id": i + 1,
+                "trade_date": trade_date,
+                "underlying": row["underlying"],
+                "currency": row["currency"],
+                "price": f"{row['price']:,.2f}",
+                "price_t_1": f"{row['price_t_1']:,.2f}",
+                "price_change": f"{row['price_change']:+.2f}%",
+                "dtl": str(row["dtl"]),
+                "last_volume": f"{row['last_volume']:,}",
+                "adv_3m": f"{row['adv_3m']:,}",
+            }
+            for i, row in enumerate(_iter_rows(columns))
         ]
+        return self._apply_fx_columns(
+            rows, inputs.fx[first], inputs.ref_fx["t_1"][first]
+        )
 
     async def get_pnl_by_currency(
         self, trade_date: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get P&L broken down by currency. TODO: Replace with DB query."""
-        logger.info("Returning mock PnL by currency data")
+        """
+        Get P&L broken down by currency, net of FX hedges.
+
+        Position exposure comes from the shared compute pass and is netted
+        against the FX hedges per currency; the view stays live, so later
+        calls and ``get_pnl_currency_updates`` only recompute currencies
+        whose FX rate or prices moved.
+        """
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        exposure = await self.get_currency_exposure(trade_date)
+        return self._currency_records(trade_date, exposure, np.arange(len(exposure)))
+
+    async def get_currency_exposure(
+        self, trade_date: Optional[str] = None
+    ) -> CurrencyExposure:
+        """Per-currency exposure engine for a trade date, refreshed from the FX matrix."""
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        result = await self.compute_pnl(trade_date)
+        cached = self._exposures.get(trade_date)
+        if cached is not None and cached[0] is result:
+            cached[1].refresh(self._fx_for(trade_date, result))
+            return cached[1]
+        hedges = FxHedges.from_columns(await self.repository.get_fx_hedges(trade_date))
+        exposure = CurrencyExposure(
+            self._view(result, "currency"),
+            hedges,
+            self._fx_for(trade_date, result),
+            version=cached[1].version if cached is not None else 0,
+        )
+        self._exposures[trade_date] = (result, exposure)
+        logger.info(
+            f"Built currency exposure for {len(exposure)} currencies, "
+            f"{len(hedges)} hedges on {trade_date}"
+        )
+        return exposure
+
+    async def get_pnl_currency_updates(
+        self,
+        usd_quotes: Optional[Mapping[str, float]] = None,
+        trade_date: Optional[str] = None,
+        since: int = 0,
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """
+        Apply FX quotes (units of currency per 1 USD) and return the currency
+        rows that changed since the caller's last read.
+
+        Row ids match ``get_pnl_by_currency``. Each consumer keeps its own
+        cursor, so an FX move read by one session is still reported to
+        every other session.
+
+        Args:
+            usd_quotes: currency -> latest rate.
+            trade_date: Trade date of the exposure (today by default).
+            since: Version returned by this consumer's previous call
+                (0 = every currency computed since the exposure was built).
+
+        Returns:
+            (changed rows, version to pass as ``since`` next time).
+        """
+        if usd_quotes:
+            self.fx.update(dict(usd_quotes))
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        exposure = await self.get_currency_exposure(trade_date)
+        rows, version = exposure.changed_since(since)
+        return self._currency_records(trade_date, exposure, rows), version
+
+    def _currency_records(
+        self, trade_date: str, exposure: CurrencyExposure, rows: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """Currency rows for the given exposure indices."""
+        fx = exposure.fx[rows]
+        fx_prior = exposure.fx_prior[rows]
+        columns = {
+            "id": (rows + 1).tolist(),
+            "currency": exposure.currencies[rows].tolist(),
+            "fx": fx.tolist(),
+            "fx_prior": fx_prior.tolist(),
+            "fx_change": ((fx / fx_prior - 1.0) * 100.0).tolist(),
+            "position": exposure.position_exposure[rows].tolist(),
+            "hedge": exposure.hedge_exposure[rows].tolist(),
+            "net": exposure.net_exposure[rows].tolist(),
+            "net_usd": (exposure.net_exposure[rows] / fx).tolist(),
+            "hedge_ratio": exposure.hedge_ratio[rows].tolist(),
+            "unhedged": exposure.unhedged_pnl[rows].tolist(),
+            "hedged": exposure.hedged_pnl[rows].tolist(),
+            "net_fx": exposure.net_fx_pnl[rows].tolist(),
+        }
         return [
             {
-                "trade_date": "2026-01-31",
-                "currency": "USD",
-                "fx_rate": "1.0000",
-                "fx_rate_t_1": "1.0000",
-                "fx_rate_change": "0.00%",
-                "ccy_exposure": "$45,678,901",
-                "usd_exposure": "$45,678,901",
-                "pos_ccy_expo": "$45,678,901",
-                "ccy_hedged_pnl": "$123,456",
-                "pos_ccy_pnl": "$123,456",
-                "net_ccy": "$123,456",
-                "pos_c_truncated": "$123.5K",
-            },
-            {
-                "trade_date": "2026-01-31",
-                "currency": "JPY",
-                "fx_rate": "149.8500",
-                "fx_rate_t_1": "149.2300",
-                "fx_rate_change": "+0.42%",
-                "ccy_exposure": "¥12,345,000,000",
-                "usd_exposure": "$82,456,789",
-                "pos_ccy_expo": "¥12,345,000,000",
-                "ccy_hedged_pnl": "¥234,567,890",
-                "pos_ccy_pnl": "$1,567,890",
-                "net_ccy": "¥234.6M",
-                "pos_c_truncated": "$1.57M",
-            },
-            {
-                "trade_date": "2026-01-31",
-                "currency": "EUR",
-                "fx_rate": "0.9234",
-                "fx_rate_t_1": "0.9189",
-                "fx_rate_change": "+0.49%",
-                "ccy_exposure": "€23,456,789",
-                "usd_exposure": "$25,402,345",
-                "pos_ccy_expo": "€23,456,789",
-                "ccy_hedged_pnl": "€345,678",
-                "pos_ccy_pnl": "$374,567",
-                "net_ccy": "€345.7K",
-                "pos_c_truncated": "$374.6K",
-            },
-            {
-                "trade_date": "2026-01-31",
-                "currency": "GBP",
-                "fx_rate": "0.7923",
-                "fx_rate_t_1": "0.7891",
-                "fx_rate_change": "+0.41%",
-                "ccy_exposure": "£8,901,234",
-                "usd_exposure": "$11,234,567",
-                "pos_ccy_expo": "£8,901,234",
-                "ccy_hedged_pnl": "£89,012",
-                "pos_ccy_pnl": "$112,345",
-                "net_ccy": "£89.0K",
-                "pos_c_truncated": "$112.3K",
-            },
+                "id": row["id"],
+                "trade_date": trade_date,
+                "currency": row["currency"],
+                "fx_rate": f"{row['fx']:.4f}",
+                "fx_rate_t_1": f"{row['fx_prior']:.4f}",
+                "fx_rate_change": f"{row['fx_change']:+.2f}%" if row["fx_change"] else "0.00%",
+                "ccy_exposure": _format_money(row["net"], row["currency"]),
+                "usd_exposure": _format_money(row["net_usd"], "USD"),
+                "pos_ccy_expo": _format_money(row["position"], row["currency"]),
+                "hedge_notional": _format_money(row["hedge"], row["currency"]),
+                "hedge_ratio": f"{row['hedge_ratio'] * 100:.1f}%",
+                "ccy_hedged_pnl": _format_money(row["hedged"], "USD"),
+                "pos_ccy_pnl": _format_money(row["unhedged"], "USD"),
+                "net_ccy": _format_compact(row["net_fx"], "USD"),
+                "pos_c_truncated": _format_compact(row["unhedged"], "USD"),
+            }
+            for row in _iter_rows(columns)
+        ]
+
+    async def get_pnl_explain(
+        self, trade_date: Optional[str] = None, by: str = "ticker"
+    ) -> List[Dict[str, Any]]:
+        """
+        Get day-over-day P&L attribution (delta, gamma, vega, theta, FX, residual).
+
+        Both closes come from one repository call. FX follows ``compute_pnl``
+        (live matrix for today, stored closes for past dates) so totals tie
+        out with the other P&L views.
+
+        Args:
+            trade_date: Date of the T close (today by default).
+            by: Label column to aggregate by (ticker, underlying, currency, book).
+        """
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        snapshots = await self.repository.get_risk_snapshots(trade_date)
+        current = RiskSnapshot.from_columns(snapshots.get("t", {}))
+        prior = RiskSnapshot.from_columns(snapshots.get("t_1", {}))
+        if trade_date >= datetime.now().strftime("%Y-%m-%d"):
+            current.fx = self.fx.usd_rate(current.currency.tolist())
+            prior.fx = self.fx.usd_rate(prior.currency.tolist(), prior=True)
+        today = np.datetime64(trade_date, "D")
+        days = int((today - np.busday_offset(today, -1, roll="forward")).astype(int))
+
+        keys, total, components = explain_pnl(prior, current, days).aggregate(by)
+        columns = {
+            by: keys.tolist(),
+            "total": total.tolist(),
+            **{name: values.tolist() for name, values in components.items()},
+        }
+        return [
             {
-                "trade_date": "2026-01-31",
-                "currency": "HKD",
-                "fx_rate": "7.8145",
-                "fx_rate_t_1": "7.8102",
-                "fx_rate_change": "+0.06%",
-                "ccy_exposure": "HK$156,789,012",
-                "usd_exposure": "$20,067,890",
-                "pos_ccy_expo": "HK$156,789,012",
-                "ccy_hedged_pnl": "HK$1,234,567",
-                "pos_ccy_pnl": "$158,012",
-                "net_ccy": "HK$1.23M",
-                "pos_c_truncated": "$158.0K",
-            },
+                "id": i + 1,
+                "trade_date": trade_date,
+                by: row[by],
+                "pnl_total": _format_money(row["total"], "USD"),
+                **{
+                    f"pnl_{name}": _format_money(row[name], "USD")
+                    for name in EXPLAIN_COMPONENTS
+                },
+            }
+            for i, row in enumerate(_iter_rows(columns))
         ]
 
+    async def get_pnl_history(self) -> PnLHistoryStore:
+        """
+        Daily P&L history, bulk-loaded from the repository on first use.
+
+        Covers ``_HISTORY_START`` up to yesterday. Once the date rolls, the
+        days since the last load are fetched and appended; days already
+        stored by ``record_close`` are skipped.
+        """
+        yesterday = str(np.datetime64(datetime.now().strftime("%Y-%m-%d"), "D") - 1)
+        if self._history_end is None or self._history_end < yesterday:
+            async with self._history_load_lock:
+                end = self._history_end
+                if end is None or end < yesterday:
+                    start = _HISTORY_START if end is None else str(np.datetime64(end) + 1)
+                    data = await self.repository.get_pnl_history(start, yesterday)
+                    if data:
+                        dates = np.asarray(data["dates"], dtype="datetime64[D]")
+                        last = self.history.last_date
+                        new = dates > last if last is not None else slice(None)
+                        if len(dates[new]):
+                            self.history.extend(
+                                dates[new], data["position_id"].tolist(), data["pnl"][new]
+                            )
+                    self._history_end = yesterday
+                    logger.info(f"Loaded P&L history through {yesterday}")
+        return self.history
+
+    async def record_close(self, trade_date: Optional[str] = None) -> None:
+        """Append a closed day's DTD P&L per position to the history store."""
+        history = await self.get_pnl_history()
+        result = await self.compute_pnl(trade_date)
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        history.append(trade_date, result.inputs.position_id.tolist(), result.pnl["t_1"])
+
+    async def get_period_pnl(
+        self, trade_date: Optional[str] = None, periods: Sequence[str] = PERIODS
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get DTD/WTD/MTD/YTD P&L per position from the history store.
+
+        Arrays align with ``compute_pnl(trade_date).inputs``. While the day
+        is still open every period includes its live DTD.
+        """
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        result = await self.compute_pnl(trade_date)
+        return await self._period_pnl(trade_date, result, periods)
+
+    async def _period_pnl(
+        self, trade_date: str, result: PnLResult, periods: Sequence[str] = PERIODS
+    ) -> Dict[str, np.ndarray]:
+        """Period P&L per position of ``result``: closed days plus the open day's DTD."""
+        history = await self.get_pnl_history()
+        totals = history.period_pnl(trade_date, result.inputs.position_id.tolist(), periods)
+        last = history.last_date
+        if last is None or last < np.datetime64(trade_date, "D"):
+            for values in totals.values():
+                values += result.pnl["t_1"]
+        return totals
+
+    async def _grouped_periods(
+        self, trade_date: str, result: PnLResult, view: GroupedPnL
+    ) -> Dict[str, np.ndarray]:
+        """``_period_pnl`` summed per group of ``view``."""
+        _, codes = result.groups(view.by)
+        return {
+            name: np.bincount(codes, weights=values, minlength=len(view))
+            for name, values in (await self._period_pnl(trade_date, result)).items()
+        }
+
     async def get_kpi_metrics(self) -> List[Dict[str, Any]]:
         """Get KPI metrics. TODO: Replace with real calculation."""
         logger.info("Returning mock KPI metrics")
@@ -213,110 +651,80 @@ class PnLService:
     async def get_pnl_full(
         self, trade_date: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get full P&L detailed view. TODO: Replace with DB query."""
-        logger.info("Returning mock full PnL data")
-        companies = [
-            ("Toyota Motor", "7203.T"),
-            ("Sony Group", "6758.T"),
-            ("Nintendo", "7974.T"),
-            ("SoftBank Group", "9984.T"),
-            ("Keyence", "6861.T"),
-            ("Fast Retailing", "9983.T"),
-            ("Tokyo Electron", "8035.T"),
-            ("Shin-Etsu Chemical", "4063.T"),
-            ("Hitachi", "6501.T"),
-            ("Mitsubishi UFJ", "8306.T"),
-            ("Recruit Holdings", "6098.T"),
-            ("Daikin Industries", "6367.T"),
-            ("KDDI", "9433.T"),
-            ("Fanuc", "6954.T"),
-            ("Murata Manufacturing", "6981.T"),
-        ]
+        """
+        Get full P&L detailed view per ticker.
 
-        pnl_data = [
-            ("$1,234,567", "$12,345", "$45,678", "$123,456", "+1.2%", "+3.5%", "+8.7%"),
-            ("$987,654", "-$8,765", "$23,456", "$67,890", "-0.9%", "+2.1%", "+5.4%"),
-            (
-                "$2,345,678",
-                "$34,567",
-                "$78,901",
-                "$234,567",
-                "+2.3%",
-                "+4.8%",
-                "+12.1%",
-            ),
-            (
-                "($456,789)",
-                "-$45,678",
-                "-$89,012",
-                "($156,789)",
-                "-3.2%",
-                "-5.6%",
-                "-9.8%",
-            ),
-            (
-                "$3,456,789",
-                "$56,789",
-                "$123,456",
-                "$345,678",
-                "+1.8%",
-                "+5.2%",
-                "+15.3%",
-            ),
-            ("$567,890", "$6,789", "$12,345", "$56,789", "+0.7%", "+1.9%", "+4.2%"),
-            (
-                "$1,890,123",
-                "-$23,456",
-                "$45,678",
-                "$189,012",
-                "-1.1%",
-                "+2.8%",
-                "+7.6%",
-            ),
-            ("$789,012", "$7,890", "$15,678", "$78,901", "+0.9%", "+2.3%", "+6.1%"),
-            ("$1,234,567", "$23,456", "$56,789", "$123,456", "+1.5%", "+3.9%", "+9.2%"),
-            (
-                "($234,567)",
-                "-$12,345",
-                "-$34,567",
-                "($78,901)",
-                "-1.8%",
-                "-4.2%",
-                "-7.5%",
-            ),
-            ("$890,123", "$8,901", "$17,890", "$89,012", "+1.0%", "+2.5%", "+6.8%"),
-            ("$456,789", "$4,567", "$9,012", "$45,678", "+0.6%", "+1.7%", "+3.9%"),
-            ("$345,678", "-$3,456", "$6,789", "$34,567", "-0.5%", "+1.2%", "+3.2%"),
-            ("$678,901", "$6,789", "$13,456", "$67,890", "+0.8%", "+2.1%", "+5.5%"),
-            ("$1,567,890", "$15,678", "$31,234", "$156,789", "+1.3%", "+3.1%", "+8.1%"),
+        Each row carries the day-over-day attribution from ``get_pnl_explain``
+        (``pnl_delta`` ... ``pnl_residual``) next to the period P&L.
+        """
+        trade_date = trade_date or datetime.now().strftime("%Y-%m-%d")
+        result = await self.compute_pnl(trade_date)
+        explain = {r["ticker"]: r for r in await self.get_pnl_explain(trade_date)}
+        view = self._view(result, "ticker")
+        periods = await self._grouped_periods(trade_date, result, view)
+        columns = {
+            "ticker": view.keys.tolist(),
+            "underlying": result.inputs.underlying[view.first_row].tolist(),
+            "ytd": periods["ytd"].tolist(),
+            "chg_1d": view.pnl["t_1"].tolist(),
+            "chg_1w": view.pnl["1w"].tolist(),
+            "chg_1m": view.pnl["1m"].tolist(),
+            "pct_1d": view.pct("t_1").tolist(),
+            "pct_1w": view.pct("1w").tolist(),
+            "pct_1m": view.pct("1m").tolist(),
+        }
+        return [
+            {
+                "id": i + 1,
+                "trade_date": trade_date,
+                "underlying": row["underlying"],
+                "ticker": row["ticker"],
+                "pnl_ytd": _format_money(row["ytd"], "USD"),
+                "pnl_chg_1d": _format_money(row["chg_1d"], "USD"),
+                "pnl_chg_1w": _format_money(row["chg_1w"], "USD"),
+                "pnl_chg_1m": _format_money(row["chg_1m"], "USD"),
+                "pnl_chg_pct_1d": f"{row['pct_1d']:+.1f}%",
+                "pnl_chg_pct_1w": f"{row['pct_1w']:+.1f}%",
+                "pnl_chg_pct_1m": f"{row['pct_1m']:+.1f}%",
+                **self._explain_columns(explain.get(row["ticker"])),
+            }
+            for i, row in enumerate(_iter_rows(columns))
         ]
 
-        result = []
-        for i, ((name, ticker), data) in enumerate(zip(companies, pnl_data)):
-            result.append(
-                {
-                    "id": i + 1,
-                    "trade_date": "2026-01-31",
-                    "underlying": name,
-                    "ticker": ticker,
-                    "pnl_ytd": data[0],
-                    "pnl_chg_1d": data[1],
-                    "pnl_chg_1w": data[2],
-                    "pnl_chg_1m": data[3],
-                    "pnl_chg_pct_1d": data[4],
-                    "pnl_chg_pct_1w": data[5],
-                    "pnl_chg_pct_1m": data[6],
-                }
-            )
-        return result
+    @staticmethod
+    def _explain_columns(row: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """The attribution columns of one ``get_pnl_explain`` row ("" if absent)."""
+        return {
+            f"pnl_{name}": row[f"pnl_{name}"] if row else "" for name in EXPLAIN_COMPONENTS
+        }
 
     async def calculate_daily_pnl(
         self, portfolio_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Calculate daily PnL."""
+        """
+        Calculate daily and YTD P&L (USD) for today's book.
+
+        Both come from ``get_period_pnl``; percentages are of the gross
+        market value at the prior close.
+
+        Args:
+            portfolio_id: Book to restrict to; None for the whole book.
+        """
+        trade_date = datetime.now().strftime("%Y-%m-%d")
+        result = await self.compute_pnl(trade_date)
+        periods = await self._period_pnl(trade_date, result, ("dtd", "ytd"))
+        mask = slice(None) if portfolio_id is None else result.inputs.book == portfolio_id
+        base = float(np.abs(result.base["t_1"][mask]).sum())
+
+        def total(period: str) -> tuple[float, float]:
+            pnl = float(periods[period][mask].sum())
+            return pnl, pnl / base * 100.0 if base else 0.0
+
+        daily, daily_pct = total("dtd")
+        ytd, ytd_pct = total("ytd")
         return {
-            "daily_pnl": 0.0,
-            "daily_pnl_pct": 0.0,
-            "ytd_pnl": 0.0,
-            "ytd_pnl_pct": 0.0,
+            "daily_pnl": daily,
+            "daily_pnl_pct": daily_pct,
+            "ytd_pnl": ytd,
+            "ytd_pnl_pct": ytd_pct,
         }
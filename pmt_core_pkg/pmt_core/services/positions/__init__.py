@@ -2,6 +2,17 @@
 pmt_core.services.positions - Position Services
 """
 
+from .position_book import PositionBook
+from .position_diff import PositionDiff, diff_positions
+from .position_history import PositionHistory
 from .position_service import PositionService
+from .trade_aggregator import TradeAggregator
 
-__all__ = ["PositionService"]
+__all__ = [
+    "PositionService",
+    "PositionBook",
+    "PositionDiff",
+    "diff_positions",
+    "PositionHistory",
+    "TradeAggregator",
+]
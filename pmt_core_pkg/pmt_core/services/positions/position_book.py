@@ -0,0 +1,203 @@
+"""
+Position Book — in-memory positions with hash indexes.
+
+Positions are keyed by (deal_num, detail_id) and indexed on ticker,
+underlying, account_id, sec_type and pos_loc, each index mapping a value
+to the keys holding it. "All warrants in ACC002" is then a dict lookup
+per criterion and an intersection starting from the smallest set, so a
+page subset costs O(k) in the rows it returns instead of a scan of the
+whole book. Trade events update the row and only the index entries whose
+values changed.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Collection, Iterable, Mapping, Optional, Union
+
+from pmt_core.models import PositionRecord
+
+INDEXED_FIELDS = ("ticker", "underlying", "account_id", "sec_type", "pos_loc")
+
+PositionKey = tuple[str, str]
+
+# A criterion is one value or any of several values.
+Criterion = Union[str, Collection[str]]
+
+
+def position_key(position: Mapping[str, Any]) -> PositionKey:
+    """(deal_num, detail_id) — the identity of a position row."""
+    return (position["deal_num"], position["detail_id"])
+
+
+def parse_amount(value: Any) -> Optional[float]:
+    """Numeric value of a display string such as "$52,500.00" or "1000"."""
+    if value is None:
+        return None
+    try:
+        return float(str(value).replace("$", "").replace(",", ""))
+    except ValueError:
+        return None
+
+
+def format_quantity(value: float) -> str:
+    """Exact display string for a share count: "1244567", or "12.5" when fractional."""
+    return f"{int(value)}" if float(value).is_integer() else repr(float(value))
+
+
+class PositionBook:
+    """
+    Positions for one date, with O(1) key access and O(k) indexed subsets.
+
+    Thread-safe; ``version`` increases on every change so callers can tell
+    whether a subset they hold is stale.
+    """
+
+    def __init__(self, positions: Iterable[PositionRecord] = ()):
+        self._lock = threading.RLock()
+        self._rows: dict[PositionKey, PositionRecord] = {}
+        # field -> value -> keys; dicts used as insertion-ordered sets.
+        self._index: dict[str, defaultdict[Any, dict[PositionKey, None]]] = {
+            field: defaultdict(dict) for field in INDEXED_FIELDS
+        }
+        self.version = 0
+        # Highest row id seen; positions opened by trades take the next one.
+        self._max_id = 0
+        for position in positions:
+            self.upsert(position)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: PositionKey) -> bool:
+        return key in self._rows
+
+    def get(self, deal_num: str, detail_id: str) -> Optional[PositionRecord]:
+        return self._rows.get((deal_num, detail_id))
+
+    def all(self) -> list[PositionRecord]:
+        """Every position, in load order."""
+        with self._lock:
+            return list(self._rows.values())
+
+    def values(self, field: str) -> list[Any]:
+        """Distinct values present for an indexed field."""
+        return list(self._index[field])
+
+    # --- Lookups ---
+
+    def find(self, **criteria: Criterion) -> list[PositionRecord]:
+        """
+        Positions matching every criterion.
+
+        Rows come back in the order they entered the smallest matching
+        index bucket, which is load order for a freshly loaded book.
+
+        Args:
+            **criteria: Indexed field -> value, or a collection of values
+                matching any of them, e.g. ``sec_type=("Bond", "Convertible")``.
+
+        Raises:
+            ValueError: If a criterion is not an indexed field.
+        """
+        unknown = set(criteria) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Positions are not indexed by {sorted(unknown)}")
+        if not criteria:
+            return self.all()
+        with self._lock:
+            candidates = sorted(
+                (self._matches(field, value) for field, value in criteria.items()), key=len
+            )
+            return [
+                self._rows[k]
+                for k in candidates[0]
+                if all(k in other for other in candidates[1:])
+            ]
+
+    def _matches(self, field: str, value: Criterion) -> dict[PositionKey, None]:
+        index = self._index[field]
+        if isinstance(value, str) or value is None:
+            return index.get(value, {})
+        merged: dict[PositionKey, None] = {}
+        for v in value:
+            merged.update(index.get(v, {}))
+        return merged
+
+    # --- Updates ---
+
+    def upsert(self, position: PositionRecord) -> Optional[PositionRecord]:
+        """Insert or replace a position; returns the previous row, if any."""
+        key = position_key(position)
+        with self._lock:
+            previous = self._rows.get(key)
+            for field in INDEXED_FIELDS:
+                old = None if previous is None else previous.get(field)
+                new = position.get(field)
+                if previous is not None and old == new:
+                    continue
+                if previous is not None:
+                    self._unindex(field, old, key)
+                self._index[field][new][key] = None
+            self._rows[key] = position
+            self._max_id = max(self._max_id, int(position.get("id") or 0))
+            self.version += 1
+        return previous
+
+    def remove(self, deal_num: str, detail_id: str) -> Optional[PositionRecord]:
+        """Drop a position; returns it, or None if it was not in the book."""
+        key = (deal_num, detail_id)
+        with self._lock:
+            previous = self._rows.pop(key, None)
+            if previous is not None:
+                for field in INDEXED_FIELDS:
+                    self._unindex(field, previous.get(field), key)
+                self.version += 1
+        return previous
+
+    def _unindex(self, field: str, value: Any, key: PositionKey) -> None:
+        bucket = self._index[field].get(value)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._index[field][value]
+
+    def apply_trade(self, trade: Mapping[str, Any]) -> Optional[PositionRecord]:
+        """
+        Apply a fill to the book.
+
+        Args:
+            trade: ``deal_num``, ``detail_id`` and signed fill ``quantity``.
+                Fills on an unknown key open a new position and must carry
+                the position's descriptive fields (ticker, sec_type, ...);
+                the new row gets the next unused ``id``.
+
+        Returns:
+            The updated position, or None if the fill closed it out.
+        """
+        key = position_key(trade)
+        quantity = float(trade["quantity"])
+        with self._lock:
+            current = self._rows.get(key)
+            if current is None:
+                position = PositionRecord(
+                    **{k: v for k, v in trade.items() if k != "quantity"}
+                )
+                position["id"] = self._max_id + 1
+                position["position"] = format_quantity(quantity)
+                self.upsert(position)
+                return position
+
+            held = parse_amount(current.get("position")) or 0.0
+            new_held = held + quantity
+            if new_held == 0:
+                self.remove(*key)
+                return None
+            position = PositionRecord(**current)
+            position["position"] = format_quantity(new_held)
+            # Scale notional / market value with the size when they are known.
+            for field in ("notional", "market_value"):
+                amount = parse_amount(current.get(field))
+                if amount is not None and held:
+                    position[field] = f"${amount * new_held / held:,.2f}"
+            self.upsert(position)
+            return position
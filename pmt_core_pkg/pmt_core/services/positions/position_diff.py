@@ -0,0 +1,124 @@
+"""
+Position Diff — compare two position snapshots by (deal_num, detail_id).
+
+One snapshot is hashed by key and the other is streamed against it: each
+row either matches a key (changed or unchanged) or is new, and whatever is
+left in the hash afterwards was removed. That is a single O(n + m) pass,
+so SOD vs intraday or T-1 vs T stays cheap on books of any size.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional
+
+from pmt_core.models import PositionRecord
+from pmt_core.services.positions.position_book import PositionKey, parse_amount, position_key
+
+# Fields that differ between any two snapshots and are not position changes.
+IGNORED_FIELDS = frozenset({"id", "trade_date"})
+
+
+@dataclass(frozen=True)
+class FieldDelta:
+    """Old and new value of one field; ``delta`` is set for numeric fields."""
+
+    old: Any
+    new: Any
+    delta: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class PositionChange:
+    """A position present in both snapshots with at least one field changed."""
+
+    key: PositionKey
+    before: PositionRecord
+    after: PositionRecord
+    fields: dict[str, FieldDelta]
+
+
+@dataclass
+class PositionDiff:
+    """Added, removed and changed positions between two snapshots."""
+
+    added: list[PositionRecord] = field(default_factory=list)
+    removed: list[PositionRecord] = field(default_factory=list)
+    changed: list[PositionChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def records(self) -> list[dict[str, Any]]:
+        """Flat rows for a grid: one per added/removed/changed field."""
+        rows = []
+        for status, positions in (("added", self.added), ("removed", self.removed)):
+            for p in positions:
+                rows.append(_record(status, p, "", None, None, None))
+        for change in self.changed:
+            for name, d in change.fields.items():
+                rows.append(_record("changed", change.after, name, d.old, d.new, d.delta))
+        return rows
+
+
+def _record(status: str, position: Mapping[str, Any], name, old, new, delta) -> dict[str, Any]:
+    return {
+        "status": status,
+        "deal_num": position["deal_num"],
+        "detail_id": position["detail_id"],
+        "ticker": position.get("ticker"),
+        "field": name,
+        "old": old,
+        "new": new,
+        "delta": delta,
+    }
+
+
+def _field_deltas(
+    before: Mapping[str, Any], after: Mapping[str, Any], ignore: frozenset[str]
+) -> dict[str, FieldDelta]:
+    deltas = {}
+    for name in {**before, **after}:
+        if name in ignore:
+            continue
+        old, new = before.get(name), after.get(name)
+        if old == new:
+            continue
+        old_num, new_num = parse_amount(old), parse_amount(new)
+        delta = None if old_num is None or new_num is None else new_num - old_num
+        deltas[name] = FieldDelta(old, new, delta)
+    return deltas
+
+
+def diff_positions(
+    before: Iterable[PositionRecord],
+    after: Iterable[PositionRecord],
+    ignore: Iterable[str] = IGNORED_FIELDS,
+) -> PositionDiff:
+    """
+    Diff two position snapshots keyed by (deal_num, detail_id).
+
+    Args:
+        before: Earlier snapshot (SOD or T-1).
+        after: Later snapshot (current or T).
+        ignore: Fields excluded from the comparison.
+
+    Returns:
+        Added and removed rows in snapshot order, and the changed rows with
+        per-field deltas (numeric difference where both sides parse).
+    """
+    ignore = frozenset(ignore)
+    remaining = {position_key(p): p for p in before}
+    diff = PositionDiff()
+    for position in after:
+        key = position_key(position)
+        prior = remaining.pop(key, None)
+        if prior is None:
+            diff.added.append(position)
+        elif prior is not position:
+            fields = _field_deltas(prior, position, ignore)
+            if fields:
+                diff.changed.append(PositionChange(key, prior, position, fields))
+    diff.removed.extend(remaining.values())
+    return diff
@@ -0,0 +1,137 @@
+"""
+Position History — daily position snapshots stored as deltas.
+
+Each date holds only what changed since the previous date: the rows that
+were added or modified (``upserts``) and the keys that were closed out
+(``removed``). Rows are never copied, so an unchanged position is shared
+by every day it exists (copy-on-write: a change stores a new row and
+leaves the old one to the earlier dates). Every ``checkpoint_every`` days
+the full key -> row map is kept as well, so rebuilding any as-of date
+means one checkpoint plus at most ``checkpoint_every - 1`` deltas.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from cachetools import LRUCache
+
+from pmt_core.models import PositionRecord
+from pmt_core.services.positions.position_book import PositionKey, position_key
+from pmt_core.services.positions.position_diff import diff_positions
+
+
+@dataclass(frozen=True)
+class PositionDelta:
+    """Changes on one date relative to the previous stored date."""
+
+    upserts: dict[PositionKey, PositionRecord] = field(default_factory=dict)
+    removed: frozenset[PositionKey] = frozenset()
+
+    def __len__(self) -> int:
+        return len(self.upserts) + len(self.removed)
+
+
+class PositionHistory:
+    """
+    Append-only as-of position store.
+
+    Dates are ISO strings and must be added in ascending order. ``as_of``
+    returns the snapshot of the latest stored date on or before the
+    requested one.
+    """
+
+    def __init__(self, checkpoint_every: int = 20, cache_size: int = 8):
+        self.checkpoint_every = checkpoint_every
+        self._lock = threading.Lock()
+        self._dates: list[str] = []
+        self._deltas: list[PositionDelta] = []
+        self._checkpoints: dict[int, dict[PositionKey, PositionRecord]] = {}
+        self._latest: dict[PositionKey, PositionRecord] = {}
+        self._snapshots: LRUCache = LRUCache(maxsize=cache_size)
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    @property
+    def dates(self) -> list[str]:
+        return list(self._dates)
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return self._dates[-1] if self._dates else None
+
+    # --- Writes ---
+
+    def apply_delta(
+        self,
+        date: str,
+        upserts: Iterable[PositionRecord] = (),
+        removed: Iterable[PositionKey] = (),
+    ) -> PositionDelta:
+        """
+        Store one date as changes against the previous stored date.
+
+        Raises:
+            ValueError: If ``date`` is not after the last stored date.
+        """
+        delta = PositionDelta(
+            upserts={position_key(p): p for p in upserts},
+            removed=frozenset(tuple(k) for k in removed),
+        )
+        with self._lock:
+            if self._dates and date <= self._dates[-1]:
+                raise ValueError(
+                    f"Position history is append-only: {date} is not after {self._dates[-1]}"
+                )
+            latest = self._latest
+            for key in delta.removed:
+                latest.pop(key, None)
+            latest.update(delta.upserts)
+            i = len(self._dates)
+            self._dates.append(date)
+            self._deltas.append(delta)
+            if i % self.checkpoint_every == 0:
+                self._checkpoints[i] = dict(latest)
+        return delta
+
+    def record(self, date: str, positions: Iterable[PositionRecord]) -> PositionDelta:
+        """Store a full snapshot for ``date``; only its diff to the prior day is kept."""
+        diff = diff_positions(self._latest.values(), positions)
+        return self.apply_delta(
+            date,
+            upserts=[*diff.added, *(change.after for change in diff.changed)],
+            removed=[position_key(p) for p in diff.removed],
+        )
+
+    # --- Reads ---
+
+    def as_of(self, date: str) -> list[PositionRecord]:
+        """
+        Positions as of ``date`` (latest stored date on or before it).
+
+        Returns an empty list before the first stored date.
+        """
+        i = bisect.bisect_right(self._dates, date) - 1
+        if i < 0:
+            return []
+        cached = self._snapshots.get(i)
+        if cached is not None:
+            return list(cached.values())
+        start = i - i % self.checkpoint_every
+        with self._lock:
+            rows = dict(self._checkpoints[start])
+            for delta in self._deltas[start + 1 : i + 1]:
+                for key in delta.removed:
+                    rows.pop(key, None)
+                rows.update(delta.upserts)
+            self._snapshots[i] = rows
+        return list(rows.values())
+
+    def delta(self, date: str) -> Optional[PositionDelta]:
+        """Changes stored for exactly ``date``, if it is a stored date."""
+        i = bisect.bisect_left(self._dates, date)
+        if i < len(self._dates) and self._dates[i] == date:
+            return self._deltas[i]
+        return None
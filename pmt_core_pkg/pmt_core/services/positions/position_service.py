@@ -1,11 +1,35 @@
-from typing import List, Optional
+from typing import Any, List, Mapping, Optional
 from pmt_core.repositories.positions import PositionRepository
 from pmt_core.repositories.protocols import PositionRepositoryProtocol
 from pmt_core.models import PositionRecord
+from pmt_core.services.positions.position_book import Criterion, PositionBook
+from pmt_core.services.positions.position_diff import PositionDiff, diff_positions
+from pmt_core.services.positions.position_history import PositionHistory
+from pmt_core.services.positions.trade_aggregator import TradeAggregator
+from pmt_core.services.emsx import EMSXService
+from pmt_core.services.notifications.notification_providers import (
+    position_diff_notifications,
+)
+from pmt_core.services.reference_data import ReferenceDataCache
+import asyncio
 import logging
+from datetime import datetime
+
+import numpy as np
+from cachetools import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Position dates whose books are kept in memory.
+_BOOK_CACHE_SIZE = 8
+
+# Calendar days of as-of position history loaded.
+_HISTORY_DAYS = 365
+
+# Book key of the position EMSX fills are booked to, per ticker.
+_FILL_DEAL = "EMSX"
+_FILL_ACCOUNT = "EMSX"
+
 
 class PositionService:
     """
@@ -13,44 +37,245 @@ class PositionService:
     Delegates data fetching to PositionRepository.
     """
 
-    def __init__(self, repository: Optional[PositionRepositoryProtocol] = None):
-        self.repository = repository or PositionRepository()
+    def __init__(
+        self,
+        repository: Optional[PositionRepositoryProtocol] = None,
+        emsx: Optional[EMSXService] = None,
+        reference_data: Optional[ReferenceDataCache] = None,
+    ):
+        self.reference_data = reference_data or ReferenceDataCache()
+        self.repository = repository or PositionRepository(
+            reference_data=self.reference_data
+        )
+        self.emsx = emsx or EMSXService()
+        self.trades = TradeAggregator()
+        self._fill_sequence = 0
+        self._fill_lock = asyncio.Lock()
+        self._books: LRUCache = LRUCache(maxsize=_BOOK_CACHE_SIZE)
+        # Positions as loaded (start of day), for intraday diffs.
+        self._loaded: LRUCache = LRUCache(maxsize=_BOOK_CACHE_SIZE)
+        # Trades applied per date, replayed whenever that book is (re)loaded.
+        self._trades: LRUCache = LRUCache(maxsize=_BOOK_CACHE_SIZE)
+        self.history = PositionHistory()
+        # Last date requested from the repository's position history.
+        self._history_end: Optional[str] = None
+        self._history_load_lock = asyncio.Lock()
+
+    async def get_position_book(
+        self, position_date: Optional[str] = None, refresh: bool = False
+    ) -> PositionBook:
+        """
+        Shared, indexed position book for a date (today by default).
+
+        Loaded from the repository once, then kept current by ``apply_trade``
+        and EMSX fills; every position page reads its subset from this book.
+        ``refresh`` reloads the start-of-day positions and replays the trades
+        applied since, so no session loses intraday changes.
+        """
+        position_date = position_date or datetime.now().strftime("%Y-%m-%d")
+        book = None if refresh else self._books.get(position_date)
+        if book is None:
+            loaded = await self._load_positions(position_date)
+            book = PositionBook(loaded)
+            for trade in self._trades.get(position_date, ()):
+                book.apply_trade(trade)
+            self._books[position_date] = book
+            self._loaded[position_date] = loaded
+            logger.info(f"Loaded position book for {position_date}: {len(book)} positions")
+        return book
+
+    async def _load_positions(self, position_date: Optional[str]) -> List[PositionRecord]:
+        """Past dates come from the position history, today from the repository."""
+        if position_date and position_date < datetime.now().strftime("%Y-%m-%d"):
+            history = await self.get_position_history()
+            if history.dates and history.dates[0] <= position_date:
+                return [
+                    PositionRecord(**{**p, "trade_date": position_date})
+                    for p in history.as_of(position_date)
+                ]
+        return await self.repository.get_positions(position_date)
+
+    async def get_position_history(self) -> PositionHistory:
+        """
+        As-of position history, bulk-loaded from the repository on first use.
+
+        Covers the last ``_HISTORY_DAYS`` calendar days up to yesterday. Once
+        the date rolls, the days since the last load are fetched and
+        appended; days already stored by ``record_close`` are skipped.
+        """
+        today = np.datetime64(datetime.now().strftime("%Y-%m-%d"), "D")
+        yesterday = str(today - 1)
+        if self._history_end is None or self._history_end < yesterday:
+            async with self._history_load_lock:
+                end = self._history_end
+                if end is None or end < yesterday:
+                    start = today - _HISTORY_DAYS if end is None else np.datetime64(end) + 1
+                    days = await self.repository.get_position_history(str(start), yesterday)
+                    self._extend_history(days)
+                    self._history_end = yesterday
+                    logger.info(f"Loaded position history through {yesterday}")
+        return self.history
+
+    def _extend_history(self, days: List[dict[str, Any]]) -> None:
+        """Append repository history days after the last stored date."""
+        history = self.history
+        for i, day in enumerate(days):
+            last = history.last_date
+            if last is not None and day["date"] <= last:
+                continue
+            if i == 0 and last is not None:
+                # The first day of a load is a full book, not a delta.
+                history.record(day["date"], day["upserts"])
+            else:
+                history.apply_delta(day["date"], day["upserts"], day["removed"])
+
+    async def record_close(self, position_date: Optional[str] = None) -> None:
+        """Append a date's end-of-day book (today by default) to the position history."""
+        position_date = position_date or datetime.now().strftime("%Y-%m-%d")
+        history = await self.get_position_history()
+        book = await self.get_position_book(position_date)
+        history.record(position_date, book.all())
+        logger.info(f"Recorded end-of-day positions for {position_date}")
 
     async def get_positions(
-        self, position_date: Optional[str] = None
+        self, position_date: Optional[str] = None, refresh: bool = False
     ) -> List[PositionRecord]:
         """Get all positions."""
-        return await self.repository.get_positions(position_date)
+        return (await self.get_position_book(position_date, refresh)).all()
+
+    async def find_positions(
+        self, position_date: Optional[str] = None, **criteria: Criterion
+    ) -> List[PositionRecord]:
+        """
+        Get positions by indexed fields (ticker, underlying, account_id,
+        sec_type, pos_loc), e.g. ``find_positions(sec_type="Warrant",
+        account_id="ACC002")``.
+        """
+        return (await self.get_position_book(position_date)).find(**criteria)
 
     async def get_stock_positions(
         self, position_date: Optional[str] = None
     ) -> List[PositionRecord]:
         """Get stock positions only."""
-        positions = await self.repository.get_positions(position_date)
-        # Filter for stocks (mock logic in repo might need updating to support varied types,
-        # but for now we filter what we get or return all if mock data is generic)
-        # Real impl would pass filter to repo or filter here
-        return [
-            p for p in positions if p.get("sec_type") == "Equity"
-        ]  # Using generic string check for now or InstrumentType
+        return await self.find_positions(position_date, sec_type="Equity")
 
     async def get_warrant_positions(
         self, position_date: Optional[str] = None
     ) -> List[PositionRecord]:
         """Get warrant positions only."""
-        # For mock purposes, asking repo for warrants specifically if supported, or filtering
-        # Since repo mock returns generic mixed or we can just ask repo to return warrants
-        # Ideally repo execution handles SQL filter.
-        # Here we just mock return from repo or filter
-        positions = await self.repository.get_positions(position_date)
-        return [p for p in positions if p.get("sec_type") == "Warrant"]
+        return await self.find_positions(position_date, sec_type="Warrant")
 
     async def get_bond_positions(
         self, position_date: Optional[str] = None
     ) -> List[PositionRecord]:
         """Get bond positions only."""
-        positions = await self.repository.get_positions(position_date)
-        return [p for p in positions if p.get("sec_type") in ["Bond", "Convertible"]]
+        return await self.find_positions(position_date, sec_type=("Bond", "Convertible"))
+
+    async def apply_trade(
+        self, trade: Mapping[str, Any], position_date: Optional[str] = None
+    ) -> Optional[PositionRecord]:
+        """
+        Apply a trade event (deal_num, detail_id, signed quantity) to the book.
+
+        Returns the updated position, or None if the trade closed it out.
+        """
+        position_date = position_date or datetime.now().strftime("%Y-%m-%d")
+        book = await self.get_position_book(position_date)
+        self._trades.setdefault(position_date, []).append(trade)
+        return book.apply_trade(trade)
+
+    def _fill_trade(self, fill: Mapping[str, Any]) -> dict[str, Any]:
+        """Book trade for an EMSX fill: signed quantity on the ticker's EMSX position."""
+        ref = self.reference_data.get(fill["ticker"])
+        quantity = float(fill["quantity"])
+        return {
+            "trade_date": datetime.now().strftime("%Y-%m-%d"),
+            "deal_num": _FILL_DEAL,
+            "detail_id": fill["ticker"],
+            "underlying": ref.bbg_code if ref else fill["ticker"],
+            "ticker": fill["ticker"],
+            "company_name": ref.company if ref else fill["ticker"],
+            "sec_id": ref.instrument_id if ref else fill["ticker"],
+            "sec_type": ref.sec_type if ref else "Equity",
+            "subtype": None,
+            "currency": ref.currency if ref else "USD",
+            "account_id": _FILL_ACCOUNT,
+            "pos_loc": ref.exchange_code if ref else "US",
+            "notional": None,
+            "market_value": None,
+            "quantity": quantity if fill["side"] == "Buy" else -quantity,
+        }
+
+    async def diff_intraday(self, position_date: Optional[str] = None) -> PositionDiff:
+        """Changes to the book since it was loaded (SOD vs current)."""
+        position_date = position_date or datetime.now().strftime("%Y-%m-%d")
+        book = await self.get_position_book(position_date)
+        return diff_positions(self._loaded.get(position_date, ()), book.all())
+
+    def get_position_notifications(self) -> list[dict]:
+        """
+        Positions notifications for today's book (``diff_intraday``: SOD vs
+        current), one per opened or resized position.
+
+        Synchronous for the notification registry, so it only reads a book
+        that is already loaded; until then there is nothing to report.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        book = self._books.get(today)
+        if book is None:
+            return []
+        diff = diff_positions(self._loaded.get(today, ()), book.all())
+        return position_diff_notifications(diff)
+
+    async def diff_position_dates(
+        self, base_date: str, compare_date: Optional[str] = None
+    ) -> PositionDiff:
+        """Changes between two position dates, e.g. T-1 vs T."""
+        base = await self.get_position_book(base_date)
+        current = await self.get_position_book(compare_date)
+        return diff_positions(base.all(), current.all())
+
+    async def sync_fills(self) -> int:
+        """
+        Consume new EMSX fills into the trade aggregates and today's book.
+
+        Returns:
+            How many fills were new.
+        """
+        async with self._fill_lock:
+            fills = await self.emsx.get_emsx_fills(self._fill_sequence)
+            if fills:
+                self._fill_sequence = max(f["sequence"] for f in fills)
+            new = [fill for fill in fills if self.trades.add_fill(fill)]
+            if new:
+                today = datetime.now().strftime("%Y-%m-%d")
+                trades = [self._fill_trade(fill) for fill in new]
+                self._trades.setdefault(today, []).extend(trades)
+                # An unloaded book picks the fills up when it is loaded.
+                book = self._books.get(today)
+                if book is not None:
+                    for trade in trades:
+                        book.apply_trade(trade)
+            return len(new)
+
+    async def get_trade_aggregates(self) -> list[dict]:
+        """Per ticker/side/broker quantity, notional, average price and fill count."""
+        await self.sync_fills()
+        return self.trades.snapshot()
+
+    async def get_trade_aggregate_updates(self, since: int = 0) -> tuple[list[dict], int]:
+        """
+        Aggregate rows changed by fills since the caller's last read.
+
+        Args:
+            since: Version returned by this consumer's previous call
+                (0 = every row).
+
+        Returns:
+            (changed rows, version to pass as ``since`` next time).
+        """
+        await self.sync_fills()
+        return self.trades.changes(since)
 
     async def get_trade_summary(
         self,
@@ -0,0 +1,131 @@
+"""
+Trade Aggregator — streaming per ticker/side/broker totals over fills.
+
+Each fill adds its quantity, notional and a count to the running totals of
+its (ticker, side, broker) bucket, so consuming a fill is O(1) however
+many fills the session has seen; average price is derived on read as
+notional / quantity. Every fill stamps its bucket with a new version, so
+each consumer can ask for the rows changed since the version it last saw
+and patch only those. Recently seen fill ids are remembered (a bounded
+window), so a redelivered fill never double counts.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional
+
+from cachetools import LRUCache
+
+AggregateKey = tuple[str, str, str]
+
+
+@dataclass
+class TradeAggregate:
+    """Running totals for one (ticker, side, broker)."""
+
+    id: int
+    ticker: str
+    side: str
+    broker: str
+    quantity: float = 0.0
+    notional: float = 0.0
+    fill_count: int = 0
+    last_price: float = 0.0
+    last_fill_time: str = ""
+    # Aggregator version at which this bucket last changed.
+    version: int = 0
+
+    @property
+    def avg_price(self) -> float:
+        return self.notional / self.quantity if self.quantity else 0.0
+
+    def record(self) -> dict[str, Any]:
+        """Grid row with display formatting."""
+        return {
+            "id": self.id,
+            "ticker": self.ticker,
+            "side": self.side,
+            "broker": self.broker,
+            "quantity": f"{self.quantity:,.0f}",
+            "notional": f"${self.notional:,.2f}",
+            "avg_price": f"{self.avg_price:.4f}",
+            "last_price": f"{self.last_price:.4f}",
+            "fill_count": self.fill_count,
+            "last_fill_time": self.last_fill_time,
+        }
+
+
+class TradeAggregator:
+    """Incremental fill aggregates with snapshot and changed-row reads."""
+
+    def __init__(self, seen_size: int = 100_000):
+        """
+        Args:
+            seen_size: Most recent fill ids remembered for dedupe. Fills are
+                consumed in sequence order, so redelivery only ever repeats
+                recent fills.
+        """
+        self._lock = threading.Lock()
+        self._aggregates: dict[AggregateKey, TradeAggregate] = {}
+        self._seen: LRUCache = LRUCache(maxsize=seen_size)
+        self.fill_count = 0
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._aggregates)
+
+    def add_fill(self, fill: Mapping[str, Any]) -> bool:
+        """
+        Add one fill.
+
+        Args:
+            fill: ``fill_id``, ``ticker``, ``side``, ``broker``, ``quantity``
+                (positive), ``price`` and optionally ``time``.
+
+        Returns:
+            False if the fill id was already consumed.
+        """
+        key = (fill["ticker"], fill["side"], fill["broker"])
+        quantity = float(fill["quantity"])
+        price = float(fill["price"])
+        with self._lock:
+            fill_id = fill.get("fill_id")
+            if fill_id is not None:
+                if fill_id in self._seen:
+                    return False
+                self._seen[fill_id] = None
+            agg = self._aggregates.get(key)
+            if agg is None:
+                agg = self._aggregates[key] = TradeAggregate(len(self._aggregates) + 1, *key)
+            agg.quantity += quantity
+            agg.notional += quantity * price
+            agg.fill_count += 1
+            agg.last_price = price
+            agg.last_fill_time = fill.get("time", agg.last_fill_time)
+            self.fill_count += 1
+            self.version += 1
+            agg.version = self.version
+        return True
+
+    def add_fills(self, fills: Iterable[Mapping[str, Any]]) -> int:
+        """Add fills in order; returns how many were new."""
+        return sum(self.add_fill(fill) for fill in fills)
+
+    def get(self, ticker: str, side: str, broker: str) -> Optional[TradeAggregate]:
+        return self._aggregates.get((ticker, side, broker))
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Every aggregate as a grid row."""
+        with self._lock:
+            return [agg.record() for agg in self._aggregates.values()]
+
+    def changes(self, since: int = 0) -> tuple[list[dict[str, Any]], int]:
+        """
+        Rows of the aggregates changed after version ``since``.
+
+        Returns:
+            (rows, current version) — pass the version back on the next call.
+        """
+        with self._lock:
+            rows = [agg.record() for agg in self._aggregates.values() if agg.version > since]
+            return rows, self.version
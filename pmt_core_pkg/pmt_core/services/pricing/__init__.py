@@ -3,6 +3,14 @@ pmt_core.services.pricing - Pricing Services
 """
 
 from .bond_pricer import BondPricer
+from .vol_surface import OptionChain, VolSurface, VolSurfaceService, implied_vol
 from .warrant_pricer import WarrantPricer
 
-__all__ = ["BondPricer", "WarrantPricer"]
+__all__ = [
+    "BondPricer",
+    "OptionChain",
+    "VolSurface",
+    "VolSurfaceService",
+    "WarrantPricer",
+    "implied_vol",
+]
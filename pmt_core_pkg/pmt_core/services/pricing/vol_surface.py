@@ -0,0 +1,476 @@
+"""
+Implied Volatility Surface — batch IV inversion and per-expiry SVI smiles.
+
+Option quotes are inverted to implied vol in one vectorized pass: a
+closed-form initial guess, then safeguarded Newton steps over the whole
+array, bisecting any element whose Newton step leaves its bracket, so a
+chain of hundreds of options costs a handful of numpy operations instead
+of one root-finder per option. Each expiry's total variance is then
+fitted with a raw SVI smile (quasi-explicit fit: for a batch of candidate
+(m, sigma) pairs the remaining parameters are a linear least-squares
+problem solved in closed form), and ``VolSurface.vol`` answers
+vol(strike, T) for whole arrays by interpolating total variance linearly
+in time.
+
+``VolSurfaceService`` caches one surface per underlying and refits it
+only when spot has moved beyond a tolerance or the surface has aged out.
+TODO: Replace the mock option chains with listed option quotes.
+"""
+
+import logging
+import math
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+# Implied vol search bracket.
+_VOL_MIN = 1e-4
+_VOL_MAX = 5.0
+
+# Raw SVI parameter order in VolSurface.params.
+SVI_PARAMS = ("a", "b", "rho", "m", "sigma")
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF via a rational erfc approximation (|error| < 1.2e-7)."""
+    x = np.asarray(x, dtype=float)
+    z = np.abs(x) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.5 * z)
+    poly = -1.26551223 + t * (1.00002368 + t * (0.37409196 + t * (0.09678418 + t * (
+        -0.18628806 + t * (0.27886807 + t * (-1.13520398 + t * (1.48851587 + t * (
+            -0.82215223 + t * 0.17087277))))))))
+    erfc = t * np.exp(-z * z + poly)
+    return np.where(x >= 0, 1.0 - 0.5 * erfc, 0.5 * erfc)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def _black(
+    forward: np.ndarray,
+    strike: np.ndarray,
+    std_dev: np.ndarray,
+    discount: np.ndarray,
+    is_call: np.ndarray,
+) -> np.ndarray:
+    """Black-76 price; ``std_dev`` is vol * sqrt(T)."""
+    intrinsic = discount * np.maximum(np.where(is_call, forward - strike, strike - forward), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = np.log(forward / strike) / std_dev + 0.5 * std_dev
+        d2 = d1 - std_dev
+        call = discount * (forward * norm_cdf(d1) - strike * norm_cdf(d2))
+    price = np.where(is_call, call, call - discount * (forward - strike))
+    return np.where(std_dev > 0, price, intrinsic)
+
+
+def black_scholes_price(
+    spot,
+    strike,
+    t,
+    vol,
+    rate=0.0,
+    div_yield=0.0,
+    is_call=True,
+) -> np.ndarray:
+    """
+    European option prices, vectorized over every argument.
+
+    Args:
+        spot: Underlying price(s).
+        strike: Strike(s).
+        t: Time to expiry in years.
+        vol: Annualized volatility.
+        rate: Continuously compounded risk-free rate.
+        div_yield: Continuous dividend (or borrow) yield.
+        is_call: True for calls, False for puts.
+
+    Returns:
+        Prices broadcast to the common shape of the inputs.
+    """
+    spot, strike, t, vol, rate, div_yield, is_call = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (spot, strike, t, vol, rate, div_yield)),
+        np.asarray(is_call, dtype=bool),
+    )
+    t = np.maximum(t, 0.0)
+    forward = spot * np.exp((rate - div_yield) * t)
+    return _black(forward, strike, vol * np.sqrt(t), np.exp(-rate * t), is_call)
+
+
+def black_scholes_delta(spot, strike, t, vol, rate=0.0, div_yield=0.0, is_call=True) -> np.ndarray:
+    """Spot delta, vectorized like ``black_scholes_price``."""
+    spot, strike, t, vol, rate, div_yield, is_call = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (spot, strike, t, vol, rate, div_yield)),
+        np.asarray(is_call, dtype=bool),
+    )
+    t = np.maximum(t, 0.0)
+    std_dev = vol * np.sqrt(t)
+    carry = np.exp(-div_yield * t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(spot / strike) + (rate - div_yield) * t) / std_dev + 0.5 * std_dev
+    expired = np.where(spot > strike, 1.0, 0.0)
+    n_d1 = np.where(std_dev > 0, norm_cdf(d1), expired)
+    return np.where(is_call, carry * n_d1, carry * (n_d1 - 1.0))
+
+
+def implied_vol(
+    prices,
+    spot,
+    strike,
+    t,
+    rate=0.0,
+    div_yield=0.0,
+    is_call=True,
+    tol: float = 1e-10,
+    max_iter: int = 60,
+) -> np.ndarray:
+    """
+    Invert option prices to Black-Scholes implied vols in one batch.
+
+    Every quote is first mapped to its out-of-the-money equivalent through
+    put-call parity (better conditioned than deep in-the-money prices).
+    Newton steps run on the still-unconverged elements only; each element
+    keeps a [lo, hi] bracket and bisects whenever its Newton step would
+    leave it, so convergence is guaranteed for every arbitrage-free price.
+
+    Args:
+        prices: Option prices.
+        spot, strike, t, rate, div_yield, is_call: As ``black_scholes_price``.
+        tol: Price tolerance relative to the discounted forward.
+        max_iter: Maximum iterations.
+
+    Returns:
+        Implied vols; NaN where the price violates no-arbitrage bounds or
+        the option has expired.
+    """
+    prices, spot, strike, t, rate, div_yield, is_call = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (prices, spot, strike, t, rate, div_yield)),
+        np.asarray(is_call, dtype=bool),
+    )
+    shape = prices.shape
+    prices, spot, strike, t, rate, div_yield, is_call = (
+        a.ravel() for a in (prices, spot, strike, t, rate, div_yield, is_call)
+    )
+
+    forward = spot * np.exp((rate - div_yield) * t)
+    discount = np.exp(-rate * t)
+    parity = discount * (forward - strike)
+    call_price = np.where(is_call, prices, prices + parity)
+    otm_call = strike >= forward
+    target = np.where(otm_call, call_price, call_price - parity)
+    upper = discount * np.where(otm_call, forward, strike)
+    with np.errstate(invalid="ignore"):
+        valid = (t > 0) & (strike > 0) & (forward > 0) & (target > 0) & (target < upper)
+
+    sqrt_t = np.sqrt(np.where(valid, t, 1.0))
+    log_fk = np.log(np.where(valid, forward / strike, 1.0))
+    # Brenner-Subrahmanyam (ATM) and Manaster-Koehler (vega peak) guesses.
+    guess = np.maximum(
+        _SQRT_2PI * target / np.where(valid, discount * forward, 1.0),
+        np.sqrt(2.0 * np.abs(log_fk)),
+    ) / sqrt_t
+
+    vol = np.clip(np.where(valid, guess, np.nan), _VOL_MIN, _VOL_MAX)
+    lo = np.full(vol.shape, _VOL_MIN)
+    hi = np.full(vol.shape, _VOL_MAX)
+    price_tol = tol * discount * forward
+    active = np.flatnonzero(valid)
+
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        s = vol[active]
+        f, k, d = forward[active], strike[active], discount[active]
+        std_dev = s * sqrt_t[active]
+        diff = _black(f, k, std_dev, d, otm_call[active]) - target[active]
+        done = np.abs(diff) <= price_tol[active]
+
+        # Price is increasing in vol: tighten the bracket around the root.
+        lo[active] = np.where(diff < 0, s, lo[active])
+        hi[active] = np.where(diff > 0, s, hi[active])
+        vega = d * f * _norm_pdf(log_fk[active] / std_dev + 0.5 * std_dev) * sqrt_t[active]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = s - diff / vega
+        outside = ~((step > lo[active]) & (step < hi[active]))
+        step = np.where(outside, 0.5 * (lo[active] + hi[active]), step)
+
+        vol[active] = np.where(done, s, step)
+        active = active[~done]
+
+    return np.where(valid, vol, np.nan).reshape(shape)
+
+
+# --- SVI ---
+
+
+def svi_total_variance(params: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """
+    Raw SVI total variance w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2)).
+
+    Args:
+        params: (..., 5) parameters in ``SVI_PARAMS`` order.
+        k: Log-moneyness log(K / F), broadcast against params[..., 0].
+    """
+    a, b, rho, m, sigma = np.moveaxis(np.asarray(params, dtype=float), -1, 0)
+    x = k - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+
+def fit_svi(
+    k: np.ndarray,
+    total_variance: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+    grid_size: int = 15,
+    rounds: int = 4,
+) -> np.ndarray:
+    """
+    Fit a raw SVI slice to (log-moneyness, total variance) points.
+
+    With y = (k - m) / sigma the slice is w = a + d*y + c*sqrt(y^2 + 1),
+    linear in (a, d, c). Each round solves that least-squares problem for a
+    whole grid of (m, sigma) candidates at once (batched 3x3 normal
+    equations), clips (a, d, c) to the no-arbitrage domain, keeps the best
+    candidate and zooms the grid in around it.
+
+    Returns:
+        Parameters in ``SVI_PARAMS`` order. Fewer than five points give a
+        flat smile at the mean variance.
+    """
+    k = np.asarray(k, dtype=float)
+    w = np.asarray(total_variance, dtype=float)
+    weights = np.ones_like(w) if weights is None else np.asarray(weights, dtype=float)
+    keep = np.isfinite(k) & np.isfinite(w) & (weights > 0)
+    k, w, weights = k[keep], w[keep], weights[keep]
+    if k.size < 5:
+        level = float(np.mean(w)) if w.size else 0.0
+        return np.array([level, 0.0, 0.0, 0.0, 0.1])
+
+    span = max(float(k.max() - k.min()), 1e-3)
+    m_lo, m_hi = float(k.min()) - 0.5 * span, float(k.max()) + 0.5 * span
+    s_lo, s_hi = math.log(1e-3), math.log(2.0 * span)
+    best = None
+    for _ in range(rounds):
+        m_grid, log_s_grid = np.meshgrid(
+            np.linspace(m_lo, m_hi, grid_size), np.linspace(s_lo, s_hi, grid_size)
+        )
+        m = m_grid.ravel()[:, None]
+        s = np.exp(log_s_grid.ravel())[:, None]
+        y = (k[None, :] - m) / s
+        root = np.sqrt(y * y + 1.0)
+        # Design matrix (candidates, points, 3) and weighted normal equations.
+        X = np.stack([np.ones_like(y), y, root], axis=-1)
+        Xw = X * weights[None, :, None]
+        A = np.einsum("cpi,cpj->cij", Xw, X) + 1e-12 * np.eye(3)
+        rhs = np.einsum("cpi,p->ci", Xw, w)
+        a, d, c = np.moveaxis(np.linalg.solve(A, rhs[..., None])[..., 0], -1, 0)
+
+        c = np.clip(c, 0.0, 4.0 * s[:, 0])
+        d = np.clip(d, -c, c)
+        # Re-solve the level for the clipped slope terms, floored so w >= 0.
+        a = np.sum(weights * (w - d[:, None] * y - c[:, None] * root), axis=1) / weights.sum()
+        a = np.maximum(a, -np.sqrt(np.maximum(c * c - d * d, 0.0)))
+        fitted = a[:, None] + d[:, None] * y + c[:, None] * root
+        sse = np.sum(weights * (fitted - w) ** 2, axis=1)
+
+        i = int(np.argmin(sse))
+        best = (a[i], d[i], c[i], m[i, 0], s[i, 0])
+        m_step = (m_hi - m_lo) / (grid_size - 1)
+        s_step = (s_hi - s_lo) / (grid_size - 1)
+        m_lo, m_hi = best[3] - 2 * m_step, best[3] + 2 * m_step
+        log_s = math.log(best[4])
+        s_lo, s_hi = log_s - 2 * s_step, log_s + 2 * s_step
+
+    a, d, c, m, s = best
+    b = c / s
+    rho = d / c if c > 0 else 0.0
+    return np.array([a, b, rho, m, s])
+
+
+# --- Surface ---
+
+
+@dataclass(frozen=True)
+class OptionChain:
+    """Option quotes for one underlying, as parallel arrays."""
+
+    strikes: np.ndarray
+    expiries: np.ndarray  # years
+    prices: np.ndarray
+    is_call: np.ndarray
+
+
+@dataclass(frozen=True)
+class VolSurface:
+    """Per-expiry SVI smiles for one underlying, interpolated in total variance."""
+
+    underlying: str
+    spot: float
+    rate: float
+    div_yield: float
+    expiries: np.ndarray  # years, ascending
+    params: np.ndarray  # (len(expiries), 5) in SVI_PARAMS order
+
+    def forward(self, t) -> np.ndarray:
+        return self.spot * np.exp((self.rate - self.div_yield) * np.asarray(t, dtype=float))
+
+    def total_variance(self, strikes, t) -> np.ndarray:
+        """
+        Total implied variance at (strike, T), vectorized.
+
+        Linear in T between fitted expiries; constant vol before the first
+        and after the last.
+        """
+        strikes, t = np.broadcast_arrays(
+            np.asarray(strikes, dtype=float), np.asarray(t, dtype=float)
+        )
+        shape = strikes.shape
+        strikes, t = strikes.ravel(), t.ravel()
+        k = np.log(strikes / self.forward(t))
+        expiries = self.expiries
+        # (expiries, points): each slice evaluated at every query strike.
+        slices = svi_total_variance(self.params[:, None, :], k[None, :])
+        cols = np.arange(k.size)
+        if expiries.size == 1:
+            w = slices[0] * t / expiries[0]
+        else:
+            j = np.clip(np.searchsorted(expiries, t), 1, expiries.size - 1)
+            t0, t1 = expiries[j - 1], expiries[j]
+            w0, w1 = slices[j - 1, cols], slices[j, cols]
+            w = w0 + (t - t0) / (t1 - t0) * (w1 - w0)
+            w = np.where(t < expiries[0], slices[0] * t / expiries[0], w)
+            w = np.where(t > expiries[-1], slices[-1] * t / expiries[-1], w)
+        return np.maximum(w, 0.0).reshape(shape)
+
+    def vol(self, strikes, t) -> np.ndarray:
+        """Implied vol at (strike, T) for whole arrays."""
+        t_arr = np.asarray(t, dtype=float)
+        w = self.total_variance(strikes, t_arr)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(w / np.broadcast_to(t_arr, w.shape))
+
+    def atm_vol(self, t: float) -> float:
+        """At-the-money-forward vol at expiry ``t``."""
+        return float(self.vol(self.forward(t), t))
+
+
+def build_surface(
+    underlying: str,
+    spot: float,
+    chain: OptionChain,
+    rate: float = 0.0,
+    div_yield: float = 0.0,
+) -> VolSurface:
+    """Invert a chain in one batch and fit one SVI slice per expiry."""
+    ivs = implied_vol(
+        chain.prices, spot, chain.strikes, chain.expiries, rate, div_yield, chain.is_call
+    )
+    expiries = np.unique(chain.expiries[np.isfinite(ivs)])
+    if not expiries.size:
+        raise ValueError(f"No valid option quotes to build a surface for {underlying}")
+    forward = spot * np.exp((rate - div_yield) * chain.expiries)
+    k = np.log(chain.strikes / forward)
+    w = ivs * ivs * chain.expiries
+    # Vega-like weights favour the liquid near-the-money quotes.
+    weights = np.exp(-0.5 * k * k / np.maximum(w, 1e-6))
+    params = np.array(
+        [
+            fit_svi(k[mask], w[mask], weights[mask])
+            for mask in (chain.expiries == expiry for expiry in expiries)
+        ]
+    )
+    return VolSurface(underlying, float(spot), rate, div_yield, expiries, params)
+
+
+def mock_option_chain(underlying: str, spot: float, rate: float = 0.0) -> OptionChain:
+    """
+    Out-of-the-money option quotes from a deterministic per-underlying smile,
+    rounded to the cent like screen prices.
+    """
+    seed = zlib.crc32(underlying.encode())
+    atm = 0.20 + (seed % 25) / 100.0
+    skew = -0.05 - (seed % 7) / 100.0
+    expiries = np.array([1, 2, 3, 6, 12]) / 12.0
+    moneyness = np.linspace(0.7, 1.3, 25)
+    T, M = np.meshgrid(expiries, moneyness, indexing="ij")
+    strikes = np.round(spot * M, 2)
+    k = np.log(M)
+    vols = atm * (1.0 + 0.1 * np.sqrt(T)) + skew * k / np.sqrt(T) + 0.3 * k * k
+    is_call = M >= 1.0
+    prices = np.round(black_scholes_price(spot, strikes, T, vols, rate, 0.0, is_call), 2)
+    return OptionChain(strikes.ravel(), T.ravel(), prices.ravel(), is_call.ravel())
+
+
+class VolSurfaceService:
+    """
+    Builds and caches implied vol surfaces per underlying.
+
+    A cached surface is reused until spot moves more than ``spot_tolerance``
+    (relative) from the spot it was fitted at, or it is older than ``ttl``
+    seconds, so live ticks do not trigger a refit each.
+    """
+
+    def __init__(
+        self,
+        chain_loader: Optional[Callable[[str, float, float], OptionChain]] = None,
+        rate: float = 0.04,
+        spot_tolerance: float = 0.01,
+        ttl: float = 60.0,
+    ):
+        """
+        Args:
+            chain_loader: (underlying, spot, rate) -> OptionChain. Defaults
+                to the mock chains.
+            rate: Risk-free rate used for inversion.
+            spot_tolerance: Relative spot move that invalidates a surface.
+            ttl: Seconds before a surface is refitted regardless of spot.
+        """
+        self._chain_loader = chain_loader or mock_option_chain
+        self.rate = rate
+        self.spot_tolerance = spot_tolerance
+        self.ttl = ttl
+        # underlying -> (monotonic build time, surface)
+        self._surfaces: dict[str, tuple[float, VolSurface]] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, underlying: str, spot: float) -> Optional[VolSurface]:
+        """Cached surface still valid at ``spot``, or None. Never builds."""
+        entry = self._surfaces.get(underlying)
+        if entry is None:
+            return None
+        built_at, surface = entry
+        if time.monotonic() - built_at >= self.ttl:
+            return None
+        if abs(spot / surface.spot - 1.0) > self.spot_tolerance:
+            return None
+        return surface
+
+    def get_surface(self, underlying: str, spot: float) -> VolSurface:
+        """Surface for ``underlying`` near ``spot``, fitted only when stale."""
+        surface = self.cached(underlying, spot)
+        if surface is not None:
+            return surface
+        chain = self._chain_loader(underlying, spot, self.rate)
+        surface = build_surface(underlying, spot, chain, self.rate)
+        with self._lock:
+            self._surfaces[underlying] = (time.monotonic(), surface)
+        logger.debug(f"Built vol surface for {underlying} at spot {spot}")
+        return surface
+
+    def get_surfaces(self, spots: Mapping[str, float]) -> dict[str, VolSurface]:
+        """Surfaces for many underlyings; blocking, so run it off the event loop."""
+        return {
+            underlying: self.get_surface(underlying, spot)
+            for underlying, spot in spots.items()
+        }
+
+    def vol(self, underlying: str, spot: float, strikes, t) -> np.ndarray:
+        """Implied vols for arrays of strikes and expiries."""
+        return self.get_surface(underlying, spot).vol(strikes, t)
@@ -13,9 +13,16 @@ TODO: Replace mock formulas with real pricing engine (Black-Scholes / Monte Carl
 
 import logging
 import math
+from typing import Optional
 
 import numpy as np
 
+from pmt_core.services.pricing.vol_surface import (
+    VolSurface,
+    black_scholes_delta,
+    black_scholes_price,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,9 +32,61 @@ class WarrantPricer:
 
     Provides fair value, Greeks, expected discount,
     and chart data generation.
-    Currently uses simplified mock formulas.
+    Currently uses simplified mock formulas; ``price_warrants`` prices
+    whole books off an implied vol surface.
     """
 
+    def __init__(self, vol_surface: Optional[VolSurface] = None):
+        """
+        Args:
+            vol_surface: Implied vol surface for smile-consistent pricing.
+        """
+        self.vol_surface = vol_surface
+
+    def price_warrants(
+        self,
+        spot_price: float,
+        strike_prices,
+        time_to_maturity_years,
+        interest_rate: float = 0.005,
+        borrow_rate_bps: float = 0,
+        volatility=None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Black-Scholes fair values and deltas for many call warrants at once.
+
+        Args:
+            spot_price: Current spot price
+            strike_prices: Strike per warrant
+            time_to_maturity_years: Maturity per warrant (or one for all)
+            interest_rate: Risk-free rate
+            borrow_rate_bps: Stock borrow cost, treated as a dividend yield
+            volatility: Vol per warrant; defaults to the surface vol at each
+                (strike, maturity)
+
+        Returns:
+            Dictionary with vol, fair_value and delta arrays
+        """
+        if volatility is None:
+            if self.vol_surface is None:
+                raise ValueError("volatility is required when no vol surface is set")
+            volatility = self.vol_surface.vol(strike_prices, time_to_maturity_years)
+        borrow = borrow_rate_bps / 10000.0
+        args = (
+            spot_price,
+            strike_prices,
+            time_to_maturity_years,
+            volatility,
+            interest_rate,
+            borrow,
+        )
+        fair_value = black_scholes_price(*args)
+        return {
+            "vol": np.broadcast_to(np.asarray(volatility, dtype=float), fair_value.shape),
+            "fair_value": fair_value,
+            "delta": black_scholes_delta(*args),
+        }
+
     def price_warrant(
         self,
         spot_price: float,
@@ -7,7 +7,10 @@ TODO: Replace mock data with actual database/repository calls.
 """
 
 import logging
-from typing import Any
+from typing import Any, Optional
+
+from pmt_core.services.pnl import PnLService
+from pmt_core.services.pnl.pnl_explain import EXPLAIN_COMPONENTS
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,9 @@ class ReconciliationService:
     Real implementation would delegate to a repository layer.
     """
 
+    def __init__(self, pnl: Optional[PnLService] = None):
+        self.pnl = pnl or PnLService()
+
     async def get_pps_recon(self, position_date: str = None) -> list[dict[str, Any]]:
         """Get PPS reconciliation data. TODO: Replace with DB query."""
         logger.info(f"Returning mock PPS reconciliation data for date={position_date}")
@@ -89,10 +95,18 @@ class ReconciliationService:
         ]
 
     async def get_pnl_recon(self, position_date: str = None) -> list[dict[str, Any]]:
-        """Get P&L reconciliation data. TODO: Replace with DB query."""
+        """
+        Get P&L reconciliation data. TODO: Replace with DB query.
+
+        Each row carries its underlying's day-over-day P&L attribution
+        (total, Greeks, FX and the unexplained residual) for the position date.
+        """
         logger.info(f"Returning mock P&L reconciliation data for date={position_date}")
+        explain = {
+            r["ticker"]: r for r in await self.pnl.get_pnl_explain(position_date or None)
+        }
         tickers = ["AAPL", "MSFT", "TSLA", "NVDA"]
-        return [
+        rows = [
             {
                 "id": i + 1,
                 "trade_date": f"2026-01-{10 + i}",
@@ -108,6 +122,11 @@ class ReconciliationService:
             }
             for i in range(8)
         ]
+        for row in rows:
+            attribution = explain.get(row["underlying"], {})
+            for name in ("total", *EXPLAIN_COMPONENTS):
+                row[f"pnl_{name}"] = attribution.get(f"pnl_{name}", "")
+        return rows
 
     async def get_risk_input_recon(self, position_date: str = None) -> list[dict[str, Any]]:
         """Get risk input reconciliation data. TODO: Replace with DB query."""
@@ -0,0 +1,7 @@
+"""
+pmt_core.services.reference_data - Reference Data Services
+"""
+
+from .reference_data_cache import InstrumentRef, ReferenceDataCache, normalize_identifier
+
+__all__ = ["ReferenceDataCache", "InstrumentRef", "normalize_identifier"]
@@ -0,0 +1,212 @@
+"""
+Reference Data Cache — one canonical instrument record per security.
+
+Instruments are loaded once and refreshed on a fixed interval. Every
+identifier a caller might hold — Bloomberg codes in any casing or with a
+composite/exchange code ("AAPL UW Equity"), ISIN, SEDOL, bare ticker or
+the canonical ID itself — is normalized and indexed into a single dict, so
+joining positions, prices and compliance lists is an O(1) lookup instead of
+string munging per row.
+TODO: Replace the mock universe with the security master query.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bloomberg yellow keys (plus the mock position suffixes).
+_YELLOW_KEYS = {
+    "EQUITY", "CORP", "GOVT", "INDEX", "CURNCY", "COMDTY", "MTGE", "MUNI",
+    "PFD", "WARRANT", "BOND",
+}
+
+# US exchange codes that roll up to the composite "US".
+_COMPOSITE_CODES = {"UN": "US", "UW": "US", "UQ": "US", "UA": "US", "UP": "US", "UR": "US"}
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentRef:
+    """Canonical reference record for one security."""
+
+    instrument_id: str
+    ticker: str
+    exchange_code: str
+    yellow_key: str
+    company: str
+    sector: str
+    currency: str
+    sec_type: str
+    isin: Optional[str] = None
+    sedol: Optional[str] = None
+
+    @property
+    def bbg_code(self) -> str:
+        """Bloomberg-style identifier, e.g. 'AAPL US Equity'."""
+        return f"{self.ticker} {self.exchange_code} {self.yellow_key}"
+
+
+def normalize_identifier(identifier: str) -> str:
+    """Uppercase, collapse whitespace and map exchange codes to their composite."""
+    tokens = identifier.upper().split()
+    if len(tokens) >= 2:
+        tokens[1] = _COMPOSITE_CODES.get(tokens[1], tokens[1])
+    return " ".join(tokens)
+
+
+def _mock_universe() -> list[InstrumentRef]:
+    """Mock security master covering the tickers used across the mock grids."""
+    listed = [
+        ("AAPL", "Apple Inc.", "Technology", "US0378331005", "2046251"),
+        ("MSFT", "Microsoft Corp.", "Technology", "US5949181045", "2588173"),
+        ("TSLA", "Tesla Inc.", "Automotive", "US88160R1014", "B616C79"),
+        ("NVDA", "NVIDIA Corp.", "Technology", "US67066G1040", "2379504"),
+        ("GOOGL", "Alphabet Inc.", "Technology", "US02079K3059", "BYVY8G0"),
+        ("META", "Meta Platforms Inc.", "Technology", "US30303M1027", "B7TL820"),
+        ("AMZN", "Amazon.com Inc.", "Consumer", "US0231351067", "2000019"),
+        ("AMD", "Advanced Micro Devices Inc.", "Technology", "US0079031078", "2007849"),
+    ]
+    refs = [
+        InstrumentRef(
+            f"EQ{i:06d}", t, "US", "Equity", name, sector, "USD", "Equity", isin, sedol
+        )
+        for i, (t, name, sector, isin, sedol) in enumerate(listed, start=1)
+    ]
+    # Position-book mock instruments (TKR*, WRT*, BND*).
+    for prefix, count, yellow_key, sec_type, company in (
+        ("TKR", 10, "Equity", "Equity", "Company {i}"),
+        ("WRT", 5, "Warrant", "Warrant", "Warrant Co {i}"),
+        ("BND", 5, "Bond", "Bond", "Bond Issuer {i}"),
+    ):
+        for i in range(count):
+            refs.append(
+                InstrumentRef(
+                    instrument_id=f"{prefix}{i:06d}",
+                    ticker=f"{prefix}{i}",
+                    exchange_code="US",
+                    yellow_key=yellow_key,
+                    company=company.format(i=i),
+                    sector="Unclassified",
+                    currency="USD",
+                    sec_type=sec_type,
+                    isin=f"US{prefix}{i:07d}",
+                    sedol=f"{prefix[0]}{i:06d}",
+                )
+            )
+    return refs
+
+
+class ReferenceDataCache:
+    """
+    Loads instruments once, refreshes them every ``refresh_interval`` seconds
+    and resolves any supported identifier to a canonical instrument.
+
+    Thread-safe: a refresh builds new indexes and swaps them in atomically.
+    Only one caller reloads at a time; while a reload is in flight, other
+    callers keep reading the previous indexes instead of loading again.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], Iterable[InstrumentRef]]] = None,
+        refresh_interval: float = 900.0,
+    ):
+        """
+        Args:
+            loader: Returns the instrument universe. Defaults to the mock universe.
+            refresh_interval: Seconds before the next access triggers a reload.
+        """
+        self._loader = loader or _mock_universe
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._by_id: dict[str, InstrumentRef] = {}
+        self._index: dict[str, str] = {}
+        self._loaded_at: Optional[float] = None
+
+    # --- Loading ---
+
+    def refresh(self) -> None:
+        """Reload the universe and rebuild every identifier index."""
+        refs = list(self._loader())
+        by_id: dict[str, InstrumentRef] = {}
+        index: dict[str, str] = {}
+        for ref in refs:
+            by_id[ref.instrument_id] = ref
+            keys = [
+                ref.instrument_id,
+                ref.bbg_code,
+                f"{ref.ticker} {ref.exchange_code}",
+                ref.ticker,
+                ref.isin,
+                ref.sedol,
+            ]
+            for key in keys:
+                # First listing wins for ambiguous bare tickers.
+                if key:
+                    index.setdefault(normalize_identifier(key), ref.instrument_id)
+        with self._lock:
+            self._by_id = by_id
+            self._index = index
+            self._loaded_at = time.monotonic()
+        logger.info(f"Reference data cache loaded {len(by_id)} instruments")
+
+    def _is_stale(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at >= self.refresh_interval
+
+    def _ensure_fresh(self) -> None:
+        if not self._is_stale():
+            return
+        if self._loaded_at is None:
+            # Nothing to serve yet: wait for whoever is loading.
+            with self._refresh_lock:
+                if self._loaded_at is None:
+                    self.refresh()
+            return
+        # Stale: one caller reloads, the rest serve the current indexes.
+        if self._refresh_lock.acquire(blocking=False):
+            try:
+                self.refresh()
+            finally:
+                self._refresh_lock.release()
+
+    # --- Lookups ---
+
+    def resolve(self, identifier: Optional[str]) -> Optional[str]:
+        """Canonical instrument ID for any supported identifier, or None."""
+        self._ensure_fresh()
+        return self._resolve(identifier)
+
+    def resolve_many(self, identifiers: Iterable[Optional[str]]) -> list[Optional[str]]:
+        """Resolve a column of identifiers (one dict hit each)."""
+        self._ensure_fresh()
+        return [self._resolve(identifier) for identifier in identifiers]
+
+    def _resolve(self, identifier: Optional[str]) -> Optional[str]:
+        if not identifier:
+            return None
+        key = normalize_identifier(identifier)
+        instrument_id = self._index.get(key)
+        if instrument_id is None:
+            tokens = key.split()
+            if len(tokens) > 1 and tokens[-1] in _YELLOW_KEYS:
+                # Unknown yellow key / exchange combination: fall back to ticker.
+                instrument_id = self._index.get(tokens[0])
+        return instrument_id
+
+    def get(self, identifier: Optional[str]) -> Optional[InstrumentRef]:
+        """Instrument record for any supported identifier, or None."""
+        instrument_id = self.resolve(identifier)
+        return self._by_id.get(instrument_id) if instrument_id else None
+
+    def instruments(self, sec_type: Optional[str] = None) -> list[InstrumentRef]:
+        """All cached instruments, optionally filtered by security type."""
+        self._ensure_fresh()
+        refs = list(self._by_id.values())
+        if sec_type:
+            refs = [r for r in refs if r.sec_type == sec_type]
+        return refs
@@ -0,0 +1,90 @@
+"""
+Tests for the intraday bar aggregator.
+"""
+
+import pytest
+
+from pmt_core.services.market_data import (
+    BarAggregator,
+    HistoricalPriceStore,
+    MarketDataService,
+)
+
+# 2026-01-05 09:30:00 UTC
+T0 = 1767605400
+
+
+class TestBarAggregator:
+    """Tests for BarAggregator."""
+
+    def test_ticks_build_ohlcv_and_vwap(self):
+        agg = BarAggregator(intervals=("1m",))
+        agg.on_tick("AAPL", 100.0, 10, T0)
+        agg.on_tick("AAPL", 102.0, 30, T0 + 5)
+        agg.on_tick("AAPL", 99.0, 10, T0 + 10)
+
+        bar = agg.current_bar("AAPL", "1m")
+        assert (bar["open"], bar["high"], bar["low"], bar["close"]) == (
+            100.0,
+            102.0,
+            99.0,
+            99.0,
+        )
+        assert bar["volume"] == 50
+        assert bar["vwap"] == pytest.approx((1000 + 3060 + 990) / 50)
+        assert agg.vwap("AAPL") == pytest.approx(bar["vwap"])
+
+    def test_completed_bars_are_persisted(self, tmp_path):
+        store = HistoricalPriceStore(tmp_path)
+        agg = BarAggregator(intervals=("1m", "5m"), history_store=store)
+        agg.on_tick("AAPL", 100.0, 10, T0)
+        completed = agg.on_tick("AAPL", 101.0, 10, T0 + 60)
+
+        assert [(t, i) for t, i, _ in completed] == [("AAPL", "1m")]
+        # Completed bars queue until persisted (off the event loop).
+        assert len(store.read("AAPL", frequency="1m")) == 0
+        assert agg.persist() == 1
+        stored = store.read("AAPL", frequency="1m")
+        assert stored["close"].tolist() == [100.0]
+        assert len(store.read("AAPL", frequency="5m")) == 0
+
+        agg.flush(T0 + 300)
+        assert agg.persist() == 2
+        assert len(store.read("AAPL", frequency="5m")) == 1
+        assert not agg.has_pending
+
+    def test_unknown_interval_rejected(self):
+        with pytest.raises(ValueError):
+            BarAggregator(intervals=("7m",))
+
+
+async def test_stop_feed_persists_finished_bars(tmp_path):
+    store = HistoricalPriceStore(tmp_path)
+    service = MarketDataService(history_store=store)
+    service.on_tick("AAPL", 100.0, 10, T0)
+    service.on_tick("AAPL", 101.0, 10, T0 + 60)
+
+    bars = await service.get_intraday_bars("AAPL", "1m")
+    assert [b["close"] for b in bars] == [100.0, 101.0]
+
+    await service.stop_feed()
+    # The 1m/5m/1h buckets of T0 + 60 have all ended by now.
+    assert store.read("AAPL", frequency="1m")["close"].tolist() == [100.0, 101.0]
+    assert len(store.read("AAPL", frequency="1h")) == 1
+    assert service.bar_aggregator.current_bar("AAPL") is None
+
+
+class TestMarketDataServiceLiveFields:
+    """Live VWAP overlay on the market data grid."""
+
+    async def test_market_data_uses_live_vwap(self, tmp_path):
+        service = MarketDataService(history_store=HistoricalPriceStore(tmp_path))
+        service.on_tick("AAPL", 100.0, 1_000_000, T0)
+        service.on_tick("AAPL", 110.0, 1_000_000, T0 + 1)
+
+        rows = {r["ticker"]: r for r in await service.get_market_data()}
+
+        assert rows["AAPL"]["vwap_price"] == "105.00"
+        assert rows["AAPL"]["last_price"] == "110.00"
+        assert rows["AAPL"]["last_volume"] == "2.0M"
+        assert rows["MSFT"]["vwap_price"] == "182.25"
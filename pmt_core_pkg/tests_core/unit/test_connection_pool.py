@@ -0,0 +1,160 @@
+"""
+Tests for the bounded database connection pool.
+"""
+
+import threading
+import time
+
+import pytest
+
+from pmt_core.exceptions import DatabaseConnectionError
+from pmt_core.repositories.common import ConnectionPool, close_pools, get_pool
+
+
+class FakeConnection:
+    def __init__(self, n: int):
+        self.n = n
+        self.closed = False
+        self.healthy = True
+        self.rollbacks = 0
+        self.broken = False
+
+    def rollback(self):
+        if self.broken:
+            raise OSError("connection reset")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnector:
+    def __init__(self):
+        self.opened: list[FakeConnection] = []
+
+    def __call__(self) -> FakeConnection:
+        conn = FakeConnection(len(self.opened))
+        self.opened.append(conn)
+        return conn
+
+
+def _pool(connect, **kwargs) -> ConnectionPool:
+    kwargs.setdefault("health_check", lambda conn: conn.healthy)
+    kwargs.setdefault("health_check_after", 0.0)
+    return ConnectionPool(connect, **kwargs)
+
+
+class TestConnectionPool:
+    """Reuse, bounds, health checks and expiry."""
+
+    def test_connections_are_reused(self):
+        connect = FakeConnector()
+        pool = _pool(connect, max_size=2)
+
+        for _ in range(5):
+            with pool.connection() as conn:
+                assert conn is connect.opened[0]
+
+        assert len(connect.opened) == 1
+        assert pool.stats() == {"size": 1, "idle": 1, "in_use": 0}
+
+    def test_exhausted_pool_raises_after_timeout(self):
+        pool = _pool(FakeConnector(), max_size=2, server="srv", database="db")
+        pool.acquire()
+        pool.acquire()
+
+        started = time.monotonic()
+        with pytest.raises(DatabaseConnectionError) as exc:
+            pool.acquire(timeout=0.05)
+
+        assert time.monotonic() - started >= 0.05
+        assert exc.value.server == "srv"
+        assert "exhausted" in exc.value.message
+
+    def test_waiter_gets_released_connection(self):
+        connect = FakeConnector()
+        pool = _pool(connect, max_size=1)
+        held = pool.acquire()
+        threading.Timer(0.05, pool.release, args=(held,)).start()
+
+        assert pool.acquire(timeout=2.0) is held
+        assert len(connect.opened) == 1
+
+    def test_unhealthy_connection_is_replaced(self):
+        connect = FakeConnector()
+        pool = _pool(connect)
+        with pool.connection() as conn:
+            pass
+        conn.healthy = False
+
+        with pool.connection() as replacement:
+            assert replacement is not conn
+        assert conn.closed
+        assert pool.stats()["size"] == 1
+
+    def test_idle_and_lifetime_expiry(self):
+        connect = FakeConnector()
+        pool = _pool(connect, idle_timeout=0.02)
+        with pool.connection():
+            pass
+        time.sleep(0.03)
+        with pool.connection() as conn:
+            assert conn is connect.opened[1]
+        assert connect.opened[0].closed
+
+        pool.max_lifetime = 0.0
+        with pool.connection() as conn:
+            assert conn is connect.opened[2]
+
+    def test_failed_block_rolls_back_and_keeps_connection(self):
+        pool = _pool(FakeConnector())
+        with pytest.raises(RuntimeError):
+            with pool.connection() as conn:
+                raise RuntimeError("query failed")
+
+        assert conn.rollbacks == 1 and not conn.closed
+        assert pool.stats()["idle"] == 1
+
+    def test_every_release_rolls_back(self):
+        pool = _pool(FakeConnector())
+        with pool.connection() as conn:
+            pass
+        held = pool.acquire()
+        pool.release(held)
+
+        assert conn is held and conn.rollbacks == 2
+        held = pool.acquire()
+        held.broken = True
+        pool.release(held)
+        assert held.closed and pool.size == 0
+
+    def test_expired_idle_connections_are_swept(self):
+        connect = FakeConnector()
+        pool = _pool(connect, idle_timeout=0.05)
+        cold, hot = pool.acquire(), pool.acquire()
+        pool.release(cold)
+        time.sleep(0.06)
+        pool.release(hot)
+
+        assert pool.acquire() is hot
+        assert cold.closed
+        assert pool.stats() == {"size": 1, "idle": 0, "in_use": 1}
+
+    def test_connect_failure_frees_slot(self):
+        def refuse():
+            raise OSError("server unreachable")
+
+        pool = _pool(refuse, max_size=1)
+        for _ in range(2):
+            with pytest.raises(DatabaseConnectionError):
+                pool.acquire(timeout=0.01)
+        assert pool.size == 0
+
+    def test_pool_is_shared_per_key(self):
+        try:
+            first = get_pool("dsn", lambda: _pool(FakeConnector()))
+            assert get_pool("dsn", lambda: _pool(FakeConnector())) is first
+        finally:
+            close_pools()
+        assert get_pool("dsn", lambda: _pool(FakeConnector())) is not first
+        close_pools()
@@ -0,0 +1,131 @@
+"""
+Tests for currency exposure netting and the live currency PnL view.
+"""
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import FxRateMatrix
+from pmt_core.services.pnl import CurrencyExposure, FxHedges, PnLService
+from pmt_core.services.pnl.pnl_engine import REFERENCE_POINTS, PnLInputs, compute_pnl
+
+
+def _fx() -> FxRateMatrix:
+    return FxRateMatrix(
+        {"USD": 1.0, "JPY": 150.0, "EUR": 0.9}, {"USD": 1.0, "JPY": 140.0, "EUR": 0.9}
+    )
+
+
+def _exposure(fx: FxRateMatrix) -> CurrencyExposure:
+    inputs = PnLInputs(
+        position_id=np.array(["P1", "P2"], dtype=object),
+        ticker=np.array(["AAA", "7203.T"], dtype=object),
+        underlying=np.array(["A Co", "Toyota"], dtype=object),
+        currency=np.array(["USD", "JPY"], dtype=object),
+        book=np.array(["X", "X"], dtype=object),
+        quantity=np.array([10.0, 1000.0]),
+        price=np.array([100.0, 1500.0]),
+        fx=fx.usd_rate(["USD", "JPY"]),
+        ref_price={r: np.array([100.0, 1400.0]) for r in REFERENCE_POINTS},
+        ref_fx={r: fx.usd_rate(["USD", "JPY"], prior=True) for r in REFERENCE_POINTS},
+    )
+    hedges = FxHedges.from_columns(
+        {
+            "hedge_id": ["H1", "H2"],
+            "book": ["X", "X"],
+            "currency": ["JPY", "EUR"],
+            "notional": [-1_200_000.0, 1000.0],
+        }
+    )
+    return CurrencyExposure(compute_pnl(inputs).aggregate("currency"), hedges, fx)
+
+
+class TestCurrencyExposure:
+    """Netting, hedged PnL and per-currency recompute."""
+
+    def test_nets_positions_against_hedges(self):
+        exposure = _exposure(_fx())
+        jpy = exposure.currencies.tolist().index("JPY")
+
+        assert exposure.currencies.tolist() == ["EUR", "JPY", "USD"]
+        assert exposure.net_exposure[jpy] == pytest.approx(1_500_000 - 1_200_000)
+        assert exposure.hedge_ratio[jpy] == pytest.approx(0.8)
+        # Yen weakened 140 -> 150: the short forward gains what the stock loses in FX.
+        unhedged = 1_500_000 / 150 - 1_400_000 / 140
+        hedge = -1_200_000 * (1 / 150 - 1 / 140)
+        assert exposure.unhedged_pnl[jpy] == pytest.approx(unhedged)
+        assert exposure.hedged_pnl[jpy] == pytest.approx(unhedged + hedge)
+
+    def test_refresh_recomputes_only_ticked_currencies(self):
+        fx = _fx()
+        exposure = _exposure(fx)
+        _, seen = exposure.changed_since(0)
+        before = exposure.hedged_pnl.copy()
+
+        fx.update({"EUR": 0.91})
+        moved = exposure.refresh(fx)
+
+        assert exposure.currencies[moved].tolist() == ["EUR"]
+        rows, version = exposure.changed_since(seen)
+        assert rows.tolist() == moved.tolist()
+        assert exposure.changed_since(version)[0].tolist() == []
+        unchanged = exposure.currencies != "EUR"
+        np.testing.assert_array_equal(exposure.hedged_pnl[unchanged], before[unchanged])
+
+
+class TestPnLCurrencyView:
+    """The currency page is a live view over the exposure engine."""
+
+    async def test_fx_tick_returns_only_that_currency(self):
+        service = PnLService(fx=FxRateMatrix())
+        rows = await service.get_pnl_by_currency()
+        jpy = next(r for r in rows if r["currency"] == "JPY")
+        _, a = await service.get_pnl_currency_updates()
+        _, b = await service.get_pnl_currency_updates()
+
+        updates, a = await service.get_pnl_currency_updates({"GBP": 0.80}, since=a)
+
+        assert jpy["hedge_ratio"] == "80.0%"
+        assert [r["currency"] for r in updates] == ["GBP"]
+        assert updates[0]["id"] == next(r["id"] for r in rows if r["currency"] == "GBP")
+        assert await service.get_pnl_currency_updates(since=a) == ([], a)
+        # Another session's cursor still sees the move; a full load clears nothing.
+        await service.get_pnl_by_currency()
+        lagging, _ = await service.get_pnl_currency_updates(since=b)
+        assert [r["currency"] for r in lagging] == ["GBP"]
+
+    async def test_past_dates_keep_their_own_fx(self):
+        service = PnLService(fx=FxRateMatrix())
+        before = await service.get_pnl_by_currency("2026-10-16")
+
+        _, seen = await service.get_pnl_currency_updates(trade_date="2026-10-16")
+        updates, _ = await service.get_pnl_currency_updates(
+            {"GBP": 0.70, "JPY": 120.0}, trade_date="2026-10-16", since=seen
+        )
+
+        assert updates == []
+        assert await service.get_pnl_by_currency("2026-10-16") == before
+        gbp = next(r for r in before if r["currency"] == "GBP")
+        assert gbp["fx_rate"] != "0.7923"
+
+    async def test_price_tick_moves_position_exposure(self):
+        service = PnLService(fx=FxRateMatrix())
+        live = await service.start_intraday()
+        await service.get_pnl_by_currency(live.trade_date)
+        _, seen = await service.get_pnl_currency_updates(trade_date=live.trade_date)
+
+        service.on_price_ticks({"AAPL": 200.0})
+        updates, _ = await service.get_pnl_currency_updates(
+            trade_date=live.trade_date, since=seen
+        )
+
+        assert [r["currency"] for r in updates] == ["USD"]
+
+
+async def test_exposures_cached_per_trade_date():
+    service = PnLService(fx=FxRateMatrix())
+    today = await service.get_currency_exposure()
+    past = await service.get_currency_exposure("2026-10-16")
+
+    assert await service.get_currency_exposure() is today
+    assert await service.get_currency_exposure("2026-10-16") is past
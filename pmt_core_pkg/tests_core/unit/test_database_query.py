@@ -0,0 +1,124 @@
+"""
+Tests for off-loop query execution in DatabaseRepository.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from pmt_core.exceptions import DataExtractionError
+from pmt_core.repositories.common import DatabaseRepository
+from pmt_core.repositories.common.database_base import _QueryHandle
+
+
+class FakeCursor:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.cancelled = threading.Event()
+        self.executed = None
+        self.description = [("ticker",), ("qty",)]
+
+    def execute(self, sql, params=None):
+        self.executed = (sql, params)
+        # Blocks like a real driver call until done or cancelled
+        self.cancelled.wait(self.delay)
+
+    def fetchall(self):
+        return [("AAPL", 100), ("MSFT", 200)]
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, cursor: FakeCursor):
+        self._cursor = cursor
+        self.timeout = 0
+
+    def cursor(self):
+        return self._cursor
+
+
+class FakeRepository(DatabaseRepository):
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.mock_mode = False
+        self.cursor_ = FakeCursor(delay)
+
+    @contextmanager
+    def get_connection(self):
+        yield FakeConnection(self.cursor_)
+
+
+class TestExecuteQuery:
+    """Blocking driver calls never stall the event loop."""
+
+    async def test_returns_rows_as_dicts(self):
+        repo = FakeRepository()
+
+        rows = await repo.execute_query("SELECT ticker, qty FROM positions WHERE id = ?", (1,))
+
+        assert rows == [{"ticker": "AAPL", "qty": 100}, {"ticker": "MSFT", "qty": 200}]
+        assert repo.cursor_.executed[1] == (1,)
+
+    async def test_event_loop_keeps_running(self):
+        repo = FakeRepository(delay=0.2)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await repo.execute_query("SELECT 1")
+        task.cancel()
+
+        assert ticks >= 5
+
+    async def test_timeout_cancels_cursor(self):
+        repo = FakeRepository(delay=5.0)
+
+        started = time.monotonic()
+        with pytest.raises(DataExtractionError) as exc:
+            await repo.execute_query("SELECT slow", timeout=0.05)
+
+        assert time.monotonic() - started < 1.0
+        assert exc.value.query == "SELECT slow"
+        assert repo.cursor_.cancelled.wait(1.0)
+
+    async def test_task_cancellation_cancels_cursor(self):
+        repo = FakeRepository(delay=5.0)
+        task = asyncio.create_task(repo.execute_query("SELECT slow"))
+        await asyncio.sleep(0.05)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert repo.cursor_.cancelled.wait(1.0)
+
+    def test_query_cancelled_before_attach_never_executes(self):
+        repo = FakeRepository()
+        handle = _QueryHandle()
+        handle.cancel()
+
+        assert repo._fetch_all("SELECT late", None, handle, timeout=1.0) == []
+        assert repo.cursor_.executed is None
+        assert not repo.cursor_.cancelled.is_set()
+
+    async def test_stored_proc_call_syntax(self):
+        repo = FakeRepository()
+
+        await repo.execute_stored_proc("usp_GetPositions", ["2026-10-16", "ACC001"])
+
+        assert repo.cursor_.executed == (
+            "{CALL usp_GetPositions (?, ?)}",
+            ("2026-10-16", "ACC001"),
+        )
@@ -0,0 +1,117 @@
+"""
+Tests for the exchange calendar index.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import ExchangeCalendar, MarketDataService
+from pmt_core.services.market_data import market_data_service
+from pmt_core.services.market_data.exchange_calendar import MOCK_HOLIDAYS
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    return ExchangeCalendar()
+
+
+class TestExchangeCalendar:
+    """Tests for ExchangeCalendar."""
+
+    def test_is_trading_day_respects_holidays(self, calendar):
+        dates = ["2026-07-03", "2026-07-06", "2026-07-04"]
+        assert calendar.is_trading_day(dates, "usa").tolist() == [False, True, False]
+        assert calendar.is_trading_day("2026-07-03", "hkg")
+
+    def test_add_business_days_matches_numpy(self, calendar):
+        dates = np.arange("2026-01-08", "2026-12-01", dtype="datetime64[D]")
+        busdaycal = np.busdaycalendar(holidays=MOCK_HOLIDAYS["usa"])
+        for n in (-3, 0, 2):
+            expected = np.busday_offset(dates, n, roll="following", busdaycal=busdaycal)
+            np.testing.assert_array_equal(
+                calendar.add_business_days(dates, n, "usa"), expected
+            )
+
+    def test_business_days_between(self, calendar):
+        # Thanksgiving week: 5 weekdays, one holiday.
+        assert calendar.business_days_between("2026-11-23", "2026-11-30") == 4
+        counts = calendar.business_days_between(
+            ["2026-11-23", "2026-11-30"], "2026-11-23"
+        )
+        assert counts.tolist() == [0, -4]
+
+    def test_previous_trading_day(self, calendar):
+        assert calendar.previous_trading_day("2026-01-20", "usa") == np.datetime64(
+            "2026-01-16"
+        )
+
+    def test_unknown_market(self, calendar):
+        with pytest.raises(ValueError):
+            calendar.is_trading_day("2026-01-02", "xxx")
+
+    def test_weekday_fallback_outside_holiday_table(self, caplog):
+        calendar = ExchangeCalendar()
+        with caplog.at_level("WARNING"):
+            # Past the table every weekday counts as a session.
+            assert calendar.is_trading_day(["2027-01-01", "2027-01-02"]).tolist() == [
+                True,
+                False,
+            ]
+            assert calendar.add_business_days("2026-12-31", 1) == np.datetime64(
+                "2027-01-01"
+            )
+            assert calendar.add_business_days("2030-01-01", 1) == np.datetime64(
+                "2030-01-02"
+            )
+            assert calendar.previous_trading_day("2025-01-01") == np.datetime64(
+                "2024-12-31"
+            )
+            assert calendar.business_days_between("2026-12-28", "2027-01-04") == 5
+        assert len(caplog.records) == 1
+        # Holidays inside the table still apply.
+        assert not calendar.is_trading_day("2026-12-25")
+        assert ExchangeCalendar(end="2027-12-31").is_trading_day("2027-12-31")
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 19, 12, 0)
+
+
+async def test_trading_calendar_rows(calendar, monkeypatch):
+    monkeypatch.setattr(market_data_service, "datetime", _FixedDatetime)
+    service = MarketDataService(calendar=calendar)
+
+    rows = await service.get_trading_calendar("2026-10-01", "2026-10-19")
+
+    assert len(rows) == 19
+    assert rows[0]["trade_date"] == "2026-10-19"
+    assert rows[0]["day_of_week"] == "Monday"
+    assert rows[-1]["chn"] == "Closed"
+    assert rows[-1]["usa"] == "Open"
+
+
+class _NextYear(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2027, 2, 15, 12, 0)
+
+
+async def test_trading_calendar_outside_holiday_table(monkeypatch):
+    monkeypatch.setattr(market_data_service, "datetime", _NextYear)
+    service = MarketDataService(calendar=ExchangeCalendar())
+
+    rows = await service.get_trading_calendar()
+
+    assert len(rows) == 60
+    assert rows[0]["trade_date"] == "2027-02-15"
+    assert rows[0]["usa"] == "Open"
+    # The lookback reaches back into the holiday table.
+    christmas = next(r for r in rows if r["trade_date"] == "2026-12-25")
+    assert christmas["usa"] == "Closed"
+    assert service.calendar.previous_trading_day(_NextYear.now()) == np.datetime64(
+        "2027-02-12"
+    )
@@ -0,0 +1,70 @@
+"""
+Tests for the FX rate matrix and its service integrations.
+"""
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import FxRateMatrix, MarketDataService
+from pmt_core.services.pnl import PnLService
+
+
+@pytest.fixture
+def fx():
+    return FxRateMatrix(
+        {"USD": 1.0, "EUR": 0.9, "JPY": 150.0, "GBP": 0.8, "HKD": 7.8},
+        {"USD": 1.0, "EUR": 0.8, "JPY": 150.0, "GBP": 0.8, "HKD": 7.8},
+    )
+
+
+class TestFxRateMatrix:
+    """Tests for FxRateMatrix."""
+
+    def test_crosses_are_triangulated_through_usd(self, fx):
+        assert fx.rate("EUR", "JPY") == pytest.approx(150.0 / 0.9)
+        assert fx.rate("JPY", "EUR") * fx.rate("EUR", "JPY") == pytest.approx(1.0)
+        assert fx.pair_rate("EURUSD") == pytest.approx(1 / 0.9)
+        assert fx.usd_rate("EUR", prior=True) == pytest.approx(0.8)
+
+    def test_convert_array_of_currencies(self, fx):
+        converted = fx.convert([90.0, 150.0, 5.0], ["EUR", "JPY", "USD"], "USD")
+        np.testing.assert_allclose(converted, [100.0, 1.0, 5.0])
+
+    def test_update_and_roll(self, fx):
+        fx.update({"EUR": 1.0, "CHF": 0.5})
+        assert fx.rate("CHF", "EUR") == pytest.approx(2.0)
+        assert fx.usd_rate("CHF", prior=True) == pytest.approx(0.5)
+
+        fx.roll()
+        assert fx.usd_rate("EUR", prior=True) == pytest.approx(1.0)
+
+    def test_unknown_currency(self, fx):
+        with pytest.raises(KeyError):
+            fx.convert([1.0], ["XXX"], "USD")
+
+
+class TestFxIntegration:
+    """Services read rates from the shared matrix."""
+
+    async def test_pnl_by_currency_converts_to_usd(self, fx):
+        rows = await PnLService(fx=fx).get_pnl_by_currency()
+        jpy = next(r for r in rows if r["currency"] == "JPY")
+        ccy_exposure = float(jpy["ccy_exposure"].lstrip("¥").replace(",", ""))
+        usd_exposure = float(jpy["usd_exposure"].lstrip("$").replace(",", ""))
+        assert usd_exposure == pytest.approx(ccy_exposure / 150.0, abs=1.0)
+        assert jpy["fx_rate"] == "150.0000"
+
+    async def test_pnl_summary_fx_change(self, fx):
+        rows = await PnLService(fx=fx).get_pnl_summary()
+        eur = next(r for r in rows if r["currency"] == "EUR")
+        assert eur["fx_rate_t_1"] == "0.8000"
+        assert eur["fx_rate_change"] == "+12.50%"
+
+    async def test_fx_rates_skip_unknown_pairs(self, fx):
+        rows = await MarketDataService(fx=fx).get_fx_rates(["EURUSD", "XXXUSD", "USDJP"])
+        assert [r["ticker"] for r in rows] == ["EURUSD"]
+        assert rows[0]["last_price"] == f"{1 / 0.9:.4f}"
+
+    def test_convert_currency(self, fx):
+        service = MarketDataService(fx=fx)
+        assert service.convert_currency(90.0, "EUR", "USD") == pytest.approx(100.0)
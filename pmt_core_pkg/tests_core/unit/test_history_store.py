@@ -0,0 +1,128 @@
+"""
+Tests for the on-disk historical price store.
+"""
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import (
+    HistoricalPriceStore,
+    HistoryColumns,
+    MarketDataService,
+)
+from pmt_core.services.market_data.history_store import BAR_DTYPE
+
+
+def _bars(dates: list[str], closes: list[float]) -> np.ndarray:
+    bars = np.zeros(len(dates), dtype=BAR_DTYPE)
+    bars["ts"] = np.array(dates, dtype="datetime64[s]")
+    bars["close"] = closes
+    return bars
+
+
+class TestHistoricalPriceStore:
+    """Tests for HistoricalPriceStore."""
+
+    def test_append_and_read_across_year_partitions(self, tmp_path):
+        """Bars spanning two years are split into partitions and read back in order."""
+        store = HistoricalPriceStore(tmp_path)
+        written = store.append(
+            "AAPL", _bars(["2025-12-30", "2025-12-31", "2026-01-02"], [1.0, 2.0, 3.0])
+        )
+
+        assert written == 3
+        assert sorted(p.name for p in (tmp_path / "1d" / "AAPL").iterdir()) == [
+            "2025.bin",
+            "2026.bin",
+        ]
+        assert store.read("AAPL")["close"].tolist() == [1.0, 2.0, 3.0]
+        assert store.read("AAPL", "2025-12-31", "2025-12-31")["close"].tolist() == [2.0]
+
+    def test_append_is_idempotent(self, tmp_path):
+        """Re-appending existing days only writes the new tail."""
+        store = HistoricalPriceStore(tmp_path)
+        store.append("AAPL", _bars(["2026-01-05", "2026-01-06"], [1.0, 2.0]))
+        written = store.append("AAPL", _bars(["2026-01-06", "2026-01-07"], [9.0, 3.0]))
+
+        assert written == 1
+        assert store.read("AAPL")["close"].tolist() == [1.0, 2.0, 3.0]
+        assert str(store.last_timestamp("AAPL").astype("datetime64[D]")) == "2026-01-07"
+
+    def test_merge_backfills_older_bars(self, tmp_path):
+        """merge() inserts history older than the stored range."""
+        store = HistoricalPriceStore(tmp_path)
+        store.append("AAPL", _bars(["2026-01-06"], [2.0]))
+        store.merge("AAPL", _bars(["2026-01-05", "2026-01-06"], [1.0, 2.5]))
+
+        assert store.read("AAPL")["close"].tolist() == [1.0, 2.5]
+
+    def test_close_matrix_aligns_on_union_of_dates(self, tmp_path):
+        """Missing observations are NaN in the aligned matrix."""
+        store = HistoricalPriceStore(tmp_path)
+        store.append("A", _bars(["2026-01-05", "2026-01-06"], [1.0, 2.0]))
+        store.append("B", _bars(["2026-01-06"], [5.0]))
+
+        dates, closes = store.read_close_matrix(["A", "B"])
+
+        assert len(dates) == 2
+        assert closes[1].tolist() == [2.0, 5.0]
+        assert np.isnan(closes[0, 1])
+
+
+class TestMarketDataServiceHistory:
+    """MarketDataService reads history through the store."""
+
+    async def test_historical_data_is_persisted(self, tmp_path):
+        service = MarketDataService(history_store=HistoricalPriceStore(tmp_path))
+        service._historical_cache.clear()
+
+        rows = await service.get_historical_data(tickers=["AAPL"])
+
+        assert len(rows) == 30
+        assert rows[0]["ticker"] == "AAPL"
+        assert len(service.history_store.read("AAPL", frequency="mock_1d")) == 30
+        # Mock bars never land in the real daily partition Yahoo syncs into.
+        assert service.history_store.last_timestamp("AAPL") is None
+
+    async def test_return_matrix_from_store(self, tmp_path):
+        store = HistoricalPriceStore(tmp_path)
+        store.append("A", _bars(["2026-01-05", "2026-01-06"], [100.0, 110.0]))
+        service = MarketDataService(history_store=store)
+
+        dates, returns = await service.get_return_matrix(["A"])
+
+        assert returns.shape == (1, 1)
+        assert returns[0, 0] == pytest.approx(np.log(1.1))
+
+
+class TestHistoryColumns:
+    """Columnar history and lazy row views."""
+
+    def test_columns_are_views_and_rows_are_lazy(self, tmp_path):
+        store = HistoricalPriceStore(tmp_path)
+        store.append("A", _bars(["2026-01-05", "2026-01-06", "2026-01-07"], [1.0, 2.0, 4.0]))
+        columns = HistoryColumns.from_bars("A", store.read("A"))
+
+        assert columns.close.tolist() == [1.0, 2.0, 4.0]
+        assert columns.pct_change().tolist() == [0.0, 100.0, 100.0]
+
+        rows = columns.rows()
+        assert len(rows) == 3
+        assert rows[-1] == {"date": "2026-01-07", "price": 4.0}
+        assert rows[1:] == [
+            {"date": "2026-01-06", "price": 2.0},
+            {"date": "2026-01-07", "price": 4.0},
+        ]
+
+    async def test_grid_rows_newest_first(self, tmp_path):
+        store = HistoricalPriceStore(tmp_path)
+        store.append("A", _bars(["2026-01-05", "2026-01-06"], [100.0, 110.0]))
+        service = MarketDataService(history_store=store)
+        columns = await service.get_history_columns("A")
+
+        rows = service._historical_grid_rows(columns, 1, "t")
+
+        assert [r["trade_date"] for r in rows] == ["2026-01-06", "2026-01-05"]
+        assert rows[0]["chg_1d_pct"] == "10.00%"
+        assert rows[0]["last_price"] == "110.00"
+        assert rows[1]["id"] == 2
@@ -0,0 +1,85 @@
+"""
+Tests for incremental intraday PnL updates.
+"""
+
+import numpy as np
+import pytest
+
+from pmt_core.repositories.pnl.pnl_repository import _mock_pnl_inputs
+from pmt_core.services.market_data.fx_engine import FxRateMatrix
+from pmt_core.services.pnl import IntradayPnL, PnLInputs, PnLService, compute_pnl
+from pmt_core.services.pnl.intraday_pnl import TRACKED_GROUPS
+
+
+@pytest.fixture
+def live():
+    columns = _mock_pnl_inputs("2026-10-16", FxRateMatrix())
+    result = compute_pnl(PnLInputs.from_columns(columns))
+    return IntradayPnL(result, "2026-10-16")
+
+
+class TestIntradayPnL:
+    """Tests for IntradayPnL."""
+
+    def test_tick_updates_only_ticked_positions(self, live):
+        before = {ref: values.copy() for ref, values in live.result.pnl.items()}
+
+        delta = live.apply_prices({"AAPL": 190.0, "UNKNOWN": 1.0})
+
+        # AAPL is held in two books: long 50k and short 20k.
+        assert {r["book"] for r in live.records(delta)} == {"US-TECH", "GLOBAL"}
+        np.testing.assert_allclose(sorted(delta.pnl_change), [-150_000.0, 375_000.0])
+        untouched = np.setdiff1d(np.arange(len(live.result)), delta.rows)
+        for ref, values in live.result.pnl.items():
+            np.testing.assert_array_equal(values[untouched], before[ref][untouched])
+            np.testing.assert_allclose(values[delta.rows], before[ref][delta.rows] + delta.pnl_change)
+
+    def test_running_totals_match_full_reaggregation(self, live):
+        rng = np.random.default_rng(0)
+        tickers = live.result.groups("ticker")[0].tolist()
+        for _ in range(20):
+            picked = rng.choice(tickers, 3, replace=False)
+            live.apply_prices({t: float(rng.uniform(50, 500)) for t in picked})
+
+        for by in TRACKED_GROUPS:
+            fresh = live.result.aggregate(by)
+            running = live.totals(by)
+            np.testing.assert_allclose(running.market_value, fresh.market_value)
+            for ref in fresh.pnl:
+                np.testing.assert_allclose(running.pnl[ref], fresh.pnl[ref])
+
+    def test_unchanged_price_is_not_a_delta(self, live):
+        price = float(live.result.inputs.price[0])
+        assert len(live.apply_prices({live.result.inputs.ticker[0]: price})) == 0
+
+
+async def test_service_emits_changed_rows_only():
+    service = PnLService()
+    rows = await service.get_pnl_changes()
+    await service.start_intraday()
+    msft = next(r for r in rows if r["ticker"] == "MSFT")
+
+    updates, version = await service.get_pnl_change_updates({"MSFT": 500.0})
+
+    assert [u["id"] for u in updates] == [msft["id"]]
+    assert updates[0]["price"] == "500.00"
+    # Views for the live date read the ticked book.
+    full = await service.get_pnl_full()
+    assert next(r for r in full if r["ticker"] == "MSFT")["pnl_chg_1d"] == updates[0]["pnl_chg_1d"]
+
+
+async def test_each_consumer_sees_every_change():
+    service = PnLService()
+    rows = await service.get_pnl_changes()
+    ids = {r["ticker"]: r["id"] for r in rows}
+
+    first, a = await service.get_pnl_change_updates({"MSFT": 500.0})
+    # A second session applying the same prices still gets the row.
+    second, b = await service.get_pnl_change_updates({"MSFT": 500.0})
+    assert [r["id"] for r in first] == [r["id"] for r in second] == [ids["MSFT"]]
+
+    updates, a = await service.get_pnl_change_updates({"AAPL": 190.0}, since=a)
+    assert [r["id"] for r in updates] == [ids["AAPL"]]
+    assert await service.get_pnl_change_updates({}, since=a) == ([], a)
+    lagging, _ = await service.get_pnl_change_updates({}, since=b)
+    assert [r["id"] for r in lagging] == [ids["AAPL"]]
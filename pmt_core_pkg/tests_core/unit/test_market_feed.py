@@ -0,0 +1,128 @@
+"""
+Tests for the market data feed adapter and simulator.
+"""
+
+import asyncio
+
+import numpy as np
+
+from pmt_core.services.market_data import (
+    HistoricalPriceStore,
+    MarketDataFeed,
+    MarketDataService,
+    QuoteUpdate,
+    SimulatedFeed,
+)
+from pmt_core.services.market_data.market_feed import FeedDisconnectedError
+
+
+class TestSimulatedFeed:
+    """Tests for SimulatedFeed."""
+
+    async def test_gbm_paths_continue_across_batches(self):
+        feed = SimulatedFeed(initial_prices={"AAPL": 200.0}, seed=7)
+        await feed.subscribe(["AAPL", "MSFT"])
+        assert isinstance(feed, MarketDataFeed)
+
+        first = feed.generate(1000, now=0.0)
+        last_aapl = [q.price for q in first if q.ticker == "AAPL"][-1]
+        second = feed.generate(1, now=1.0)
+        next_aapl = feed.generate(200, now=2.0)
+
+        assert {q.ticker for q in first} == {"AAPL", "MSFT"}
+        assert all(q.bid < q.price < q.ask for q in first)
+        # Paths walk from the start price in small steps, not from scratch.
+        aapl = np.array([q.price for q in first if q.ticker == "AAPL"])
+        assert abs(aapl[0] / 200.0 - 1) < 0.01
+        assert np.max(np.abs(np.diff(np.log(aapl)))) < 0.01
+        later = [q.price for q in second + next_aapl if q.ticker == "AAPL"]
+        assert abs(later[0] / last_aapl - 1) < 0.01
+
+    async def test_unsubscribe_diff(self):
+        feed = SimulatedFeed(seed=1)
+        await feed.subscribe(["A", "B", "C"])
+        await feed.unsubscribe(["B"])
+        assert feed.subscriptions == ["A", "C"]
+        assert {q.ticker for q in feed.generate(100)} == {"A", "C"}
+
+
+class _FlakyFeed(SimulatedFeed):
+    """Drops the connection after its first batch, once."""
+
+    def __init__(self):
+        super().__init__(tick_rate=None, seed=3)
+        self.connects = 0
+
+    async def connect(self) -> None:
+        self.connects += 1
+        await super().connect()
+
+    async def stream(self):
+        async for batch in super().stream():
+            yield batch
+            if self.connects == 1:
+                raise FeedDisconnectedError("dropped")
+
+
+async def test_service_consumes_feed_and_reconnects(tmp_path, monkeypatch):
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr("asyncio.sleep", lambda delay: real_sleep(0))
+    feed = _FlakyFeed()
+    service = MarketDataService(history_store=HistoricalPriceStore(tmp_path), feed=feed)
+    await service.subscribe_to_tickers(["SMCI"])
+    await service.stop_feed()
+
+    ticks = await service.run_feed(max_batches=3)
+
+    assert ticks == 3 * 500
+    assert feed.connects == 2
+    last = service.bar_aggregator.snapshot()["SMCI"]["last_price"]
+    # SMCI seeds the price movers, so live prints re-rank it.
+    assert service.top_movers.get("price", "SMCI")[0] == last
+
+
+def test_on_quotes_feeds_bars():
+    service = MarketDataService(feed=SimulatedFeed())
+    service.on_quotes([QuoteUpdate("AAPL", 10.0, 100, 9.99, 10.01, 1767605400.0)])
+    assert service.bar_aggregator.current_bar("AAPL")["close"] == 10.0
+
+
+async def test_feed_follows_consumer_subscriptions(tmp_path):
+    feed = SimulatedFeed(tick_rate=None)
+    service = MarketDataService(history_store=HistoricalPriceStore(tmp_path), feed=feed)
+
+    await service.subscribe_to_tickers(["AAPL", "MSFT"], consumer="a")
+    await service.subscribe_to_tickers(["MSFT", "TSLA"], consumer="b")
+    assert sorted(feed.subscriptions) == ["AAPL", "MSFT", "TSLA"]
+
+    await service.release_consumer("a")
+    assert sorted(feed.subscriptions) == ["MSFT", "TSLA"]
+    assert service._feed_task is not None
+
+    await service.unsubscribe_from_tickers(["MSFT", "TSLA"], consumer="b")
+    assert feed.subscriptions == []
+    assert service._feed_task is None
+
+
+def test_simulator_only_in_mock_mode(monkeypatch):
+    monkeypatch.setenv("USE_MOCK_DATA", "False")
+    assert MarketDataService().feed is None
+
+    monkeypatch.setenv("USE_MOCK_DATA", "True")
+    assert MarketDataService().feed.tick_rate < 1_000
+
+
+async def test_mock_feed_starts_from_last_prices(tmp_path, monkeypatch):
+    monkeypatch.setenv("USE_MOCK_DATA", "True")
+    service = MarketDataService(history_store=HistoricalPriceStore(tmp_path))
+    service.on_quotes([QuoteUpdate("MSFT", 415.0, 10, 414.9, 415.1, 1767605400.0)])
+    service._seed_mock_history("NVDA", 0)
+
+    await service.subscribe_to_tickers(["MSFT", "NVDA", "AAPL"], consumer="a")
+    await service.stop_feed()
+
+    # AAPL has no known price, so it is not simulated from a made-up start.
+    assert service.feed.subscriptions == ["MSFT", "NVDA"]
+    prices = {q.ticker: q.price for q in service.feed.generate(10, now=0.0)}
+    assert abs(prices["MSFT"] / 415.0 - 1) < 0.01
+    assert abs(prices["NVDA"] / 151.0 - 1) < 0.01
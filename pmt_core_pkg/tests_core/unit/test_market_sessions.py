@@ -0,0 +1,66 @@
+"""
+Tests for the market session index.
+"""
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import (
+    ExchangeCalendar,
+    MarketDataService,
+    MarketSessionIndex,
+)
+
+HOUR = 3600
+DAY = 86400
+# 2026-10-19 00:00 UTC — Monday; HKEX closed for Chung Yeung.
+MIDNIGHT = 1792368000
+NOW = MIDNIGHT + 8 * HOUR + 3200
+
+
+@pytest.fixture(scope="module")
+def sessions():
+    calendar = ExchangeCalendar()
+    return MarketSessionIndex(calendar, horizon_days=14, now=NOW)
+
+
+class TestMarketSessionIndex:
+    """Tests for MarketSessionIndex."""
+
+    def test_open_exchanges(self, sessions):
+        assert sessions.open_exchanges(NOW) == ["NSE"]
+        assert sessions.current_period("NSE", NOW) == "Full Day"
+
+    def test_nyse_open_is_dst_aware(self, sessions):
+        # 09:30 EDT is 13:30 UTC before the November DST change ...
+        assert sessions.next_open("NYSE", NOW) == MIDNIGHT + 13.5 * HOUR
+        assert sessions.seconds_until_open("NYSE", NOW) == 13.5 * HOUR - (NOW - MIDNIGHT)
+        # ... and 14:30 UTC after it (Monday 2026-11-02), past the initial horizon.
+        nov_2 = MIDNIGHT + 14 * DAY
+        assert sessions.next_open("NYSE", nov_2) == nov_2 + 14.5 * HOUR
+        assert sessions.is_open("NYSE", NOW + 5 * HOUR)
+
+    def test_is_open_vectorized_over_lunch_break(self, sessions):
+        # Tuesday 2026-10-20 JST: 10:00, 12:00 (lunch), 13:00, 16:00.
+        tue_midnight_jst = MIDNIGHT + 15 * HOUR
+        ts = tue_midnight_jst + np.array([10, 12, 13, 16]) * HOUR
+        assert sessions.is_open("TSE", ts).tolist() == [True, False, True, False]
+
+    def test_weekday_sessions_past_calendar_coverage(self, sessions):
+        jan_4_2027 = MIDNIGHT + 77 * DAY
+        assert sessions.is_open("NYSE", jan_4_2027 + 15 * HOUR)
+        assert sessions.next_open("NYSE", jan_4_2027) == jan_4_2027 + 14.5 * HOUR
+
+    def test_unknown_exchange(self, sessions):
+        with pytest.raises(ValueError):
+            sessions.is_open("LSE", NOW)
+
+
+async def test_market_hours_rows(sessions):
+    service = MarketDataService(calendar=sessions.calendar, sessions=sessions)
+
+    rows = await service.get_market_hours()
+
+    assert {r["market"] for r in rows} >= {"NYSE", "HKEX", "TSE"}
+    assert len([r for r in rows if r["market"] == "HKEX"]) == 2
+    assert all(r["is_open"] in ("Yes", "No") for r in rows)
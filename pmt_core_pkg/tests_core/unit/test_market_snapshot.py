@@ -0,0 +1,108 @@
+"""
+Tests for versioned market snapshots.
+"""
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import (
+    HistoricalPriceStore,
+    MarketDataService,
+    MarketSnapshotStore,
+    QuoteUpdate,
+    SimulatedFeed,
+    VersionedCache,
+)
+
+T0 = 1767605400.0
+
+
+class TestMarketSnapshotStore:
+    """Tests for MarketSnapshotStore."""
+
+    def test_publish_is_copy_on_write(self):
+        store = MarketSnapshotStore()
+        v1 = store.publish({"AAPL": {"last": 100.0}})
+        v2 = store.publish({"AAPL": {"last": 101.0}, "MSFT": {"last": 400.0}})
+
+        assert (v1.version, v2.version) == (1, 2)
+        assert v1.get("AAPL") == 100.0
+        assert "MSFT" not in v1
+        assert v2.column(["MSFT", "AAPL", "XXX"]).tolist()[:2] == [400.0, 101.0]
+        assert np.isnan(v2.get("XXX"))
+        with pytest.raises(ValueError):
+            v2.fields["last"][0] = 0.0
+        with pytest.raises(TypeError):
+            v2.fields["last"] = np.zeros(2)
+
+    def test_publish_shares_unchanged_index_and_fields(self):
+        store = MarketSnapshotStore()
+        v1 = store.publish({"AAPL": {"last": 100.0, "bid": 99.9}})
+        v2 = store.publish({"AAPL": {"last": 101.0}})
+
+        assert v2.index is v1.index
+        assert v2.fields["bid"] is v1.fields["bid"]
+        assert v2.fields["last"] is not v1.fields["last"]
+        assert (v1.get("AAPL"), v2.get("AAPL")) == (100.0, 101.0)
+
+    def test_retention_is_by_age(self):
+        store = MarketSnapshotStore(retention=60.0, min_history=2)
+        for price in range(1, 500):
+            store.publish({"A": {"last": float(price)}})
+        # Hundreds of publishes later, recent versions are still readable.
+        assert store.get(1).get("A") == 1.0
+
+        store.retention = 0.0
+        for price in (1.0, 2.0, 3.0):
+            store.publish({"A": {"last": price}})
+        assert store.get(store.version - 1).get("A") == 2.0
+        assert store.get().version == 502
+        with pytest.raises(KeyError):
+            store.get(1)
+
+    def test_pinned_version_outlives_retention(self):
+        store = MarketSnapshotStore(retention=0.0, min_history=1)
+        store.publish({"A": {"last": 1.0}})
+
+        with store.pin() as pinned:
+            with store.pin(pinned.version):
+                for price in (2.0, 3.0, 4.0):
+                    store.publish({"A": {"last": price}})
+            assert store.get(pinned.version).get("A") == 1.0
+
+        with pytest.raises(KeyError):
+            store.get(pinned.version)
+
+
+class TestVersionedCache:
+    """Tests for VersionedCache."""
+
+    def test_computes_once_per_version(self):
+        cache = VersionedCache(keep_versions=1)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get_or_compute(1, "kpi", compute) == 1
+        assert cache.get_or_compute(1, "kpi", compute) == 1
+        assert cache.get_or_compute(2, "kpi", compute) == 2
+        assert cache.get_or_compute(1, "kpi", compute) == 3
+
+
+async def test_market_data_reads_pinned_snapshot(tmp_path):
+    service = MarketDataService(
+        history_store=HistoricalPriceStore(tmp_path), feed=SimulatedFeed()
+    )
+    service.on_quotes([QuoteUpdate("AAPL", 100.0, 10, 99.9, 100.1, T0)])
+    pinned = service.get_snapshot().version
+    service.on_quotes([QuoteUpdate("AAPL", 120.0, 10, 119.9, 120.1, T0 + 1)])
+
+    old = {r["ticker"]: r for r in await service.get_market_data(version=pinned)}
+    new = {r["ticker"]: r for r in await service.get_market_data()}
+
+    assert old["AAPL"]["last_price"] == "100.00"
+    assert old["AAPL"]["bid"] == "99.90"
+    assert new["AAPL"]["last_price"] == "120.00"
+    assert new["AAPL"]["vwap_price"] == "110.00"
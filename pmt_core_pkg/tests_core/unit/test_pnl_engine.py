@@ -0,0 +1,117 @@
+"""
+Tests for the vectorized PnL engine and the PnL views built on it.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import FxRateMatrix
+from pmt_core.services.pnl import PnLService
+from pmt_core.services.pnl.pnl_engine import REFERENCE_POINTS, PnLInputs, compute_pnl
+
+
+def _inputs() -> PnLInputs:
+    ref_price = {r: np.array([100.0, 1000.0, 50.0]) for r in REFERENCE_POINTS}
+    ref_fx = {r: np.array([1.0, 100.0, 1.0]) for r in REFERENCE_POINTS}
+    ref_fx["1m"] = np.array([1.0, 125.0, 1.0])
+    return PnLInputs(
+        position_id=np.array(["P1", "P2", "P3"], dtype=object),
+        ticker=np.array(["AAA", "BBB", "AAA"], dtype=object),
+        underlying=np.array(["A Co", "B Co", "A Co"], dtype=object),
+        currency=np.array(["USD", "JPY", "USD"], dtype=object),
+        book=np.array(["X", "X", "Y"], dtype=object),
+        quantity=np.array([10.0, 100.0, -4.0]),
+        price=np.array([110.0, 1100.0, 110.0]),
+        fx=np.array([1.0, 100.0, 1.0]),
+        ref_price=ref_price,
+        ref_fx=ref_fx,
+    )
+
+
+class TestComputePnL:
+    """Tests for compute_pnl and grouped views."""
+
+    def test_period_pnl_includes_fx_translation(self):
+        result = compute_pnl(_inputs())
+
+        np.testing.assert_allclose(result.pnl["t_1"], [100.0, 100.0, -240.0])
+        # Yen was weaker a month ago: same local gain, more USD.
+        np.testing.assert_allclose(result.pnl["1m"][1], 1100.0 - 800.0)
+        np.testing.assert_allclose(result.pnl_local["1m"][1], 10_000.0)
+
+    def test_aggregate_by_ticker(self):
+        view = compute_pnl(_inputs()).aggregate("ticker")
+
+        assert view.keys.tolist() == ["AAA", "BBB"]
+        np.testing.assert_allclose(view.pnl["t_1"], [-140.0, 100.0])
+        np.testing.assert_allclose(view.pct("t_1"), [-140.0 / 1200.0 * 100, 10.0])
+        assert view.first_row.tolist() == [0, 1]
+
+    def test_unknown_group(self):
+        with pytest.raises(ValueError):
+            compute_pnl(_inputs()).aggregate("sector")
+
+
+class TestPnLServiceViews:
+    """All PnL pages come from one compute pass."""
+
+    async def test_views_share_one_repository_call(self, mocker):
+        service = PnLService()
+        spy = mocker.spy(service.repository, "get_pnl_inputs")
+
+        full = await service.get_pnl_full("2026-10-16")
+        changes = await service.get_pnl_changes("2026-10-16")
+        currency = await service.get_pnl_by_currency("2026-10-16")
+        summary = await service.get_pnl_summary("2026-10-16")
+
+        assert spy.call_count == 1
+        assert [r["pnl_ytd"] for r in full] == [r["pnl_ytd"] for r in changes]
+        assert {r["currency"] for r in currency} == {"USD", "JPY", "EUR", "GBP", "HKD"}
+        # Sony is held in two books but summarized once.
+        assert [r["underlying"] for r in summary].count("Sony Group") == 1
+
+    async def test_book_totals_tie_out(self):
+        fx = FxRateMatrix(
+            {"USD": 1.0, "EUR": 0.9, "JPY": 150.0, "GBP": 0.8, "HKD": 7.8},
+            {"USD": 1.0, "EUR": 0.9, "JPY": 150.0, "GBP": 0.8, "HKD": 7.8},
+        )
+        service = PnLService(fx=fx)
+        result = await service.compute_pnl()
+
+        by_book = result.aggregate("book").pnl["t_1"].sum()
+        by_ccy = result.aggregate("currency").pnl["t_1"].sum()
+        daily = await service.calculate_daily_pnl()
+
+        assert by_book == pytest.approx(by_ccy)
+        assert daily["daily_pnl"] == pytest.approx(by_book)
+
+
+class TestPnLDateBatching:
+    """Multi-date loads and adjacent-date prefetch for the date picker."""
+
+    async def test_range_is_one_round_trip(self, mocker):
+        service = PnLService()
+        spy = mocker.spy(service.repository, "get_pnl_inputs_range")
+
+        changes = await service.get_pnl_changes_range(["2026-10-14", "2026-10-15", "2026-10-14"])
+        single = mocker.spy(service.repository, "get_pnl_inputs")
+        again = await service.get_pnl_changes("2026-10-15")
+
+        assert spy.call_count == 1
+        assert list(changes) == ["2026-10-14", "2026-10-15"]
+        assert single.call_count == 0
+        assert [r["pnl_ytd"] for r in again] == [r["pnl_ytd"] for r in changes["2026-10-15"]]
+
+    async def test_prefetch_adjacent_business_days(self, mocker):
+        service = PnLService()
+        spy = mocker.spy(service.repository, "get_pnl_inputs_range")
+
+        service.prefetch_adjacent_dates("2026-10-12", window=1)  # a Monday
+        await asyncio.gather(*service._prefetch_tasks)
+
+        assert spy.call_args.args[0] == ["2026-10-09", "2026-10-13"]
+        single = mocker.spy(service.repository, "get_pnl_inputs")
+        await service.get_pnl_changes("2026-10-09")
+        assert single.call_count == 0
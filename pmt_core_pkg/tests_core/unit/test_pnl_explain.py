@@ -0,0 +1,101 @@
+"""
+Tests for PnL attribution.
+"""
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import FxRateMatrix
+from pmt_core.services.pnl import PnLService, RiskSnapshot, explain_pnl
+from pmt_core.services.reconciliation import ReconciliationService
+from pmt_core.services.pricing.vol_surface import black_scholes_price
+
+
+def _option_book(spot, vol, fx, days_to_expiry):
+    """Long 1,000 one-year-ish calls per strike, revalued exactly."""
+    strikes = np.array([80.0, 100.0, 120.0])
+    t = days_to_expiry / 365.0
+    n = len(strikes)
+
+    def value(s, v, tt):
+        return 1000 * black_scholes_price(s, strikes, tt, v)
+
+    bump = 0.01
+    price = value(spot, vol, t)
+    up, down = value(spot + bump, vol, t), value(spot - bump, vol, t)
+    return RiskSnapshot(
+        position_id=np.array(["C80", "C100", "C120"], dtype=object),
+        ticker=np.array(["XYZ"] * n, dtype=object),
+        underlying=np.array(["XYZ"] * n, dtype=object),
+        currency=np.array(["EUR"] * n, dtype=object),
+        book=np.array(["OPT"] * n, dtype=object),
+        spot=np.full(n, spot),
+        vol=np.full(n, vol),
+        fx=np.full(n, fx),
+        value=price,
+        delta=(up - down) / (2 * bump),
+        gamma=(up - 2 * price + down) / bump**2,
+        vega=value(spot, vol + 0.005, t) - value(spot, vol - 0.005, t),
+        theta=value(spot, vol, t - 1 / 365.0) - price,
+    )
+
+
+def test_greeks_explain_option_book():
+    prior = _option_book(100.0, 0.25, 0.90, 200)
+    current = _option_book(101.5, 0.26, 0.92, 199)
+
+    explain = explain_pnl(prior, current, days=1)
+
+    total = explain.total
+    np.testing.assert_allclose(
+        sum(explain.components.values()), total, rtol=1e-12, atol=1e-9
+    )
+    residual = explain.components["residual"]
+    # Cross terms (vanna, volga) are all that is left unexplained.
+    assert np.all(np.abs(residual) < 0.05 * np.abs(total))
+    # FX translation of yesterday's value is exact.
+    np.testing.assert_allclose(explain.components["fx"], prior.value * (1 / 0.92 - 1 / 0.90))
+    assert np.all(explain.components["delta"] > 0)
+    assert np.all(explain.components["theta"] < 0)
+
+
+def test_positions_are_matched_by_id():
+    prior = _option_book(100.0, 0.25, 0.90, 200)
+    current = _option_book(100.0, 0.25, 0.90, 199).take(np.array([2, 0]))
+
+    explain = explain_pnl(prior, current)
+
+    assert explain.positions.position_id.tolist() == ["C120", "C80"]
+    keys, total, components = explain.aggregate("book")
+    assert keys.tolist() == ["OPT"]
+    assert total[0] == pytest.approx(explain.total.sum())
+
+
+async def test_explain_ties_out_with_currency_view():
+    fx = FxRateMatrix(
+        {"USD": 1.0, "EUR": 0.9, "JPY": 150.0, "GBP": 0.8, "HKD": 7.8},
+        {"USD": 1.0, "EUR": 0.8, "JPY": 151.0, "GBP": 0.8, "HKD": 7.8},
+    )
+    service = PnLService(fx=fx)
+
+    explain = await service.get_pnl_explain(by="currency")
+    currency = await service.get_pnl_by_currency()
+
+    assert [r["pnl_total"] for r in explain] == [r["pos_ccy_pnl"] for r in currency]
+    usd = next(r for r in explain if r["currency"] == "USD")
+    assert usd["pnl_fx"] == "$0"
+
+
+async def test_full_and_recon_views_carry_attribution():
+    service = PnLService()
+    explain = {r["ticker"]: r for r in await service.get_pnl_explain("2026-10-16")}
+
+    full = await service.get_pnl_full("2026-10-16")
+    recon = await ReconciliationService(pnl=service).get_pnl_recon("2026-10-16")
+
+    aapl = next(r for r in full if r["ticker"] == "AAPL")
+    assert aapl["pnl_residual"] == explain["AAPL"]["pnl_residual"]
+    assert all(r["pnl_delta"] for r in full)
+    assert recon[1]["underlying"] == "MSFT"
+    assert recon[1]["pnl_total"] == explain["MSFT"]["pnl_total"]
+    assert recon[1]["pnl_fx"] == "$0"
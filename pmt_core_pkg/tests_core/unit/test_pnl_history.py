@@ -0,0 +1,129 @@
+"""
+Tests for the append-only PnL history store and its period roll-ups.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pmt_core.services.performance import PerformanceService
+from pmt_core.services.pnl import PnLHistoryStore, PnLService, pnl_service
+from pmt_core.services.pnl.pnl_history import period_start
+from pmt_core.services.pnl.pnl_service import _format_money
+
+
+def _store(days: int = 300, positions: int = 5):
+    dates = np.arange(np.datetime64("2025-01-01"), np.datetime64("2026-12-31"))
+    dates = dates[np.is_busday(dates)][:days]
+    pnl = np.random.default_rng(7).normal(0, 1000, (len(dates), positions))
+    store = PnLHistoryStore(capacity_days=8, capacity_positions=2)
+    store.extend(dates, [f"P{i}" for i in range(positions)], pnl)
+    return store, dates, pnl
+
+
+class TestPnLHistoryStore:
+    """Prefix-sum range queries match a brute-force sum."""
+
+    def test_range_matches_brute_force(self):
+        store, dates, pnl = _store()
+
+        # A full year, a weekend (no trading days) and a single day.
+        ranges = [("2025-01-01", "2025-12-31"), ("2025-03-15", "2025-03-16"), ("2025-06-02",) * 2]
+        for start, end in ranges:
+            mask = (dates >= np.datetime64(start)) & (dates <= np.datetime64(end))
+            np.testing.assert_allclose(store.range_pnl(start, end), pnl[mask].sum(axis=0))
+
+    def test_period_starts(self):
+        asof = np.datetime64("2025-06-12")  # Thursday
+
+        assert period_start(asof, "wtd") == np.datetime64("2025-06-09")
+        assert period_start(asof, "mtd") == np.datetime64("2025-06-01")
+        assert period_start(asof, "ytd") == np.datetime64("2025-01-01")
+
+    def test_append_only(self):
+        store, dates, _ = _store(days=10)
+
+        with pytest.raises(ValueError):
+            store.append(dates[-1], ["P0"], [1.0])
+
+    def test_new_position_has_no_prior_history(self):
+        store, dates, pnl = _store(days=10)
+        store.append("2026-01-05", ["P9", "P0"], [50.0, 10.0])
+
+        total = store.range_pnl(dates[0], "2026-01-05", ["P0", "P9", "missing"])
+
+        np.testing.assert_allclose(total, [pnl[:, 0].sum() + 10.0, 50.0, 0.0])
+
+
+class TestPnLHistoryService:
+    """History bulk-loads, extends as the date rolls and feeds period views and KPIs."""
+
+    async def test_period_pnl_ties_to_history(self, mocker):
+        service = PnLService()
+        spy = mocker.spy(service.repository, "get_pnl_history")
+
+        periods = await service.get_period_pnl("2026-10-16")
+        history = await service.get_pnl_history()
+        result = await service.compute_pnl("2026-10-16")
+        ids = result.inputs.position_id.tolist()
+
+        assert spy.call_count == 1
+        assert set(periods) == {"dtd", "wtd", "mtd", "ytd"}
+        # The date is closed, so every period is history only.
+        np.testing.assert_allclose(
+            periods["ytd"], history.range_pnl("2026-01-01", "2026-10-16", ids)
+        )
+        assert history.last_date < np.datetime64("today")
+
+    async def test_history_extends_when_the_date_rolls(self, monkeypatch, mocker):
+        class _Friday(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2026, 10, 16, 12, 0)
+
+        service = PnLService()
+        monkeypatch.setattr(pnl_service, "datetime", _Friday)
+        await service.get_pnl_history()
+        assert service.history.last_date == np.datetime64("2026-10-15")
+        await service.record_close("2026-10-16")
+        closed = service.history.range_pnl("2026-10-16", "2026-10-16")
+
+        monkeypatch.undo()
+        spy = mocker.spy(service.repository, "get_pnl_history")
+        history = await service.get_pnl_history()
+        await service.get_pnl_history()
+
+        # One fetch of the missing days; the recorded close is kept.
+        assert spy.call_count == 1
+        assert spy.call_args.args[0] == "2026-10-16"
+        today = np.datetime64(datetime.now().strftime("%Y-%m-%d"), "D")
+        assert history.last_date == np.busday_offset(today, -1, roll="forward")
+        np.testing.assert_allclose(history.range_pnl("2026-10-16", "2026-10-16"), closed)
+
+    async def test_views_roll_up_through_history(self):
+        service = PnLService()
+        today = np.datetime64("today").astype(str)
+
+        periods = await service.get_period_pnl(today)
+        result = await service.compute_pnl(today)
+        changes = await service.get_pnl_changes(today)
+        full = await service.get_pnl_full(today)
+        daily = await service.calculate_daily_pnl()
+
+        # Today is open: the live DTD is the whole DTD and part of every period.
+        np.testing.assert_allclose(periods["dtd"], result.pnl["t_1"])
+        keys, codes = result.groups("ticker")
+        ytd = np.bincount(codes, weights=periods["ytd"], minlength=len(keys))
+        assert [r["pnl_ytd"] for r in full] == [_format_money(v, "USD") for v in ytd]
+        assert [r["pnl_ytd"] for r in changes] == [r["pnl_ytd"] for r in full]
+        assert daily["ytd_pnl"] == pytest.approx(periods["ytd"].sum())
+
+    async def test_kpis_from_history(self):
+        kpis = await PerformanceService().get_kpi_metrics()
+
+        assert [k["label"] for k in kpis] == ["Total NAV", "Daily P&L", "YTD Return", "Net Exposure"]
+        for kpi in kpis:
+            xs, ys = zip(*(map(int, p.split(",")) for p in kpi["trend_data"].split()))
+            assert 0 <= min(xs) and max(xs) <= 50
+            assert 0 <= min(ys) and max(ys) <= 24
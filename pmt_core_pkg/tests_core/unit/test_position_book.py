@@ -0,0 +1,274 @@
+"""
+Tests for the indexed position book, position diffs, as-of position history
+and the PositionService views on them.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from pmt_core.services.notifications import notification_providers
+from pmt_core.services.positions import position_service
+from pmt_core.services.positions import (
+    PositionBook,
+    PositionHistory,
+    PositionService,
+    diff_positions,
+)
+
+
+def _position(deal: str, ticker: str, sec_type: str, account: str, qty: int = 100) -> dict:
+    return {
+        "id": 0,
+        "trade_date": "2026-10-16",
+        "deal_num": deal,
+        "detail_id": f"{deal}-1",
+        "underlying": f"{ticker} US Equity",
+        "ticker": ticker,
+        "company_name": ticker,
+        "sec_id": deal,
+        "sec_type": sec_type,
+        "subtype": None,
+        "currency": "USD",
+        "account_id": account,
+        "pos_loc": "NY",
+        "notional": f"${qty * 10:,.2f}",
+        "position": str(qty),
+        "market_value": f"${qty * 11:,.2f}",
+    }
+
+
+@pytest.fixture
+def book() -> PositionBook:
+    return PositionBook(
+        [
+            _position("D1", "AAPL", "Equity", "ACC001"),
+            _position("D2", "AAPL", "Warrant", "ACC002"),
+            _position("D3", "MSFT", "Warrant", "ACC002"),
+            _position("D4", "MSFT", "Bond", "ACC003"),
+            _position("D5", "TSLA", "Convertible", "ACC003"),
+        ]
+    )
+
+
+class TestPositionBook:
+    """Indexed lookups and incremental updates."""
+
+    def test_find_intersects_indexes(self, book):
+        assert [p["deal_num"] for p in book.find(sec_type="Warrant", account_id="ACC002")] == [
+            "D2",
+            "D3",
+        ]
+        assert [p["deal_num"] for p in book.find(ticker="AAPL", sec_type="Warrant")] == ["D2"]
+        assert [p["deal_num"] for p in book.find(sec_type=("Bond", "Convertible"))] == ["D4", "D5"]
+        assert book.find(ticker="NVDA") == []
+
+    def test_unknown_field(self, book):
+        with pytest.raises(ValueError):
+            book.find(company_name="AAPL")
+
+    def test_partial_fill_scales_size(self, book):
+        updated = book.apply_trade({"deal_num": "D1", "detail_id": "D1-1", "quantity": 50})
+
+        assert updated["position"] == "150"
+        assert updated["market_value"] == "$1,650.00"
+        assert book.find(ticker="AAPL", sec_type="Equity") == [updated]
+
+    def test_close_out_and_open(self, book):
+        assert book.apply_trade({"deal_num": "D3", "detail_id": "D3-1", "quantity": -100}) is None
+        assert [p["deal_num"] for p in book.find(ticker="MSFT")] == ["D4"]
+
+        opened = {**_position("D6", "NVDA", "Equity", "ACC001"), "quantity": 25}
+        del opened["position"]
+        book.apply_trade(opened)
+
+        assert [p["position"] for p in book.find(ticker="NVDA")] == ["25"]
+        assert "NVDA" in book.values("ticker")
+
+    def test_sizes_keep_every_digit(self, book):
+        updated = book.apply_trade(
+            {"deal_num": "D1", "detail_id": "D1-1", "quantity": 1_244_467}
+        )
+        assert updated["position"] == "1244567"
+        updated = book.apply_trade({"deal_num": "D1", "detail_id": "D1-1", "quantity": 0.5})
+        assert updated["position"] == "1244567.5"
+
+    def test_reindex_on_changed_field(self, book):
+        moved = {**book.get("D1", "D1-1"), "account_id": "ACC009"}
+        book.upsert(moved)
+
+        assert [p["deal_num"] for p in book.find(account_id="ACC001")] == []
+        assert book.find(account_id="ACC009") == [moved]
+
+
+class TestPositionServiceBook:
+    """Every position page reads one shared book."""
+
+    async def test_pages_share_one_load(self, mocker):
+        service = PositionService()
+        spy = mocker.spy(service.repository, "get_positions")
+
+        stocks = await service.get_stock_positions()
+        warrants = await service.get_warrant_positions()
+        bonds = await service.get_bond_positions()
+        everything = await service.get_positions()
+
+        assert spy.call_count == 1
+        assert len(stocks) + len(warrants) + len(bonds) == len(everything)
+        assert {p["sec_type"] for p in warrants} == {"Warrant"}
+
+        await service.get_positions(refresh=True)
+        assert spy.call_count == 2
+
+    async def test_refresh_keeps_applied_trades(self):
+        service = PositionService()
+        await service.apply_trade({"deal_num": "DEAL000", "detail_id": "D000", "quantity": 500})
+
+        await service.get_positions(refresh=True)
+        book = await service.get_position_book()
+
+        assert book.get("DEAL000", "D000")["position"] == "1500"
+        assert [c.key for c in (await service.diff_intraday()).changed] == [("DEAL000", "D000")]
+
+    async def test_emsx_fills_feed_the_book(self):
+        service = PositionService()
+        await service.get_positions()
+
+        await service.sync_fills()
+        book = await service.get_position_book()
+        fills = service.emsx._fills
+
+        expected = {}
+        for fill in fills:
+            sign = 1 if fill["side"] == "Buy" else -1
+            expected[fill["ticker"]] = expected.get(fill["ticker"], 0) + sign * fill["quantity"]
+        held = {p["ticker"]: float(p["position"]) for p in book.find(account_id="EMSX")}
+        assert held == {t: q for t, q in expected.items() if q}
+        assert {p["sec_type"] for p in book.find(account_id="EMSX")} == {"Equity"}
+        ids = [p["id"] for p in book.all()]
+        assert len(set(ids)) == len(ids)
+
+
+class TestPositionDiff:
+    """Keyed single-pass diff of two snapshots."""
+
+    def test_added_removed_changed(self):
+        before = [
+            _position("D1", "AAPL", "Equity", "ACC001"),
+            _position("D2", "MSFT", "Equity", "ACC001"),
+            _position("D3", "TSLA", "Equity", "ACC001"),
+        ]
+        after = [
+            {**_position("D1", "AAPL", "Equity", "ACC001", qty=150), "trade_date": "2026-10-17"},
+            before[2],
+            _position("D4", "NVDA", "Equity", "ACC001"),
+        ]
+
+        diff = diff_positions(before, after)
+
+        assert [p["deal_num"] for p in diff.added] == ["D4"]
+        assert [p["deal_num"] for p in diff.removed] == ["D2"]
+        [change] = diff.changed
+        assert change.key == ("D1", "D1-1")
+        assert set(change.fields) == {"position", "notional", "market_value"}
+        assert change.fields["position"].delta == 50
+        assert change.fields["market_value"].delta == pytest.approx(550.0)
+        assert len(diff.records()) == 5
+
+    async def test_intraday_diff_and_notifications(self):
+        service = PositionService()
+        assert not await service.diff_intraday()
+
+        await service.apply_trade({"deal_num": "DEAL000", "detail_id": "D000", "quantity": 500})
+        diff = await service.diff_intraday()
+
+        assert [c.key for c in diff.changed] == [("DEAL000", "D000")]
+        [note] = notification_providers.position_diff_notifications(diff)
+        assert note["message"] == "TKR0 position size updated: 1000 -> 1500"
+        assert service.get_position_notifications() == [note]
+
+    def test_no_notifications_before_the_book_loads(self):
+        assert PositionService().get_position_notifications() == []
+
+
+class TestPositionHistory:
+    """Delta-chain storage with checkpoints reconstructs every as-of date."""
+
+    def test_as_of_matches_recorded_snapshots(self):
+        history = PositionHistory(checkpoint_every=4)
+        book = {f"D{i}": _position(f"D{i}", "AAPL", "Equity", "A") for i in range(5)}
+        snapshots = {}
+        for day in range(1, 12):
+            date = f"2026-01-{day:02d}"
+            resized = f"D{day % 4 + 1}"
+            book[resized] = {**book[resized], "position": str(100 + day)}
+            if day == 6:
+                del book["D0"]
+                book["D9"] = _position("D9", "NVDA", "Equity", "A")
+            history.record(date, book.values())
+            snapshots[date] = list(book.values())
+
+        for date, expected in snapshots.items():
+            assert {(p["deal_num"], p["position"]) for p in history.as_of(date)} == {
+                (p["deal_num"], p["position"]) for p in expected
+            }
+        assert history.as_of("2025-12-31") == []
+        assert history.as_of("2026-02-01") == history.as_of("2026-01-11")
+        # Day two stores only the resized row.
+        assert len(history.delta("2026-01-02")) == 1
+
+    def test_unchanged_rows_are_shared(self):
+        history = PositionHistory()
+        rows = [_position("D1", "AAPL", "Equity", "A"), _position("D2", "MSFT", "Equity", "A")]
+        history.record("2026-01-01", rows)
+        history.record("2026-01-02", [rows[0], {**rows[1], "position": "200"}])
+
+        assert history.as_of("2026-01-02")[0] is history.as_of("2026-01-01")[0]
+        with pytest.raises(ValueError):
+            history.record("2026-01-02", rows)
+
+    async def test_historical_dates_come_from_history(self, mocker):
+        service = PositionService()
+        spy = mocker.spy(service.repository, "get_positions")
+        history = await service.get_position_history()
+        past = history.dates[-30]
+
+        positions = await service.get_positions(past)
+
+        assert spy.call_count == 0
+        assert {p["trade_date"] for p in positions} == {past}
+        assert len(positions) == 20
+
+    async def test_close_is_recorded(self):
+        service = PositionService()
+        await service.apply_trade({"deal_num": "DEAL000", "detail_id": "D000", "quantity": 500})
+
+        await service.record_close()
+        history = await service.get_position_history()
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        assert history.last_date == today
+        assert {(p["deal_num"], p["position"]) for p in history.as_of(today)} == {
+            (p["deal_num"], p["position"]) for p in await service.get_positions()
+        }
+
+    async def test_history_extends_when_the_date_rolls(self, monkeypatch, mocker):
+        class _Friday(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2026, 10, 16, 12, 0)
+
+        service = PositionService()
+        monkeypatch.setattr(position_service, "datetime", _Friday)
+        await service.get_position_history()
+        assert service.history.last_date == "2026-10-15"
+
+        monkeypatch.undo()
+        spy = mocker.spy(service.repository, "get_position_history")
+        history = await service.get_position_history()
+        await service.get_position_history()
+
+        assert spy.call_count == 1
+        assert spy.call_args.args[0] == "2026-10-16"
+        assert history.last_date > "2026-10-15"
+        assert len(history.as_of("2026-10-16")) == 20
@@ -0,0 +1,121 @@
+"""
+Tests for the reference data cache.
+"""
+
+import threading
+
+import pytest
+
+from pmt_core.repositories.positions import PositionRepository
+from pmt_core.services.instruments import InstrumentsService
+from pmt_core.services.reference_data import InstrumentRef, ReferenceDataCache
+
+
+@pytest.fixture
+def cache():
+    return ReferenceDataCache()
+
+
+class TestReferenceDataCache:
+    """Tests for ReferenceDataCache."""
+
+    @pytest.mark.parametrize(
+        "identifier",
+        [
+            "AAPL",
+            "aapl us equity",
+            "AAPL  UW Equity",
+            "AAPL US",
+            "US0378331005",
+            "2046251",
+            "EQ000001",
+        ],
+    )
+    def test_identifiers_resolve_to_one_instrument(self, cache, identifier):
+        assert cache.resolve(identifier) == "EQ000001"
+
+    def test_position_underlyings_resolve(self, cache):
+        ids = cache.resolve_many(["TKR0 US Equity", "WRT1 US Warrant", "BND2 US Bond"])
+        assert ids == ["TKR000000", "WRT000001", "BND000002"]
+
+    def test_unknown_identifiers(self, cache):
+        assert cache.resolve("ZZZZ US Equity") is None
+        assert cache.resolve("") is None
+        assert cache.get(None) is None
+
+    def test_refresh_interval_reloads(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return [
+                InstrumentRef(
+                    "X1", "XYZ", "LN", "Equity", "XYZ plc", "Energy", "GBP", "Equity"
+                )
+            ]
+
+        cache = ReferenceDataCache(loader=loader, refresh_interval=0)
+        assert cache.get("xyz ln equity").currency == "GBP"
+        assert cache.resolve("XYZ") == "X1"
+        assert len(calls) == 2
+
+        cache.refresh_interval = 3600
+        cache.resolve("XYZ")
+        assert len(calls) == 2
+
+    def test_concurrent_callers_load_once(self):
+        calls = []
+        release = threading.Event()
+
+        def loader():
+            calls.append(1)
+            release.wait(1.0)
+            return [
+                InstrumentRef(
+                    "X1", "XYZ", "LN", "Equity", "XYZ plc", "Energy", "GBP", "Equity"
+                )
+            ]
+
+        cache = ReferenceDataCache(loader=loader)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.resolve("XYZ")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["X1"] * 8
+        assert len(calls) == 1
+
+    def test_stale_index_served_while_reloading(self):
+        cache = ReferenceDataCache(refresh_interval=0)
+        cache.refresh()
+        calls = []
+        cache._loader = lambda: calls.append(1) or []
+
+        with cache._refresh_lock:
+            # Another caller holds the reload: keep serving the old index.
+            assert cache.resolve("AAPL") == "EQ000001"
+        assert calls == []
+
+
+async def test_instruments_ticker_data_uses_cache(cache):
+    rows = await InstrumentsService(reference_data=cache).get_ticker_data()
+    assert rows[0]["company"] == "Apple Inc."
+    assert rows[2]["sector"] == "Automotive"
+
+
+async def test_position_rows_come_from_cache(cache):
+    repository = PositionRepository(reference_data=cache)
+
+    tickers = await repository.get_ticker_data()
+    positions = await repository.get_positions("2026-01-16")
+
+    assert tickers[2]["company"] == "Tesla Inc."
+    assert all(cache.resolve(p["underlying"]) for p in positions)
+    assert positions[10]["underlying"] == "WRT0 US Warrant"
+    assert positions[10]["company_name"] == "Warrant Co 0"
@@ -0,0 +1,84 @@
+"""
+Tests for the incremental top movers engine.
+"""
+
+import random
+
+import pytest
+
+from pmt_core.services.market_data import (
+    HistoricalPriceStore,
+    IndexedHeap,
+    MarketDataService,
+    TopMoversEngine,
+)
+
+
+class TestIndexedHeap:
+    """Tests for IndexedHeap."""
+
+    def test_smallest_tracks_updates_and_removals(self):
+        rng = random.Random(7)
+        heap = IndexedHeap()
+        values = {}
+        for _ in range(500):
+            key = rng.randrange(60)
+            if rng.random() < 0.2:
+                heap.remove(key)
+                values.pop(key, None)
+            else:
+                values[key] = rng.uniform(-100, 100)
+                heap.set(key, values[key])
+
+        expected = sorted((v, k) for k, v in values.items())[:5]
+        assert heap.smallest(5) == expected
+        assert len(heap) == len(values)
+
+
+class TestTopMoversEngine:
+    """Tests for TopMoversEngine."""
+
+    def test_top_and_bottom_follow_updates(self):
+        engine = TopMoversEngine(k=2)
+        for i, ticker in enumerate(["A", "B", "C", "D"]):
+            engine.update("ops", ticker, value=float(i))
+        engine.update("ops", "A", value=10.0)
+
+        assert [m["ticker"] for m in engine.top("ops")] == ["A", "D"]
+        assert [m["ticker"] for m in engine.bottom("ops")] == ["B", "C"]
+
+    def test_price_category_ranks_by_change(self):
+        engine = TopMoversEngine(k=1)
+        engine.update("price", "HIGH", value=900.0, change=1.0)
+        engine.update("price", "MOVER", value=10.0, change=20.0)
+
+        assert engine.snapshot()["price"]["top"][0]["ticker"] == "MOVER"
+
+    def test_unknown_category_rejected(self):
+        with pytest.raises(ValueError):
+            TopMoversEngine().update("bogus", "A", 1.0)
+
+
+class TestMarketDataServiceTopMovers:
+    """Top movers served through MarketDataService."""
+
+    async def test_snapshot_covers_all_categories(self, tmp_path):
+        service = MarketDataService(history_store=HistoricalPriceStore(tmp_path))
+        snapshot = await service.get_top_movers_snapshot()
+
+        assert set(snapshot) == {"ops", "ytd", "delta", "price", "volume"}
+        assert snapshot["ops"]["top"][0] == {
+            "ticker": "NVDA",
+            "name": "NVIDIA",
+            "value": "+$2.4M",
+            "change": "+12%",
+            "is_positive": True,
+        }
+
+    async def test_price_ticks_reorder_movers(self, tmp_path):
+        service = MarketDataService(history_store=HistoricalPriceStore(tmp_path))
+        # PLTR previous close is 24.5 / 1.021; a tick at 49 is roughly +100%.
+        service.on_tick("PLTR", 49.0, 100, 1767605400)
+
+        top = await service.get_top_movers("price")
+        assert top[0]["ticker"] == "PLTR"
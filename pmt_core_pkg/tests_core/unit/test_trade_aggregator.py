@@ -0,0 +1,98 @@
+"""
+Tests for streaming trade aggregates over EMSX fills.
+"""
+
+import pytest
+
+from pmt_core.services.emsx import emsx_service
+from pmt_core.services.positions import PositionService, TradeAggregator
+
+
+def _fill(fill_id: str, ticker: str, side: str, broker: str, qty: float, price: float) -> dict:
+    return {
+        "fill_id": fill_id,
+        "ticker": ticker,
+        "side": side,
+        "broker": broker,
+        "quantity": qty,
+        "price": price,
+    }
+
+
+class TestTradeAggregator:
+    """Incremental totals, dedupe and changed-row reads."""
+
+    def test_aggregates_per_ticker_side_broker(self):
+        trades = TradeAggregator()
+        trades.add_fills(
+            [
+                _fill("F1", "AAPL", "Buy", "GS", 100, 190.0),
+                _fill("F2", "AAPL", "Buy", "GS", 300, 194.0),
+                _fill("F3", "AAPL", "Sell", "GS", 50, 195.0),
+                _fill("F4", "AAPL", "Buy", "MS", 10, 191.0),
+            ]
+        )
+
+        agg = trades.get("AAPL", "Buy", "GS")
+        assert len(trades) == 3
+        assert agg.quantity == 400
+        assert agg.fill_count == 2
+        assert agg.avg_price == pytest.approx((100 * 190 + 300 * 194) / 400)
+
+    def test_redelivered_fill_is_ignored(self):
+        trades = TradeAggregator()
+
+        assert trades.add_fill(_fill("F1", "MSFT", "Buy", "GS", 100, 400.0))
+        assert not trades.add_fill(_fill("F1", "MSFT", "Buy", "GS", 100, 400.0))
+        assert trades.get("MSFT", "Buy", "GS").quantity == 100
+
+    def test_changes_only_touched_rows(self):
+        trades = TradeAggregator()
+        trades.add_fill(_fill("F1", "MSFT", "Buy", "GS", 100, 400.0))
+        trades.add_fill(_fill("F2", "TSLA", "Sell", "MS", 100, 250.0))
+        assert len(trades.snapshot()) == 2
+        _, a = trades.changes()
+        _, b = trades.changes()
+
+        trades.add_fill(_fill("F3", "TSLA", "Sell", "MS", 100, 252.0))
+
+        [row], a = trades.changes(a)
+        assert row["ticker"] == "TSLA" and row["fill_count"] == 2
+        assert trades.changes(a) == ([], a)
+        # Reads are per consumer: the other cursor still sees the fill.
+        assert [r["ticker"] for r in trades.changes(b)[0]] == ["TSLA"]
+
+    def test_seen_ids_are_bounded(self):
+        trades = TradeAggregator(seen_size=2)
+        for i in range(3):
+            trades.add_fill(_fill(f"F{i}", "MSFT", "Buy", "GS", 100, 400.0))
+
+        assert len(trades._seen) == 2
+        assert not trades.add_fill(_fill("F2", "MSFT", "Buy", "GS", 100, 400.0))
+
+
+class TestTradeAggregatesService:
+    """PositionService consumes EMSX fills incrementally."""
+
+    async def test_sync_consumes_each_fill_once(self, mocker):
+        service = PositionService()
+        spy = mocker.spy(service.emsx, "get_emsx_fills")
+
+        rows = await service.get_trade_aggregates()
+        _, version = await service.get_trade_aggregate_updates()
+        updates, _ = await service.get_trade_aggregate_updates(since=version)
+
+        assert sum(r["fill_count"] for r in rows) == 40
+        assert spy.call_args_list[1].args == (40,)
+        assert service.trades.fill_count == len(service.emsx._fills)
+        assert 1 <= len(updates) <= 5
+
+    async def test_mock_fill_buffer_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(emsx_service, "_MOCK_FILL_BUFFER", 50)
+        emsx = emsx_service.EMSXService()
+        for _ in range(20):
+            cursor = emsx._fill_sequence
+            fills = await emsx.get_emsx_fills(cursor)
+
+        assert len(emsx._fills) == 50
+        assert [f["sequence"] for f in fills] == list(range(cursor + 1, emsx._fill_sequence + 1))
@@ -0,0 +1,116 @@
+"""
+Tests for implied vol inversion and the SVI vol surface.
+"""
+
+import numpy as np
+import pytest
+
+from pmt_core.services.market_data import MarketDataService
+from pmt_core.services.pricing import VolSurfaceService, WarrantPricer, implied_vol
+from pmt_core.services.pricing.vol_surface import (
+    black_scholes_price,
+    fit_svi,
+    mock_option_chain,
+    svi_total_variance,
+)
+
+
+def test_implied_vol_round_trips_in_batch():
+    rng = np.random.default_rng(0)
+    n = 500
+    strikes = rng.uniform(70, 140, n)
+    expiries = rng.uniform(0.05, 2.0, n)
+    vols = rng.uniform(0.1, 0.8, n)
+    is_call = rng.random(n) < 0.5
+    prices = black_scholes_price(100.0, strikes, expiries, vols, 0.03, 0.01, is_call)
+
+    ivs = implied_vol(prices, 100.0, strikes, expiries, 0.03, 0.01, is_call)
+
+    # Vol is only identifiable where the option carries some time value.
+    time_value = prices - black_scholes_price(100.0, strikes, expiries, 0.0, 0.03, 0.01, is_call)
+    priced = time_value > 1e-3
+    assert priced.mean() > 0.95
+    np.testing.assert_allclose(ivs[priced], vols[priced], atol=1e-5)
+
+
+def test_implied_vol_rejects_arbitrage_prices():
+    # Below intrinsic, above the forward, and expired.
+    ivs = implied_vol([5.0, 120.0, 3.0], 100.0, [90.0, 100.0, 100.0], [1.0, 1.0, 0.0])
+    assert np.isnan(ivs).all()
+
+
+def test_fit_svi_recovers_smile():
+    true = np.array([0.02, 0.1, -0.5, 0.05, 0.2])
+    k = np.linspace(-0.4, 0.3, 30)
+    w = svi_total_variance(true, k)
+
+    params = fit_svi(k, w)
+
+    np.testing.assert_allclose(svi_total_variance(params, k), w, atol=2e-5)
+
+
+class TestVolSurfaceService:
+    """Tests for VolSurfaceService."""
+
+    def test_surface_reprices_chain(self):
+        service = VolSurfaceService()
+        chain = mock_option_chain("AAPL", 180.0, service.rate)
+        market = implied_vol(
+            chain.prices, 180.0, chain.strikes, chain.expiries, service.rate, 0.0, chain.is_call
+        )
+        surface = service.get_surface("AAPL", 180.0)
+
+        fitted = surface.vol(chain.strikes, chain.expiries)
+
+        liquid = np.isfinite(market) & (np.abs(chain.strikes / 180.0 - 1) < 0.2)
+        assert np.max(np.abs(fitted[liquid] - market[liquid])) < 0.005
+        # Downside skew and a term between fitted expiries.
+        assert surface.vol(150.0, 0.25) > surface.vol(210.0, 0.25)
+        between = surface.vol(180.0, [1 / 12, 0.1, 2 / 12])
+        assert min(between[0], between[2]) <= between[1] <= max(between[0], between[2])
+
+    def test_refits_on_spot_move_or_age(self):
+        calls = []
+
+        def loader(underlying, spot, rate):
+            calls.append(spot)
+            return mock_option_chain(underlying, spot, rate)
+
+        service = VolSurfaceService(chain_loader=loader, spot_tolerance=0.01)
+        first = service.get_surface("MSFT", 400.0)
+        # Ticks within tolerance reuse the fit.
+        assert service.get_surface("MSFT", 401.0) is first
+        assert service.get_surface("MSFT", 397.0) is first
+        assert service.get_surface("MSFT", 410.0) is not first
+
+        service.ttl = 0.0
+        service.get_surface("MSFT", 410.0)
+        assert calls == [400.0, 410.0, 410.0]
+
+
+def test_warrant_pricer_uses_surface():
+    surface = VolSurfaceService().get_surface("NVDA", 100.0)
+    pricer = WarrantPricer(vol_surface=surface)
+    strikes = np.array([80.0, 100.0, 120.0])
+
+    result = pricer.price_warrants(100.0, strikes, 0.5)
+
+    np.testing.assert_allclose(result["vol"], surface.vol(strikes, 0.5))
+    assert np.all(np.diff(result["fair_value"]) < 0)
+    assert np.all((result["delta"] > 0) & (result["delta"] < 1))
+    with pytest.raises(ValueError):
+        WarrantPricer().price_warrants(100.0, strikes, 0.5)
+
+
+async def test_market_grid_shows_surface_vol():
+    service = MarketDataService()
+
+    rows = await service.get_market_data()
+
+    vols = {r["ticker"]: r["implied_vol_pct"] for r in rows}
+    assert all(v.endswith("%") for v in vols.values())
+    assert len(set(vols.values())) > 1
+    # A second read at unchanged spots is served from the surface cache.
+    cached = {t: service.vol_surfaces.cached(t, 182.50) for t in vols}
+    assert all(cached.values())
+    assert await service.get_market_data() == rows
@@ -0,0 +1,167 @@
+"""
+Tests for the batched Yahoo Finance fetcher, run against a local stub HTTP server.
+"""
+
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from pmt_core.services.market_data import (
+    HistoricalPriceStore,
+    MarketDataService,
+    TokenBucket,
+    YahooFinanceFetcher,
+)
+
+
+class _StubYahooHandler(BaseHTTPRequestHandler):
+    """Serves /info/<symbol> and /history?symbols=A,B; fails each info path once."""
+
+    failed_once: set = set()
+    history_calls: list = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.startswith("/info/"):
+            symbol = url.path.rsplit("/", 1)[-1]
+            if symbol not in self.failed_once:
+                self.failed_once.add(symbol)
+                self.send_response(429)
+                self.end_headers()
+                return
+            body = {"shortName": f"{symbol} Corp", "currentPrice": 10.0}
+        else:
+            symbols = parse_qs(url.query)["symbols"][0].split(",")
+            self.history_calls.append(symbols)
+            body = {
+                s: {"dates": ["2026-01-05", "2026-01-06"], "close": [1.0, 2.0]}
+                for s in symbols
+            }
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _StubYahooHandler.failed_once = set()
+    _StubYahooHandler.history_calls = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubYahooHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def _loaders(base_url: str):
+    def info_loader(symbol):
+        with urllib.request.urlopen(f"{base_url}/info/{symbol}") as resp:
+            return json.load(resp)
+
+    def history_loader(symbols, period, start):
+        with urllib.request.urlopen(
+            f"{base_url}/history?symbols={','.join(symbols)}"
+        ) as resp:
+            data = json.load(resp)
+        frames = {
+            s: pd.DataFrame(
+                {"Close": v["close"]}, index=pd.DatetimeIndex(v["dates"])
+            )
+            for s, v in data.items()
+        }
+        return pd.concat(frames, axis=1)
+
+    return info_loader, history_loader
+
+
+class TestYahooFinanceFetcher:
+    """Tests for YahooFinanceFetcher."""
+
+    def test_fetch_infos_retries_rate_limited_calls(self, stub_server, tmp_path):
+        info_loader, history_loader = _loaders(stub_server)
+        fetcher = YahooFinanceFetcher(
+            rate_per_sec=1000,
+            backoff_base=0.001,
+            history_store=HistoricalPriceStore(tmp_path),
+            info_loader=info_loader,
+            history_loader=history_loader,
+        )
+
+        infos = fetcher.fetch_infos([f"S{i}" for i in range(20)])
+
+        assert len(infos) == 20
+        assert infos["S3"]["shortName"] == "S3 Corp"
+
+    def test_download_history_chunks_and_persists(self, stub_server, tmp_path):
+        info_loader, history_loader = _loaders(stub_server)
+        store = HistoricalPriceStore(tmp_path)
+        fetcher = YahooFinanceFetcher(
+            chunk_size=2,
+            rate_per_sec=1000,
+            history_store=store,
+            info_loader=info_loader,
+            history_loader=history_loader,
+        )
+
+        result = fetcher.download_history(["A", "B", "C"])
+
+        assert set(result) == {"A", "B", "C"}
+        assert sorted(len(c) for c in _StubYahooHandler.history_calls) == [1, 2]
+        assert store.read("C")["close"].tolist() == [1.0, 2.0]
+
+    def test_download_history_drops_open_session_bar(self, tmp_path):
+        today = pd.Timestamp.today().normalize()
+        frame = pd.DataFrame(
+            {"Close": [1.0, 2.0, 3.0]},
+            index=pd.date_range(end=today, periods=3, freq="D"),
+        )
+        store = HistoricalPriceStore(tmp_path)
+        fetcher = YahooFinanceFetcher(
+            rate_per_sec=1000,
+            history_store=store,
+            history_loader=lambda symbols, period, start: frame,
+        )
+
+        result = fetcher.download_history(["A"])
+
+        assert result["A"]["close"].tolist() == [1.0, 2.0]
+        assert store.read("A")["close"].tolist() == [1.0, 2.0]
+
+    async def test_service_fetch_multiple_stocks(self, stub_server, tmp_path):
+        info_loader, history_loader = _loaders(stub_server)
+        store = HistoricalPriceStore(tmp_path)
+        fetcher = YahooFinanceFetcher(
+            rate_per_sec=1000,
+            backoff_base=0.001,
+            history_store=store,
+            info_loader=info_loader,
+            history_loader=history_loader,
+        )
+        service = MarketDataService(history_store=store, fetcher=fetcher)
+
+        result = await service.fetch_multiple_stocks(["AAPL", "MSFT"])
+
+        assert result["MSFT"]["name"] == "MSFT Corp"
+        assert result["AAPL"]["current_price"] == 10.0
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_acquire_times_out_when_empty(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        assert bucket.acquire(timeout=0)
+        start = time.monotonic()
+        assert not bucket.acquire(timeout=0.01)
+        assert time.monotonic() - start < 0.5
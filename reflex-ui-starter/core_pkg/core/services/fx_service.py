@@ -2,34 +2,138 @@
 FX Service — Core business logic for FX (Foreign Exchange) data.
 
 Provides mock FX data and realistic tick generation for the starter template.
+Ticks are generated for all pairs at once from NumPy arrays, so the tick
+path scales to thousands of pairs.
 """
 
-import random
-from typing import List
+from typing import List, Optional
 
-
-# Volatility multiplier by currency (JPY pairs move in larger pips)
-_VOLATILITY: dict[str, float] = {
-    "JPY": 0.015,   # ~1.5 pips on 150-yen crosses
-    "HKD": 0.0001,  # HKD is pegged, barely moves
-}
-_DEFAULT_VOL = 0.0003  # ~0.3 pips for standard pairs
+import numpy as np
 
 
-def _vol_for_pair(pair: str) -> float:
-    """Get volatility multiplier based on quote currency."""
-    quote = pair.split("/")[1] if "/" in pair else ""
-    return _VOLATILITY.get(quote, _DEFAULT_VOL)
+# Per-tick log-return volatility by currency (relative, not pips).
+_CCY_VOL: dict[str, float] = {
+    "USD": 0.00002,
+    "EUR": 0.00002,
+    "GBP": 0.000025,
+    "JPY": 0.00003,
+    "CHF": 0.00002,
+    "AUD": 0.00003,
+    "NZD": 0.00003,
+    "CAD": 0.00002,
+    "SGD": 0.000015,
+}
+_DEFAULT_CCY_VOL = 0.00002
+
+# Pegged currencies follow their anchor's shock plus a tiny residual.
+_PEGS: dict[str, str] = {"HKD": "USD"}
+_PEG_VOL = 0.000001
+
+# Fraction of pairs that print on each tick, and spread jitter (log-normal sigma).
+_TICK_FRACTION = 0.3
+_SPREAD_JITTER = 0.15
+
+
+class _FxBook:
+    """NumPy arrays for one set of FX rows, advanced together tick by tick."""
+
+    def __init__(self, rows: List[dict], baseline: Optional[List[float]] = None):
+        self.pairs = [row["pair"] for row in rows]
+
+        base, quote = zip(*(p.split("/") for p in self.pairs)) if rows else ((), ())
+        currencies = sorted(set(base) | set(quote) | set(_PEGS.values()))
+        ccy_index = {c: i for i, c in enumerate(currencies)}
+        self.base_ix = np.array([ccy_index[c] for c in base], dtype=np.intp)
+        self.quote_ix = np.array([ccy_index[c] for c in quote], dtype=np.intp)
+        self.ccy_vol = np.array([_CCY_VOL.get(c, _DEFAULT_CCY_VOL) for c in currencies])
+        pegged = [c for c in currencies if c in _PEGS]
+        self.peg_ix = np.array([ccy_index[c] for c in pegged], dtype=np.intp)
+        self.anchor_ix = np.array([ccy_index[_PEGS[c]] for c in pegged], dtype=np.intp)
+
+        self.mid = np.array([row["mid"] for row in rows], dtype=float)
+        # Baseline mids (session open) for change_pct calculation
+        self.baseline = self.mid.copy() if baseline is None else np.array(baseline, dtype=float)
+        self.base_spread = np.array([row["spread"] for row in rows], dtype=float)
+        self.volume = np.array([row["volume"] for row in rows], dtype=np.int64)
+        # JPY pairs quote to 2 dp (mid 3 dp); everything else to 5 dp.
+        self.jpy = np.array(["JPY" in p for p in self.pairs], dtype=bool)
+        self.min_spread = np.where(self.jpy, 0.01, 0.00001)
+
+    def step(self, rng: np.random.Generator, tick_fraction: float) -> List[dict]:
+        """Advance the arrays one tick; partial row dicts for the pairs that printed."""
+        n = len(self.pairs)
+        if not n:
+            return []
+        changed = np.flatnonzero(rng.random(n) < tick_fraction)
+        if not changed.size:
+            return []
+
+        # Correlated shocks: one draw per currency, pairs take base minus quote.
+        shocks = self.ccy_vol * rng.standard_normal(len(self.ccy_vol))
+        residual = _PEG_VOL * rng.standard_normal(len(self.peg_ix))
+        shocks[self.peg_ix] = shocks[self.anchor_ix] + residual
+        returns = shocks[self.base_ix[changed]] - shocks[self.quote_ix[changed]]
+
+        mid = self.mid[changed] * np.exp(returns)
+        jitter = np.exp(_SPREAD_JITTER * rng.standard_normal(changed.size))
+        spread = np.maximum(self.base_spread[changed] * jitter, self.min_spread[changed])
+        # Volume jitter: ±5% of current volume, floored at 10k.
+        volume = self.volume[changed]
+        volume_jitter = (volume * rng.uniform(-0.05, 0.05, changed.size)).astype(np.int64)
+        volume = np.maximum(10_000, volume + volume_jitter)
+
+        self.mid[changed] = mid
+        self.volume[changed] = volume
+
+        jpy = self.jpy[changed]
+        bid = np.where(jpy, np.round(mid - spread / 2, 2), np.round(mid - spread / 2, 5))
+        ask = np.where(jpy, np.round(mid + spread / 2, 2), np.round(mid + spread / 2, 5))
+        mid_out = np.where(jpy, np.round(mid, 3), np.round(mid, 5))
+        spread_out = np.where(jpy, np.round(ask - bid, 2), np.round(ask - bid, 5))
+        change_pct = np.round((mid / self.baseline[changed] - 1.0) * 100, 2)
+
+        pairs = self.pairs
+        return [
+            {
+                "pair": pairs[i],
+                "bid": b,
+                "ask": a,
+                "mid": m,
+                "spread": s,
+                "change_pct": c,
+                "volume": v,
+            }
+            for i, b, a, m, s, c, v in zip(
+                changed.tolist(),
+                bid.tolist(),
+                ask.tolist(),
+                mid_out.tolist(),
+                spread_out.tolist(),
+                change_pct.tolist(),
+                volume.tolist(),
+            )
+        ]
 
 
 class FxService:
-    """Service for FX data operations."""
+    """Service for FX data operations.
+
+    All pairs are held in NumPy arrays. Each tick draws one shock per
+    currency, so pairs sharing a currency move together (EUR/USD, EUR/JPY
+    and EUR/GBP all feel the same EUR shock), and recomputes mid, spread
+    and change% for the pairs that printed in one vectorized pass.
+    """
 
-    def __init__(self):
+    def __init__(
+        self, seed: Optional[int] = None, tick_fraction: float = _TICK_FRACTION
+    ):
         self._fx_data: List[dict] = []
         self._initialized = False
         # Store baseline mids for change_pct calculation
         self._baseline_mids: dict[str, float] = {}
+        self._book = _FxBook([])
+        self._rng = np.random.default_rng(seed)
+        self._tick_fraction = tick_fraction
 
     def get_fx_data(self) -> List[dict]:
         """Get all FX data rows."""
@@ -38,12 +142,33 @@ class FxService:
             self._initialized = True
         return self._fx_data
 
+    def load(self, rows: List[dict]) -> None:
+        """Load FX rows into the tick arrays; their mids become the change% baseline."""
+        self._fx_data = list(rows)
+        self._initialized = True
+        self._baseline_mids = {row["pair"]: row["mid"] for row in rows}
+        self._book = _FxBook(rows)
+
+    def tick(self) -> List[dict]:
+        """Advance the service's own rows by one tick and return only the rows that changed.
+
+        Returns:
+            Partial row dicts (pair, bid, ask, mid, spread, change_pct, volume)
+            for the pairs that printed this tick.
+        """
+        self.get_fx_data()
+        updates = self._book.step(self._rng, self._tick_fraction)
+        self._fx_data = _merge(self._fx_data, updates)
+        return updates
+
     def generate_tick(self, rows: List[dict]) -> List[dict]:
-        """Apply realistic random perturbation to FX prices.
+        """Apply one realistic tick to FX rows.
 
-        For each row, nudges bid/ask by a small random amount scaled to the
-        pair's typical volatility, then recalculates mid, spread, change_pct,
-        and volume.
+        Prices move from the given rows' own mids, and the service's rows
+        are not touched, so sessions ticking their own row lists (through a
+        shared service) do not interfere. Only pairs that printed get new
+        row dicts; unchanged rows are returned as the same objects so AG
+        Grid can skip them.
 
         Args:
             rows: Current list of FX row dicts (will NOT be mutated).
@@ -51,52 +176,10 @@ class FxService:
         Returns:
             New list of row dicts with updated prices.
         """
-        ticked: List[dict] = []
-        for row in rows:
-            pair = row["pair"]
-            vol = _vol_for_pair(pair)
-
-            # Random walk: bid moves ±vol, ask moves ±vol independently
-            bid = row["bid"] + random.uniform(-vol, vol)
-            ask = row["ask"] + random.uniform(-vol, vol)
-
-            # Ensure ask > bid (minimum 1 pip spread)
-            if ask <= bid:
-                ask = bid + vol * 0.5
-
-            mid = round((bid + ask) / 2, 5)
-            spread = round(abs(ask - bid), 5)
-
-            # change_pct relative to session open (baseline)
-            baseline = self._baseline_mids.get(pair, mid)
-            change_pct = round(((mid - baseline) / baseline) * 100, 2) if baseline else 0.0
-
-            # Volume jitter: ±5% of current volume
-            base_vol = row["volume"]
-            volume = max(10_000, base_vol + random.randint(-base_vol // 20, base_vol // 20))
-
-            # Round bid/ask to appropriate decimal places
-            if "JPY" in pair:
-                bid = round(bid, 2)
-                ask = round(ask, 2)
-                mid = round(mid, 3)
-                spread = round(spread, 2)
-            else:
-                bid = round(bid, 5)
-                ask = round(ask, 5)
-                mid = round(mid, 5)
-                spread = round(spread, 5)
-
-            ticked.append({
-                **row,
-                "bid": bid,
-                "ask": ask,
-                "mid": mid,
-                "spread": spread,
-                "change_pct": change_pct,
-                "volume": volume,
-            })
-        return ticked
+        self.get_fx_data()
+        baseline = [self._baseline_mids.get(row["pair"], row["mid"]) for row in rows]
+        updates = _FxBook(rows, baseline).step(self._rng, self._tick_fraction)
+        return _merge(rows, updates)
 
     def get_summary_stats(self) -> dict:
         """Get summary statistics for FX data."""
@@ -126,6 +209,15 @@ class FxService:
             {"pair": "USD/SGD", "bid": 1.3412, "ask": 1.3416, "mid": 1.3414, "change_pct": 0.08, "spread": 0.0004, "volume": 180_000, "session": "Singapore", "status": "Active"},
             {"pair": "USD/HKD", "bid": 7.8102, "ask": 7.8108, "mid": 7.8105, "change_pct": 0.01, "spread": 0.0006, "volume": 320_000, "session": "Hong Kong", "status": "Active"},
         ]
-        # Store baseline mids for change_pct calculation
-        for row in self._fx_data:
-            self._baseline_mids[row["pair"]] = row["mid"]
+        self.load(self._fx_data)
+
+
+def _merge(rows: List[dict], updates: List[dict]) -> List[dict]:
+    """Overlay partial updates (keyed by pair) onto rows without mutating them."""
+    if not updates:
+        return list(rows)
+    by_pair = {u["pair"]: u for u in updates}
+    return [
+        {**row, **by_pair[row["pair"]]} if row["pair"] in by_pair else row
+        for row in rows
+    ]
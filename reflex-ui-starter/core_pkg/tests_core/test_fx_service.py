@@ -1,5 +1,6 @@
 """Tests for FxService — core business logic for FX data."""
 
+import numpy as np
 import pytest
 from core.services.fx_service import FxService
 
@@ -66,3 +67,62 @@ class TestGetSummaryStats:
         stats = service.get_summary_stats()
         required = {"total", "gainers", "losers"}
         assert required.issubset(stats.keys())
+
+
+class TestVectorizedTick:
+    def test_generate_tick_rebuilds_only_printed_rows(self):
+        service = FxService(seed=5)
+        data = service.get_fx_data()
+        ticked = service.generate_tick(data)
+        rebuilt = [after for before, after in zip(data, ticked) if after is not before]
+        assert 0 < len(rebuilt) < len(data)
+        # The service's own rows are left alone.
+        assert service.get_fx_data() is data
+
+    def test_generate_tick_moves_from_the_given_rows(self):
+        service = FxService(seed=8, tick_fraction=1.0)
+        data = service.get_fx_data()
+        # A session whose rows have drifted far from the service's own.
+        session_rows = [{**row, "mid": row["mid"] * 2} for row in data]
+        ticked = service.generate_tick(session_rows)
+        for before, after in zip(session_rows, ticked):
+            assert abs(after["mid"] / before["mid"] - 1) < 0.001
+        assert service.get_fx_data() is data
+
+    def test_no_prints_returns_no_updates(self):
+        service = FxService(seed=1, tick_fraction=0.0)
+        data = service.get_fx_data()
+        assert service.tick() == []
+        assert all(a is b for a, b in zip(data, service.generate_tick(data)))
+
+    def test_shared_currency_shocks_are_correlated(self):
+        service = FxService(seed=42, tick_fraction=1.0)
+        data = service.get_fx_data()
+        pairs = [r["pair"] for r in data]
+        eur_usd, eur_jpy = pairs.index("EUR/USD"), pairs.index("EUR/JPY")
+        mids = []
+        for _ in range(2000):
+            service.tick()
+            mids.append(service._book.mid[[eur_usd, eur_jpy]].copy())
+        returns = np.diff(np.log(np.array(mids)), axis=0)
+        assert np.corrcoef(returns.T)[0, 1] > 0.2
+
+    def test_pegged_pair_barely_moves(self):
+        service = FxService(seed=3, tick_fraction=1.0)
+        service.get_fx_data()
+        for _ in range(500):
+            service.tick()
+        hkd = next(r for r in service.get_fx_data() if r["pair"] == "USD/HKD")
+        assert abs(hkd["change_pct"]) < 0.01
+
+    def test_scales_to_thousands_of_pairs(self):
+        rows = [
+            {"pair": f"C{i:04d}/USD", "bid": 1.0, "ask": 1.0002, "mid": 1.0001,
+             "change_pct": 0.0, "spread": 0.0002, "volume": 100_000}
+            for i in range(5000)
+        ]
+        service = FxService(seed=0)
+        service.load(rows)
+        updates = service.tick()
+        assert 1000 < len(updates) < 2000
+        assert all(u["ask"] > u["bid"] for u in updates)